@@ -0,0 +1,140 @@
+"""Throughput of batch_extract_bytes against extraction through temporary files.
+
+A batch of PDF, spreadsheet and presentation documents is extracted from bytes in memory, and
+through temporary files written to tmpfs and to a real disk, as the bytes extraction path used to
+do. Images are left out, as their extraction time is dominated by OCR.
+
+The disk directory defaults to the current working directory and can be set with the
+BENCHMARK_DISK_DIR environment variable.
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import anyio
+from kreuzberg import ExtractionConfig, batch_extract_bytes, batch_extract_file
+from kreuzberg._mime_types import (
+    EXCEL_MIME_TYPE,
+    PDF_MIME_TYPE,
+    POWER_POINT_MIME_TYPE,
+)
+from kreuzberg._utils._cache import clear_all_caches
+
+SOURCE_FILES = Path(__file__).parent.parent / "tests" / "test_source_files"
+DOCUMENTS = [
+    ("searchable.pdf", PDF_MIME_TYPE),
+    ("test-article.pdf", PDF_MIME_TYPE),
+    ("sample-contract.pdf", PDF_MIME_TYPE),
+    ("excel.xlsx", EXCEL_MIME_TYPE),
+    ("excel-multi-sheet.xlsx", EXCEL_MIME_TYPE),
+    ("pitch-deck-presentation.pptx", POWER_POINT_MIME_TYPE),
+]
+BATCH_COPIES = 20
+ITERATIONS = 3
+TMPFS_DIR = Path("/dev/shm")
+
+
+def load_batch() -> list[tuple[bytes, str]]:
+    documents = [
+        ((SOURCE_FILES / name).read_bytes(), mime_type) for name, mime_type in DOCUMENTS
+    ]
+    return documents * BATCH_COPIES
+
+
+async def extract_in_memory(
+    contents: list[tuple[bytes, str]], config: ExtractionConfig, _: Path | None
+) -> None:
+    await batch_extract_bytes(contents, config=config)
+
+
+async def extract_through_temp_files(
+    contents: list[tuple[bytes, str]], config: ExtractionConfig, directory: Path | None
+) -> None:
+    paths = []
+    try:
+        for index, (content, mime_type) in enumerate(contents):
+            suffix = {
+                PDF_MIME_TYPE: ".pdf",
+                EXCEL_MIME_TYPE: ".xlsx",
+                POWER_POINT_MIME_TYPE: ".pptx",
+            }[mime_type]
+            with tempfile.NamedTemporaryFile(
+                suffix=f"-{index}{suffix}", dir=directory, delete=False
+            ) as f:
+                f.write(content)
+            paths.append(f.name)
+        await batch_extract_file(paths, config=config)
+    finally:
+        for path in paths:
+            Path(path).unlink(missing_ok=True)
+
+
+async def measure(mode: str, directory: Path | None) -> dict[str, Any]:
+    contents = load_batch()
+    config = ExtractionConfig()
+    extract = extract_in_memory if mode == "in-memory" else extract_through_temp_files
+
+    durations = []
+    for _ in range(ITERATIONS):
+        clear_all_caches()
+        start = time.perf_counter()
+        await extract(contents, config, directory)
+        durations.append(time.perf_counter() - start)
+
+    duration = min(durations)
+    return {
+        "documents": len(contents),
+        "megabytes": sum(len(content) for content, _ in contents) / 1_000_000,
+        "duration_seconds": duration,
+        "documents_per_second": len(contents) / duration,
+    }
+
+
+async def benchmark_batch_extract_bytes() -> dict[str, Any]:
+    disk_dir = Path(os.environ.get("BENCHMARK_DISK_DIR", Path.cwd()))
+    tmpfs_dir = TMPFS_DIR if TMPFS_DIR.is_dir() else None
+
+    print("🔬 BATCH EXTRACT BYTES BENCHMARK")
+    print(f"Disk: {disk_dir}, tmpfs: {tmpfs_dir or 'unavailable'}")
+    print("=" * 60)
+    print(f"{'Mode':<18} {'Documents':>9} {'Seconds':>8} {'Docs/s':>8}")
+
+    results: dict[str, Any] = {"modes": {}}
+    with tempfile.TemporaryDirectory(dir=disk_dir) as disk_tmp:
+        modes: list[tuple[str, Path | None]] = [
+            ("in-memory", None),
+            ("tempfile-disk", Path(disk_tmp)),
+        ]
+        if tmpfs_dir is not None:
+            modes.insert(1, ("tempfile-tmpfs", tmpfs_dir))
+
+        for mode, directory in modes:
+            run = await measure(mode, directory)
+            results["modes"][mode] = run
+            print(
+                f"{mode:<18} {run['documents']:>9} {run['duration_seconds']:>8.2f} "
+                f"{run['documents_per_second']:>8.1f}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = anyio.run(benchmark_batch_extract_bytes)
+
+        results_file = Path("batch_extract_bytes_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
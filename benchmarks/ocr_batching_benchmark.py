@@ -0,0 +1,130 @@
+"""Wall time of EasyOCR recognising the pages of a PDF one at a time and in batches.
+
+EasyOCR used to run its detector on one page and its recogniser on one text line per call. Batches of pages of
+the same size now go through ``readtext_batched`` together and their text lines are recognised in batches, with
+batch sizes recommended by ``get_recommended_batch_size`` from the memory available on the device. The batch size
+of PaddleOCR's text line recogniser is recommended the same way.
+
+The recommended batch sizes are reported for the rendered pages. If EasyOCR is installed, the pages are recognised
+one at a time and as a batch on CPU.
+"""
+
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import psutil
+import pypdfium2
+from kreuzberg._ocr._easyocr import EasyOCRBackend
+from kreuzberg._utils._device import (
+    LINE_CROP_SIZE_MB,
+    DeviceInfo,
+    get_recommended_batch_size,
+)
+from kreuzberg.exceptions import MissingDependencyError
+from PIL import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 8
+DPI = 200
+ITERATIONS = 2
+
+
+def build_pages(directory: Path, page_count: int) -> list[Path]:
+    document = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    paths = []
+    for page_index in range(page_count):
+        page = document[page_index % len(document)]
+        path = directory / f"page_{page_index}.png"
+        page.render(scale=DPI / 72).to_pil().save(path)
+        page.close()
+        paths.append(path)
+    document.close()
+    return paths
+
+
+def measure(paths: list[Path], batched: bool) -> dict[str, Any]:
+    backend = EasyOCRBackend()
+    config = {"language": "en", "beam_width": 5, "device": "cpu"}
+    latencies = []
+    characters = 0
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        if batched:
+            results = backend.process_batch_sync(paths, **config)
+        else:
+            results = [backend.process_file_sync(path, **config) for path in paths]
+        latencies.append(time.perf_counter() - start)
+        characters = sum(len(result.content) for result in results)
+    return {
+        "batched": batched,
+        "median_s": statistics.median(latencies),
+        "characters": characters,
+    }
+
+
+def benchmark_ocr_batching() -> dict[str, Any]:
+    print("🔬 OCR BATCHING BENCHMARK")
+    print(
+        f"Pages: {PAGE_COUNT} at {DPI} DPI, available memory: "
+        f"{psutil.virtual_memory().available / 1024**3:.1f} GB, iterations: {ITERATIONS}"
+    )
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_pages(Path(directory), PAGE_COUNT)
+        with Image.open(paths[0]) as page:
+            page_size_mb = page.width * page.height * 3 / 1024**2
+
+        cpu = DeviceInfo(device_type="cpu", name="CPU")
+        results: dict[str, Any] = {
+            "page_size_mb": page_size_mb,
+            "page_batch_size": get_recommended_batch_size(cpu, page_size_mb),
+            "line_batch_size": get_recommended_batch_size(cpu, LINE_CROP_SIZE_MB),
+            "ocr": [],
+        }
+        print(f"Page size: {page_size_mb:.1f} MB")
+        print(f"Recommended CPU batch size of pages: {results['page_batch_size']}")
+        print(f"Recommended CPU batch size of lines: {results['line_batch_size']}")
+
+        try:
+            EasyOCRBackend._init_easyocr_sync(language="en", device="cpu")
+        except MissingDependencyError:
+            print("\nOCR: unavailable (easyocr is not installed)")
+            return results
+
+        print(f"\n{'Mode':<10} {'Median s':>10} {'Speedup':>8} {'Characters':>11}")
+        baseline = None
+        for batched in (False, True):
+            run = measure(paths, batched)
+            baseline = baseline or run["median_s"]
+            run["speedup"] = baseline / run["median_s"]
+            results["ocr"].append(run)
+            mode = "batched" if batched else "per page"
+            print(
+                f"{mode:<10} {run['median_s']:>10.2f} {run['speedup']:>7.2f}x "
+                f"{run['characters']:>11}"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_ocr_batching()
+
+        results_file = Path("ocr_batching_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
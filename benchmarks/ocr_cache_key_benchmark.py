@@ -0,0 +1,135 @@
+"""Latency of computing the OCR cache key of a rendered page, which is paid on every cache hit.
+
+The tesseract backend used to PNG-encode every page and hash the PNG with sha256 before it could look up the OCR
+cache. Pages are now keyed by a hash of their uncompressed PNM encoding, the raw pixels with their mode and size,
+with xxh3 when xxhash is installed and sha256 otherwise. The perceptual key hashes a downsampled gradient of the
+page instead, so rescans and recompressions of a page share its cache entry; its lookup in the index of cached
+perceptual hashes is measured with it.
+"""
+
+import hashlib
+import io
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+from kreuzberg._ocr._tesseract import _encode_image
+from kreuzberg._utils._cache import (
+    HAS_XXHASH,
+    PerceptualHashIndex,
+    get_image_hash,
+    get_perceptual_image_hash,
+)
+from PIL.Image import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 4
+ITERATIONS = 5
+INDEXED_HASHES = 10_000
+
+
+def build_pages(page_count: int) -> list[Image]:
+    document = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    pages = []
+    for page_index in range(min(page_count, len(document))):
+        page = document[page_index]
+        pages.append(page.render(scale=300 / 72).to_pil().convert("RGB"))
+        page.close()
+    document.close()
+    return pages
+
+
+def build_index(directory: Path, pages: list[Image]) -> PerceptualHashIndex:
+    index = PerceptualHashIndex(directory / "perceptual_hashes.tsv")
+    for i in range(INDEXED_HASHES):
+        index.add("benchmark", hashlib.shake_128(str(i).encode()).digest(128))
+    for image in pages:
+        index.add("benchmark", get_perceptual_image_hash(image))
+    return index
+
+
+def png_sha256_key(image: Image, index: PerceptualHashIndex) -> None:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    hashlib.sha256(buffer.getvalue()).hexdigest()[:16]
+
+
+def pixel_key(image: Image, index: PerceptualHashIndex) -> None:
+    get_image_hash(_encode_image(image))
+
+
+def perceptual_key(image: Image, index: PerceptualHashIndex) -> None:
+    if index.find("benchmark", get_perceptual_image_hash(image)) is None:
+        raise RuntimeError("Indexed page was not found")
+
+
+def measure(key: Any, pages: list[Image], index: PerceptualHashIndex) -> dict[str, Any]:
+    key(pages[0], index)
+
+    latencies = []
+    for _ in range(ITERATIONS):
+        for image in pages:
+            start = time.perf_counter()
+            key(image, index)
+            latencies.append(time.perf_counter() - start)
+
+    return {
+        "pages": len(pages),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+    }
+
+
+def benchmark_ocr_cache_key() -> dict[str, Any]:
+    print("🔬 OCR CACHE KEY BENCHMARK")
+    print(f"Pages: {PAGE_COUNT}, iterations: {ITERATIONS}, xxhash: {HAS_XXHASH}")
+    print("=" * 60)
+    print(f"{'Key':<12} {'Median ms':>10} {'p95 ms':>8} {'Speedup':>8}")
+
+    pages = build_pages(PAGE_COUNT)
+    results: dict[str, Any] = {
+        "xxhash": HAS_XXHASH,
+        "indexed_hashes": INDEXED_HASHES,
+        "runs": {},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        index = build_index(Path(directory), pages)
+        baseline = None
+        for name, key in {
+            "png_sha256": png_sha256_key,
+            "pixels": pixel_key,
+            "perceptual": perceptual_key,
+        }.items():
+            run = measure(key, pages, index)
+            baseline = baseline or run["median_ms"]
+            run["speedup"] = baseline / run["median_ms"]
+            results["runs"][name] = run
+            print(
+                f"{name:<12} {run['median_ms']:>10.1f} "
+                f"{run['p95_ms']:>8.1f} {run['speedup']:>7.2f}x"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_ocr_cache_key()
+
+        results_file = Path("ocr_cache_key_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -0,0 +1,134 @@
+"""OCR time against accuracy at different PDF render resolutions.
+
+Pages of searchable PDFs are rendered at several fixed DPIs and with the adaptive render modes of
+PDFRenderConfig, then recognised with Tesseract. Accuracy is the similarity of the recognised words
+to the words of the page's text layer, which serves as ground truth.
+
+Requires the tesseract binary to be installed.
+"""
+
+import json
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pypdfium2
+from kreuzberg._extractors._pdf import PDFExtractor
+from kreuzberg._ocr._tesseract import TesseractBackend
+from kreuzberg._pdf_render import PDFRenderConfig, render_pdf_page
+from kreuzberg._utils._cache import clear_all_caches
+
+SOURCE_FILES = Path(__file__).parent.parent / "tests" / "test_source_files"
+SOURCE_PDFS = [
+    (SOURCE_FILES / "sample-contract.pdf", 3),
+    (SOURCE_FILES / "test-article.pdf", 3),
+]
+FIXED_DPIS = [100, 150, 200, 300, 400]
+ADAPTIVE_CONFIGS = {
+    "adaptive": PDFRenderConfig(),
+    "adaptive-grayscale": PDFRenderConfig(color_mode="grayscale"),
+    "adaptive-bilevel": PDFRenderConfig(color_mode="bilevel"),
+}
+
+
+def word_accuracy(expected: str, actual: str) -> float:
+    return SequenceMatcher(
+        None, expected.split(), actual.split(), autojunk=False
+    ).ratio()
+
+
+def get_render_configs() -> dict[str, PDFRenderConfig]:
+    configs = {
+        f"{dpi}dpi": PDFRenderConfig(adaptive=False, dpi=dpi, max_pixels=None)
+        for dpi in FIXED_DPIS
+    }
+    configs.update(ADAPTIVE_CONFIGS)
+    return configs
+
+
+async def measure_page(
+    backend: TesseractBackend,
+    document: pypdfium2.PdfDocument,
+    page_index: int,
+    config: PDFRenderConfig,
+    ground_truth: str,
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    image = render_pdf_page(document, page_index, config)
+    render_seconds = time.perf_counter() - start
+    width, height = image.size
+
+    start = time.perf_counter()
+    result = await backend.process_image(image)
+    ocr_seconds = time.perf_counter() - start
+    image.close()
+
+    return {
+        "page": page_index + 1,
+        "width": width,
+        "height": height,
+        "render_seconds": render_seconds,
+        "ocr_seconds": ocr_seconds,
+        "accuracy": word_accuracy(ground_truth, result.content),
+    }
+
+
+async def benchmark_ocr_dpi() -> dict[str, Any]:
+    backend = TesseractBackend()
+    configs = get_render_configs()
+
+    print("🔬 OCR DPI BENCHMARK")
+    print("=" * 60)
+    print(
+        f"{'Mode':<20} {'Megapixels':>10} {'Render s':>9} {'OCR s':>8} {'Accuracy':>9}"
+    )
+
+    results: dict[str, Any] = {"modes": {}}
+    for name, config in configs.items():
+        pages = []
+        for pdf_path, page_count in SOURCE_PDFS:
+            document = pypdfium2.PdfDocument(str(pdf_path))
+            for page_index in range(min(page_count, len(document))):
+                # the OCR cache would otherwise hide repeated renders of the same page
+                clear_all_caches()
+                ground_truth = PDFExtractor._get_page_text(document, page_index)
+                page = await measure_page(
+                    backend, document, page_index, config, ground_truth
+                )
+                pages.append({"file": pdf_path.name, **page})
+            document.close()
+
+        summary = {
+            "megapixels": sum(p["width"] * p["height"] for p in pages)
+            / len(pages)
+            / 1_000_000,
+            "render_seconds": sum(p["render_seconds"] for p in pages),
+            "ocr_seconds": sum(p["ocr_seconds"] for p in pages),
+            "accuracy": sum(p["accuracy"] for p in pages) / len(pages),
+        }
+        results["modes"][name] = {"summary": summary, "pages": pages}
+        print(
+            f"{name:<20} {summary['megapixels']:>10.1f} {summary['render_seconds']:>9.2f} "
+            f"{summary['ocr_seconds']:>8.2f} {summary['accuracy']:>9.3f}"
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = anyio.run(benchmark_ocr_dpi)
+
+        results_file = Path("ocr_dpi_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -0,0 +1,156 @@
+"""Peak RSS of the PDF render→OCR pipeline as the page count grows.
+
+The OCR backend is replaced by a stub that sleeps for a fixed time per page, so the benchmark
+measures the memory held by rendered pages rather than the OCR engine itself. The legacy
+behaviour (render every page before OCR starts) is measured alongside for comparison.
+"""
+
+import gc
+import json
+import tempfile
+import threading
+import time
+from multiprocessing import cpu_count
+from pathlib import Path
+from typing import Any
+
+import anyio
+import psutil
+import pypdfium2
+from kreuzberg._extractors._pdf import PDFExtractor
+from kreuzberg._mime_types import PDF_MIME_TYPE, PLAIN_TEXT_MIME_TYPE
+from kreuzberg._types import ExtractionConfig, ExtractionResult
+from kreuzberg._utils._pdf_document import PDFDocumentContext
+from PIL.Image import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "non-searchable.pdf"
+)
+PAGE_COUNTS = [5, 10, 20, 40]
+OCR_SECONDS_PER_PAGE = 0.05
+
+
+class StubOCRBackend:
+    async def process_image(self, image: Image, **kwargs: Any) -> ExtractionResult:
+        await anyio.sleep(OCR_SECONDS_PER_PAGE)
+        return ExtractionResult(
+            content="", mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[]
+        )
+
+
+class PeakRSSSampler:
+    def __init__(self, interval: float = 0.005) -> None:
+        self.process = psutil.Process()
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            time.sleep(self.interval)
+
+    def __enter__(self) -> "PeakRSSSampler":  # noqa: PYI034
+        self.peak = self.process.memory_info().rss
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def build_pdf(page_count: int, directory: Path) -> Path:
+    source = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    document = pypdfium2.PdfDocument.new()
+    for _ in range(page_count):
+        document.import_pages(source, [0])
+    output = directory / f"scan_{page_count}.pdf"
+    document.save(str(output))
+    document.close()
+    source.close()
+    return output
+
+
+async def run_pipeline(extractor: PDFExtractor, pdf_path: Path) -> None:
+    async with PDFDocumentContext(pdf_path) as document:
+        await extractor._extract_pdf_text_with_ocr(document, ocr_backend="tesseract")
+
+
+async def run_eager(extractor: PDFExtractor, pdf_path: Path) -> None:
+    backend = StubOCRBackend()
+    document = pypdfium2.PdfDocument(str(pdf_path))
+    images = [extractor._render_page(document, i) for i in range(len(document))]
+    for image in images:
+        await backend.process_image(image)
+    document.close()
+
+
+def measure(runner: Any, extractor: PDFExtractor, pdf_path: Path) -> dict[str, float]:
+    gc.collect()
+    baseline = psutil.Process().memory_info().rss
+    start = time.perf_counter()
+    with PeakRSSSampler() as sampler:
+        anyio.run(runner, extractor, pdf_path)
+    duration = time.perf_counter() - start
+    return {
+        "peak_rss_delta_mb": (sampler.peak - baseline) / 1024 / 1024,
+        "duration_seconds": duration,
+    }
+
+
+def benchmark_ocr_pipeline_memory() -> dict[str, Any]:
+    import kreuzberg._extractors._pdf as pdf_module
+
+    pdf_module.get_ocr_backend = lambda _: StubOCRBackend()  # type: ignore[assignment,return-value]
+
+    max_rendered_pages = min(cpu_count(), 4)
+    extractor = PDFExtractor(
+        mime_type=PDF_MIME_TYPE,
+        config=ExtractionConfig(ocr_max_rendered_pages=max_rendered_pages),
+    )
+
+    print("🔬 OCR PIPELINE MEMORY BENCHMARK")
+    print(
+        f"Source page: {SOURCE_PDF.name}, ocr_max_rendered_pages={max_rendered_pages}"
+    )
+    print(f"Stub OCR latency: {OCR_SECONDS_PER_PAGE * 1000:.0f}ms per page")
+    print("=" * 60)
+    print(
+        f"{'Pages':>6} {'Pipeline MB':>12} {'Eager MB':>10} {'Pipeline s':>11} {'Eager s':>8}"
+    )
+
+    results: dict[str, Any] = {"max_rendered_pages": max_rendered_pages, "runs": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for page_count in PAGE_COUNTS:
+            pdf_path = build_pdf(page_count, Path(tmp))
+            pipeline = measure(run_pipeline, extractor, pdf_path)
+            eager = measure(run_eager, extractor, pdf_path)
+            results["runs"].append(
+                {"pages": page_count, "pipeline": pipeline, "eager": eager}
+            )
+            print(
+                f"{page_count:>6} {pipeline['peak_rss_delta_mb']:>12.1f} "
+                f"{eager['peak_rss_delta_mb']:>10.1f} "
+                f"{pipeline['duration_seconds']:>11.2f} {eager['duration_seconds']:>8.2f}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_ocr_pipeline_memory()
+
+        results_file = Path("ocr_pipeline_memory_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -0,0 +1,158 @@
+"""Wall time of OCR of a very large image as a whole and in overlapping bands recognised in parallel.
+
+Tesseract recognises an image on a single core, so a large drawing used to be OCR'd by one process while the other
+cores were idle. The image extractor now splits images above ``ocr_tile_min_pixels`` into one horizontal band per
+worker, recognises the bands concurrently and removes the lines recognised twice in their overlaps.
+
+The large image is built by stacking rendered pages of a PDF. The cost of splitting the image and joining the band
+texts is measured without tesseract. If tesseract is installed, the complete extraction is measured at increasing
+numbers of workers, with the OCR cache cleared before every run.
+"""
+
+import io
+import json
+import multiprocessing as mp
+import shutil
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+from kreuzberg import ExtractionConfig, extract_bytes_sync
+from kreuzberg._ocr._tiling import merge_band_texts, split_into_bands
+from kreuzberg._utils._cache import clear_all_caches
+from PIL import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 4
+OVERLAP = 200
+ITERATIONS = 3
+
+
+def build_image(page_count: int) -> Image.Image:
+    document = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    pages = []
+    for page_index in range(min(page_count, len(document))):
+        page = document[page_index]
+        pages.append(page.render(scale=300 / 72).to_pil().convert("L"))
+        page.close()
+    document.close()
+
+    image = Image.new(
+        "L",
+        (max(page.width for page in pages), sum(page.height for page in pages)),
+        255,
+    )
+    top = 0
+    for page in pages:
+        image.paste(page, (0, top))
+        top += page.height
+    return image
+
+
+def encode_png(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def worker_counts() -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= mp.cpu_count():
+        counts.append(counts[-1] * 2)
+    if counts[-1] != mp.cpu_count():
+        counts.append(mp.cpu_count())
+    return counts
+
+
+def measure_tiling(image: Image.Image, band_count: int) -> dict[str, Any]:
+    texts = [
+        "\n".join(f"line {line} of the image" for line in range(start, start + 120))
+        for start in range(0, band_count * 100, 100)
+    ]
+    latencies = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        split_into_bands(image, band_count, OVERLAP)
+        merge_band_texts(texts)
+        latencies.append(time.perf_counter() - start)
+    return {"bands": band_count, "median_ms": statistics.median(latencies) * 1000}
+
+
+def measure_ocr(content: bytes, workers: int) -> dict[str, Any]:
+    config = ExtractionConfig(
+        ocr_tile_min_pixels=None if workers == 1 else 1,
+        ocr_tile_overlap=OVERLAP,
+        ocr_tile_max_workers=workers,
+    )
+    latencies = []
+    characters = 0
+    for _ in range(ITERATIONS):
+        clear_all_caches()
+        start = time.perf_counter()
+        result = extract_bytes_sync(content, "image/png", config=config)
+        latencies.append(time.perf_counter() - start)
+        characters = len(result.content)
+    return {
+        "workers": workers,
+        "median_s": statistics.median(latencies),
+        "characters": characters,
+    }
+
+
+def benchmark_ocr_tiling() -> dict[str, Any]:
+    print("🔬 OCR TILING BENCHMARK")
+    print(
+        f"Pages stacked: {PAGE_COUNT}, CPUs: {mp.cpu_count()}, iterations: {ITERATIONS}"
+    )
+    print("=" * 60)
+
+    image = build_image(PAGE_COUNT)
+    print(
+        f"Image: {image.width}x{image.height} ({image.width * image.height / 1e6:.1f} MP)"
+    )
+    results: dict[str, Any] = {"size": image.size, "tiling": [], "ocr": []}
+
+    print(f"\n{'Bands':<8} {'Split + join ms':>16}")
+    for band_count in (2, 4, 8, 16):
+        run = measure_tiling(image, band_count)
+        results["tiling"].append(run)
+        print(f"{band_count:<8} {run['median_ms']:>16.1f}")
+
+    if not shutil.which("tesseract"):
+        print("\nOCR: unavailable (tesseract is not installed)")
+        return results
+
+    content = encode_png(image)
+    print(f"\n{'Workers':<8} {'Median s':>10} {'Speedup':>8} {'Characters':>11}")
+    baseline = None
+    for workers in worker_counts():
+        run = measure_ocr(content, workers)
+        baseline = baseline or run["median_s"]
+        run["speedup"] = baseline / run["median_s"]
+        results["ocr"].append(run)
+        print(
+            f"{workers:<8} {run['median_s']:>10.2f} {run['speedup']:>7.2f}x "
+            f"{run['characters']:>11}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_ocr_tiling()
+
+        results_file = Path("ocr_tiling_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
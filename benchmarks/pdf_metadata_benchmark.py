@@ -0,0 +1,104 @@
+"""Cost of PDF metadata extraction on large documents, by requested metadata fields.
+
+A 1,000 page PDF is built by repeating the pages of a test article, and its metadata is
+extracted with every expensive field, with each one alone, and with the cheap fields only.
+The document is parsed anew for every run, as it is for every extraction. The first row
+walks the whole page tree on top of the metadata, as reading the first page size and page
+count through the page list used to do.
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+from kreuzberg._playa import (
+    ALL_PDF_METADATA_FIELDS,
+    extract_pdf_metadata_from_document,
+)
+from playa import parse
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 1000
+ITERATIONS = 5
+FIELD_SETS = {
+    "page list": ALL_PDF_METADATA_FIELDS,
+    "all": ALL_PDF_METADATA_FIELDS,
+    "outline": frozenset({"outline"}),
+    "languages": frozenset({"languages"}),
+    "summary": frozenset({"summary"}),
+    "cheap only": frozenset(),
+}
+
+
+def build_pdf(page_count: int, directory: Path) -> Path:
+    source = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    document = pypdfium2.PdfDocument.new()
+    while len(document) < page_count:
+        pages = list(range(min(len(source), page_count - len(document))))
+        document.import_pages(source, pages)
+    output = directory / f"text_{page_count}.pdf"
+    document.save(str(output))
+    document.close()
+    source.close()
+    return output
+
+
+def measure(
+    content: bytes, fields: frozenset[Any], walk_page_list: bool
+) -> dict[str, Any]:
+    durations = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        document = parse(content, max_workers=1)
+        if walk_page_list:
+            len(document.pages)
+        metadata = extract_pdf_metadata_from_document(document, fields)
+        durations.append(time.perf_counter() - start)
+
+    return {
+        "fields": sorted(fields),
+        "duration_ms": min(durations) * 1000,
+        "metadata_keys": sorted(metadata),
+    }
+
+
+def benchmark_pdf_metadata() -> dict[str, Any]:
+    print("🔬 PDF METADATA BENCHMARK")
+    print(f"Pages: {PAGE_COUNT}")
+    print("=" * 60)
+    print(f"{'Fields':<12} {'Milliseconds':>12} {'Speedup':>8}")
+
+    results: dict[str, Any] = {"pages": PAGE_COUNT, "runs": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        content = build_pdf(PAGE_COUNT, Path(tmp)).read_bytes()
+        baseline = None
+        for name, fields in FIELD_SETS.items():
+            run = measure(content, fields, walk_page_list=name == "page list")
+            baseline = baseline or run["duration_ms"]
+            run["speedup"] = baseline / run["duration_ms"]
+            results["runs"][name] = run
+            print(f"{name:<12} {run['duration_ms']:>12.1f} {run['speedup']:>7.2f}x")
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_pdf_metadata()
+
+        results_file = Path("pdf_metadata_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
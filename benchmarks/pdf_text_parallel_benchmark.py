@@ -0,0 +1,120 @@
+"""Speedup of process-parallel PDF text layer extraction over in-process extraction.
+
+A large text PDF is built by repeating the pages of a test article, and its text layer is
+extracted in-process and with increasing numbers of worker processes. The worker pool is
+started before each timed run, as it is reused across extractions in a long-running process.
+"""
+
+import json
+import tempfile
+import time
+from multiprocessing import cpu_count
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+from kreuzberg._extractors._pdf import PDFExtractor
+from kreuzberg._mime_types import PDF_MIME_TYPE
+from kreuzberg._types import ExtractionConfig
+from kreuzberg._utils import _process_pool
+from kreuzberg._utils._pdf_document import PDFDocumentContext
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 5000
+ITERATIONS = 3
+
+
+def build_pdf(page_count: int, directory: Path) -> Path:
+    source = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    document = pypdfium2.PdfDocument.new()
+    while len(document) < page_count:
+        pages = list(range(min(len(source), page_count - len(document))))
+        document.import_pages(source, pages)
+    output = directory / f"text_{page_count}.pdf"
+    document.save(str(output))
+    document.close()
+    source.close()
+    return output
+
+
+def get_process_counts() -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= cpu_count():
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpu_count():
+        counts.append(cpu_count())
+    return counts
+
+
+def measure(pdf_path: Path, process_count: int) -> float:
+    config = ExtractionConfig(
+        parallel_pdf_text_min_pages=None if process_count == 1 else 1,
+        parallel_pdf_text_min_pages_per_process=1,
+    )
+    extractor = PDFExtractor(mime_type=PDF_MIME_TYPE, config=config)
+
+    _process_pool.shutdown_process_pool()
+    _process_pool._POOL_SIZE = process_count
+    list(_process_pool._init_process_pool().map(abs, range(process_count)))
+
+    durations = []
+    for _ in range(ITERATIONS):
+        with PDFDocumentContext(pdf_path) as document:
+            start = time.perf_counter()
+            extractor._extract_pdf_searchable_text_sync(document)
+            durations.append(time.perf_counter() - start)
+
+    _process_pool.shutdown_process_pool()
+    return min(durations)
+
+
+def benchmark_pdf_text_parallel() -> dict[str, Any]:
+    print("🔬 PDF TEXT PARALLEL EXTRACTION BENCHMARK")
+    print(f"Pages: {PAGE_COUNT}, CPUs: {cpu_count()}")
+    print("=" * 60)
+    print(f"{'Processes':>9} {'Seconds':>8} {'Speedup':>8} {'Efficiency':>11}")
+
+    results: dict[str, Any] = {
+        "pages": PAGE_COUNT,
+        "cpu_count": cpu_count(),
+        "runs": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = build_pdf(PAGE_COUNT, Path(tmp))
+        baseline = None
+        for process_count in get_process_counts():
+            duration = measure(pdf_path, process_count)
+            baseline = baseline or duration
+            speedup = baseline / duration
+            results["runs"].append(
+                {
+                    "processes": process_count,
+                    "duration_seconds": duration,
+                    "speedup": speedup,
+                }
+            )
+            print(
+                f"{process_count:>9} {duration:>8.2f} {speedup:>7.2f}x "
+                f"{speedup / process_count:>10.0%}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_pdf_text_parallel()
+
+        results_file = Path("pdf_text_parallel_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -0,0 +1,176 @@
+"""Scaling of CPU-bound tasks over ProcessPoolManager, and the cost of handing a rendered page to a worker.
+
+ProcessPoolManager used to run its tasks in threads, so GIL-bound work did not scale with the number of cores. The
+same batch of pure-Python tasks is run in threads and through ProcessPoolManager worker processes at increasing
+concurrency.
+
+Rendered pages used to reach the workers as PNG bytes, encoded in the parent, pickled to the worker and decoded
+there. They are now copied once into shared memory and mapped by the worker. Both hand-offs are measured round-trip,
+including the worker reading the pixels, with the OCR itself left out.
+"""
+
+import io
+import json
+import multiprocessing as mp
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pypdfium2
+from kreuzberg._utils._process_pool import (
+    ProcessPoolManager,
+    SharedImage,
+    open_shared_image,
+    share_image,
+)
+from PIL import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+TASK_COUNT = 16
+TASK_SIZE = 2_000_000
+PAGE_COUNT = 4
+ITERATIONS = 5
+
+
+def cpu_task(size: int) -> int:
+    total = 0
+    for i in range(size):
+        total += i * i % 7
+    return total
+
+
+def read_png_page(content: bytes) -> int:
+    with Image.open(io.BytesIO(content)) as image:
+        return len(image.tobytes())
+
+
+def read_shared_page(shared_image: SharedImage) -> int:
+    with open_shared_image(shared_image) as image:
+        return len(image.tobytes())
+
+
+def build_pages(page_count: int) -> list[Image.Image]:
+    document = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    pages = []
+    for page_index in range(min(page_count, len(document))):
+        page = document[page_index]
+        pages.append(page.render(scale=300 / 72).to_pil().convert("RGB"))
+        page.close()
+    document.close()
+    return pages
+
+
+async def run_in_threads(concurrency: int) -> None:
+    limiter = anyio.CapacityLimiter(concurrency)
+    async with anyio.create_task_group() as tg:
+        for _ in range(TASK_COUNT):
+            tg.start_soon(
+                lambda: anyio.to_thread.run_sync(cpu_task, TASK_SIZE, limiter=limiter)
+            )
+
+
+async def run_in_processes(manager: ProcessPoolManager, concurrency: int) -> None:
+    await manager.submit_batch(
+        cpu_task, [(TASK_SIZE,)] * TASK_COUNT, max_concurrent=concurrency
+    )
+
+
+async def measure_scaling(concurrency: int) -> dict[str, Any]:
+    results = {}
+    start = time.perf_counter()
+    await run_in_threads(concurrency)
+    results["threads_s"] = time.perf_counter() - start
+
+    async with ProcessPoolManager(max_processes=concurrency) as manager:
+        await manager.submit_task(cpu_task, 1)
+        start = time.perf_counter()
+        await run_in_processes(manager, concurrency)
+        results["processes_s"] = time.perf_counter() - start
+
+    results["speedup"] = results["threads_s"] / results["processes_s"]
+    return results
+
+
+async def png_handoff(manager: ProcessPoolManager, page: Image.Image) -> None:
+    buffer = io.BytesIO()
+    page.save(buffer, format="PNG")
+    await manager.submit_task(read_png_page, buffer.getvalue())
+
+
+async def shared_handoff(manager: ProcessPoolManager, page: Image.Image) -> None:
+    with share_image(page) as shared_image:
+        await manager.submit_task(read_shared_page, shared_image)
+
+
+async def measure_handoff(handoff: Any, pages: list[Image.Image]) -> dict[str, Any]:
+    async with ProcessPoolManager(max_processes=1) as manager:
+        await handoff(manager, pages[0])
+
+        latencies = []
+        for _ in range(ITERATIONS):
+            for page in pages:
+                start = time.perf_counter()
+                await handoff(manager, page)
+                latencies.append(time.perf_counter() - start)
+
+    return {
+        "pages": len(pages),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+    }
+
+
+async def benchmark_process_pool() -> dict[str, Any]:
+    print("🔬 PROCESS POOL BENCHMARK")
+    print(f"CPUs: {mp.cpu_count()}, tasks: {TASK_COUNT}, pages: {PAGE_COUNT}")
+    print("=" * 60)
+    print(f"{'Concurrency':<12} {'Threads s':>10} {'Processes s':>12} {'Speedup':>8}")
+
+    results: dict[str, Any] = {
+        "cpu_count": mp.cpu_count(),
+        "scaling": {},
+        "handoff": {},
+    }
+    for concurrency in sorted({1, 2, mp.cpu_count()}):
+        run = await measure_scaling(concurrency)
+        results["scaling"][concurrency] = run
+        print(
+            f"{concurrency:<12} {run['threads_s']:>10.2f} "
+            f"{run['processes_s']:>12.2f} {run['speedup']:>7.2f}x"
+        )
+
+    print(f"\n{'Hand-off':<12} {'Median ms':>10} {'p95 ms':>8} {'Speedup':>8}")
+    pages = build_pages(PAGE_COUNT)
+    baseline = None
+    for name, handoff in {"png": png_handoff, "shared": shared_handoff}.items():
+        run = await measure_handoff(handoff, pages)
+        baseline = baseline or run["median_ms"]
+        run["speedup"] = baseline / run["median_ms"]
+        results["handoff"][name] = run
+        print(
+            f"{name:<12} {run['median_ms']:>10.1f} "
+            f"{run['p95_ms']:>8.1f} {run['speedup']:>7.2f}x"
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = anyio.run(benchmark_process_pool)
+
+        results_file = Path("process_pool_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
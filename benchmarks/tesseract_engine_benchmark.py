@@ -0,0 +1,130 @@
+"""Per-page OCR latency of the tesseract CLI backend against the in-process tesserocr backend.
+
+Pages of a test article are rendered at OCR resolution, and cut into small crops as well,
+and every image is recognised by both backends. The OCR cache is bypassed, so every run
+recognises the image. The CLI backend starts a tesseract process and loads the traineddata
+for every image, while the tesserocr backend loads it once, in the untimed warm-up.
+"""
+
+import json
+import statistics
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+from kreuzberg._ocr._tesseract import (
+    PSMMode,
+    TesseractBackend,
+    TesseractConfig,
+    _encode_image,
+)
+from kreuzberg._ocr._tesserocr import TesserocrBackend
+from kreuzberg.exceptions import MissingDependencyError
+from PIL.Image import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 4
+CROPS_PER_PAGE = 4
+ITERATIONS = 3
+LANGUAGE = "eng"
+
+
+def build_images(page_count: int) -> dict[str, list[tuple[Image, bytes]]]:
+    document = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    pages = []
+    for page_index in range(min(page_count, len(document))):
+        page = document[page_index]
+        pages.append(page.render(scale=300 / 72).to_pil().convert("RGB"))
+        page.close()
+    document.close()
+
+    crops = []
+    for image in pages:
+        height = image.height // CROPS_PER_PAGE
+        crops.extend(
+            image.crop((0, i * height, image.width, (i + 1) * height))
+            for i in range(CROPS_PER_PAGE)
+        )
+
+    return {
+        "pages": [(image, _encode_image(image)) for image in pages],
+        "crops": [(image, _encode_image(image)) for image in crops],
+    }
+
+
+def measure(
+    backend: TesseractBackend, images: list[tuple[Image, bytes]]
+) -> dict[str, Any]:
+    config = asdict(TesseractConfig(language=LANGUAGE))
+    config.pop("language")
+    config.pop("psm")
+    backend._validate_tesseract_version_sync()
+    backend._recognize_image_sync(*images[0], LANGUAGE, PSMMode.AUTO, **config)
+
+    latencies = []
+    for _ in range(ITERATIONS):
+        for image, content in images:
+            start = time.perf_counter()
+            backend._recognize_image_sync(
+                image, content, LANGUAGE, PSMMode.AUTO, **config
+            )
+            latencies.append(time.perf_counter() - start)
+
+    return {
+        "images": len(images),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+    }
+
+
+def benchmark_tesseract_engine() -> dict[str, Any]:
+    print("🔬 TESSERACT ENGINE LATENCY BENCHMARK")
+    print(f"Pages: {PAGE_COUNT}, crops per page: {CROPS_PER_PAGE}")
+    print("=" * 60)
+    print(
+        f"{'Images':<8} {'Backend':<10} {'Median ms':>10} {'p95 ms':>8} {'Speedup':>8}"
+    )
+
+    backends = {"tesseract": TesseractBackend(), "tesserocr": TesserocrBackend()}
+    results: dict[str, Any] = {"language": LANGUAGE, "runs": {}}
+    for kind, images in build_images(PAGE_COUNT).items():
+        results["runs"][kind] = {}
+        baseline = None
+        for name, backend in backends.items():
+            try:
+                run = measure(backend, images)
+            except MissingDependencyError as e:
+                results["runs"][kind][name] = {"error": str(e)}
+                print(f"{kind:<8} {name:<10} {'unavailable':>10}")
+                continue
+            baseline = baseline or run["median_ms"]
+            run["speedup"] = baseline / run["median_ms"]
+            results["runs"][kind][name] = run
+            print(
+                f"{kind:<8} {name:<10} {run['median_ms']:>10.1f} "
+                f"{run['p95_ms']:>8.1f} {run['speedup']:>7.2f}x"
+            )
+
+    TesserocrBackend.engine_pool.close()
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_tesseract_engine()
+
+        results_file = Path("tesseract_engine_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
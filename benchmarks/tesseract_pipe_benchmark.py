@@ -0,0 +1,149 @@
+"""Per-page overhead of handing a rendered page to tesseract, with temporary files and over pipes.
+
+The temporary-file path is the one the tesseract backend used to take: the page is PNG-encoded to hash it for the
+OCR cache, PNG-encoded again into a temporary image file, and the text is written by tesseract to a temporary text
+file and read back. The piped path encodes the page once, as uncompressed PNM, hashes those bytes and pipes them to
+``tesseract stdin stdout``.
+
+The overhead is measured without tesseract, as the encoding, hashing and file operations of each path. If
+tesseract is installed, the complete per-page latency of both paths is measured as well.
+"""
+
+import hashlib
+import io
+import json
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import pypdfium2
+from kreuzberg._ocr._tesseract import _encode_image
+from PIL.Image import Image
+
+SOURCE_PDF = (
+    Path(__file__).parent.parent / "tests" / "test_source_files" / "test-article.pdf"
+)
+PAGE_COUNT = 4
+ITERATIONS = 5
+TESSERACT_COMMAND = ["-l", "eng", "--psm", "3", "--oem", "1", "--loglevel", "OFF"]
+
+
+def build_pages(page_count: int) -> list[Image]:
+    document = pypdfium2.PdfDocument(str(SOURCE_PDF))
+    pages = []
+    for page_index in range(min(page_count, len(document))):
+        page = document[page_index]
+        pages.append(page.render(scale=300 / 72).to_pil().convert("RGB"))
+        page.close()
+    document.close()
+    return pages
+
+
+def encode_png(image: Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def temp_file_overhead(image: Image, run_tesseract: bool) -> None:
+    hashlib.sha256(encode_png(image)).hexdigest()
+    with tempfile.TemporaryDirectory() as directory:
+        image_path = Path(directory) / "page.png"
+        output_base = Path(directory) / "page"
+        image.save(image_path, format="PNG")
+        if run_tesseract:
+            subprocess.run(
+                ["tesseract", str(image_path), str(output_base), *TESSERACT_COMMAND],
+                check=True,
+                capture_output=True,
+            )
+        else:
+            output_base.with_suffix(".txt").write_text("")
+        output_base.with_suffix(".txt").read_text("utf-8")
+
+
+def piped_overhead(image: Image, run_tesseract: bool) -> None:
+    image_content = _encode_image(image)
+    hashlib.sha256(image_content).hexdigest()
+    if run_tesseract:
+        subprocess.run(
+            ["tesseract", "stdin", "stdout", *TESSERACT_COMMAND],
+            check=True,
+            capture_output=True,
+            input=image_content,
+        )
+
+
+def measure(path: Any, pages: list[Image], run_tesseract: bool) -> dict[str, Any]:
+    path(pages[0], run_tesseract)
+
+    latencies = []
+    for _ in range(ITERATIONS):
+        for image in pages:
+            start = time.perf_counter()
+            path(image, run_tesseract)
+            latencies.append(time.perf_counter() - start)
+
+    return {
+        "pages": len(pages),
+        "median_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1] * 1000,
+    }
+
+
+def benchmark_tesseract_pipe() -> dict[str, Any]:
+    print("🔬 TESSERACT PIPE OVERHEAD BENCHMARK")
+    print(f"Pages: {PAGE_COUNT}, iterations: {ITERATIONS}")
+    print("=" * 60)
+    print(f"{'Scope':<10} {'Path':<10} {'Median ms':>10} {'p95 ms':>8} {'Speedup':>8}")
+
+    pages = build_pages(PAGE_COUNT)
+    scopes = {"overhead": False}
+    if shutil.which("tesseract"):
+        scopes["ocr"] = True
+
+    results: dict[str, Any] = {
+        "png_bytes": len(encode_png(pages[0])),
+        "pnm_bytes": len(_encode_image(pages[0])),
+        "runs": {},
+    }
+    for scope, run_tesseract in scopes.items():
+        results["runs"][scope] = {}
+        baseline = None
+        for name, path in {
+            "temp_file": temp_file_overhead,
+            "piped": piped_overhead,
+        }.items():
+            run = measure(path, pages, run_tesseract)
+            baseline = baseline or run["median_ms"]
+            run["speedup"] = baseline / run["median_ms"]
+            results["runs"][scope][name] = run
+            print(
+                f"{scope:<10} {name:<10} {run['median_ms']:>10.1f} "
+                f"{run['p95_ms']:>8.1f} {run['speedup']:>7.2f}x"
+            )
+
+    if "ocr" not in scopes:
+        print(f"{'ocr':<10} {'-':<10} {'unavailable':>10}")
+    return results
+
+
+if __name__ == "__main__":
+    try:
+        results = benchmark_tesseract_pipe()
+
+        results_file = Path("tesseract_pipe_benchmark_results.json")
+        with results_file.open("w") as f:
+            json.dump(results, f, indent=2, default=str)
+
+        print(f"\n💾 Results saved to {results_file}")
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        import traceback
+
+        traceback.print_exc()
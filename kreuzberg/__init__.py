@@ -6,11 +6,16 @@ from kreuzberg._gmft import GMFTConfig
 from kreuzberg._language_detection import LanguageDetectionConfig
 from kreuzberg._ocr._easyocr import EasyOCRConfig
 from kreuzberg._ocr._paddleocr import PaddleOCRConfig
+from kreuzberg._ocr._prepass import OCRPrepassConfig
+from kreuzberg._ocr._preprocessing import ImagePreprocessingConfig
 from kreuzberg._ocr._tesseract import TesseractConfig
+from kreuzberg._pdf_probe import PDFClassification, PDFPageClassification, classify_pdf, classify_pdf_sync
+from kreuzberg._pdf_render import PDFRenderConfig
 
 from ._ocr._tesseract import PSMMode
 from ._registry import ExtractorRegistry
 from ._types import Entity, ExtractionConfig, ExtractionResult, Metadata, TableData
+from ._warmup import warmup, warmup_sync
 from .exceptions import KreuzbergError, MissingDependencyError, OCRError, ParsingError, ValidationError
 from .extraction import (
     batch_extract_bytes,
@@ -20,6 +25,7 @@ from .extraction import (
     extract_bytes,
     extract_bytes_sync,
     extract_file,
+    extract_file_stream,
     extract_file_sync,
 )
 
@@ -32,11 +38,16 @@ __all__ = [
     "ExtractionResult",
     "ExtractorRegistry",
     "GMFTConfig",
+    "ImagePreprocessingConfig",
     "KreuzbergError",
     "LanguageDetectionConfig",
     "Metadata",
     "MissingDependencyError",
     "OCRError",
+    "OCRPrepassConfig",
+    "PDFClassification",
+    "PDFPageClassification",
+    "PDFRenderConfig",
     "PSMMode",
     "PaddleOCRConfig",
     "ParsingError",
@@ -49,11 +60,16 @@ __all__ = [
     "batch_extract_bytes_sync",
     "batch_extract_file",
     "batch_extract_file_sync",
+    "classify_pdf",
+    "classify_pdf_sync",
     "discover_and_load_config",
     "extract_bytes",
     "extract_bytes_sync",
     "extract_file",
+    "extract_file_stream",
     "extract_file_sync",
     "load_config_from_path",
     "try_discover_config",
+    "warmup",
+    "warmup_sync",
 ]
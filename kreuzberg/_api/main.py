@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from json import dumps
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -13,6 +14,7 @@ from kreuzberg import (
     ParsingError,
     ValidationError,
     batch_extract_bytes,
+    warmup,
 )
 from kreuzberg._config import try_discover_config
 
@@ -98,8 +100,24 @@ async def get_configuration() -> dict[str, Any]:
     }
 
 
+async def warmup_on_startup(app: Litestar) -> None:
+    """Load the OCR backend and models of the discovered configuration before serving, if enabled.
+
+    Enabled by setting the environment variable KREUZBERG_WARMUP to true. The load time of every component is
+    logged and kept in the application state as ``warmup_timings``.
+    """
+    if os.environ.get("KREUZBERG_WARMUP", "false").lower() not in ("true", "1", "yes"):
+        return
+
+    timings = await warmup(try_discover_config() or ExtractionConfig())
+    app.state.warmup_timings = timings
+    if app.logger:
+        app.logger.info("Warm-up complete", timings=timings)
+
+
 app = Litestar(
     route_handlers=[handle_files_upload, health_check, get_configuration],
+    on_startup=[warmup_on_startup],
     plugins=[OpenTelemetryPlugin(OpenTelemetryConfig())],
     logging_config=StructLoggingConfig(),
     exception_handlers={
@@ -19,7 +19,10 @@ else:
 from kreuzberg._gmft import GMFTConfig
 from kreuzberg._ocr._easyocr import EasyOCRConfig
 from kreuzberg._ocr._paddleocr import PaddleOCRConfig
+from kreuzberg._ocr._prepass import OCRPrepassConfig
+from kreuzberg._ocr._preprocessing import ImagePreprocessingConfig
 from kreuzberg._ocr._tesseract import TesseractConfig
+from kreuzberg._pdf_render import PDFRenderConfig
 from kreuzberg._types import ExtractionConfig, OcrBackendType
 from kreuzberg.exceptions import ValidationError
 
@@ -84,20 +87,26 @@ def parse_ocr_backend_config(
     Returns:
         Backend-specific configuration object or None.
     """
-    if backend not in config_dict:
+    # The tesserocr backend is configured by the tesseract section, as it shares its configuration  # ~keep
+    section = "tesseract" if backend == "tesserocr" else backend
+    if section not in config_dict:
         return None
 
-    backend_config = config_dict[backend]
+    backend_config = config_dict[section]
     if not isinstance(backend_config, dict):
         return None
 
-    if backend == "tesseract":
+    if section == "tesseract":
         # Convert psm integer to PSMMode enum if needed
         processed_config = backend_config.copy()
         if "psm" in processed_config and isinstance(processed_config["psm"], int):
             from kreuzberg._ocr._tesseract import PSMMode  # noqa: PLC0415
 
             processed_config["psm"] = PSMMode(processed_config["psm"])
+        if isinstance(processed_config.get("preprocessing"), dict):
+            processed_config["preprocessing"] = ImagePreprocessingConfig(**processed_config["preprocessing"])
+        if isinstance(processed_config.get("prepass"), dict):
+            processed_config["prepass"] = OCRPrepassConfig(**processed_config["prepass"])
         return TesseractConfig(**processed_config)
     if backend == "easyocr":
         return EasyOCRConfig(**backend_config)
@@ -120,11 +129,25 @@ def build_extraction_config_from_dict(config_dict: dict[str, Any]) -> Extraction
     # Copy basic configuration fields using dictionary comprehension
     basic_fields = {
         "force_ocr",
+        "ocr_fallback_mode",
+        "ocr_embedded_images",
+        "pdf_metadata_fields",
         "chunk_content",
         "extract_tables",
         "max_chars",
         "max_overlap",
         "ocr_backend",
+        "ocr_max_rendered_pages",
+        "ocr_tile_min_pixels",
+        "ocr_tile_overlap",
+        "ocr_tile_max_workers",
+        "page_range",
+        "max_pages",
+        "document_timeout",
+        "parallel_pdf_text_min_pages",
+        "parallel_pdf_text_min_pages_per_process",
+        "parallel_playa_min_pages",
+        "parallel_playa_max_workers",
         "extract_entities",
         "extract_keywords",
         "auto_detect_language",
@@ -143,6 +166,10 @@ def build_extraction_config_from_dict(config_dict: dict[str, Any]) -> Extraction
     if extraction_config.get("extract_tables") and "gmft" in config_dict and isinstance(config_dict["gmft"], dict):
         extraction_config["gmft_config"] = GMFTConfig(**config_dict["gmft"])
 
+    # Handle PDF render configuration for OCR
+    if "pdf_render" in config_dict and isinstance(config_dict["pdf_render"], dict):
+        extraction_config["pdf_render_config"] = PDFRenderConfig(**config_dict["pdf_render"])
+
     # Convert "none" to None for ocr_backend
     if extraction_config.get("ocr_backend") == "none":
         extraction_config["ocr_backend"] = None
@@ -277,11 +304,25 @@ def try_discover_config(start_path: Path | str | None = None) -> ExtractionConfi
 # Define common configuration fields to avoid repetition
 _CONFIG_FIELDS = [
     "force_ocr",
+    "ocr_fallback_mode",
+    "ocr_embedded_images",
+    "pdf_metadata_fields",
     "chunk_content",
     "extract_tables",
     "max_chars",
     "max_overlap",
     "ocr_backend",
+    "ocr_max_rendered_pages",
+    "ocr_tile_min_pixels",
+    "ocr_tile_overlap",
+    "ocr_tile_max_workers",
+    "page_range",
+    "max_pages",
+    "document_timeout",
+    "parallel_pdf_text_min_pages",
+    "parallel_pdf_text_min_pages_per_process",
+    "parallel_playa_min_pages",
+    "parallel_playa_max_workers",
     "extract_entities",
     "extract_keywords",
     "auto_detect_language",
@@ -310,12 +351,12 @@ def _build_ocr_config_from_cli(
     ocr_backend: str, cli_args: MutableMapping[str, Any]
 ) -> TesseractConfig | EasyOCRConfig | PaddleOCRConfig | None:
     """Build OCR config from CLI arguments."""
-    config_key = f"{ocr_backend}_config"
+    config_key = "tesseract_config" if ocr_backend == "tesserocr" else f"{ocr_backend}_config"
     if not cli_args.get(config_key):
         return None
 
     backend_args = cli_args[config_key]
-    if ocr_backend == "tesseract":
+    if ocr_backend in {"tesseract", "tesserocr"}:
         return TesseractConfig(**backend_args)
     if ocr_backend == "easyocr":
         return EasyOCRConfig(**backend_args)
@@ -362,6 +403,22 @@ def _configure_gmft(
         config_dict["gmft_config"] = gmft_config
 
 
+def _configure_pdf_render(
+    config_dict: dict[str, Any],
+    file_config: dict[str, Any],
+    cli_args: MutableMapping[str, Any],
+) -> None:
+    """Configure PDF rendering for OCR in config dictionary."""
+    pdf_render_config = None
+    if cli_args.get("pdf_render_config"):
+        pdf_render_config = PDFRenderConfig(**cli_args["pdf_render_config"])
+    elif "pdf_render" in file_config and isinstance(file_config["pdf_render"], dict):
+        pdf_render_config = PDFRenderConfig(**file_config["pdf_render"])
+
+    if pdf_render_config:
+        config_dict["pdf_render_config"] = pdf_render_config
+
+
 def build_extraction_config(
     file_config: dict[str, Any],
     cli_args: MutableMapping[str, Any],
@@ -384,6 +441,7 @@ def build_extraction_config(
     # Configure complex components
     _configure_ocr_backend(config_dict, file_config, cli_args)
     _configure_gmft(config_dict, file_config, cli_args)
+    _configure_pdf_render(config_dict, file_config, cli_args)
 
     # Convert "none" to None for ocr_backend
     if config_dict.get("ocr_backend") == "none":
@@ -148,8 +148,14 @@ def classify_document_from_layout(
 def auto_detect_document_type(
     result: ExtractionResult, config: ExtractionConfig, file_path: Path | None = None
 ) -> ExtractionResult:
-    if config.document_classification_mode == "vision" and file_path:
-        layout_result = get_ocr_backend("tesseract").process_file_sync(file_path, **config.get_config_dict())
+    if config.document_classification_mode == "vision" and result.layout is not None:
+        result.document_type, result.document_type_confidence = classify_document_from_layout(result, config)
+    elif config.document_classification_mode == "vision" and file_path:
+        # The extraction did not run Tesseract with layout output, e.g. because another OCR backend is configured
+        ocr_config = config.get_config_dict() if config.ocr_backend in {"tesseract", "tesserocr"} else {}
+        layout_result = get_ocr_backend("tesseract").process_file_sync(
+            file_path, **{**ocr_config, "include_layout": True}
+        )
         result.document_type, result.document_type_confidence = classify_document_from_layout(layout_result, config)
     else:
         result.document_type, result.document_type_confidence = classify_document(result, config)
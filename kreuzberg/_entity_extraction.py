@@ -193,6 +193,33 @@ def _load_spacy_model(model_name: str, spacy_config: SpacyEntityExtractionConfig
         return None
 
 
+def load_entity_model(spacy_config: SpacyEntityExtractionConfig | None = None) -> None:
+    """Load the spaCy model that entity extraction uses for text of unknown language.
+
+    Args:
+        spacy_config: Configuration for spaCy entity extraction.
+
+    Raises:
+        MissingDependencyError: If `spacy` or the spaCy model is not installed.
+    """
+    spacy_config = spacy_config or SpacyEntityExtractionConfig()
+    try:
+        import spacy  # noqa: F401, PLC0415
+    except ImportError as e:
+        raise MissingDependencyError.create_for_package(
+            package_name="spacy",
+            dependency_group="entity-extraction",
+            functionality="Entity Extraction",
+        ) from e
+
+    model_name = _select_spacy_model(None, spacy_config)
+    if model_name and _load_spacy_model(model_name, spacy_config) is None:
+        raise MissingDependencyError(
+            f"The spaCy model '{model_name}' is required to use Entity Extraction. You can install it using "
+            f"`python -m spacy download {model_name}`."
+        )
+
+
 def _select_spacy_model(languages: list[str] | None, spacy_config: SpacyEntityExtractionConfig) -> str | None:
     """Select the best spaCy model based on detected languages."""
     if not languages:
@@ -236,3 +263,21 @@ def extract_keywords(
             dependency_group="entity-extraction",
             functionality="Keyword Extraction",
         ) from e
+
+
+def load_keyword_model() -> None:
+    """Load the KeyBERT model, downloading its embedding model if it is not cached yet.
+
+    Raises:
+        MissingDependencyError: If `keybert` is not installed.
+    """
+    try:
+        from keybert import KeyBERT  # noqa: PLC0415
+    except ImportError as e:
+        raise MissingDependencyError.create_for_package(
+            package_name="keybert",
+            dependency_group="entity-extraction",
+            functionality="Keyword Extraction",
+        ) from e
+
+    KeyBERT()
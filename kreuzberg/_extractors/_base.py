@@ -7,6 +7,7 @@ from kreuzberg._types import ExtractionResult, normalize_metadata
 from kreuzberg._utils._quality import calculate_quality_score, clean_extracted_text
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
     from pathlib import Path
 
     from kreuzberg._types import ExtractionConfig
@@ -79,6 +80,20 @@ class Extractor(ABC):
             ExtractionResult: The extracted content along with metadata about the extraction.
         """
 
+    async def extract_path_stream_async(self, path: Path) -> AsyncGenerator[ExtractionResult, None]:
+        """Asynchronously extract content from a file, yielding results as they become available.
+
+        The default implementation yields a single result for the whole file. Extractors for paged
+        formats override this to yield one result per page as soon as that page is ready.
+
+        Args:
+            path: The path to the file to process.
+
+        Yields:
+            ExtractionResult: The extracted content along with metadata about the extraction.
+        """
+        yield await self.extract_path_async(path)
+
     @classmethod
     def supports_mimetype(cls, mime_type: str) -> bool:
         """Verify whether the extractor supports the given MIME type.
@@ -127,4 +142,5 @@ class Extractor(ABC):
             chunks=result.chunks,
             detected_languages=result.detected_languages,
             tables=result.tables,
+            layout=result.layout,
         )
@@ -3,25 +3,32 @@ from __future__ import annotations
 import contextlib
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from io import BytesIO
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from anyio import Path as AsyncPath
+from PIL import Image
 
 from kreuzberg._extractors._base import Extractor
-from kreuzberg._mime_types import IMAGE_MIME_TYPES
+from kreuzberg._mime_types import IMAGE_MIME_TYPES, PLAIN_TEXT_MIME_TYPE
 from kreuzberg._ocr import get_ocr_backend
 from kreuzberg._ocr._easyocr import EasyOCRConfig
 from kreuzberg._ocr._paddleocr import PaddleOCRConfig
-from kreuzberg._ocr._tesseract import TesseractConfig
+from kreuzberg._ocr._tiling import ImageBand, merge_band_layouts, merge_band_texts, split_into_bands
+from kreuzberg._types import ExtractionResult, Metadata
+from kreuzberg._utils._sync import run_sync, run_taskgroup
 from kreuzberg._utils._tmp import create_temp_file
 from kreuzberg.exceptions import ValidationError
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Mapping
 
-    from kreuzberg._types import ExtractionResult
+    from PIL.Image import Image as PILImage
+
+    from kreuzberg._ocr._base import OCRBackend
 
 
 class ImageExtractor(Extractor):
@@ -49,34 +56,78 @@ class ImageExtractor(Extractor):
     }
 
     async def extract_bytes_async(self, content: bytes) -> ExtractionResult:
-        extension = self._get_extension_from_mime_type(self.mime_type)
-        file_path, unlink = await create_temp_file(f".{extension}")
-        await AsyncPath(file_path).write_bytes(content)
+        if self.config.ocr_backend is None:
+            raise ValidationError("ocr_backend is None, cannot perform OCR")
+
+        if (image := await run_sync(self._open_image, content)) is None:
+            # Pillow cannot decode every format the OCR backends accept, so these still go through a file
+            extension = self._get_extension_from_mime_type(self.mime_type)
+            file_path, unlink = await create_temp_file(f".{extension}", content)
+            try:
+                return await self.extract_path_async(file_path)
+            finally:
+                await unlink()
+
+        backend = get_ocr_backend(self.config.ocr_backend)
+        config_kwargs = self._get_config_kwargs()
         try:
-            return await self.extract_path_async(file_path)
+            if frames := await run_sync(self._load_selected_frames, image):
+                results = [await self._process_image(backend, frame, config_kwargs) for frame in frames]
+                result = self._join_frame_results(results)
+            else:
+                result = await self._process_image(backend, image, config_kwargs)
         finally:
-            await unlink()
+            image.close()
+        return self._apply_quality_processing(result)
 
     async def extract_path_async(self, path: Path) -> ExtractionResult:
         if self.config.ocr_backend is None:
             raise ValidationError("ocr_backend is None, cannot perform OCR")
 
-        result = await get_ocr_backend(self.config.ocr_backend).process_file(path, **self.config.get_config_dict())
+        backend = get_ocr_backend(self.config.ocr_backend)
+        config_kwargs = self._get_config_kwargs()
+        if frames := await run_sync(self._load_selected_frames_from_path, path):
+            results = [await self._process_image(backend, frame, config_kwargs) for frame in frames]
+            result = self._join_frame_results(results)
+        elif (image := await run_sync(self._open_oversized_image, path)) is not None:
+            try:
+                result = await self._process_image(backend, image, config_kwargs)
+            finally:
+                image.close()
+        else:
+            result = await backend.process_file(path, **config_kwargs)
         return self._apply_quality_processing(result)
 
     def extract_bytes_sync(self, content: bytes) -> ExtractionResult:
         """Pure sync implementation of extract_bytes."""
-        extension = self._get_extension_from_mime_type(self.mime_type)
-        fd, temp_path = tempfile.mkstemp(suffix=f".{extension}")
+        if self.config.ocr_backend is None:
+            raise ValidationError("ocr_backend is None, cannot perform OCR")
 
-        try:
-            with os.fdopen(fd, "wb") as f:
-                f.write(content)
+        if (image := self._open_image(content)) is None:
+            # Pillow cannot decode every format the OCR backends accept, so these still go through a file
+            extension = self._get_extension_from_mime_type(self.mime_type)
+            fd, temp_path = tempfile.mkstemp(suffix=f".{extension}")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+
+                return self.extract_path_sync(Path(temp_path))
+            finally:
+                with contextlib.suppress(OSError):
+                    Path(temp_path).unlink()
 
-            return self.extract_path_sync(Path(temp_path))
+        backend = get_ocr_backend(self.config.ocr_backend)
+        config_kwargs = self._get_sync_config_kwargs()
+        try:
+            if frames := self._load_selected_frames(image):
+                result = self._join_frame_results(
+                    [self._process_image_sync(backend, frame, config_kwargs) for frame in frames]
+                )
+            else:
+                result = self._process_image_sync(backend, image, config_kwargs)
         finally:
-            with contextlib.suppress(OSError):
-                Path(temp_path).unlink()
+            image.close()
+        return self._apply_quality_processing(result)
 
     def extract_path_sync(self, path: Path) -> ExtractionResult:
         """Pure sync implementation of extract_path."""
@@ -84,25 +135,215 @@ class ImageExtractor(Extractor):
             raise ValidationError("ocr_backend is None, cannot perform OCR")
 
         backend = get_ocr_backend(self.config.ocr_backend)
+        config_kwargs = self._get_sync_config_kwargs()
 
-        if self.config.ocr_backend == "tesseract":
-            config = (
-                self.config.ocr_config if isinstance(self.config.ocr_config, TesseractConfig) else TesseractConfig()
+        if frames := self._load_selected_frames_from_path(path):
+            result = self._join_frame_results(
+                [self._process_image_sync(backend, frame, config_kwargs) for frame in frames]
             )
-            result = backend.process_file_sync(path, **asdict(config))
+        elif (image := self._open_oversized_image(path)) is not None:
+            try:
+                result = self._process_image_sync(backend, image, config_kwargs)
+            finally:
+                image.close()
+        else:
+            result = backend.process_file_sync(path, **config_kwargs)
+        return self._apply_quality_processing(result)
+
+    async def _process_image(
+        self, backend: OCRBackend[Any], image: PILImage, config_kwargs: dict[str, Any]
+    ) -> ExtractionResult:
+        """OCR an image, in overlapping bands recognised concurrently if it is larger than 'ocr_tile_min_pixels'."""
+        if (band_count := self._get_band_count(image)) < 2:
+            return await backend.process_image(image, **config_kwargs)
+
+        bands = await run_sync(split_into_bands, image, band_count, self.config.ocr_tile_overlap)
+        results = await run_taskgroup(*(backend.process_image(band.image, **config_kwargs) for band in bands))
+        return self._join_band_results(bands, results)
+
+    def _process_image_sync(
+        self, backend: OCRBackend[Any], image: PILImage, config_kwargs: dict[str, Any]
+    ) -> ExtractionResult:
+        """OCR an image, in overlapping bands recognised in worker threads if it is larger than 'ocr_tile_min_pixels'.
+
+        The OCR backends release the GIL while recognising, either waiting for a tesseract process or in native code.
+        """
+        if (band_count := self._get_band_count(image)) < 2:
+            return backend.process_image_sync(image, **config_kwargs)
+
+        bands = split_into_bands(image, band_count, self.config.ocr_tile_overlap)
+        with ThreadPoolExecutor(max_workers=len(bands)) as executor:
+            results = list(executor.map(lambda band: backend.process_image_sync(band.image, **config_kwargs), bands))
+        return self._join_band_results(bands, results)
+
+    def _get_band_count(self, image: PILImage) -> int:
+        """Get the number of bands an image is OCR'd in, or 1 if it is OCR'd as a whole.
+
+        Every band is at least four times as high as the overlap of the bands, so that the overlaps stay a small part
+        of the work.
+        """
+        min_pixels = self.config.ocr_tile_min_pixels
+        if min_pixels is None or image.width * image.height < min_pixels:
+            return 1
+        max_workers = self.config.ocr_tile_max_workers or cpu_count()
+        return max(1, min(max_workers, image.height // (4 * self.config.ocr_tile_overlap)))
+
+    def _open_oversized_image(self, path: Path) -> PILImage | None:
+        """Open an image file if it is large enough to be OCR'd in bands, reading only its header to find out.
+
+        Returns:
+            The lazily decoded image, or None if it is OCR'd as a whole, Pillow cannot read the format, or the image
+            exceeds Pillow's decompression bomb limit, in which case the OCR backend reads the file itself.
+        """
+        if self.config.ocr_tile_min_pixels is None:
+            return None
+        try:
+            image = Image.open(path)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return None
+        if self._get_band_count(image) < 2:
+            image.close()
+            return None
+        return image
+
+    def _get_config_kwargs(self) -> dict[str, Any]:
+        """Get the keyword arguments of the configured OCR backend.
+
+        If the document type is classified from the OCR layout, Tesseract is asked for the layout of the words in
+        the same pass, so the classification does not OCR the image again.
+        """
+        config_kwargs = self.config.get_config_dict()
+        if (
+            self.config.ocr_backend in {"tesseract", "tesserocr"}
+            and self.config.auto_detect_document_type
+            and self.config.document_classification_mode == "vision"
+        ):
+            config_kwargs["include_layout"] = True
+        return config_kwargs
+
+    def _get_sync_config_kwargs(self) -> dict[str, Any]:
+        """Get the keyword arguments of the configured OCR backend for the sync backend methods."""
+        if self.config.ocr_backend in {"tesseract", "tesserocr"}:
+            config_kwargs = self._get_config_kwargs()
         elif self.config.ocr_backend == "paddleocr":
             paddle_config = (
                 self.config.ocr_config if isinstance(self.config.ocr_config, PaddleOCRConfig) else PaddleOCRConfig()
             )
-            result = backend.process_file_sync(path, **asdict(paddle_config))
+            config_kwargs = asdict(paddle_config)
         elif self.config.ocr_backend == "easyocr":
             easy_config = (
                 self.config.ocr_config if isinstance(self.config.ocr_config, EasyOCRConfig) else EasyOCRConfig()
             )
-            result = backend.process_file_sync(path, **asdict(easy_config))
+            config_kwargs = asdict(easy_config)
         else:
             raise NotImplementedError(f"Sync OCR not implemented for {self.config.ocr_backend}")
-        return self._apply_quality_processing(result)
+        return config_kwargs
+
+    @staticmethod
+    def _open_image(content: bytes) -> PILImage | None:
+        """Open image bytes in memory.
+
+        Args:
+            content: The content of the image file.
+
+        Returns:
+            The lazily decoded image, or None if Pillow cannot read the format or the image exceeds Pillow's
+            decompression bomb limit.
+        """
+        try:
+            return Image.open(BytesIO(content))
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return None
+
+    def _load_selected_frames_from_path(self, path: Path) -> list[PILImage]:
+        """Load the frames of a multi-page image file selected by 'page_range' and 'max_pages'.
+
+        Files whose frames exceed Pillow's decompression bomb limit are left to the OCR backend.
+        """
+        if self.config.page_range is None and self.config.max_pages is None:
+            return []
+
+        try:
+            with Image.open(path) as image:
+                return self._load_selected_frames(image)
+        except Image.DecompressionBombError:
+            return []
+
+    def _load_selected_frames(self, image: PILImage) -> list[PILImage]:
+        """Load the frames of a multi-page image selected by 'page_range' and 'max_pages'.
+
+        Args:
+            image: The opened image.
+
+        Returns:
+            The selected frames, all frames if no page selection is configured, or an empty list if the image has
+            a single frame.
+        """
+        frame_count = getattr(image, "n_frames", 1)
+        if frame_count <= 1:
+            return []
+
+        frames = []
+        for index in self.config.get_page_indices(frame_count):
+            image.seek(index)
+            frames.append(image.copy())
+        return frames
+
+    @classmethod
+    def _join_frame_results(cls, results: list[ExtractionResult]) -> ExtractionResult:
+        """Combine the OCR results of individual frames into a single result.
+
+        The OCR layouts of the frames, if any, are concatenated with the page number set to the position of the frame.
+        """
+        layout = None
+        if layouts := [
+            result.layout.assign(page_num=i + 1) for i, result in enumerate(results) if result.layout is not None
+        ]:
+            import pandas as pd  # noqa: PLC0415
+
+            layout = pd.concat(layouts, ignore_index=True).astype({"page_num": "int32"})
+
+        return ExtractionResult(
+            content="\n".join(result.content for result in results),
+            mime_type=PLAIN_TEXT_MIME_TYPE,
+            metadata=cls._join_metadata(results),
+            chunks=[],
+            layout=layout,
+        )
+
+    @classmethod
+    def _join_band_results(cls, bands: list[ImageBand], results: list[ExtractionResult]) -> ExtractionResult:
+        """Combine the OCR results of the overlapping bands of an image into a single result.
+
+        The lines of text and the words of the OCR layouts recognised in two bands are kept once.
+        """
+        layout = None
+        if all(result.layout is not None for result in results):
+            layout = merge_band_layouts(bands, [result.layout for result in results])
+
+        return ExtractionResult(
+            content=merge_band_texts([result.content for result in results]),
+            mime_type=PLAIN_TEXT_MIME_TYPE,
+            metadata=cls._join_metadata(results),
+            chunks=[],
+            layout=layout,
+        )
+
+    @staticmethod
+    def _join_metadata(results: list[ExtractionResult]) -> Metadata:
+        """Combine the OCR metadata of several images, concatenating pre-pass results and summing preprocessing timings."""
+        metadata: Metadata = {}
+        timings: dict[str, float] = {}
+        for result in results:
+            for step, seconds in result.metadata.get("preprocessing_timings", {}).items():
+                timings[step] = timings.get(step, 0.0) + seconds
+            if "ocr_rotations" in result.metadata:
+                metadata.setdefault("ocr_rotations", []).extend(result.metadata["ocr_rotations"])
+            if "ocr_languages" in result.metadata:
+                metadata.setdefault("ocr_languages", []).extend(result.metadata["ocr_languages"])
+        if timings:
+            metadata["preprocessing_timings"] = timings
+        return metadata
 
     def _get_extension_from_mime_type(self, mime_type: str) -> str:
         if mime_type in self.IMAGE_MIME_TYPE_EXT_MAP:
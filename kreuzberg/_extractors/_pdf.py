@@ -4,16 +4,16 @@ import contextlib
 import os
 import tempfile
 from dataclasses import asdict
+from functools import partial
 from multiprocessing import cpu_count
 from pathlib import Path
 from re import Pattern
 from re import compile as compile_regex
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, ClassVar, Literal, cast
 
 import anyio
 import pypdfium2
-from anyio import Path as AsyncPath
-from playa import parse
+import pypdfium2.raw as pdfium_c
 
 from kreuzberg._extractors._base import Extractor
 from kreuzberg._mime_types import PDF_MIME_TYPE, PLAIN_TEXT_MIME_TYPE
@@ -21,18 +21,26 @@ from kreuzberg._ocr import get_ocr_backend
 from kreuzberg._ocr._easyocr import EasyOCRConfig
 from kreuzberg._ocr._paddleocr import PaddleOCRConfig
 from kreuzberg._ocr._tesseract import TesseractConfig
-from kreuzberg._playa import extract_pdf_metadata, extract_pdf_metadata_sync
-from kreuzberg._types import ExtractionResult, OcrBackendType
+from kreuzberg._pdf_probe import classify_pdf_document
+from kreuzberg._pdf_render import render_pdf_page
+from kreuzberg._playa import extract_pdf_metadata_from_document
+from kreuzberg._types import ExtractionResult, Metadata, OcrBackendType
+from kreuzberg._utils._deadline import get_deadline, skip_if_expired
 from kreuzberg._utils._errors import create_error_context, should_retry
-from kreuzberg._utils._pdf_lock import pypdfium_file_lock
+from kreuzberg._utils._pdf_document import PDFDocumentContext
+from kreuzberg._utils._pdf_lock import pypdfium_file_lock, run_sync_with_pypdfium_file_lock
+from kreuzberg._utils._process_pool import extract_pdf_text_in_processes
 from kreuzberg._utils._string import normalize_spaces
-from kreuzberg._utils._sync import run_sync, run_taskgroup_batched
+from kreuzberg._utils._sync import run_sync, run_taskgroup_until_deadline
 from kreuzberg._utils._table import generate_table_summary
-from kreuzberg._utils._tmp import create_temp_file
 from kreuzberg.exceptions import ParsingError
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncGenerator
+
     from PIL.Image import Image
+    from playa.document import Document
+    from playa.page import Page
 
 
 class PDFExtractor(Extractor):
@@ -40,49 +48,70 @@ class PDFExtractor(Extractor):
     CORRUPTED_PATTERN: ClassVar[Pattern[str]] = compile_regex(r"[\x00-\x08\x0B-\x0C\x0E-\x1F]|\uFFFD")
     SHORT_TEXT_THRESHOLD: ClassVar[int] = 50
     MINIMUM_CORRUPTED_RESULTS: ClassVar[int] = 2
+    MIN_EMBEDDED_IMAGE_SIZE: ClassVar[int] = 32
 
     async def extract_bytes_async(self, content: bytes) -> ExtractionResult:
-        file_path, unlink = await create_temp_file(".pdf")
-        await AsyncPath(file_path).write_bytes(content)
-        try:
-            metadata = await extract_pdf_metadata(content)
-            result = await self.extract_path_async(file_path)
-
-            result.metadata = metadata
-            return result
-        finally:
-            await unlink()
+        async with PDFDocumentContext(None, content) as document:
+            return await self._extract_document_async(document)
 
     async def extract_path_async(self, path: Path) -> ExtractionResult:
-        content_bytes = await AsyncPath(path).read_bytes()
+        async with PDFDocumentContext(path) as document:
+            return await self._extract_document_async(document)
 
+    async def _extract_document_async(self, document: PDFDocumentContext) -> ExtractionResult:
+        """Extract text, metadata and tables from a PDF, reusing the parsed handles of the document context.
+
+        Args:
+            document: The document context of the PDF file.
+
+        Returns:
+            The extraction result.
+        """
         result: ExtractionResult | None = None
+        await run_sync(self._track_deadline_pages, document)
 
-        if not self.config.force_ocr:
+        if not self.config.force_ocr and self.config.ocr_fallback_mode == "page":
+            result = await self._extract_pdf_text_per_page(document)
+        elif not self.config.force_ocr and not (
+            self.config.ocr_backend is not None and await run_sync(self._lacks_text_layer, document)
+        ):
             try:
-                content = await self._extract_pdf_searchable_text(path)
+                content = await self._extract_pdf_searchable_text(document)
                 if self._validate_extracted_text(content):
+                    if self._should_ocr_embedded_images():
+                        content = await self._extract_text_with_embedded_images(document)
                     result = ExtractionResult(content=content, mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[])
             except ParsingError:
                 # If searchable text extraction fails, continue to OCR or empty result
                 pass
 
         if not result and self.config.ocr_backend is not None:
-            result = await self._extract_pdf_text_with_ocr(path, self.config.ocr_backend)
+            result = await self._extract_pdf_text_with_ocr(document, self.config.ocr_backend)
 
         if not result:
             result = ExtractionResult(content="", mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[])
 
-        result.metadata = await extract_pdf_metadata(content_bytes)
+        metadata = await run_sync(self._extract_metadata_sync, document)
+        metadata.update(result.metadata)
+        result.metadata = metadata
 
-        if self.config.extract_tables:
+        if self.config.extract_tables and not skip_if_expired(stage="tables"):
             # GMFT is optional dependency
             try:
                 from kreuzberg._gmft import extract_tables  # noqa: PLC0415
 
-                result.tables = await extract_tables(path, self.config.gmft_config)
+                result.tables = await extract_tables(
+                    await run_sync(document.get_path),
+                    self.config.gmft_config,
+                    page_indices=await self._get_selected_page_indices(document),
+                )
             except ImportError:
                 result.tables = []
+            except ParsingError:
+                # The isolated table extraction times out when the document deadline passes  # ~keep
+                if not skip_if_expired(stage="tables"):
+                    raise
+                result.tables = []
 
             # Enhance metadata with table information
             if result.tables:
@@ -98,53 +127,105 @@ class PDFExtractor(Extractor):
 
         return self._apply_quality_processing(result)
 
+    async def extract_path_stream_async(self, path: Path) -> AsyncGenerator[ExtractionResult, None]:
+        """Extract a PDF page by page, yielding each page's result as soon as it is ready.
+
+        Only a single page's text and rendered image are held at any time, so memory stays bounded
+        regardless of the page count. Pages whose text layer fails validation fall back to OCR when an
+        OCR backend is configured. Once the document deadline passes, the page being extracted is
+        abandoned and the stream ends.
+
+        Args:
+            path: The path to the PDF file.
+
+        Raises:
+            ParsingError: If the PDF file could not be opened.
+
+        Yields:
+            One extraction result per page, with ``page_number`` and ``text_source`` set in its metadata.
+        """
+        async with PDFDocumentContext(path) as document:
+            pdf = await self._open_pdf_document(document)
+            with pypdfium_file_lock(path):
+                page_count = len(pdf)
+
+            page_indices = self.config.get_page_indices(page_count)
+            for position, page_index in enumerate(page_indices):
+                result = None
+                deadline = get_deadline()
+                with anyio.move_on_after(None if deadline is None else deadline.remaining()):
+                    result = await self._extract_page_async(pdf, path, page_index)
+                if result is None:
+                    skip_if_expired(page_indices[position:])
+                    return
+                yield result
+
     def extract_bytes_sync(self, content: bytes) -> ExtractionResult:
         """Pure sync implementation of PDF extraction from bytes."""
-        fd, temp_path = tempfile.mkstemp(suffix=".pdf")
-        try:
-            with os.fdopen(fd, "wb") as f:
-                f.write(content)
+        with PDFDocumentContext(None, content) as document:
+            result = self._extract_document_sync(document)
 
-            result = self.extract_path_sync(Path(temp_path))
-
-            metadata = extract_pdf_metadata_sync(content)
+            metadata = self._extract_metadata_sync(document)
+            metadata.update(result.metadata)
             result.metadata = metadata
 
             return result
-        finally:
-            with contextlib.suppress(OSError):
-                Path(temp_path).unlink()
 
     def extract_path_sync(self, path: Path) -> ExtractionResult:
         """Pure sync implementation of PDF extraction from path."""
-        try:
-            text = self._extract_pdf_searchable_text_sync(path)
-        except ParsingError:
+        with PDFDocumentContext(path) as document:
+            return self._extract_document_sync(document)
+
+    def _extract_document_sync(self, document: PDFDocumentContext) -> ExtractionResult:
+        """Extract text and tables from a PDF, reusing the parsed handles of the document context."""
+        metadata: Metadata = {}
+        self._track_deadline_pages(document)
+        if not self.config.force_ocr and self.config.ocr_fallback_mode == "page":
+            text, metadata = self._extract_pdf_text_per_page_sync(document)
+        else:
             text = ""
+            if self.config.ocr_backend is None or (not self.config.force_ocr and not self._lacks_text_layer(document)):
+                with contextlib.suppress(ParsingError):
+                    text = self._extract_pdf_searchable_text_sync(document)
 
-        if (self.config.force_ocr or not self._validate_extracted_text(text)) and self.config.ocr_backend is not None:
-            text = self._extract_pdf_with_ocr_sync(path)
+            if (
+                self.config.force_ocr or not self._validate_extracted_text(text)
+            ) and self.config.ocr_backend is not None:
+                text, metadata = self._extract_pdf_with_ocr_sync(document)
+            elif self._should_ocr_embedded_images() and self._validate_extracted_text(text):
+                text = self._extract_text_with_embedded_images_sync(document)
 
         tables = []
-        if self.config.extract_tables:
+        if self.config.extract_tables and not skip_if_expired(stage="tables"):
             # GMFT is optional dependency
             try:
                 from kreuzberg._gmft import extract_tables_sync  # noqa: PLC0415
 
-                tables = extract_tables_sync(path)
+                tables = extract_tables_sync(
+                    document.get_path(), page_indices=self._get_selected_page_indices_sync(document)
+                )
             except ImportError:
                 tables = []
+            except ParsingError:
+                # The isolated table extraction times out when the document deadline passes  # ~keep
+                if not skip_if_expired(stage="tables"):
+                    raise
 
         # Use playa for better text structure preservation when not using OCR
-        if not self.config.force_ocr and self._validate_extracted_text(text):
-            text = self._extract_with_playa_sync(path, fallback_text=text)
+        if (
+            not self.config.force_ocr
+            and not metadata.get("ocr_pages")
+            and not self._should_ocr_embedded_images()
+            and self._validate_extracted_text(text)
+        ):
+            text = self._extract_with_playa_sync(document, fallback_text=text)
 
         text = normalize_spaces(text)
 
         result = ExtractionResult(
             content=text,
             mime_type=PLAIN_TEXT_MIME_TYPE,
-            metadata={},
+            metadata=metadata,
             tables=tables,
             chunks=[],
         )
@@ -190,26 +271,74 @@ class PDFExtractor(Extractor):
 
         return (len(corruption_matches) / len(text)) < corruption_threshold
 
-    async def _convert_pdf_to_images(self, input_file: Path) -> list[Image]:
-        """Convert a PDF file to images.
+    def _lacks_text_layer(self, document: PDFDocumentContext) -> bool:
+        """Check with the page-type probe whether none of the selected pages has any text objects.
+
+        Extracting the text layer of such a document can only produce an empty result, so it goes straight to OCR.
+
+        Args:
+            document: The document context of the PDF file.
+
+        Returns:
+            True if the document has selected pages and none of them has a text object.
+        """
+        try:
+            pdf = document.get_pdfium_document()
+        except pypdfium2.PdfiumError:
+            return False
+        with pypdfium_file_lock(document.lock_key):
+            classification = classify_pdf_document(pdf, self.config.get_page_indices(len(pdf)))
+        return bool(classification.pages) and not any(page.text_object_count for page in classification.pages)
+
+    async def _get_selected_page_indices(self, document: PDFDocumentContext) -> list[int] | None:
+        """Get the page indices selected by the configuration, or None if all pages are selected."""
+        return await run_sync(self._get_selected_page_indices_sync, document)
+
+    def _get_selected_page_indices_sync(self, document: PDFDocumentContext) -> list[int] | None:
+        """Get the page indices selected by the configuration, or None if all pages are selected (sync version)."""
+        if self.config.page_range is None and self.config.max_pages is None:
+            return None
+        with contextlib.suppress(pypdfium2.PdfiumError):
+            pdf = document.get_pdfium_document()
+            with pypdfium_file_lock(document.lock_key):
+                return self.config.get_page_indices(len(pdf))
+        return None
+
+    def _track_deadline_pages(self, document: PDFDocumentContext) -> None:
+        """Register the selected pages with the deadline of the extraction, so skipped pages can be reported."""
+        if (deadline := get_deadline()) is None:
+            return
+        with contextlib.suppress(pypdfium2.PdfiumError):
+            pdf = document.get_pdfium_document()
+            with pypdfium_file_lock(document.lock_key):
+                deadline.page_indices = self.config.get_page_indices(len(pdf))
+
+    def _extract_metadata_sync(self, document: PDFDocumentContext) -> Metadata:
+        """Extract the PDF metadata from the shared playa document, with the configured expensive fields.
+
+        Raises:
+            ParsingError: If the PDF metadata could not be extracted.
+        """
+        return extract_pdf_metadata_from_document(document.get_playa_document(), self.config.pdf_metadata_fields)
+
+    async def _open_pdf_for_rendering(self, document: PDFDocumentContext) -> pypdfium2.PdfDocument:
+        """Get the pypdfium2 document for page rendering, retrying transient failures to open it.
 
         Args:
-            input_file: The path to the PDF file.
+            document: The document context of the PDF file.
 
         Raises:
-            ParsingError: If the PDF file could not be converted to images.
+            ParsingError: If the PDF file could not be opened for conversion to images.
 
         Returns:
-            A list of Pillow Images.
+            The shared pypdfium2 document, owned by the document context.
         """
-        document: pypdfium2.PdfDocument | None = None
+        input_file = document.path
         last_error = None
 
         for attempt in range(3):  # Try up to 3 times  # ~keep
             try:
-                with pypdfium_file_lock(input_file):
-                    document = await run_sync(pypdfium2.PdfDocument, str(input_file))
-                    return [page.render(scale=4.25).to_pil() for page in cast("pypdfium2.PdfDocument", document)]
+                return await run_sync(document.get_pdfium_document)
             except pypdfium2.PdfiumError as e:  # noqa: PERF203
                 last_error = e
                 if not should_retry(e, attempt + 1):
@@ -224,10 +353,6 @@ class PDFExtractor(Extractor):
                     ) from e
                 # Wait before retry with exponential backoff  # ~keep
                 await anyio.sleep(0.5 * (attempt + 1))
-            finally:
-                if document:
-                    with pypdfium_file_lock(input_file), contextlib.suppress(Exception):
-                        await run_sync(document.close)
 
         # All retries failed  # ~keep
         raise ParsingError(
@@ -240,33 +365,457 @@ class PDFExtractor(Extractor):
             ),
         ) from last_error
 
-    async def _extract_pdf_text_with_ocr(self, input_file: Path, ocr_backend: OcrBackendType) -> ExtractionResult:
+    async def _extract_pdf_text_with_ocr(
+        self, document: PDFDocumentContext, ocr_backend: OcrBackendType
+    ) -> ExtractionResult:
         """Extract text from a scanned PDF file using OCR.
 
+        Pages are rendered lazily by a producer and handed to concurrent OCR consumers. At most
+        ``ocr_max_rendered_pages`` rendered pages exist at any time; each is released as soon as it is recognised.
+        When the document deadline passes, no further pages are rendered and the running OCR calls are cancelled.
+
         Args:
-            input_file: The path to the PDF file.
+            document: The document context of the PDF file.
             ocr_backend: The OCR backend to use.
 
         Returns:
             The extraction result with text content and metadata.
         """
-        images = await self._convert_pdf_to_images(input_file)
+        from kreuzberg._utils._cache import get_page_cache  # noqa: PLC0415
+
         backend = get_ocr_backend(ocr_backend)
-        ocr_results = await run_taskgroup_batched(
-            *[backend.process_image(image, **self.config.get_config_dict()) for image in images],
-            batch_size=cpu_count(),
-        )
+        config_dict = self.config.get_config_dict()
+        rendered_pages = anyio.Semaphore(self.config.ocr_max_rendered_pages or cpu_count())
+        page_cache = get_page_cache()
+        deadline = get_deadline()
+
+        async def ocr_page(position: int, image: Image) -> None:
+            try:
+                result = await backend.process_image(image, **config_dict)
+                page_contents[position] = result.content
+                completed.add(position)
+                if (cache_kwargs := page_cache_keys.get(position)) is not None:
+                    await page_cache.aset(result, **cache_kwargs)
+            finally:
+                image.close()
+                rendered_pages.release()
+
+        input_file = document.lock_key
+        pdf = await self._open_pdf_for_rendering(document)
+        with pypdfium_file_lock(input_file):
+            page_indices = self.config.get_page_indices(len(pdf))
+        cached_pages, page_cache_keys = await run_sync(self._lookup_page_cache, document, page_indices)
+        page_contents = [cached_pages.get(position, "") for position in range(len(page_indices))]
+        completed = set(cached_pages)
+
+        with anyio.move_on_after(None if deadline is None else deadline.remaining()):
+            async with anyio.create_task_group() as tg:
+                for position, page_index in enumerate(page_indices):
+                    if position in cached_pages:
+                        continue
+                    await rendered_pages.acquire()
+                    if deadline is not None and deadline.expired:
+                        rendered_pages.release()
+                        break
+                    try:
+                        with pypdfium_file_lock(input_file):
+                            image = await run_sync(self._render_ocr_page, pdf, page_index)
+                    except BaseException:
+                        rendered_pages.release()
+                        raise
+                    tg.start_soon(ocr_page, position, image)
+
+        if skipped := [page_index for position, page_index in enumerate(page_indices) if position not in completed]:
+            skip_if_expired(skipped, stage="ocr")
+
         # Use list comprehension and join for efficient string building
-        content = "\n".join(result.content for result in ocr_results)
+        content = "\n".join(page_contents)
+
+        return ExtractionResult(
+            content=content,
+            mime_type=PLAIN_TEXT_MIME_TYPE,
+            metadata=self._get_page_cache_metadata(len(cached_pages), len(page_indices)),
+            chunks=[],
+        )
+
+    @staticmethod
+    async def _open_pdf_document(document: PDFDocumentContext) -> pypdfium2.PdfDocument:
+        """Get the pypdfium2 document of a document context.
+
+        Args:
+            document: The document context of the PDF file.
+
+        Raises:
+            ParsingError: If the PDF file could not be opened.
+
+        Returns:
+            The shared pypdfium2 document, owned by the document context.
+        """
+        try:
+            return await run_sync(document.get_pdfium_document)
+        except pypdfium2.PdfiumError as e:
+            raise ParsingError(
+                "Could not open PDF file",
+                context=create_error_context(
+                    operation="open_pdf_document",
+                    file_path=document.path,
+                    error=e,
+                ),
+            ) from e
+
+    async def _extract_page_async(
+        self, document: pypdfium2.PdfDocument, input_file: Path | str, page_index: int
+    ) -> ExtractionResult:
+        """Extract a single page, falling back to OCR when its text layer is missing or corrupted.
+
+        Args:
+            document: The opened PDF document.
+            input_file: The path to the PDF file, or another key of its pypdfium2 file lock.
+            page_index: The 0-based index of the page.
+
+        Returns:
+            The extraction result for the page.
+        """
+        text = ""
+        text_source: Literal["text_layer", "ocr"] = "text_layer"
+
+        if not self.config.force_ocr:
+            text = await run_sync_with_pypdfium_file_lock(input_file, self._get_page_text, document, page_index)
+
+        if (self.config.force_ocr or not self._validate_extracted_text(text)) and self.config.ocr_backend is not None:
+            text = await self._ocr_page_async(document, input_file, page_index)
+            text_source = "ocr"
+        elif self._should_ocr_embedded_images():
+            text = await self._merge_embedded_image_text(document, input_file, page_index) or text
+
+        result = ExtractionResult(
+            content=normalize_spaces(text),
+            mime_type=PLAIN_TEXT_MIME_TYPE,
+            metadata={"page_number": page_index + 1, "text_source": text_source},
+            chunks=[],
+        )
+        return self._apply_quality_processing(result)
+
+    async def _ocr_page_async(self, document: pypdfium2.PdfDocument, input_file: Path | str, page_index: int) -> str:
+        """Render a single page and run it through the configured OCR backend.
+
+        The page is rendered under the file lock of the document, so concurrent calls render one page at a time and
+        only recognise their pages concurrently.
+
+        Args:
+            document: The opened PDF document.
+            input_file: The path to the PDF file, or another key of its pypdfium2 file lock.
+            page_index: The 0-based index of the page.
+
+        Returns:
+            The recognised text of the page.
+        """
+        image = await run_sync_with_pypdfium_file_lock(input_file, self._render_ocr_page, document, page_index)
+        try:
+            ocr_result = await get_ocr_backend(cast("OcrBackendType", self.config.ocr_backend)).process_image(
+                image, **self.config.get_config_dict()
+            )
+        finally:
+            image.close()
+        return ocr_result.content
+
+    async def _extract_pdf_text_per_page(self, document: PDFDocumentContext) -> ExtractionResult:
+        """Extract text deciding between the text layer and OCR separately for each page.
+
+        Pages whose text layer passes validation keep their pdfium text, and only the remaining pages
+        are rendered and OCR'd. Page order is preserved.
+
+        Args:
+            document: The document context of the PDF file.
+
+        Returns:
+            The extraction result, with the 1-based numbers of OCR'd pages in ``ocr_pages``.
+        """
+        input_file = document.lock_key
+        try:
+            pdf = await self._open_pdf_document(document)
+        except ParsingError:
+            return ExtractionResult(content="", mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[])
+
+        with pypdfium_file_lock(input_file):
+            page_indices = self.config.get_page_indices(len(pdf))
+        pages_text = await run_sync_with_pypdfium_file_lock(
+            input_file, self._get_pages_text_until_deadline, pdf, page_indices
+        )
+
+        ocr_positions: list[int] = []
+        metadata: Metadata = {}
+        if self.config.ocr_backend is not None:
+            ocr_positions = [
+                i for i, text in enumerate(pages_text) if text is not None and not self._validate_extracted_text(text)
+            ]
+            cached_pages, page_cache_keys = await run_sync(
+                self._lookup_page_cache, document, [page_indices[i] for i in ocr_positions]
+            )
+            missed = [i for i in range(len(ocr_positions)) if i not in cached_pages]
+            ocr_texts = await run_taskgroup_until_deadline(
+                *[partial(self._ocr_page_async, pdf, input_file, page_indices[ocr_positions[i]]) for i in missed],
+                max_concurrency=self.config.ocr_max_rendered_pages or cpu_count(),
+            )
+            missed_pages = {i: text for i, text in zip(missed, ocr_texts, strict=True) if text is not None}
+            await run_sync(self._store_page_cache, page_cache_keys, missed_pages)
+            for i, text in [*cached_pages.items(), *missed_pages.items()]:
+                pages_text[ocr_positions[i]] = text
+            if skipped := [page_indices[ocr_positions[i]] for i in missed if i not in missed_pages]:
+                skip_if_expired(skipped, stage="ocr")
+            if ocr_positions:
+                metadata = self._get_page_cache_metadata(len(cached_pages), len(ocr_positions))
+
+            if self._should_ocr_embedded_images():
+                ocr_position_set = set(ocr_positions)
+                text_positions = [
+                    i for i, text in enumerate(pages_text) if text is not None and i not in ocr_position_set
+                ]
+                merged_texts = await self._ocr_embedded_images(
+                    pdf, input_file, [page_indices[i] for i in text_positions]
+                )
+                for position, merged_text in zip(text_positions, merged_texts, strict=True):
+                    pages_text[position] = merged_text or pages_text[position]
+        ocr_page_indices = [page_indices[i] for i in ocr_positions]
+
+        if ocr_page_indices:
+            metadata["ocr_pages"] = [i + 1 for i in ocr_page_indices]
+
+        return ExtractionResult(
+            content=normalize_spaces("\n".join(text or "" for text in pages_text)),
+            mime_type=PLAIN_TEXT_MIME_TYPE,
+            metadata=metadata,
+            chunks=[],
+        )
+
+    def _get_pages_text_until_deadline(
+        self, document: pypdfium2.PdfDocument, page_indices: list[int]
+    ) -> list[str | None]:
+        """Extract the text layer of pages until the document deadline passes.
+
+        Returns:
+            The text of every page, with None for the pages skipped because the deadline passed.
+        """
+        pages_text: list[str | None] = [None] * len(page_indices)
+        for position, page_index in enumerate(page_indices):
+            if skip_if_expired(page_indices[position:], stage="text_layer"):
+                break
+            pages_text[position] = self._get_page_text(document, page_index)
+        return pages_text
+
+    @staticmethod
+    def _get_page_text(document: pypdfium2.PdfDocument, page_index: int) -> str:
+        """Extract the text layer of a single page, returning an empty string if it cannot be read."""
+        page = document[page_index]
+        try:
+            text_page = page.get_textpage()
+            try:
+                return cast("str", text_page.get_text_bounded())
+            finally:
+                text_page.close()
+        except Exception:  # noqa: BLE001
+            return ""
+        finally:
+            page.close()
+
+    def _should_ocr_embedded_images(self) -> bool:
+        """Whether the embedded images of text layer pages are OCR'd."""
+        return self.config.ocr_embedded_images and self.config.ocr_backend is not None
+
+    def _split_page_at_images(self, document: pypdfium2.PdfDocument, page_index: int) -> list[str | Image] | None:
+        """Split the text layer of a page at its embedded images, in reading order.
+
+        The page is cut into horizontal bands at the top edge of every image, and each image is placed before the
+        text of the band it starts. Images are decoded at their native resolution, without rendering the page.
+
+        Args:
+            document: The opened PDF document.
+            page_index: The 0-based index of the page.
+
+        Returns:
+            The text of every band interleaved with the images, or None if the page has no image large enough to OCR.
+        """
+        page = document[page_index]
+        try:
+            images: list[tuple[float, Image]] = []
+            for image_object in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)):
+                if min(image_object.get_size()) < self.MIN_EMBEDDED_IMAGE_SIZE:
+                    continue
+                try:
+                    bitmap = image_object.get_bitmap(render=False)
+                except pypdfium2.PdfiumError:
+                    continue
+                try:
+                    # some bitmap formats are converted without copying the buffer, which is released below
+                    images.append((image_object.get_pos()[3], bitmap.to_pil().copy()))
+                finally:
+                    bitmap.close()
+
+            if not images:
+                return None
+
+            left, bottom, right, top = page.get_bbox()
+            text_page = page.get_textpage()
+            try:
+                char_extents = []
+                for index in range(text_page.count_chars()):
+                    _, char_bottom, _, char_top = text_page.get_charbox(index)
+                    if char_bottom < char_top:
+                        char_extents.append((char_bottom, char_top))
+
+                segments: list[str | Image] = []
+                band_top = top
+                for image_top, image in sorted(images, key=lambda item: item[0], reverse=True):
+                    cut = min(image_top, band_top)
+                    # move the cut up to the gap above any line it crosses, so that no line is split
+                    while crossed := [
+                        char_top for char_bottom, char_top in char_extents if char_bottom < cut < char_top
+                    ]:
+                        cut = min(max(crossed), band_top)
+                        if cut == band_top:
+                            break
+                    segments.extend((text_page.get_text_bounded(left, cut, right, band_top), image))
+                    band_top = cut
+                segments.append(text_page.get_text_bounded(left, bottom, right, band_top))
+                return segments
+            finally:
+                text_page.close()
+        finally:
+            page.close()
+
+    async def _merge_embedded_image_text(
+        self, document: pypdfium2.PdfDocument, input_file: Path | str, page_index: int
+    ) -> str | None:
+        """OCR the embedded images of a page and merge their text into its text layer.
+
+        Args:
+            document: The opened PDF document.
+            input_file: The path to the PDF file, or another key of its pypdfium2 file lock.
+            page_index: The 0-based index of the page.
+
+        Returns:
+            The merged text of the page, or None if the page has no image large enough to OCR.
+        """
+        segments = await run_sync_with_pypdfium_file_lock(input_file, self._split_page_at_images, document, page_index)
+        if segments is None:
+            return None
+
+        backend = get_ocr_backend(cast("OcrBackendType", self.config.ocr_backend))
+        config_dict = self.config.get_config_dict()
+        parts = []
+        try:
+            for segment in segments:
+                if isinstance(segment, str):
+                    parts.append(segment)
+                else:
+                    parts.append((await backend.process_image(segment, **config_dict)).content)
+        finally:
+            for segment in segments:
+                if not isinstance(segment, str):
+                    segment.close()
+        return "\n".join(part for part in parts if part.strip())
+
+    def _merge_embedded_image_text_sync(
+        self, document: pypdfium2.PdfDocument, input_file: Path | str, page_index: int
+    ) -> str | None:
+        """OCR the embedded images of a page and merge their text into its text layer (sync version)."""
+        with pypdfium_file_lock(input_file):
+            segments = self._split_page_at_images(document, page_index)
+        if segments is None:
+            return None
+
+        backend = get_ocr_backend(cast("OcrBackendType", self.config.ocr_backend))
+        config_dict = self.config.get_config_dict()
+        parts = []
+        try:
+            for segment in segments:
+                if isinstance(segment, str):
+                    parts.append(segment)
+                else:
+                    parts.append(backend.process_image_sync(segment, **config_dict).content)
+        finally:
+            for segment in segments:
+                if not isinstance(segment, str):
+                    segment.close()
+        return "\n".join(part for part in parts if part.strip())
+
+    async def _ocr_embedded_images(
+        self, document: pypdfium2.PdfDocument, input_file: Path | str, page_indices: list[int]
+    ) -> list[str | None]:
+        """Merge the OCR'd text of the embedded images into the text layer of several pages concurrently.
+
+        The embedded images of one page at a time are decoded under the file lock of the document, while the images
+        of several pages are OCR'd concurrently.
+
+        Returns:
+            The merged text of every page, or None for pages without an image large enough to OCR and for pages
+            not merged before the document deadline passed.
+        """
+        merged_texts = await run_taskgroup_until_deadline(
+            *[
+                partial(self._merge_embedded_image_text, document, input_file, page_index)
+                for page_index in page_indices
+            ],
+            max_concurrency=self.config.ocr_max_rendered_pages or cpu_count(),
+        )
+        if None in merged_texts:
+            skip_if_expired(stage="embedded_image_ocr")
+        return merged_texts
+
+    async def _extract_text_with_embedded_images(self, document: PDFDocumentContext) -> str:
+        """Extract the text layer of the selected pages with the OCR'd text of their embedded images merged in."""
+        pdf = await self._open_pdf_document(document)
+        with pypdfium_file_lock(document.lock_key):
+            page_indices = self.config.get_page_indices(len(pdf))
+        pages_text = await run_sync_with_pypdfium_file_lock(
+            document.lock_key, lambda: [self._get_page_text(pdf, i) for i in page_indices]
+        )
+
+        merged_texts = await self._ocr_embedded_images(pdf, document.lock_key, page_indices)
+        return normalize_spaces(
+            "\n".join(merged or text for text, merged in zip(pages_text, merged_texts, strict=True))
+        )
 
-        return ExtractionResult(content=content, mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[])
+    def _extract_text_with_embedded_images_sync(self, document: PDFDocumentContext) -> str:
+        """Extract the text layer with the OCR'd text of the embedded images merged in (sync version)."""
+        pdf = document.get_pdfium_document()
+        with pypdfium_file_lock(document.lock_key):
+            page_indices = self.config.get_page_indices(len(pdf))
+        pages_text = []
+        for page_index in page_indices:
+            merged_text = None
+            if not skip_if_expired(stage="embedded_image_ocr"):
+                merged_text = self._merge_embedded_image_text_sync(pdf, document.lock_key, page_index)
+            if merged_text is None:
+                with pypdfium_file_lock(document.lock_key):
+                    merged_text = self._get_page_text(pdf, page_index)
+            pages_text.append(merged_text)
+        return "\n".join(pages_text)
+
+    def _render_ocr_page(self, document: pypdfium2.PdfDocument, page_index: int, default_scale: float = 4.25) -> Image:
+        """Render a single page for OCR using 'pdf_render_config', or at 'default_scale' if it is not set."""
+        if self.config.pdf_render_config is None:
+            return self._render_page(document, page_index, default_scale)
+        return render_pdf_page(document, page_index, self.config.pdf_render_config)
 
     @staticmethod
-    async def _extract_pdf_searchable_text(input_file: Path) -> str:
+    def _render_page(document: pypdfium2.PdfDocument, page_index: int, scale: float = 4.25) -> Image:
+        """Render a single page to a Pillow image."""
+        page = document[page_index]
+        try:
+            bitmap = page.render(scale=scale)
+            try:
+                return cast("Image", bitmap.to_pil())
+            finally:
+                bitmap.close()
+        finally:
+            page.close()
+
+    async def _extract_pdf_searchable_text(self, document: PDFDocumentContext) -> str:
         """Extract text from a searchable PDF file using pypdfium2.
 
         Args:
-            input_file: The path to the PDF file.
+            document: The document context of the PDF file.
 
         Raises:
             ParsingError: If the text could not be extracted from the PDF file.
@@ -274,19 +823,38 @@ class PDFExtractor(Extractor):
         Returns:
             The extracted text.
         """
-        document: pypdfium2.PdfDocument | None = None
+        lock_key = document.lock_key
         try:
-            with pypdfium_file_lock(input_file):
-                document = await run_sync(pypdfium2.PdfDocument, str(input_file))
+            pdf = await run_sync(document.get_pdfium_document)
+            with pypdfium_file_lock(lock_key):
+                page_indices = self.config.get_page_indices(len(pdf))
+
+            if (text := await run_sync(self._extract_pdf_text_in_processes, document, page_indices)) is not None:
+                if not text.strip():
+                    raise ParsingError(
+                        "Could not extract any text from PDF",
+                        context=create_error_context(operation="extract_pdf_searchable_text", file_path=document.path),
+                    )
+                return normalize_spaces(text)
+
+            with pypdfium_file_lock(lock_key):
                 pages_content = []
                 page_errors = []
 
-                for i, page in enumerate(cast("pypdfium2.PdfDocument", document)):
+                for position, i in enumerate(page_indices):
+                    if skip_if_expired(page_indices[position:], stage="text_layer"):
+                        break
                     try:
-                        text_page = page.get_textpage()
-                        page_content = text_page.get_text_bounded()
-                        pages_content.append(page_content)
-                    except Exception as e:  # noqa: PERF203, BLE001
+                        page = pdf[i]
+                        try:
+                            text_page = page.get_textpage()
+                            try:
+                                pages_content.append(text_page.get_text_bounded())
+                            finally:
+                                text_page.close()
+                        finally:
+                            page.close()
+                    except Exception as e:  # noqa: BLE001
                         page_errors.append({"page": i + 1, "error": str(e)})
                         pages_content.append(f"[Error extracting page {i + 1}]")
 
@@ -300,7 +868,7 @@ class PDFExtractor(Extractor):
                         "Could not extract any text from PDF",
                         context=create_error_context(
                             operation="extract_pdf_searchable_text",
-                            file_path=input_file,
+                            file_path=document.path,
                             page_errors=page_errors,
                         ),
                     )
@@ -311,23 +879,49 @@ class PDFExtractor(Extractor):
                 "Could not extract text from PDF file",
                 context=create_error_context(
                     operation="extract_pdf_searchable_text",
-                    file_path=input_file,
+                    file_path=document.path,
                     error=e,
                 ),
             ) from e
-        finally:
-            if document:
-                with pypdfium_file_lock(input_file), contextlib.suppress(Exception):
-                    await run_sync(document.close)
 
-    def _extract_pdf_searchable_text_sync(self, path: Path) -> str:
+    def _extract_pdf_text_in_processes(self, document: PDFDocumentContext, page_indices: list[int]) -> str | None:
+        """Extract the text layer in parallel worker processes if enough pages are selected.
+
+        Args:
+            document: The document context of the PDF file.
+            page_indices: The 0-based indices of the selected pages.
+
+        Returns:
+            The text of the pages joined by newlines, or None if the pages should be extracted in-process, either
+            because there are too few of them, because the extraction has a deadline the worker processes cannot
+            check, or because the worker processes failed.
+        """
+        min_pages = self.config.parallel_pdf_text_min_pages
+        if min_pages is None or len(page_indices) < min_pages or get_deadline() is not None:
+            return None
+        try:
+            return extract_pdf_text_in_processes(
+                str(document.get_path()), page_indices, self.config.parallel_pdf_text_min_pages_per_process
+            )
+        except (ParsingError, OSError, RuntimeError):
+            return None
+
+    def _extract_pdf_searchable_text_sync(self, document: PDFDocumentContext) -> str:
         """Extract searchable text from PDF using pypdfium2 (sync version)."""
-        pdf = None
         try:
-            with pypdfium_file_lock(path):
-                pdf = pypdfium2.PdfDocument(str(path))
+            pdf = document.get_pdfium_document()
+            with pypdfium_file_lock(document.lock_key):
+                page_indices = self.config.get_page_indices(len(pdf))
+
+            if (text := self._extract_pdf_text_in_processes(document, page_indices)) is not None:
+                return text
+
+            with pypdfium_file_lock(document.lock_key):
                 pages_text = []
-                for page in pdf:
+                for position, i in enumerate(page_indices):
+                    if skip_if_expired(page_indices[position:], stage="text_layer"):
+                        break
+                    page = pdf[i]
                     text_page = page.get_textpage()
                     text = text_page.get_text_bounded()
                     pages_text.append(text)
@@ -336,56 +930,189 @@ class PDFExtractor(Extractor):
                 return "\n".join(pages_text)
         except Exception as e:
             raise ParsingError(f"Failed to extract PDF text: {e}") from e
-        finally:
-            if pdf:
-                with pypdfium_file_lock(path), contextlib.suppress(Exception):
-                    pdf.close()
 
-    def _extract_pdf_with_ocr_sync(self, path: Path) -> str:
-        """Extract text from PDF using OCR (sync version)."""
-        pdf = None
+    def _extract_pdf_with_ocr_sync(self, document: PDFDocumentContext) -> tuple[str, Metadata]:
+        """Extract text from PDF using OCR (sync version).
+
+        Returns:
+            The extracted text and the page cache metadata.
+        """
         try:
-            images = []
-            with pypdfium_file_lock(path):
-                pdf = pypdfium2.PdfDocument(str(path))
-                for page in pdf:
-                    bitmap = page.render(scale=200 / 72)
-                    pil_image = bitmap.to_pil()
-                    images.append(pil_image)
-                    bitmap.close()
-                    page.close()
+            pdf = document.get_pdfium_document()
+            with pypdfium_file_lock(document.lock_key):
+                page_indices = self.config.get_page_indices(len(pdf))
 
-            image_paths = []
-            temp_files = []
+            pages_text, metadata = self._ocr_pages_sync(document, page_indices)
+            return "\n\n".join(pages_text), metadata
+        except Exception as e:
+            raise ParsingError(f"Failed to OCR PDF: {e}") from e
 
-            try:
-                for i, img in enumerate(images):
-                    fd, temp_path = tempfile.mkstemp(suffix=f"_page_{i}.png")
-                    temp_files.append((fd, temp_path))
-                    img.save(temp_path, format="PNG")
-                    os.close(fd)
-                    image_paths.append(temp_path)
+    def _extract_pdf_text_per_page_sync(self, document: PDFDocumentContext) -> tuple[str, Metadata]:
+        """Extract text deciding between the text layer and OCR separately for each page (sync version).
 
-                return self._process_pdf_images_with_ocr(image_paths)
+        Returns:
+            The extracted text and its metadata, with the 1-based numbers of the OCR'd pages in ``ocr_pages``.
+        """
+        lock_key = document.lock_key
+        try:
+            pdf = document.get_pdfium_document()
+            with pypdfium_file_lock(lock_key):
+                page_indices = self.config.get_page_indices(len(pdf))
+                pages_text = self._get_pages_text_until_deadline(pdf, page_indices)
+
+            if self.config.ocr_backend is None:
+                return "\n".join(text or "" for text in pages_text), {}
+
+            ocr_positions = [
+                i for i, text in enumerate(pages_text) if text is not None and not self._validate_extracted_text(text)
+            ]
+            if self._should_ocr_embedded_images():
+                ocr_position_set = set(ocr_positions)
+                for position in (
+                    i for i, text in enumerate(pages_text) if text is not None and i not in ocr_position_set
+                ):
+                    if skip_if_expired(stage="embedded_image_ocr"):
+                        break
+                    merged_text = self._merge_embedded_image_text_sync(pdf, lock_key, page_indices[position])
+                    pages_text[position] = merged_text or pages_text[position]
+            if not ocr_positions:
+                return "\n".join(text or "" for text in pages_text), {}
+
+            ocr_page_indices = [page_indices[i] for i in ocr_positions]
+            ocr_texts, metadata = self._ocr_pages_sync(document, ocr_page_indices)
+            for position, text in zip(ocr_positions, ocr_texts, strict=True):
+                pages_text[position] = text
+            metadata["ocr_pages"] = [i + 1 for i in ocr_page_indices]
+
+            return "\n".join(text or "" for text in pages_text), metadata
+        except pypdfium2.PdfiumError:
+            return "", {}
+
+    def _ocr_pages_sync(self, document: PDFDocumentContext, page_indices: list[int]) -> tuple[list[str], Metadata]:
+        """OCR pages, reusing the page cache and rendering only the pages without a cached result (sync version).
+
+        Each page is written to a temporary image file as soon as it is rendered, so only one rendered
+        page is held in memory at a time. With a document deadline, the pages are OCR'd in batches of
+        ``ocr_max_rendered_pages`` and no further batch is started once it has passed.
 
-            finally:
-                for _, temp_path in temp_files:
-                    with contextlib.suppress(OSError):
-                        Path(temp_path).unlink()
+        Args:
+            document: The document context of the PDF file.
+            page_indices: The 0-based indices of the pages to OCR.
 
-        except Exception as e:
-            raise ParsingError(f"Failed to OCR PDF: {e}") from e
+        Returns:
+            The text of every page, empty for the pages skipped because of the deadline, and the page cache metadata.
+        """
+        cached_pages, page_cache_keys = self._lookup_page_cache(document, page_indices)
+        missed = [i for i in range(len(page_indices)) if i not in cached_pages]
+        batch_size = len(missed) if get_deadline() is None else self.config.ocr_max_rendered_pages or cpu_count()
+
+        missed_pages: dict[int, str] = {}
+        for start in range(0, len(missed), max(batch_size, 1)):
+            if skip_if_expired([page_indices[i] for i in missed[start:]], stage="ocr"):
+                break
+            batch = missed[start : start + batch_size]
+            ocr_texts = self._render_and_ocr_pages_sync(document, [page_indices[i] for i in batch])
+            missed_pages.update(zip(batch, ocr_texts, strict=True))
+
+        self._store_page_cache(page_cache_keys, missed_pages)
+        pages_text = {**cached_pages, **missed_pages}
+        return [pages_text.get(i, "") for i in range(len(page_indices))], self._get_page_cache_metadata(
+            len(cached_pages), len(page_indices)
+        )
+
+    def _render_and_ocr_pages_sync(self, document: PDFDocumentContext, page_indices: list[int]) -> list[str]:
+        """Render pages to temporary image files one at a time and OCR them in one batch, returning their text."""
+        pdf = document.get_pdfium_document()
+        image_paths = []
+        try:
+            for page_index in page_indices:
+                with pypdfium_file_lock(document.lock_key):
+                    image = self._render_ocr_page(pdf, page_index, default_scale=200 / 72)
+                fd, temp_path = tempfile.mkstemp(suffix=f"_page_{page_index}.png")
+                image_paths.append(temp_path)
+                os.close(fd)
+                image.save(temp_path, format="PNG")
+                image.close()
+
+            return [result.content for result in self._ocr_pdf_images_sync(image_paths)] if image_paths else []
         finally:
-            if pdf:
-                with pypdfium_file_lock(path), contextlib.suppress(Exception):
-                    pdf.close()
+            for temp_path in image_paths:
+                with contextlib.suppress(OSError):
+                    Path(temp_path).unlink()
+
+    def _get_page_cache_kwargs(self, document: PDFDocumentContext, page_index: int) -> dict[str, str] | None:
+        """Get the page cache key of a page for the configured OCR, or None if the page could not be hashed."""
+        if (fingerprint := document.get_page_fingerprint(page_index)) is None:
+            return None
+        return {
+            "page_hash": fingerprint,
+            "ocr_backend": str(self.config.ocr_backend),
+            "ocr_config": str(sorted(self.config.get_config_dict().items())),
+            "pdf_render_config": str(self.config.pdf_render_config),
+        }
+
+    def _lookup_page_cache(
+        self, document: PDFDocumentContext, page_indices: list[int]
+    ) -> tuple[dict[int, str], dict[int, dict[str, str]]]:
+        """Look up the OCR results of pages in the page cache, by the content hash of each page.
+
+        Args:
+            document: The document context of the PDF file.
+            page_indices: The 0-based indices of the pages to OCR.
 
-    def _process_pdf_images_with_ocr(self, image_paths: list[str]) -> str:
-        """Process PDF images with the configured OCR backend."""
+        Returns:
+            The cached text of every hit and the page cache key of every miss, both by position in ``page_indices``.
+        """
+        from kreuzberg._utils._cache import get_page_cache  # noqa: PLC0415
+
+        page_cache = get_page_cache()
+        cached_pages: dict[int, str] = {}
+        page_cache_keys: dict[int, dict[str, str]] = {}
+        for position, page_index in enumerate(page_indices):
+            if (cache_kwargs := self._get_page_cache_kwargs(document, page_index)) is None:
+                continue
+            if (cached_result := page_cache.get(**cache_kwargs)) is not None:
+                cached_pages[position] = cached_result.content
+            else:
+                page_cache_keys[position] = cache_kwargs
+        return cached_pages, page_cache_keys
+
+    @staticmethod
+    def _store_page_cache(page_cache_keys: dict[int, dict[str, str]], pages_text: dict[int, str]) -> None:
+        """Store the OCR results of pages in the page cache, by position as returned by ``_lookup_page_cache``."""
+        from kreuzberg._utils._cache import get_page_cache  # noqa: PLC0415
+
+        page_cache = get_page_cache()
+        for position, text in pages_text.items():
+            if (cache_kwargs := page_cache_keys.get(position)) is not None:
+                page_cache.set(
+                    ExtractionResult(content=text, mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[]),
+                    **cache_kwargs,
+                )
+
+    @staticmethod
+    def _get_page_cache_metadata(hits: int, page_count: int) -> Metadata:
+        """Get the page cache hit and miss counts of an OCR pass over ``page_count`` pages."""
+        return {"page_cache_hits": hits, "page_cache_misses": page_count - hits}
+
+    def _get_playa_worker_count(self, page_count: int) -> int:
+        """Get the number of worker processes for the playa text pass over ``page_count`` pages.
+
+        Returns:
+            The number of workers, or 1 if the pass should run in the current process.
+        """
+        min_pages = self.config.parallel_playa_min_pages
+        if min_pages is None or page_count < min_pages:
+            return 1
+        max_workers = self.config.parallel_playa_max_workers or max(1, cpu_count() - 1)
+        return min(max_workers, page_count)
+
+    def _ocr_pdf_images_sync(self, image_paths: list[str]) -> list[ExtractionResult]:
+        """Run the configured OCR backend over PDF page images, returning one result per image."""
         backend = get_ocr_backend(self.config.ocr_backend)
         paths = [Path(p) for p in image_paths]
 
-        if self.config.ocr_backend == "tesseract":
+        if self.config.ocr_backend in {"tesseract", "tesserocr"}:
             config = (
                 self.config.ocr_config if isinstance(self.config.ocr_config, TesseractConfig) else TesseractConfig()
             )
@@ -403,23 +1130,66 @@ class PDFExtractor(Extractor):
         else:
             raise NotImplementedError(f"Sync OCR not implemented for {self.config.ocr_backend}")
 
-        # Use list comprehension and join for efficient string building
-        return "\n\n".join(result.content for result in results)
+        return results
 
-    def _extract_with_playa_sync(self, path: Path, fallback_text: str) -> str:
-        """Extract text using playa for better structure preservation."""
-        with contextlib.suppress(Exception):
-            content = path.read_bytes()
-            document = parse(content, max_workers=1)
+    def _extract_with_playa_sync(self, document: PDFDocumentContext, fallback_text: str) -> str:
+        """Extract text using playa for better structure preservation.
+
+        The pages are parsed in worker processes if enough of them are selected, see ``_get_playa_worker_count``,
+        and in the current process otherwise or if the workers fail. The pass only replaces the text of a complete
+        text layer, so it is skipped once the document deadline has passed or any page was skipped, and
+        ``fallback_text`` is kept if the deadline passes during the pass.
+        """
+        if (deadline := get_deadline()) is not None and (deadline.expired or deadline.exceeded):
+            return fallback_text
 
+        with contextlib.suppress(Exception):
             # Extract text while preserving structure
-            pages_text = []
-            for page in document.pages:
-                page_text = page.extract_text()
-                if page_text and page_text.strip():
-                    pages_text.append(page_text)
+            pdf = document.get_pdfium_document()
+            with pypdfium_file_lock(document.lock_key):
+                page_indices = self.config.get_page_indices(len(pdf))
+
+            pages_text: list[str] | None = None
+            if (worker_count := self._get_playa_worker_count(len(page_indices))) > 1:
+                with contextlib.suppress(Exception), document.open_playa_document(worker_count) as playa_document:
+                    pages_text = self._map_playa_pages(playa_document, page_indices, worker_count)
+            if pages_text is None:
+                pages = document.get_playa_document().pages
+                pages_text = []
+                for i in page_indices:
+                    if deadline is not None and deadline.expired:
+                        return fallback_text
+                    pages_text.append(_extract_playa_page_text(pages[i]))
 
-            if pages_text:
+            if pages_text := [page_text for page_text in pages_text if page_text and page_text.strip()]:
                 return "\n\n".join(pages_text)
 
         return fallback_text
+
+    @staticmethod
+    def _map_playa_pages(playa_document: Document, page_indices: list[int], worker_count: int) -> list[str] | None:
+        """Extract the text of pages in the worker processes of a playa document.
+
+        With a document deadline, the pages are submitted in chunks so that no more work is queued once it has
+        passed, as closing the document waits for all submitted pages.
+
+        Returns:
+            The text of every page, or None if the deadline passed before all pages were extracted.
+        """
+        if (deadline := get_deadline()) is None:
+            return list(playa_document.pages[page_indices].map(_extract_playa_page_text))
+
+        pages_text: list[str] = []
+        chunk_size = worker_count * 4
+        for start in range(0, len(page_indices), chunk_size):
+            if deadline.expired:
+                return None
+            pages_text.extend(
+                playa_document.pages[page_indices[start : start + chunk_size]].map(_extract_playa_page_text)
+            )
+        return pages_text
+
+
+def _extract_playa_page_text(page: Page) -> str:
+    """Extract the text of a playa page, in the current process or in a worker process."""
+    return page.extract_text()
@@ -2,15 +2,11 @@ from __future__ import annotations
 
 import contextlib
 import csv
-import os
 import sys
-import tempfile
 from datetime import date, datetime, time, timedelta
-from io import StringIO
-from pathlib import Path
-from typing import Any
+from io import BytesIO, StringIO
+from typing import TYPE_CHECKING, Any
 
-from anyio import Path as AsyncPath
 from PIL import Image
 from python_calamine import CalamineWorkbook
 
@@ -19,12 +15,14 @@ from kreuzberg._mime_types import MARKDOWN_MIME_TYPE, SPREADSHEET_MIME_TYPES
 from kreuzberg._types import ExtractionResult, Metadata
 from kreuzberg._utils._string import normalize_spaces
 from kreuzberg._utils._sync import run_sync, run_taskgroup
-from kreuzberg._utils._tmp import create_temp_file
 from kreuzberg.exceptions import ParsingError
 
 if sys.version_info < (3, 11):  # pragma: no cover
     from exceptiongroup import ExceptionGroup  # type: ignore[import-not-found]
 
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
 
 CellValue = int | float | str | bool | time | date | datetime | timedelta
 
@@ -33,16 +31,14 @@ class SpreadSheetExtractor(Extractor):
     SUPPORTED_MIME_TYPES = SPREADSHEET_MIME_TYPES
 
     async def extract_bytes_async(self, content: bytes) -> ExtractionResult:
-        xlsx_path, unlink = await create_temp_file(".xlsx")
-        await AsyncPath(xlsx_path).write_bytes(content)
-        try:
-            return await self.extract_path_async(xlsx_path)
-        finally:
-            await unlink()
+        return await self._extract_workbook_async(content)
 
     async def extract_path_async(self, path: Path) -> ExtractionResult:
+        return await self._extract_workbook_async(path)
+
+    async def _extract_workbook_async(self, source: Path | bytes) -> ExtractionResult:
         try:
-            workbook: CalamineWorkbook = await run_sync(CalamineWorkbook.from_path, str(path))
+            workbook: CalamineWorkbook = await run_sync(self._open_workbook, source)
             tasks = [self._convert_sheet_to_text(workbook, sheet_name) for sheet_name in workbook.sheet_names]
 
             try:
@@ -59,33 +55,27 @@ class SpreadSheetExtractor(Extractor):
             except ExceptionGroup as eg:
                 raise ParsingError(
                     "Failed to extract file data",
-                    context={"file": str(path), "errors": eg.exceptions},
+                    context={**self._get_source_context(source), "errors": eg.exceptions},
                 ) from eg
         except Exception as e:
             if isinstance(e, ParsingError):
                 raise
             raise ParsingError(
                 "Failed to extract file data",
-                context={"file": str(path), "error": str(e)},
+                context={**self._get_source_context(source), "error": str(e)},
             ) from e
 
     def extract_bytes_sync(self, content: bytes) -> ExtractionResult:
         """Pure sync implementation of extract_bytes."""
-        fd, temp_path = tempfile.mkstemp(suffix=".xlsx")
-
-        try:
-            with os.fdopen(fd, "wb") as f:
-                f.write(content)
-
-            return self.extract_path_sync(Path(temp_path))
-        finally:
-            with contextlib.suppress(OSError):
-                Path(temp_path).unlink()
+        return self._extract_workbook_sync(content)
 
     def extract_path_sync(self, path: Path) -> ExtractionResult:
         """Pure sync implementation of extract_path."""
+        return self._extract_workbook_sync(path)
+
+    def _extract_workbook_sync(self, source: Path | bytes) -> ExtractionResult:
         try:
-            workbook = CalamineWorkbook.from_path(str(path))
+            workbook = self._open_workbook(source)
             results = []
 
             for sheet_name in workbook.sheet_names:
@@ -103,9 +93,30 @@ class SpreadSheetExtractor(Extractor):
         except Exception as e:
             raise ParsingError(
                 "Failed to extract file data",
-                context={"file": str(path), "error": str(e)},
+                context={**self._get_source_context(source), "error": str(e)},
             ) from e
 
+    @staticmethod
+    def _open_workbook(source: Path | bytes) -> CalamineWorkbook:
+        """Open a workbook from a file path, or from bytes without writing them to disk.
+
+        Args:
+            source: The path to the spreadsheet or its content.
+
+        Returns:
+            The opened workbook.
+        """
+        if isinstance(source, bytes):
+            return CalamineWorkbook.from_filelike(BytesIO(source))
+        return CalamineWorkbook.from_path(str(source))
+
+    @staticmethod
+    def _get_source_context(source: Path | bytes) -> dict[str, Any]:
+        """Describe the extracted spreadsheet for error contexts."""
+        if isinstance(source, bytes):
+            return {"content_size": len(source)}
+        return {"file": str(source)}
+
     @staticmethod
     def _convert_cell_to_str(value: Any) -> str:
         """Convert a cell value to string representation.
@@ -138,9 +149,6 @@ class SpreadSheetExtractor(Extractor):
         csv_data = csv_buffer.getvalue()
         csv_buffer.close()
 
-        csv_path, unlink = await create_temp_file(".csv")
-        await AsyncPath(csv_path).write_text(csv_data)
-
         csv_reader = csv.reader(StringIO(csv_data))
         rows = list(csv_reader)
         result = ""
@@ -158,7 +166,6 @@ class SpreadSheetExtractor(Extractor):
 
             result = "\n".join(markdown_lines)
 
-        await unlink()
         return f"## {sheet_name}\n\n{normalize_spaces(result)}"
 
     def _convert_sheet_to_text_sync(self, workbook: CalamineWorkbook, sheet_name: str) -> str:
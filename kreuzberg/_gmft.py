@@ -17,6 +17,7 @@ import msgspec
 from PIL import Image
 
 from kreuzberg._types import TableData
+from kreuzberg._utils._deadline import get_deadline, get_remaining_time, skip_if_expired
 from kreuzberg._utils._sync import run_sync
 from kreuzberg.exceptions import MissingDependencyError, ParsingError
 
@@ -139,7 +140,10 @@ class GMFTConfig:
 
 
 async def extract_tables(
-    file_path: str | PathLike[str], config: GMFTConfig | None = None, use_isolated_process: bool | None = None
+    file_path: str | PathLike[str],
+    config: GMFTConfig | None = None,
+    use_isolated_process: bool | None = None,
+    page_indices: list[int] | None = None,
 ) -> list[TableData]:
     """Extracts tables from a PDF file.
 
@@ -151,6 +155,7 @@ async def extract_tables(
         config: An optional configuration object.
         use_isolated_process: Whether to use an isolated process for extraction.
             If None, uses environment variable KREUZBERG_GMFT_ISOLATED (default: True).
+        page_indices: The 0-based indices of the pages to detect tables on. If None, all pages are used.
 
     Raises:
         MissingDependencyError: Raised when the required dependencies are not installed.
@@ -184,6 +189,7 @@ async def extract_tables(
         "file_info": str(sorted(file_info.items())),
         "extractor": "gmft",
         "config": str(sorted(msgspec.to_builtins(config).items())),
+        "page_indices": str(page_indices),
     }
 
     table_cache = get_table_cache()
@@ -204,7 +210,9 @@ async def extract_tables(
 
     try:
         if use_isolated_process:
-            result = await _extract_tables_isolated_async(file_path, config)
+            result = await _extract_tables_isolated_async(
+                file_path, config, timeout=get_remaining_time(300.0), page_indices=page_indices
+            )
 
             await table_cache.aset(result, **cache_kwargs)
 
@@ -239,27 +247,11 @@ async def extract_tables(
                 config=TATRDetectorConfig(detector_base_threshold=config.detector_base_threshold)
             )
             doc = await run_sync(PyPDFium2Document, str(file_path))
-            cropped_tables: list[CroppedTable] = []
-            dataframes: list[DataFrame] = []
             try:
-                for page in doc:
-                    cropped_tables.extend(await run_sync(detector.extract, page))
+                result = await run_sync(_extract_tables_from_document, doc, detector, formatter, page_indices)
 
-                for cropped_table in cropped_tables:
-                    formatted_table = await run_sync(formatter.extract, cropped_table)
-                    dataframes.append(await run_sync(formatted_table.df))
-
-                result = [
-                    TableData(
-                        cropped_image=cropped_table.image(),
-                        page_number=cropped_table.page.page_number,
-                        text=data_frame.to_markdown(),
-                        df=data_frame,
-                    )
-                    for data_frame, cropped_table in zip(dataframes, cropped_tables, strict=False)
-                ]
-
-                await table_cache.aset(result, **cache_kwargs)
+                if not _tables_cut_short():
+                    await table_cache.aset(result, **cache_kwargs)
 
                 return result
             finally:
@@ -274,7 +266,10 @@ async def extract_tables(
 
 
 def extract_tables_sync(
-    file_path: str | PathLike[str], config: GMFTConfig | None = None, use_isolated_process: bool | None = None
+    file_path: str | PathLike[str],
+    config: GMFTConfig | None = None,
+    use_isolated_process: bool | None = None,
+    page_indices: list[int] | None = None,
 ) -> list[TableData]:
     """Synchronous wrapper for extract_tables.
 
@@ -283,6 +278,7 @@ def extract_tables_sync(
         config: An optional configuration object.
         use_isolated_process: Whether to use an isolated process for extraction.
             If None, uses environment variable KREUZBERG_GMFT_ISOLATED (default: True).
+        page_indices: The 0-based indices of the pages to detect tables on. If None, all pages are used.
 
     Returns:
         A list of table data dictionaries.
@@ -313,6 +309,7 @@ def extract_tables_sync(
         "file_info": str(sorted(file_info.items())),
         "extractor": "gmft",
         "config": str(sorted(msgspec.to_builtins(config).items())),
+        "page_indices": str(page_indices),
     }
 
     table_cache = get_table_cache()
@@ -321,7 +318,9 @@ def extract_tables_sync(
         return cached_result  # type: ignore[no-any-return]
 
     if use_isolated_process:
-        result = _extract_tables_isolated(file_path, config)
+        result = _extract_tables_isolated(
+            file_path, config, timeout=get_remaining_time(300.0), page_indices=page_indices
+        )
 
         table_cache.set(result, **cache_kwargs)
 
@@ -353,27 +352,11 @@ def extract_tables_sync(
             config=TATRDetectorConfig(detector_base_threshold=config.detector_base_threshold)
         )
         doc = PyPDFium2Document(str(file_path))
-        cropped_tables: list[Any] = []
-        dataframes: list[Any] = []
         try:
-            for page in doc:
-                cropped_tables.extend(detector.extract(page))
+            result = _extract_tables_from_document(doc, detector, formatter, page_indices)
 
-            for cropped_table in cropped_tables:
-                formatted_table = formatter.extract(cropped_table)
-                dataframes.append(formatted_table.df())
-
-            result = [
-                TableData(
-                    cropped_image=cropped_table.image(),
-                    page_number=cropped_table.page.page_number,
-                    text=data_frame.to_markdown(),
-                    df=data_frame,
-                )
-                for data_frame, cropped_table in zip(dataframes, cropped_tables, strict=False)
-            ]
-
-            table_cache.set(result, **cache_kwargs)
+            if not _tables_cut_short():
+                table_cache.set(result, **cache_kwargs)
 
             return result
         finally:
@@ -385,10 +368,77 @@ def extract_tables_sync(
         ) from e
 
 
+def load_table_models() -> None:
+    """Import GMFT and load its TATR table detection and structure recognition models.
+
+    The models are downloaded if they are not cached yet. Tables are extracted in a new process by default, which
+    loads the models again from the cache, while in-process extraction reuses the imported modules.
+
+    Raises:
+        MissingDependencyError: Raised when the required dependencies are not installed.
+    """
+    try:
+        from gmft.auto import AutoTableDetector, AutoTableFormatter  # type: ignore[attr-defined]  # noqa: PLC0415
+    except ImportError as e:
+        raise MissingDependencyError.create_for_package(
+            dependency_group="gmft", functionality="table extraction", package_name="gmft"
+        ) from e
+
+    AutoTableDetector()  # type: ignore[no-untyped-call]
+    AutoTableFormatter()  # type: ignore[no-untyped-call]
+
+
+def _extract_tables_from_document(
+    doc: Any, detector: Any, formatter: Any, page_indices: list[int] | None
+) -> list[TableData]:
+    """Detect and format the tables on the selected pages of an opened gmft document.
+
+    Detection and formatting stop when the document deadline passes, and only the tables formatted so far are
+    returned.
+
+    Args:
+        doc: The opened gmft PDF document.
+        detector: The gmft table detector.
+        formatter: The gmft table formatter.
+        page_indices: The 0-based indices of the pages to detect tables on. If None, all pages are used.
+
+    Returns:
+        A list of table data dictionaries.
+    """
+    cropped_tables: list[CroppedTable] = []
+    dataframes: list[DataFrame] = []
+    selected_pages = None if page_indices is None else set(page_indices)
+    for i, page in enumerate(doc):
+        if (selected_pages is None or i in selected_pages) and not skip_if_expired(stage="tables"):
+            cropped_tables.extend(detector.extract(page))
+
+    for cropped_table in cropped_tables:
+        if skip_if_expired(stage="tables"):
+            break
+        formatted_table = formatter.extract(cropped_table)
+        dataframes.append(formatted_table.df())
+
+    return [
+        TableData(
+            cropped_image=cropped_table.image(),
+            page_number=cropped_table.page.page_number,
+            text=data_frame.to_markdown(),
+            df=data_frame,
+        )
+        for data_frame, cropped_table in zip(dataframes, cropped_tables, strict=False)
+    ]
+
+
+def _tables_cut_short() -> bool:
+    """Whether the table extraction of the current document was cut short by its deadline."""
+    return (deadline := get_deadline()) is not None and "tables" in deadline.skipped_stages
+
+
 def _extract_tables_in_process(
     file_path: str | PathLike[str],
     config_dict: dict[str, Any],
     result_queue: queue.Queue[tuple[bool, Any]],
+    page_indices: list[int] | None = None,
 ) -> None:
     """Extract tables in an isolated process to handle potential segfaults.
 
@@ -396,6 +446,7 @@ def _extract_tables_in_process(
         file_path: Path to the PDF file
         config_dict: Serialized GMFTConfig as a dict
         result_queue: Queue to put results or errors
+        page_indices: 0-based indices of the pages to process, or None for all pages
     """
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
@@ -430,8 +481,10 @@ def _extract_tables_in_process(
         dataframes = []
 
         try:
-            for page in doc:
-                cropped_tables.extend(detector.extract(page))  # type: ignore[attr-defined]
+            selected_pages = None if page_indices is None else set(page_indices)
+            for i, page in enumerate(doc):
+                if selected_pages is None or i in selected_pages:
+                    cropped_tables.extend(detector.extract(page))  # type: ignore[attr-defined]
 
             for cropped_table in cropped_tables:
                 formatted_table = formatter.extract(cropped_table)  # type: ignore[attr-defined]
@@ -467,6 +520,7 @@ def _extract_tables_isolated(
     file_path: str | PathLike[str],
     config: GMFTConfig | None = None,
     timeout: float = 300.0,
+    page_indices: list[int] | None = None,
 ) -> list[TableData]:
     """Extract tables using an isolated process to handle segfaults.
 
@@ -474,6 +528,7 @@ def _extract_tables_isolated(
         file_path: Path to the PDF file
         config: GMFT configuration
         timeout: Maximum time to wait for extraction
+        page_indices: 0-based indices of the pages to process, or None for all pages
 
     Returns:
         List of extracted tables
@@ -489,7 +544,7 @@ def _extract_tables_isolated(
 
     process = ctx.Process(
         target=_extract_tables_in_process,
-        args=(str(file_path), config_dict, result_queue),
+        args=(str(file_path), config_dict, result_queue, page_indices),
     )
 
     process.start()
@@ -576,6 +631,7 @@ async def _extract_tables_isolated_async(
     file_path: str | PathLike[str],
     config: GMFTConfig | None = None,
     timeout: float = 300.0,  # noqa: ASYNC109
+    page_indices: list[int] | None = None,
 ) -> list[TableData]:
     """Async version of extract_tables_isolated using asyncio.
 
@@ -583,6 +639,7 @@ async def _extract_tables_isolated_async(
         file_path: Path to the PDF file
         config: GMFT configuration
         timeout: Maximum time to wait for extraction
+        page_indices: 0-based indices of the pages to process, or None for all pages
 
     Returns:
         List of extracted tables
@@ -598,7 +655,7 @@ async def _extract_tables_isolated_async(
 
     process = ctx.Process(
         target=_extract_tables_in_process,
-        args=(str(file_path), config_dict, result_queue),
+        args=(str(file_path), config_dict, result_queue, page_indices),
     )
 
     process.start()
@@ -81,7 +81,7 @@ def extract_document(  # noqa: PLR0913
         extract_tables: Extract tables from the document
         extract_entities: Extract named entities
         extract_keywords: Extract keywords
-        ocr_backend: OCR backend to use (tesseract, easyocr, paddleocr)
+        ocr_backend: OCR backend to use (tesseract, tesserocr, easyocr, paddleocr)
         max_chars: Maximum characters per chunk
         max_overlap: Character overlap between chunks
         keyword_count: Number of keywords to extract
@@ -132,7 +132,7 @@ def extract_bytes(  # noqa: PLR0913
         extract_tables: Extract tables from the document
         extract_entities: Extract named entities
         extract_keywords: Extract keywords
-        ocr_backend: OCR backend to use (tesseract, easyocr, paddleocr)
+        ocr_backend: OCR backend to use (tesseract, tesserocr, easyocr, paddleocr)
         max_chars: Maximum characters per chunk
         max_overlap: Character overlap between chunks
         keyword_count: Number of keywords to extract
@@ -198,7 +198,7 @@ def get_discovered_config() -> str:
 @mcp.resource("config://available-backends")
 def get_available_backends() -> str:
     """Get available OCR backends."""
-    return "tesseract, easyocr, paddleocr"
+    return "tesseract, tesserocr, easyocr, paddleocr"
 
 
 @mcp.resource("extractors://supported-formats")
@@ -5,6 +5,7 @@ from kreuzberg._ocr._base import OCRBackend
 from kreuzberg._ocr._easyocr import EasyOCRBackend
 from kreuzberg._ocr._paddleocr import PaddleBackend
 from kreuzberg._ocr._tesseract import TesseractBackend, TesseractProcessPool
+from kreuzberg._ocr._tesserocr import TesserocrBackend
 from kreuzberg._types import OcrBackendType
 
 __all__ = [
@@ -13,6 +14,7 @@ __all__ = [
     "PaddleBackend",
     "TesseractBackend",
     "TesseractProcessPool",
+    "TesserocrBackend",
     "get_ocr_backend",
 ]
 
@@ -23,4 +25,6 @@ def get_ocr_backend(backend: OcrBackendType) -> OCRBackend[Any]:
         return EasyOCRBackend()
     if backend == "paddleocr":
         return PaddleBackend()
+    if backend == "tesserocr":
+        return TesserocrBackend()
     return TesseractBackend()
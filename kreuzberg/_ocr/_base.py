@@ -108,6 +108,23 @@ class OCRBackend(ABC, Generic[T]):
         tasks = [self.process_file(path, **kwargs) for path in paths]
         return await run_taskgroup(*tasks)
 
+    async def warmup(self, **kwargs: Unpack[T]) -> None:
+        """Asynchronously load and validate everything the backend needs to recognise its first image.
+
+        The default implementation does nothing. Backends override it to move their start-up cost, e.g. loading
+        models, out of the first call to ``process_image`` or ``process_file``.
+
+        Args:
+            **kwargs: Any kwargs related to the given backend
+        """
+
+    def warmup_sync(self, **kwargs: Unpack[T]) -> None:
+        """Synchronously load and validate everything the backend needs to recognise its first image.
+
+        Args:
+            **kwargs: Any kwargs related to the given backend
+        """
+
     def __hash__(self) -> int:
         """Hash function for allowing caching."""
         return hash(type(self).__name__)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import warnings
+from collections import defaultdict
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal
 
@@ -10,7 +12,13 @@ from PIL import Image
 from kreuzberg._mime_types import PLAIN_TEXT_MIME_TYPE
 from kreuzberg._ocr._base import OCRBackend
 from kreuzberg._types import ExtractionResult, Metadata
-from kreuzberg._utils._device import DeviceInfo, DeviceType, validate_device_request
+from kreuzberg._utils._device import (
+    LINE_CROP_SIZE_MB,
+    DeviceInfo,
+    DeviceType,
+    get_recommended_batch_size,
+    validate_device_request,
+)
 from kreuzberg._utils._string import normalize_spaces
 from kreuzberg._utils._sync import run_sync
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
@@ -166,6 +174,7 @@ class EasyOCRConfig:
 
 class EasyOCRBackend(OCRBackend[EasyOCRConfig]):
     _reader: ClassVar[Any] = None
+    _device_info: ClassVar[DeviceInfo | None] = None
 
     async def process_image(self, image: Image.Image, **kwargs: Unpack[EasyOCRConfig]) -> ExtractionResult:
         """Asynchronously process an image and extract its text and metadata using EasyOCR.
@@ -194,6 +203,7 @@ class EasyOCRBackend(OCRBackend[EasyOCRConfig]):
                 self._reader.readtext,
                 np.array(image),
                 beamWidth=beam_width,
+                batch_size=self._get_batch_size(LINE_CROP_SIZE_MB),
                 **kwargs,
             )
 
@@ -221,6 +231,129 @@ class EasyOCRBackend(OCRBackend[EasyOCRConfig]):
         except Exception as e:
             raise OCRError(f"Failed to load or process image using EasyOCR: {e}") from e
 
+    async def warmup(self, **kwargs: Unpack[EasyOCRConfig]) -> None:
+        """Asynchronously load the EasyOCR models of the configured languages.
+
+        Args:
+            **kwargs: Configuration parameters for EasyOCR including language, etc.
+
+        Raises:
+            MissingDependencyError: If EasyOCR is not installed.
+            OCRError: If initialization fails.
+        """
+        await self._init_easyocr(**kwargs)
+
+    def warmup_sync(self, **kwargs: Unpack[EasyOCRConfig]) -> None:
+        """Synchronously load the EasyOCR models of the configured languages.
+
+        Args:
+            **kwargs: Configuration parameters for EasyOCR including language, etc.
+
+        Raises:
+            MissingDependencyError: If EasyOCR is not installed.
+            OCRError: If initialization fails.
+        """
+        self._init_easyocr_sync(**kwargs)
+
+    async def process_batch(self, paths: list[Path], **kwargs: Unpack[EasyOCRConfig]) -> list[ExtractionResult]:
+        """Asynchronously process a batch of files, recognising pages of the same size together.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Configuration parameters for EasyOCR including language, detection thresholds, etc.
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+
+        Raises:
+            OCRError: If file loading or OCR processing fails.
+        """
+        await self._init_easyocr(**kwargs)
+        return await run_sync(self.process_batch_sync, paths, **kwargs)
+
+    def process_batch_sync(self, paths: list[Path], **kwargs: Unpack[EasyOCRConfig]) -> list[ExtractionResult]:
+        """Synchronously process a batch of files, recognising pages of the same size together.
+
+        The detector and the recogniser each run once per batch of pages instead of once per page, and the text lines
+        of the pages are recognised in batches as well. The batch sizes follow the memory available on the device.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Configuration parameters for EasyOCR including language, detection thresholds, etc.
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+
+        Raises:
+            OCRError: If file loading or OCR processing fails.
+        """
+        if not paths:
+            return []
+
+        self._init_easyocr_sync(**kwargs)
+        with ExitStack() as stack:
+            try:
+                images: list[Image.Image] = [stack.enter_context(Image.open(path)) for path in paths]
+            except Exception as e:
+                raise OCRError(f"Failed to load or process image using EasyOCR: {e}") from e
+            return self._process_images_batched(images, **kwargs)
+
+    def _process_images_batched(
+        self, images: list[Image.Image], **kwargs: Unpack[EasyOCRConfig]
+    ) -> list[ExtractionResult]:
+        """Recognise images with ``readtext_batched``, in batches of images of the same size and mode.
+
+        Args:
+            images: The images to recognise.
+            **kwargs: Configuration parameters for EasyOCR including language, detection thresholds, etc.
+
+        Returns:
+            The extraction result of every image, in the order of the images.
+
+        Raises:
+            OCRError: If OCR processing fails.
+        """
+        beam_width = kwargs.pop("beam_width")
+        kwargs.pop("language", None)
+        kwargs.pop("use_gpu", None)
+
+        page_size_mb = max(image.width * image.height * 3 for image in images) / 1024**2
+        line_batch_size = self._get_batch_size(LINE_CROP_SIZE_MB)
+        results: dict[int, ExtractionResult] = {}
+        for batch in self._group_images(images, self._get_batch_size(page_size_mb)):
+            try:
+                batch_results = self._reader.readtext_batched(
+                    [np.array(images[index]) for index in batch],
+                    beamWidth=beam_width,
+                    batch_size=line_batch_size,
+                    **kwargs,
+                )
+            except Exception as e:
+                raise OCRError(f"Failed to OCR using EasyOCR: {e}", context={"batch_size": len(batch)}) from e
+            for index, result in zip(batch, batch_results, strict=True):
+                results[index] = self._process_easyocr_result(result, images[index])
+        return [results[index] for index in range(len(images))]
+
+    @staticmethod
+    def _group_images(images: list[Image.Image], batch_size: int) -> list[list[int]]:
+        """Group the indices of images into batches of at most ``batch_size`` images of the same size and mode.
+
+        ``readtext_batched`` stacks the images of a batch into one array, so they must have the same shape.
+        """
+        groups: defaultdict[tuple[tuple[int, int], str], list[int]] = defaultdict(list)
+        for index, image in enumerate(images):
+            groups[image.size, image.mode].append(index)
+        return [
+            indices[start : start + batch_size]
+            for indices in groups.values()
+            for start in range(0, len(indices), batch_size)
+        ]
+
+    @classmethod
+    def _get_batch_size(cls, input_size_mb: float) -> int:
+        """Get the recommended batch size on the device of the reader, for items of the given size."""
+        return get_recommended_batch_size(cls._device_info or DeviceInfo(device_type="cpu", name="CPU"), input_size_mb)
+
     @staticmethod
     def _process_easyocr_result(result: list[Any], image: Image.Image) -> ExtractionResult:
         """Process EasyOCR result into an ExtractionResult with metadata.
@@ -364,6 +497,7 @@ class EasyOCRBackend(OCRBackend[EasyOCRConfig]):
             )
         except Exception as e:
             raise OCRError(f"Failed to initialize EasyOCR: {e}") from e
+        cls._device_info = device_info
 
     @classmethod
     def _resolve_device_config(cls, **kwargs: Unpack[EasyOCRConfig]) -> DeviceInfo:
@@ -465,6 +599,7 @@ class EasyOCRBackend(OCRBackend[EasyOCRConfig]):
             result = self._reader.readtext(
                 np.array(image),
                 beamWidth=beam_width,
+                batch_size=self._get_batch_size(LINE_CROP_SIZE_MB),
                 **kwargs,
             )
 
@@ -531,3 +666,4 @@ class EasyOCRBackend(OCRBackend[EasyOCRConfig]):
             )
         except Exception as e:
             raise OCRError(f"Failed to initialize EasyOCR: {e}") from e
+        cls._device_info = device_info
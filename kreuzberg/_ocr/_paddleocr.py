@@ -13,7 +13,13 @@ from PIL import Image
 from kreuzberg._mime_types import PLAIN_TEXT_MIME_TYPE
 from kreuzberg._ocr._base import OCRBackend
 from kreuzberg._types import ExtractionResult, Metadata
-from kreuzberg._utils._device import DeviceInfo, DeviceType, validate_device_request
+from kreuzberg._utils._device import (
+    LINE_CROP_SIZE_MB,
+    DeviceInfo,
+    DeviceType,
+    get_recommended_batch_size,
+    validate_device_request,
+)
 from kreuzberg._utils._string import normalize_spaces
 from kreuzberg._utils._sync import run_sync
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
@@ -158,6 +164,50 @@ class PaddleBackend(OCRBackend[PaddleOCRConfig]):
         except Exception as e:
             raise OCRError(f"Failed to load or process image using PaddleOCR: {e}") from e
 
+    async def process_batch(self, paths: list[Path], **kwargs: Unpack[PaddleOCRConfig]) -> list[ExtractionResult]:
+        """Asynchronously process a batch of files, one page after another in a worker thread.
+
+        PaddleOCR detects the text of one page per call and its predictors are not safe to share between threads, so
+        the pages are not recognised concurrently. The text lines of each page are classified and recognised in
+        batches, whose size follows the memory available on the device.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Configuration parameters for PaddleOCR including language, detection thresholds, etc.
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+
+        Raises:
+            OCRError: If file loading or OCR processing fails.
+        """
+        await self._init_paddle_ocr(**kwargs)
+        return await run_sync(self.process_batch_sync, paths, **kwargs)
+
+    async def warmup(self, **kwargs: Unpack[PaddleOCRConfig]) -> None:
+        """Asynchronously load the PaddleOCR models of the configured language.
+
+        Args:
+            **kwargs: Configuration parameters for PaddleOCR including language, detection thresholds, etc.
+
+        Raises:
+            MissingDependencyError: If PaddleOCR is not installed.
+            OCRError: If initialization fails.
+        """
+        await self._init_paddle_ocr(**kwargs)
+
+    def warmup_sync(self, **kwargs: Unpack[PaddleOCRConfig]) -> None:
+        """Synchronously load the PaddleOCR models of the configured language.
+
+        Args:
+            **kwargs: Configuration parameters for PaddleOCR including language, detection thresholds, etc.
+
+        Raises:
+            MissingDependencyError: If PaddleOCR is not installed.
+            OCRError: If initialization fails.
+        """
+        self._init_paddle_ocr_sync(**kwargs)
+
     @staticmethod
     def _process_paddle_result(result: list[Any] | Any, image: Image.Image) -> ExtractionResult:
         """Process PaddleOCR result into an ExtractionResult with metadata.
@@ -278,6 +328,9 @@ class PaddleBackend(OCRBackend[PaddleOCRConfig]):
         kwargs.setdefault("det_db_thresh", 0.3)
         kwargs.setdefault("det_db_box_thresh", 0.5)
         kwargs.setdefault("det_db_unclip_ratio", 1.6)
+        line_batch_size = get_recommended_batch_size(device_info, LINE_CROP_SIZE_MB)
+        kwargs.setdefault("rec_batch_num", line_batch_size)
+        kwargs.setdefault("cls_batch_num", line_batch_size)
 
         if device_info.device_type == "cuda" and kwargs.get("gpu_memory_limit"):
             kwargs["gpu_mem"] = int(kwargs["gpu_memory_limit"] * 1024)
@@ -445,6 +498,9 @@ class PaddleBackend(OCRBackend[PaddleOCRConfig]):
         kwargs.setdefault("det_db_thresh", 0.3)
         kwargs.setdefault("det_db_box_thresh", 0.5)
         kwargs.setdefault("det_db_unclip_ratio", 1.6)
+        line_batch_size = get_recommended_batch_size(device_info, LINE_CROP_SIZE_MB)
+        kwargs.setdefault("rec_batch_num", line_batch_size)
+        kwargs.setdefault("cls_batch_num", line_batch_size)
 
         if device_info.device_type == "cuda" and kwargs.get("gpu_memory_limit"):
             kwargs["gpu_mem"] = int(kwargs["gpu_memory_limit"] * 1024)
@@ -0,0 +1,210 @@
+"""Low-resolution pre-pass before OCR, detecting the orientation, script and languages of a page."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from PIL import Image
+
+from kreuzberg._language_detection import LanguageDetectionConfig, detect_languages
+from kreuzberg.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from PIL.Image import Image as PILImage
+
+ROTATIONS: Final[tuple[int, ...]] = (0, 90, 180, 270)
+"""The clockwise rotations, in degrees, that the orientation detection can report."""
+
+_TRANSPOSITIONS: Final[dict[int, Image.Transpose]] = {
+    90: Image.Transpose.ROTATE_270,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_90,
+}
+
+_SCRIPT_LANGUAGES: Final[dict[str, frozenset[str]]] = {
+    "Arabic": frozenset({"ara", "fas", "pus", "snd", "uig", "urd"}),
+    "Bengali": frozenset({"asm", "ben"}),
+    "Cyrillic": frozenset({"bel", "bul", "kaz", "kir", "mkd", "mon", "rus", "srp", "tat", "tgk", "ukr", "uzb_cyrl"}),
+    "Devanagari": frozenset({"hin", "mar", "nep", "san"}),
+    "Greek": frozenset({"ell", "grc"}),
+    "Han": frozenset({"chi_sim", "chi_tra", "jpn"}),
+    "Hangul": frozenset({"kor"}),
+    "Hebrew": frozenset({"heb", "yid"}),
+    "Japanese": frozenset({"jpn"}),
+    "Katakana": frozenset({"jpn"}),
+    "Hiragana": frozenset({"jpn"}),
+    "Thai": frozenset({"tha"}),
+}
+"""The Tesseract languages written in each non-Latin script reported by orientation and script detection."""
+
+_LANGDETECT_LANGUAGES: Final[dict[str, tuple[str, ...]]] = {
+    "ar": ("ara",),
+    "bg": ("bul",),
+    "bn": ("ben",),
+    "ca": ("cat",),
+    "cs": ("ces",),
+    "da": ("dan",),
+    "de": ("deu",),
+    "el": ("ell",),
+    "en": ("eng",),
+    "es": ("spa",),
+    "et": ("est",),
+    "eu": ("eus",),
+    "fa": ("fas",),
+    "fi": ("fin",),
+    "fr": ("fra",),
+    "gl": ("glg",),
+    "he": ("heb",),
+    "hi": ("hin",),
+    "hr": ("hrv",),
+    "hu": ("hun",),
+    "id": ("ind",),
+    "it": ("ita",),
+    "ja": ("jpn",),
+    "ko": ("kor",),
+    "lt": ("lit",),
+    "lv": ("lav",),
+    "nl": ("nld",),
+    "no": ("nor",),
+    "pl": ("pol",),
+    "pt": ("por",),
+    "ro": ("ron",),
+    "ru": ("rus",),
+    "sk": ("slk",),
+    "sl": ("slv",),
+    "sr": ("srp", "srp_latn"),
+    "sv": ("swe",),
+    "th": ("tha",),
+    "tr": ("tur",),
+    "uk": ("ukr",),
+    "vi": ("vie",),
+    "zh": ("chi_sim", "chi_tra"),
+}
+"""The Tesseract languages of the ISO 639-1 codes returned by language detection."""
+
+_MIN_DRAFT_CHARACTERS = 20
+
+
+@dataclass(unsafe_hash=True, frozen=True, slots=True)
+class OCRPrepassConfig:
+    """Configuration of the low-resolution pre-pass run on every page before OCR.
+
+    The pre-pass works on a downscaled draft of the page. Tesseract's orientation and script detection finds
+    pages that are upside down or on their side, which are rotated upright before OCR, and the detected script
+    narrows down the configured languages. If several languages remain, a quick OCR of the draft with one of
+    them is passed to language detection, and the full-resolution OCR only uses the detected languages.
+    Recognising a page with a single language is several times faster than with ``eng+deu+fra+...``.
+
+    The orientation detection requires the ``osd`` Tesseract language data, and the language detection the
+    ``langdetect`` optional dependency.
+    """
+
+    detect_orientation: bool = True
+    """Whether to detect the orientation and script of pages, rotating them upright."""
+    min_orientation_confidence: float = 2.0
+    """Smallest confidence of the orientation and script detection for its result to be used."""
+    detect_language: bool = True
+    """Whether to detect the languages of pages among the configured languages."""
+    max_languages: int = 2
+    """Largest number of detected languages the page is recognised with."""
+    draft_scale: float = 0.5
+    """Scale of the draft of the page, relative to the image passed to OCR."""
+
+    def __post_init__(self) -> None:
+        if self.max_languages < 1 or not 0 < self.draft_scale <= 1 or self.min_orientation_confidence < 0:
+            raise ValidationError(
+                "'max_languages' must be positive, 'draft_scale' must be above 0 and at most 1 and "
+                "'min_orientation_confidence' must not be negative",
+                context={
+                    "max_languages": self.max_languages,
+                    "draft_scale": self.draft_scale,
+                    "min_orientation_confidence": self.min_orientation_confidence,
+                },
+            )
+
+
+def get_prepass_config(value: OCRPrepassConfig | dict[str, Any] | None) -> OCRPrepassConfig | None:
+    """Get the pre-pass configuration from an OCR configuration value, which may have been converted to a dict."""
+    if isinstance(value, dict):
+        return OCRPrepassConfig(**value)
+    return value
+
+
+def make_draft(image: PILImage, scale: float) -> PILImage:
+    """Make the grayscale, downscaled draft of a page the pre-pass works on."""
+    draft = image.convert("L")
+    if scale < 1:
+        size = (max(1, round(draft.width * scale)), max(1, round(draft.height * scale)))
+        draft = draft.resize(size, Image.Resampling.BOX)
+    return draft
+
+
+def rotate_image(image: PILImage, rotation: int) -> PILImage:
+    """Rotate an image clockwise by a multiple of 90 degrees, without resampling it."""
+    return image.transpose(_TRANSPOSITIONS[rotation]) if rotation in _TRANSPOSITIONS else image
+
+
+def parse_osd(output: str) -> tuple[int, float, str | None, float]:
+    """Parse the output of Tesseract's orientation and script detection.
+
+    Args:
+        output: The output of ``tesseract --psm 0``.
+
+    Returns:
+        The clockwise rotation in degrees that makes the page upright, the confidence of the orientation, the
+        detected script and the confidence of the script. The rotation and confidences are 0 and the script None if
+        they are missing from the output.
+    """
+    values = dict(re.findall(r"^([A-Za-z ]+):\s*(\S+)", output, flags=re.MULTILINE))
+    try:
+        rotation = int(values.get("Rotate", "0")) % 360
+        orientation_confidence = float(values.get("Orientation confidence", "0"))
+        script_confidence = float(values.get("Script confidence", "0"))
+    except ValueError:
+        return 0, 0.0, None, 0.0
+    return (rotation if rotation in ROTATIONS else 0), orientation_confidence, values.get("Script"), script_confidence
+
+
+def get_script_languages(languages: list[str], script: str | None) -> list[str]:
+    """Get the languages written in a script, keeping all languages if none of them or the script is unknown.
+
+    Args:
+        languages: The configured Tesseract languages.
+        script: The script detected by orientation and script detection.
+
+    Returns:
+        The languages written in the script, in their configured order.
+    """
+    if script is None:
+        return languages
+    if script == "Latin":
+        non_latin = frozenset().union(*_SCRIPT_LANGUAGES.values())
+        in_script = [language for language in languages if language not in non_latin]
+    else:
+        in_script = [language for language in languages if language in _SCRIPT_LANGUAGES.get(script, ())]
+    return in_script or languages
+
+
+def select_languages(draft_text: str, languages: list[str], max_languages: int) -> list[str]:
+    """Select the languages of a page among the configured languages, by language detection on a draft of its text.
+
+    Args:
+        draft_text: The text of a quick OCR of the page.
+        languages: The configured Tesseract languages.
+        max_languages: The largest number of languages to select.
+
+    Raises:
+        MissingDependencyError: If fast-langdetect is not installed.
+
+    Returns:
+        The detected languages in their configured order, or all languages if none of them was detected.
+    """
+    text = " ".join(draft_text.split())
+    if len(text) < _MIN_DRAFT_CHARACTERS:
+        return languages
+
+    detected = detect_languages(text, LanguageDetectionConfig(multilingual=True, top_k=max_languages)) or []
+    candidates = {language for code in detected for language in _LANGDETECT_LANGUAGES.get(code.split("-")[0], ())}
+    return [language for language in languages if language in candidates][:max_languages] or languages
@@ -0,0 +1,282 @@
+"""Image preprocessing before OCR: border cropping, deskewing, downscaling, binarization and despeckling."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from statistics import median
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from kreuzberg.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from numpy.typing import NDArray
+    from PIL.Image import Image as PILImage
+
+_INK_THRESHOLD = 128
+_MIN_INK_ROW_SHARE = 0.005
+_BORDER_INK_SHARE = 0.5
+_MIN_LINE_ROWS = 3
+_BASELINE_PERCENTILE = 10
+_DESKEW_PROBE_WIDTH = 800
+_DESKEW_COARSE_STEP = 1.0
+_DESKEW_FINE_STEP = 0.1
+_MIN_SKEW_ANGLE = 0.1
+_SAUVOLA_DYNAMIC_RANGE = 128.0
+
+
+@dataclass(unsafe_hash=True, frozen=True, slots=True)
+class ImagePreprocessingConfig:
+    """Configuration of the image preprocessing applied before OCR.
+
+    The enabled steps run in this order: cropping of dark scan borders and blank margins, deskewing, downscaling to
+    ``target_x_height``, binarization and despeckling. Every step works on a grayscale copy of the image,
+    and the result is a bilevel image when ``binarize`` is enabled. Clean, bilevel input of the right size is
+    recognised considerably faster by Tesseract than noisy, skewed or over-sized scans.
+    """
+
+    crop_borders: bool = True
+    """Whether to crop dark scan borders and the blank margins around the text."""
+    border_padding: int = 10
+    """Blank margin, in pixels, kept around the text when cropping."""
+    deskew: bool = True
+    """Whether to straighten text lines that are rotated by up to ``max_skew_angle`` degrees."""
+    max_skew_angle: float = 5.0
+    """Largest skew angle, in degrees, searched for when deskewing."""
+    downscale: bool = True
+    """Whether to downscale images whose text is larger than ``target_x_height``. Images are never upscaled."""
+    target_x_height: int = 24
+    """Target height of lowercase letters in pixels. Tesseract is most accurate with an x-height of 20-30 pixels."""
+    binarize: bool = True
+    """Whether to binarize the image with Sauvola's adaptive threshold, which copes with uneven lighting and shadows."""
+    binarize_window: int = 31
+    """Side of the square window, in pixels, the threshold of every pixel is computed over. Must be odd."""
+    binarize_k: float = 0.2
+    """Sensitivity of the adaptive threshold. Higher values drop more faint strokes and background noise."""
+    despeckle: bool = True
+    """Whether to remove isolated specks of noise with a median filter."""
+    despeckle_size: int = 3
+    """Side of the median filter, in pixels. Must be odd."""
+
+    def __post_init__(self) -> None:
+        if self.border_padding < 0 or self.target_x_height < 1 or not 0 <= self.max_skew_angle <= 45:
+            raise ValidationError(
+                "'border_padding' must not be negative, 'target_x_height' must be positive and 'max_skew_angle' "
+                "must be between 0 and 45 degrees",
+                context={
+                    "border_padding": self.border_padding,
+                    "target_x_height": self.target_x_height,
+                    "max_skew_angle": self.max_skew_angle,
+                },
+            )
+        if self.binarize_window < 3 or self.binarize_window % 2 == 0:
+            raise ValidationError(
+                "'binarize_window' must be an odd number of at least 3",
+                context={"binarize_window": self.binarize_window},
+            )
+        if self.despeckle_size < 3 or self.despeckle_size % 2 == 0:
+            raise ValidationError(
+                "'despeckle_size' must be an odd number of at least 3", context={"despeckle_size": self.despeckle_size}
+            )
+
+
+def preprocess_image(image: PILImage, config: ImagePreprocessingConfig) -> tuple[PILImage, dict[str, float]]:
+    """Preprocess an image for OCR.
+
+    Args:
+        image: The image to preprocess. It is not modified.
+        config: The preprocessing configuration.
+
+    Returns:
+        The preprocessed image, in mode 1 if it was binarized and L otherwise, and the seconds spent in each of the
+        enabled steps.
+    """
+    steps: list[tuple[str, bool, Callable[[PILImage], PILImage]]] = [
+        ("crop_borders", config.crop_borders, lambda gray: _crop_borders(gray, config.border_padding)),
+        ("deskew", config.deskew, lambda gray: _deskew(gray, config.max_skew_angle)),
+        ("downscale", config.downscale, lambda gray: _downscale(gray, config.target_x_height)),
+        ("binarize", config.binarize, lambda gray: _binarize(gray, config.binarize_window, config.binarize_k)),
+        ("despeckle", config.despeckle, lambda gray: gray.filter(ImageFilter.MedianFilter(config.despeckle_size))),
+    ]
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    gray = _to_grayscale(image)
+    timings["grayscale"] = time.perf_counter() - start
+    for name, enabled, step in steps:
+        if enabled:
+            start = time.perf_counter()
+            gray = step(gray)
+            timings[name] = time.perf_counter() - start
+
+    if config.binarize:
+        gray = gray.convert("1", dither=Image.Dither.NONE)
+    return gray, timings
+
+
+def get_preprocessing_config(
+    value: ImagePreprocessingConfig | dict[str, Any] | None,
+) -> ImagePreprocessingConfig | None:
+    """Get the preprocessing configuration from an OCR configuration value.
+
+    The OCR configuration reaches the backends as a dict of its fields, so the nested preprocessing configuration
+    may have been converted to a dict as well.
+    """
+    if isinstance(value, dict):
+        return ImagePreprocessingConfig(**value)
+    return value
+
+
+def _to_grayscale(image: PILImage) -> PILImage:
+    """Convert an image to grayscale, flattening transparent images onto white."""
+    if image.mode in {"RGBA", "LA", "PA"} or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, "white")
+        image.paste(rgba, mask=rgba.getchannel("A"))
+    return image.convert("L") if image.mode != "L" else image.copy()
+
+
+def _ink(gray: PILImage) -> NDArray[np.bool_]:
+    """Get the mask of the dark pixels of a grayscale image, by a global threshold."""
+    return np.asarray(gray) < _INK_THRESHOLD
+
+
+def _span(mask: NDArray[np.bool_], padding: int = 0) -> tuple[int, int] | None:
+    """Get the span from the first to the last set element of a mask, widened by ``padding`` within its bounds."""
+    indices = np.flatnonzero(mask)
+    if not indices.size:
+        return None
+    return max(0, int(indices[0]) - padding), min(mask.size, int(indices[-1]) + 1 + padding)
+
+
+def _crop_borders(gray: PILImage, padding: int) -> PILImage:
+    """Crop the dark scan borders and the blank margins of an image, keeping ``padding`` pixels around the text.
+
+    The rows and columns that are mostly ink at the edges of the image are the dark borders. Once they are cut off,
+    the rows and columns without ink at the edges are the blank margins.
+    """
+    ink = _ink(gray)
+    rows = _span(ink.mean(axis=1) < _BORDER_INK_SHARE)
+    columns = _span(ink.mean(axis=0) < _BORDER_INK_SHARE)
+    if rows is None or columns is None:
+        return gray
+
+    ink = ink[rows[0] : rows[1], columns[0] : columns[1]]
+    text_rows = _span(ink.mean(axis=1) >= _MIN_INK_ROW_SHARE, padding)
+    text_columns = _span(ink.mean(axis=0) >= _MIN_INK_ROW_SHARE, padding)
+    if text_rows is None or text_columns is None:
+        return gray.crop((columns[0], rows[0], columns[1], rows[1]))
+    return gray.crop(
+        (
+            columns[0] + text_columns[0],
+            rows[0] + text_rows[0],
+            columns[0] + text_columns[1],
+            rows[0] + text_rows[1],
+        )
+    )
+
+
+def _estimate_x_height(gray: PILImage) -> float | None:
+    """Estimate the median x-height of the text of an image.
+
+    The image is reduced to a horizontal projection profile, and every run of rows with ink is treated as a line of
+    text. Within a line, the rows holding at least half of its densest row's ink are the x-height band, as the
+    ascenders and descenders above and below it are sparse. The ink every row has in common, such as a slanted scan
+    border, is subtracted first, and runs taller than a quarter of the image are not taken for lines of text.
+
+    Returns:
+        The x-height in pixels, or None if no lines of text were found.
+    """
+    profile = _ink(gray).mean(axis=1)
+    profile = profile - np.percentile(profile, _BASELINE_PERCENTILE)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], (profile >= _MIN_INK_ROW_SHARE).astype(np.int8), [0]))))
+    x_heights = []
+    for start, end in zip(edges[::2], edges[1::2], strict=True):
+        if _MIN_LINE_ROWS <= end - start <= gray.height // 4:
+            line = profile[start:end]
+            x_heights.append(int(np.count_nonzero(line >= line.max() / 2)))
+    return median(x_heights) if x_heights else None
+
+
+def _downscale(gray: PILImage, target_x_height: int) -> PILImage:
+    """Downscale an image so that the x-height of its text is ``target_x_height``, if it is larger."""
+    x_height = _estimate_x_height(gray)
+    if x_height is None or x_height <= target_x_height:
+        return gray
+    scale = target_x_height / x_height
+    size = (max(1, round(gray.width * scale)), max(1, round(gray.height * scale)))
+    return gray.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+def _alignment_score(probe: PILImage, angle: float) -> float:
+    """Score how well the text lines of an ink probe align with its rows when rotated by ``angle`` degrees.
+
+    Aligned lines concentrate their ink in few rows, which maximizes the sum of squares of the row sums.
+    """
+    rotated = probe.rotate(angle, resample=Image.Resampling.BILINEAR, expand=True, fillcolor=0)
+    row_sums = np.asarray(rotated, dtype=np.float64).sum(axis=1)
+    return float(np.square(row_sums).sum())
+
+
+def _find_skew_angle(gray: PILImage, max_angle: float) -> float:
+    """Find the angle, in degrees counter-clockwise, that straightens the text lines of an image.
+
+    The angles are searched in whole degrees on a reduced ink probe of the image first, and then refined in tenths of
+    a degree around the best of them.
+    """
+    probe = gray.point(lambda value: 255 if value < _INK_THRESHOLD else 0)
+    if probe.width > _DESKEW_PROBE_WIDTH:
+        probe = probe.resize(
+            (_DESKEW_PROBE_WIDTH, max(1, probe.height * _DESKEW_PROBE_WIDTH // probe.width)), Image.Resampling.BOX
+        )
+
+    best = 0.0
+    for step, span in ((_DESKEW_COARSE_STEP, max_angle), (_DESKEW_FINE_STEP, _DESKEW_COARSE_STEP)):
+        angles = np.arange(max(-max_angle, best - span), min(max_angle, best + span) + step / 2, step)
+        best = max((float(angle) for angle in angles), key=lambda angle: _alignment_score(probe, angle))
+    return best
+
+
+def _deskew(gray: PILImage, max_angle: float) -> PILImage:
+    """Rotate an image so that its text lines are horizontal."""
+    angle = _find_skew_angle(gray, max_angle) if max_angle else 0.0
+    if abs(angle) < _MIN_SKEW_ANGLE:
+        return gray
+    return gray.rotate(angle, resample=Image.Resampling.BICUBIC, expand=True, fillcolor=255)
+
+
+def _window_sums(values: NDArray[np.float64], window: int) -> NDArray[np.float64]:
+    """Sum ``values`` over the square window centred on every element, with an integral image.
+
+    The values are padded by repeating their edges, so every window holds ``window ** 2`` values.
+    """
+    padded = np.pad(values, window // 2, mode="edge")
+    integral: NDArray[np.float64] = np.pad(padded, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    return (
+        integral[window:, window:]
+        - integral[:-window, window:]
+        - integral[window:, :-window]
+        + integral[:-window, :-window]
+    )
+
+
+def _binarize(gray: PILImage, window: int, k: float) -> PILImage:
+    """Binarize an image with Sauvola's adaptive threshold.
+
+    The threshold of every pixel is ``mean * (1 + k * (std / 128 - 1))`` of the window around it, so it follows
+    uneven lighting, and drops towards black in flat regions, which keeps their noise out.
+
+    Returns:
+        The binarized image, in mode L with the values 0 and 255.
+    """
+    pixels = np.asarray(gray, dtype=np.float64)
+    area = window * window
+    mean = _window_sums(pixels, window) / area
+    variance = _window_sums(np.square(pixels), window) / area - np.square(mean)
+    threshold = mean * (1 + k * (np.sqrt(np.maximum(variance, 0)) / _SAUVOLA_DYNAMIC_RANGE - 1))
+    return Image.fromarray(np.where(pixels > threshold, 255, 0).astype(np.uint8))
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import hashlib
 import io
+import math
 import os
 import re
 import subprocess
 import sys
 import tempfile
+from contextlib import ExitStack
 from dataclasses import dataclass
 from enum import Enum
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Final
+from typing import TYPE_CHECKING, Any, ClassVar, Final, cast
 
 import anyio
 from anyio import Path as AsyncPath
@@ -20,15 +23,28 @@ from typing_extensions import Self
 
 from kreuzberg._mime_types import PLAIN_TEXT_MIME_TYPE
 from kreuzberg._ocr._base import OCRBackend
-from kreuzberg._types import ExtractionResult
+from kreuzberg._ocr._prepass import (
+    OCRPrepassConfig,
+    get_prepass_config,
+    get_script_languages,
+    make_draft,
+    parse_osd,
+    rotate_image,
+    select_languages,
+)
+from kreuzberg._ocr._preprocessing import ImagePreprocessingConfig, get_preprocessing_config, preprocess_image
+from kreuzberg._types import ExtractionResult, Metadata
 from kreuzberg._utils._string import normalize_spaces
-from kreuzberg._utils._sync import run_sync
+from kreuzberg._utils._sync import run_sync, run_taskgroup
 from kreuzberg._utils._tmp import create_temp_file
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
 
 if TYPE_CHECKING:
+    from pandas import DataFrame
     from PIL.Image import Image as PILImage
 
+    from kreuzberg._utils._process_pool import SharedImage
+
 try:  # pragma: no cover
     from typing import Unpack  # type: ignore[attr-defined]
 except ImportError:  # pragma: no cover
@@ -167,6 +183,20 @@ TESSERACT_SUPPORTED_LANGUAGE_CODES: Final[set[str]] = {
 
 MINIMAL_SUPPORTED_TESSERACT_VERSION: Final[int] = 5
 
+MAX_IMAGES_PER_TESSERACT_RUN: Final[int] = 16
+"""The maximum number of images OCR'd by one tesseract process in a batch."""
+
+TESSERACT_PAGE_SEPARATOR: Final[str] = "\f"
+"""The separator tesseract writes between the texts of the images of a multi-image run."""
+
+_WARMUP_IMAGE_SIZE: Final[int] = 32
+"""The width and height of the blank image recognised to load the traineddata."""
+
+_BACKEND_OPTIONS: Final[frozenset[str]] = frozenset(
+    {"include_layout", "language", "perceptual_cache_key", "prepass", "preprocessing", "psm"}
+)
+"""The ``TesseractConfig`` fields used by the backend itself rather than passed to tesseract as variables."""
+
 
 class PSMMode(Enum):
     """Enum for Tesseract Page Segmentation Modes (PSM) with human-readable values."""
@@ -201,6 +231,10 @@ class TesseractConfig:
 
     classify_use_pre_adapted_templates: bool = True
     """Whether to use pre-adapted templates during classification to improve recognition accuracy."""
+    include_layout: bool = False
+    """Whether to also return the layout of the recognised words as the result's ``layout``, from the same Tesseract
+    run (TSV output): a frame with the page, block, paragraph, line and word number, box and confidence of every word.
+    Requires pandas."""
     language: str = "eng"
     """Language code to use for OCR.
     Examples:
@@ -212,6 +246,20 @@ class TesseractConfig:
     """Enable or disable the use of n-gram-based language models for improved text recognition.
 
     Default is False for optimal performance on modern documents. Enable for degraded or historical text."""
+    perceptual_cache_key: bool = False
+    """Whether to key the OCR cache of images by a perceptual hash instead of their exact pixels.
+
+    Near-identical images, such as rescans or recompressions of a page, then reuse the cached result. Images that
+    differ only slightly, for example in a few words, may share it as well."""
+    prepass: OCRPrepassConfig | None = None
+    """A low-resolution pre-pass detecting the orientation and languages of every image. None disables it.
+
+    Images are rotated upright and recognised with only the detected ones of the configured ``language`` codes, and
+    the rotation and languages are reported in the ``ocr_rotations`` and ``ocr_languages`` metadata."""
+    preprocessing: ImagePreprocessingConfig | None = None
+    """Preprocessing of the images before OCR, such as deskewing and adaptive binarization. None disables it.
+
+    The OCR cache is keyed by the original image, so a cached image is neither preprocessed nor OCR'd again."""
     psm: PSMMode = PSMMode.AUTO
     """Page segmentation mode (PSM) to guide Tesseract on how to segment the image (e.g., single block, single line)."""
     tessedit_dont_blkrej_good_wds: bool = True
@@ -240,14 +288,15 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
     ) -> ExtractionResult:
         from kreuzberg._utils._cache import get_ocr_cache  # noqa: PLC0415
 
-        image_buffer = io.BytesIO()
-        await run_sync(image.save, image_buffer, format="PNG")
-        image_content = image_buffer.getvalue()
+        ocr_config = str(sorted(kwargs.items()))
+        image_hash, image_content, perceptual_hash = await run_sync(
+            _get_image_cache_key, image, ocr_config, kwargs.get("perceptual_cache_key", False)
+        )
 
         cache_kwargs = {
-            "image_hash": hashlib.sha256(image_content).hexdigest()[:16],
+            "image_hash": image_hash,
             "ocr_backend": "tesseract",
-            "ocr_config": str(sorted(kwargs.items())),
+            "ocr_config": ocr_config,
         }
 
         ocr_cache = get_ocr_cache()
@@ -268,16 +317,22 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
 
         try:
             await self._validate_tesseract_version()
-            image_path, unlink = await create_temp_file(".png")
-            await run_sync(image.save, str(image_path), format="PNG")
-            try:
-                result = await self.process_file(image_path, **kwargs)
+            language = self._validate_language_code(kwargs.pop("language", "eng"))
+            psm = kwargs.pop("psm", PSMMode.AUTO)
+            tsv = kwargs.pop("include_layout", False)
+            prepass = get_prepass_config(kwargs.pop("prepass", None))
+            preprocessing = get_preprocessing_config(kwargs.pop("preprocessing", None))
+            kwargs.pop("perceptual_cache_key", None)
+            output, metadata = await self._prepare_and_recognize_image(
+                image, image_content, language, psm, prepass, preprocessing, tsv=tsv, **kwargs
+            )
 
-                await ocr_cache.aset(result, **cache_kwargs)
+            extraction_result = _build_result(output, tsv=tsv, metadata=metadata)
+            await ocr_cache.aset(extraction_result, **cache_kwargs)
+            if perceptual_hash is not None:
+                await run_sync(_index_perceptual_hash, ocr_config, perceptual_hash)
 
-                return result
-            finally:
-                await unlink()
+            return extraction_result
         finally:
             ocr_cache.mark_complete(**cache_kwargs)
 
@@ -326,59 +381,42 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
 
         try:
             await self._validate_tesseract_version()
-            output_path, unlink = await create_temp_file(".txt")
             language = self._validate_language_code(kwargs.pop("language", "eng"))
             psm = kwargs.pop("psm", PSMMode.AUTO)
-            try:
-                output_base = str(output_path).replace(".txt", "")
-                command = [
-                    "tesseract",
-                    str(path),
-                    output_base,
-                    "-l",
+            tsv = kwargs.pop("include_layout", False)
+            prepass = kwargs.pop("prepass", None)
+            preprocessing = kwargs.pop("preprocessing", None)
+            perceptual_cache_key = kwargs.pop("perceptual_cache_key", False)
+            output, metadata = (
+                await self._preprocess_and_recognize_files(
+                    [path],
                     language,
-                    "--psm",
-                    str(psm.value),
-                    "--oem",
-                    "1",
-                    "--loglevel",
-                    "OFF",
-                ]
-                for kwarg, value in kwargs.items():
-                    if isinstance(value, bool):
-                        command.extend(["-c", f"{kwarg}={1 if value else 0}"])
-                    else:
-                        # Handle string parameters (like tessedit_char_whitelist)
-                        command.extend(["-c", f"{kwarg}={value}"])
-
-                env: dict[str, Any] | None = None
-                if sys.platform.startswith("linux"):
-                    env = {"OMP_THREAD_LIMIT": "1"}
-
-                result = await run_process(command, env=env)
-
-                if not result.returncode == 0:
-                    raise OCRError(
-                        "OCR failed with a non-0 return code.",
-                        context={
-                            "error": result.stderr.decode() if isinstance(result.stderr, bytes) else result.stderr
-                        },
-                    )
-
-                output = await AsyncPath(output_path).read_text("utf-8")
-                extraction_result = ExtractionResult(
-                    content=normalize_spaces(output), mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[]
+                    psm,
+                    get_prepass_config(prepass),
+                    get_preprocessing_config(preprocessing),
+                    tsv=tsv,
+                    **kwargs,
                 )
+            )[0]
+            extraction_result = _build_result(output, tsv=tsv, metadata=metadata)
+
+            final_cache_kwargs = cache_kwargs.copy()
+            final_cache_kwargs["ocr_config"] = str(
+                sorted(
+                    {
+                        **kwargs,
+                        "include_layout": tsv,
+                        "language": language,
+                        "perceptual_cache_key": perceptual_cache_key,
+                        "prepass": prepass,
+                        "preprocessing": preprocessing,
+                        "psm": psm,
+                    }.items()
+                )
+            )
+            await ocr_cache.aset(extraction_result, **final_cache_kwargs)
 
-                final_cache_kwargs = cache_kwargs.copy()
-                final_cache_kwargs["ocr_config"] = str(sorted({**kwargs, "language": language, "psm": psm}.items()))
-                await ocr_cache.aset(extraction_result, **final_cache_kwargs)
-
-                return extraction_result
-            except (RuntimeError, OSError) as e:
-                raise OCRError(f"Failed to OCR using tesseract: {e}") from e
-            finally:
-                await unlink()
+            return extraction_result
         finally:
             ocr_cache.mark_complete(**cache_kwargs)
 
@@ -423,14 +461,15 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
         """
         from kreuzberg._utils._cache import get_ocr_cache  # noqa: PLC0415
 
-        image_buffer = io.BytesIO()
-        image.save(image_buffer, format="PNG")
-        image_content = image_buffer.getvalue()
+        ocr_config = str(sorted(kwargs.items()))
+        image_hash, image_content, perceptual_hash = _get_image_cache_key(
+            image, ocr_config, kwargs.get("perceptual_cache_key", False)
+        )
 
         cache_kwargs = {
-            "image_hash": hashlib.sha256(image_content).hexdigest()[:16],
+            "image_hash": image_hash,
             "ocr_backend": "tesseract",
-            "ocr_config": str(sorted(kwargs.items())),
+            "ocr_config": ocr_config,
         }
 
         ocr_cache = get_ocr_cache()
@@ -451,18 +490,22 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
 
         try:
             self._validate_tesseract_version_sync()
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-                image_path = Path(tmp_file.name)
-                image.save(str(image_path), format="PNG")
-            try:
-                result = self.process_file_sync(image_path, **kwargs)
+            language = self._validate_language_code(kwargs.pop("language", "eng"))
+            psm = kwargs.pop("psm", PSMMode.AUTO)
+            tsv = kwargs.pop("include_layout", False)
+            prepass = get_prepass_config(kwargs.pop("prepass", None))
+            preprocessing = get_preprocessing_config(kwargs.pop("preprocessing", None))
+            kwargs.pop("perceptual_cache_key", None)
+            output, metadata = self._prepare_and_recognize_image_sync(
+                image, image_content, language, psm, prepass, preprocessing, tsv=tsv, **kwargs
+            )
 
-                ocr_cache.set(result, **cache_kwargs)
+            extraction_result = _build_result(output, tsv=tsv, metadata=metadata)
+            ocr_cache.set(extraction_result, **cache_kwargs)
+            if perceptual_hash is not None:
+                _index_perceptual_hash(ocr_config, perceptual_hash)
 
-                return result
-            finally:
-                if image_path.exists():
-                    image_path.unlink()
+            return extraction_result
         finally:
             ocr_cache.mark_complete(**cache_kwargs)
 
@@ -508,35 +551,571 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
 
         try:
             self._validate_tesseract_version_sync()
-            with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-                output_base = tmp_file.name.replace(".txt", "")
             language = self._validate_language_code(kwargs.pop("language", "eng"))
             psm = kwargs.pop("psm", PSMMode.AUTO)
+            tsv = kwargs.pop("include_layout", False)
+            prepass = kwargs.pop("prepass", None)
+            preprocessing = kwargs.pop("preprocessing", None)
+            perceptual_cache_key = kwargs.pop("perceptual_cache_key", False)
+            output, metadata = self._preprocess_and_recognize_files_sync(
+                [path],
+                language,
+                psm,
+                get_prepass_config(prepass),
+                get_preprocessing_config(preprocessing),
+                tsv=tsv,
+                **kwargs,
+            )[0]
+            extraction_result = _build_result(output, tsv=tsv, metadata=metadata)
+
+            final_cache_kwargs = cache_kwargs.copy()
+            final_cache_kwargs["ocr_config"] = str(
+                sorted(
+                    {
+                        **kwargs,
+                        "include_layout": tsv,
+                        "language": language,
+                        "perceptual_cache_key": perceptual_cache_key,
+                        "prepass": prepass,
+                        "preprocessing": preprocessing,
+                        "psm": psm,
+                    }.items()
+                )
+            )
+            ocr_cache.set(extraction_result, **final_cache_kwargs)
+
+            return extraction_result
+        finally:
+            ocr_cache.mark_complete(**cache_kwargs)
+
+    async def process_batch(self, paths: list[Path], **kwargs: Unpack[TesseractConfig]) -> list[ExtractionResult]:
+        """Asynchronously process a batch of image files, several of them per tesseract process.
+
+        The files without a cached result are split into chunks, spread evenly over the CPUs with at most
+        ``MAX_IMAGES_PER_TESSERACT_RUN`` files each, and every chunk is OCR'd by one tesseract process, so tesseract
+        starts and loads its traineddata once per chunk. Each file still gets its own result and OCR cache entry,
+        shared with ``process_file``.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Any kwargs related to the given backend
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+        """
+        from kreuzberg._utils._cache import get_ocr_cache  # noqa: PLC0415
+
+        ocr_cache = get_ocr_cache()
+        cache_kwargs = [self._get_file_cache_kwargs(path, kwargs) for path in paths]
+        results: list[ExtractionResult | None] = [await ocr_cache.aget(**keys) for keys in cache_kwargs]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return cast("list[ExtractionResult]", results)
+
+        await self._validate_tesseract_version()
+        language, psm, tsv, prepass, preprocessing, options = self._get_batch_options(kwargs)
+
+        async def process_chunk(chunk: list[int]) -> None:
+            for i in chunk:
+                ocr_cache.mark_processing(**cache_kwargs[i])
             try:
-                command = self._build_tesseract_command(path, output_base, language, psm, **kwargs)
-                self._run_tesseract_sync(command)
-
-                output_path = Path(output_base + ".txt")
-                with output_path.open(encoding="utf-8") as f:
-                    output = f.read()
-                extraction_result = ExtractionResult(
-                    content=normalize_spaces(output), mime_type=PLAIN_TEXT_MIME_TYPE, metadata={}, chunks=[]
+                outputs = await self._preprocess_and_recognize_files(
+                    [paths[i] for i in chunk], language, psm, prepass, preprocessing, tsv=tsv, **options
                 )
+                for i, (text, metadata) in zip(chunk, outputs, strict=True):
+                    result = _build_result(text, tsv=tsv, metadata=metadata)
+                    await ocr_cache.aset(result, **cache_kwargs[i])
+                    results[i] = result
+            finally:
+                for i in chunk:
+                    ocr_cache.mark_complete(**cache_kwargs[i])
 
-                final_cache_kwargs = cache_kwargs.copy()
-                final_cache_kwargs["ocr_config"] = str(sorted({**kwargs, "language": language, "psm": psm}.items()))
-                ocr_cache.set(extraction_result, **final_cache_kwargs)
+        batch_size = _get_batch_size(len(missing), cpu_count())
+        await run_taskgroup(
+            *(process_chunk(missing[start : start + batch_size]) for start in range(0, len(missing), batch_size))
+        )
+        return cast("list[ExtractionResult]", results)
 
-                return extraction_result
-            except (RuntimeError, OSError) as e:
-                raise OCRError(f"Failed to OCR using tesseract: {e}") from e
+    def process_batch_sync(self, paths: list[Path], **kwargs: Unpack[TesseractConfig]) -> list[ExtractionResult]:
+        """Synchronously process a batch of image files, several of them per tesseract process.
+
+        The files without a cached result are OCR'd in chunks of at most ``MAX_IMAGES_PER_TESSERACT_RUN`` files, one
+        tesseract process per chunk, so tesseract starts and loads its traineddata once per chunk. Each file still
+        gets its own result and OCR cache entry, shared with ``process_file_sync``.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Any kwargs related to the given backend
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+        """
+        from kreuzberg._utils._cache import get_ocr_cache  # noqa: PLC0415
+
+        ocr_cache = get_ocr_cache()
+        cache_kwargs = [self._get_file_cache_kwargs(path, kwargs) for path in paths]
+        results: list[ExtractionResult | None] = [ocr_cache.get(**keys) for keys in cache_kwargs]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return cast("list[ExtractionResult]", results)
+
+        self._validate_tesseract_version_sync()
+        language, psm, tsv, prepass, preprocessing, options = self._get_batch_options(kwargs)
+
+        for start in range(0, len(missing), MAX_IMAGES_PER_TESSERACT_RUN):
+            chunk = missing[start : start + MAX_IMAGES_PER_TESSERACT_RUN]
+            for i in chunk:
+                ocr_cache.mark_processing(**cache_kwargs[i])
+            try:
+                outputs = self._preprocess_and_recognize_files_sync(
+                    [paths[i] for i in chunk], language, psm, prepass, preprocessing, tsv=tsv, **options
+                )
+                for i, (text, metadata) in zip(chunk, outputs, strict=True):
+                    result = _build_result(text, tsv=tsv, metadata=metadata)
+                    ocr_cache.set(result, **cache_kwargs[i])
+                    results[i] = result
             finally:
-                for ext in [".txt"]:
-                    temp_file = Path(output_base + ext)
-                    if temp_file.exists():
-                        temp_file.unlink()
+                for i in chunk:
+                    ocr_cache.mark_complete(**cache_kwargs[i])
+
+        return cast("list[ExtractionResult]", results)
+
+    async def warmup(self, **kwargs: Unpack[TesseractConfig]) -> None:
+        """Asynchronously validate Tesseract and load the traineddata of the configured languages.
+
+        A small blank image is recognised with the configured languages and variables, which fails if the traineddata
+        is missing and leaves it in the page cache of the system for the first image, or in an idle engine of the
+        ``tesserocr`` backend.
+
+        Args:
+            **kwargs: Any kwargs related to the given backend
+
+        Raises:
+            MissingDependencyError: If Tesseract is not installed or is below version 5.
+            OCRError: If Tesseract failed to load the languages.
+        """
+        await self._validate_tesseract_version()
+        language, psm, _, _, _, options = self._get_batch_options(kwargs)
+        image = Image.new("L", (_WARMUP_IMAGE_SIZE, _WARMUP_IMAGE_SIZE), 255)
+        await self._recognize_image(image, _encode_image(image), language, psm, **options)
+
+    def warmup_sync(self, **kwargs: Unpack[TesseractConfig]) -> None:
+        """Synchronously validate Tesseract and load the traineddata of the configured languages.
+
+        Args:
+            **kwargs: Any kwargs related to the given backend
+
+        Raises:
+            MissingDependencyError: If Tesseract is not installed or is below version 5.
+            OCRError: If Tesseract failed to load the languages.
+        """
+        self._validate_tesseract_version_sync()
+        language, psm, _, _, _, options = self._get_batch_options(kwargs)
+        image = Image.new("L", (_WARMUP_IMAGE_SIZE, _WARMUP_IMAGE_SIZE), 255)
+        self._recognize_image_sync(image, _encode_image(image), language, psm, **options)
+
+    def _get_file_cache_kwargs(self, path: Path, kwargs: dict[str, Any]) -> dict[str, str]:
+        """Get the OCR cache key of an image file, the same as ``process_file`` uses."""
+        return {
+            "file_info": str(sorted(self._get_file_info(path).items())),
+            "ocr_backend": "tesseract",
+            "ocr_config": str(sorted(kwargs.items())),
+        }
+
+    def _get_batch_options(
+        self, kwargs: dict[str, Any]
+    ) -> tuple[str, PSMMode, bool, OCRPrepassConfig | None, ImagePreprocessingConfig | None, dict[str, Any]]:
+        """Split the configuration of a batch into the validated language, the PSM, the layout flag, the pre-pass and
+        preprocessing configurations and the variables.
+        """
+        options = {key: value for key, value in kwargs.items() if key not in _BACKEND_OPTIONS}
+        return (
+            self._validate_language_code(kwargs.get("language", "eng")),
+            kwargs.get("psm", PSMMode.AUTO),
+            kwargs.get("include_layout", False),
+            get_prepass_config(kwargs.get("prepass")),
+            get_preprocessing_config(kwargs.get("preprocessing")),
+            options,
+        )
+
+    async def _preprocess_and_recognize_files(
+        self,
+        paths: list[Path],
+        language: str,
+        psm: PSMMode,
+        prepass: OCRPrepassConfig | None,
+        preprocessing: ImagePreprocessingConfig | None,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> list[tuple[str, Metadata]]:
+        """Recognise image files with one tesseract process, preprocessing them first if configured.
+
+        A single preprocessed image is piped to tesseract, several are written to uncompressed temporary files. With a
+        pre-pass, every file may be recognised with different languages, so the files are recognised one by one.
+
+        Returns:
+            The output of each file, and its metadata with the pre-pass results and the preprocessing timings.
+        """
+        if prepass is not None:
+            outputs = []
+            for path in paths:
+                image = await run_sync(_open_image, path)
+                try:
+                    outputs.append(
+                        await self._prepare_and_recognize_image(
+                            image, None, language, psm, prepass, preprocessing, tsv=tsv, **kwargs
+                        )
+                    )
+                finally:
+                    image.close()
+            return outputs
+
+        if preprocessing is None:
+            return [(text, {}) for text in await self._recognize_files(paths, language, psm, tsv=tsv, **kwargs)]
+
+        if len(paths) == 1:
+            image, image_content, metadata = await run_sync(_preprocess_image, paths[0], preprocessing)
+            return [(await self._recognize_image(image, image_content, language, psm, tsv=tsv, **kwargs), metadata)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            preprocessed_paths, metadata_list = await run_sync(_preprocess_files, paths, preprocessing, Path(directory))
+            texts = await self._recognize_files(preprocessed_paths, language, psm, tsv=tsv, **kwargs)
+        return list(zip(texts, metadata_list, strict=True))
+
+    def _preprocess_and_recognize_files_sync(
+        self,
+        paths: list[Path],
+        language: str,
+        psm: PSMMode,
+        prepass: OCRPrepassConfig | None,
+        preprocessing: ImagePreprocessingConfig | None,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> list[tuple[str, Metadata]]:
+        """Recognise image files with one tesseract process, preprocessing them first if configured (sync version).
+
+        Returns:
+            The output of each file, and its metadata with the pre-pass results and the preprocessing timings.
+        """
+        if prepass is not None:
+            outputs = []
+            for path in paths:
+                with _open_image(path) as image:
+                    outputs.append(
+                        self._prepare_and_recognize_image_sync(
+                            image, None, language, psm, prepass, preprocessing, tsv=tsv, **kwargs
+                        )
+                    )
+            return outputs
+
+        if preprocessing is None:
+            return [(text, {}) for text in self._recognize_files_sync(paths, language, psm, tsv=tsv, **kwargs)]
+
+        if len(paths) == 1:
+            image, image_content, metadata = _preprocess_image(paths[0], preprocessing)
+            return [(self._recognize_image_sync(image, image_content, language, psm, tsv=tsv, **kwargs), metadata)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            preprocessed_paths, metadata_list = _preprocess_files(paths, preprocessing, Path(directory))
+            texts = self._recognize_files_sync(preprocessed_paths, language, psm, tsv=tsv, **kwargs)
+        return list(zip(texts, metadata_list, strict=True))
+
+    async def _prepare_and_recognize_image(
+        self,
+        image: PILImage,
+        image_content: bytes | None,
+        language: str,
+        psm: PSMMode,
+        prepass: OCRPrepassConfig | None,
+        preprocessing: ImagePreprocessingConfig | None,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> tuple[str, Metadata]:
+        """Recognise an image after running the pre-pass and the preprocessing, if configured.
+
+        Args:
+            image: The image.
+            image_content: The image encoded by ``_encode_image``, or None to encode it when needed.
+            language: The validated Tesseract language code.
+            psm: The page segmentation mode.
+            prepass: The pre-pass configuration.
+            preprocessing: The preprocessing configuration.
+            tsv: Whether to output TSV, with the layout of the words, instead of plain text.
+            **kwargs: The remaining Tesseract configuration variables.
+
+        Returns:
+            The output, and the metadata with the pre-pass results and the preprocessing timings.
+        """
+        metadata: Metadata = {}
+        if prepass is not None:
+            prepared, language, metadata = await self._run_prepass(image, language, prepass)
+            if prepared is not image:
+                image, image_content = prepared, None
+        if preprocessing is not None:
+            image, image_content, preprocessing_metadata = await run_sync(_preprocess_image, image, preprocessing)
+            metadata.update(preprocessing_metadata)
+        if image_content is None:
+            image_content = await run_sync(_encode_image, image)
+        return await self._recognize_image(image, image_content, language, psm, tsv=tsv, **kwargs), metadata
+
+    def _prepare_and_recognize_image_sync(
+        self,
+        image: PILImage,
+        image_content: bytes | None,
+        language: str,
+        psm: PSMMode,
+        prepass: OCRPrepassConfig | None,
+        preprocessing: ImagePreprocessingConfig | None,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> tuple[str, Metadata]:
+        """Recognise an image after running the pre-pass and the preprocessing, if configured (sync version).
+
+        Returns:
+            The output, and the metadata with the pre-pass results and the preprocessing timings.
+        """
+        metadata: Metadata = {}
+        if prepass is not None:
+            prepared, language, metadata = self._run_prepass_sync(image, language, prepass)
+            if prepared is not image:
+                image, image_content = prepared, None
+        if preprocessing is not None:
+            image, image_content, preprocessing_metadata = _preprocess_image(image, preprocessing)
+            metadata.update(preprocessing_metadata)
+        if image_content is None:
+            image_content = _encode_image(image)
+        return self._recognize_image_sync(image, image_content, language, psm, tsv=tsv, **kwargs), metadata
+
+    async def _run_prepass(
+        self, image: PILImage, language: str, prepass: OCRPrepassConfig
+    ) -> tuple[PILImage, str, Metadata]:
+        """Detect the orientation and languages of an image on a low-resolution draft.
+
+        Args:
+            image: The image.
+            language: The validated Tesseract language code, one or more languages joined by ``+``.
+            prepass: The pre-pass configuration.
+
+        Raises:
+            MissingDependencyError: If the languages are to be detected and fast-langdetect is not installed.
+
+        Returns:
+            The image rotated upright, the detected languages joined by ``+``, and the metadata with both.
+        """
+        draft = await run_sync(make_draft, image, prepass.draft_scale)
+        languages = language.split("+")
+        rotation = 0
+        if prepass.detect_orientation:
+            rotation, orientation_confidence, script, script_confidence = await self._detect_orientation(
+                draft, languages[0]
+            )
+            if orientation_confidence < prepass.min_orientation_confidence:
+                rotation = 0
+            if script_confidence >= prepass.min_orientation_confidence:
+                languages = get_script_languages(languages, script)
+            if rotation:
+                image = await run_sync(rotate_image, image, rotation)
+                draft = rotate_image(draft, rotation)
+        if prepass.detect_language and len(languages) > 1:
+            draft_text = await self._recognize_image(
+                draft, await run_sync(_encode_image, draft), languages[0], PSMMode.AUTO
+            )
+            languages = await run_sync(select_languages, draft_text, languages, prepass.max_languages)
+
+        language = "+".join(languages)
+        return image, language, {"ocr_rotations": [rotation], "ocr_languages": [language]}
+
+    def _run_prepass_sync(
+        self, image: PILImage, language: str, prepass: OCRPrepassConfig
+    ) -> tuple[PILImage, str, Metadata]:
+        """Detect the orientation and languages of an image on a low-resolution draft (sync version).
+
+        Raises:
+            MissingDependencyError: If the languages are to be detected and fast-langdetect is not installed.
+
+        Returns:
+            The image rotated upright, the detected languages joined by ``+``, and the metadata with both.
+        """
+        draft = make_draft(image, prepass.draft_scale)
+        languages = language.split("+")
+        rotation = 0
+        if prepass.detect_orientation:
+            rotation, orientation_confidence, script, script_confidence = self._detect_orientation_sync(
+                draft, languages[0]
+            )
+            if orientation_confidence < prepass.min_orientation_confidence:
+                rotation = 0
+            if script_confidence >= prepass.min_orientation_confidence:
+                languages = get_script_languages(languages, script)
+            if rotation:
+                image = rotate_image(image, rotation)
+                draft = rotate_image(draft, rotation)
+        if prepass.detect_language and len(languages) > 1:
+            draft_text = self._recognize_image_sync(draft, _encode_image(draft), languages[0], PSMMode.AUTO)
+            languages = select_languages(draft_text, languages, prepass.max_languages)
+
+        language = "+".join(languages)
+        return image, language, {"ocr_rotations": [rotation], "ocr_languages": [language]}
+
+    async def _detect_orientation(self, image: PILImage, language: str) -> tuple[int, float, str | None, float]:  # noqa: ARG002
+        """Detect the orientation and script of an image with Tesseract's orientation and script detection.
+
+        Args:
+            image: The image.
+            language: The validated code of a configured Tesseract language.
+
+        Returns:
+            The clockwise rotation in degrees that makes the image upright, its confidence, the script and its
+            confidence, as returned by ``parse_osd``. Images the detection fails on, for example because they
+            hold too little text, are reported as upright with no confidence.
+        """
+        command = ["tesseract", "stdin", "stdout", "--psm", str(PSMMode.OSD_ONLY.value), "-l", "osd"]
+        try:
+            output = await self._run_tesseract(command, input_data=await run_sync(_encode_image, image))
+        except OCRError:
+            return 0, 0.0, None, 0.0
+        return parse_osd(output)
+
+    def _detect_orientation_sync(self, image: PILImage, language: str) -> tuple[int, float, str | None, float]:  # noqa: ARG002
+        """Detect the orientation and script of an image with Tesseract's orientation and script detection (sync
+        version).
+
+        Returns:
+            The rotation, its confidence, the script and its confidence, as returned by ``parse_osd``.
+        """
+        command = ["tesseract", "stdin", "stdout", "--psm", str(PSMMode.OSD_ONLY.value), "-l", "osd"]
+        try:
+            output = self._run_tesseract_sync(command, input_data=_encode_image(image))
+        except (OCRError, OSError, subprocess.TimeoutExpired):
+            return 0, 0.0, None, 0.0
+        return parse_osd(output)
+
+    async def _recognize_files(
+        self, paths: list[Path], language: str, psm: PSMMode, tsv: bool = False, **kwargs: Any
+    ) -> list[str]:
+        """Recognise the text of image files with one tesseract process.
+
+        Several files are passed to tesseract in a list file and its output is split into pages, at the page separator
+        or by the page numbers of the TSV output. If the output does not split into one page per file, the files are
+        recognised one by one instead.
+
+        Args:
+            paths: The image files.
+            language: The validated Tesseract language code.
+            psm: The page segmentation mode.
+            tsv: Whether to output TSV, with the layout of the words, instead of plain text.
+            **kwargs: The remaining Tesseract configuration variables.
+
+        Raises:
+            OCRError: If tesseract could not be run or failed.
+
+        Returns:
+            The output of each file.
+        """
+        if len(paths) == 1:
+            command = self._build_tesseract_command(paths[0], "stdout", language, psm, tsv=tsv, **kwargs)
+            return [await self._run_tesseract(command)]
+
+        list_path, unlink = await create_temp_file(".txt")
+        try:
+            await AsyncPath(list_path).write_text("".join(f"{path.resolve()}\n" for path in paths), "utf-8")
+            command = self._build_tesseract_command(
+                list_path, "stdout", language, psm, tsv=tsv, page_separator=TESSERACT_PAGE_SEPARATOR, **kwargs
+            )
+            output = await self._run_tesseract(command)
         finally:
-            ocr_cache.mark_complete(**cache_kwargs)
+            await unlink()
+
+        if (pages := _split_tesseract_pages(output, len(paths), tsv=tsv)) is not None:
+            return pages
+        return [(await self._recognize_files([path], language, psm, tsv=tsv, **kwargs))[0] for path in paths]
+
+    def _recognize_files_sync(
+        self, paths: list[Path], language: str, psm: PSMMode, tsv: bool = False, **kwargs: Any
+    ) -> list[str]:
+        """Recognise the text of image files with one tesseract process (sync version).
+
+        Raises:
+            OCRError: If tesseract could not be run or failed.
+
+        Returns:
+            The output of each file.
+        """
+        if len(paths) == 1:
+            command = self._build_tesseract_command(paths[0], "stdout", language, psm, tsv=tsv, **kwargs)
+            try:
+                return [self._run_tesseract_sync(command)]
+            except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+                raise OCRError(f"Failed to OCR using tesseract: {e}") from e
+
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as list_file:
+            list_file.write("".join(f"{path.resolve()}\n" for path in paths))
+        try:
+            command = self._build_tesseract_command(
+                list_file.name, "stdout", language, psm, tsv=tsv, page_separator=TESSERACT_PAGE_SEPARATOR, **kwargs
+            )
+            output = self._run_tesseract_sync(command, timeout=30 * len(paths))
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            raise OCRError(f"Failed to OCR using tesseract: {e}") from e
+        finally:
+            Path(list_file.name).unlink(missing_ok=True)
+
+        if (pages := _split_tesseract_pages(output, len(paths), tsv=tsv)) is not None:
+            return pages
+        return [self._recognize_files_sync([path], language, psm, tsv=tsv, **kwargs)[0] for path in paths]
+
+    async def _recognize_image(
+        self,
+        image: PILImage,  # noqa: ARG002
+        image_content: bytes,
+        language: str,
+        psm: PSMMode,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> str:
+        """Recognise the text of an image with a tesseract process.
+
+        The uncompressed image is piped to tesseract and the text read back, so nothing touches the disk.
+
+        Args:
+            image: The image.
+            image_content: The image encoded by ``_encode_image``.
+            language: The validated Tesseract language code.
+            psm: The page segmentation mode.
+            tsv: Whether to output TSV, with the layout of the words, instead of plain text.
+            **kwargs: The remaining Tesseract configuration variables.
+
+        Raises:
+            OCRError: If tesseract could not be run or failed.
+
+        Returns:
+            The recognised text, or the TSV output.
+        """
+        command = self._build_tesseract_command("stdin", "stdout", language, psm, tsv=tsv, **kwargs)
+        return await self._run_tesseract(command, input_data=image_content)
+
+    def _recognize_image_sync(
+        self,
+        image: PILImage,  # noqa: ARG002
+        image_content: bytes,
+        language: str,
+        psm: PSMMode,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> str:
+        """Recognise the text of an image with a tesseract process (sync version).
+
+        Raises:
+            OCRError: If tesseract could not be run or failed.
+
+        Returns:
+            The recognised text, or the TSV output.
+        """
+        command = self._build_tesseract_command("stdin", "stdout", language, psm, tsv=tsv, **kwargs)
+        try:
+            return self._run_tesseract_sync(command, input_data=image_content)
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            raise OCRError(f"Failed to OCR using tesseract: {e}") from e
 
     def _get_file_info(self, path: Path) -> dict[str, Any]:
         """Get file information for caching."""
@@ -555,9 +1134,13 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
             }
 
     def _build_tesseract_command(
-        self, path: Path, output_base: str, language: str, psm: PSMMode, **kwargs: Any
+        self, path: Path | str, output_base: str, language: str, psm: PSMMode, tsv: bool = False, **kwargs: Any
     ) -> list[str]:
-        """Build tesseract command with all parameters."""
+        """Build tesseract command with all parameters.
+
+        Pass ``"stdin"`` as the path and ``"stdout"`` as the output base to pipe the image and the text, and ``tsv``
+        to output TSV, with the layout of the words, instead of plain text.
+        """
         command = [
             "tesseract",
             str(path),
@@ -576,10 +1159,54 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
                 command.extend(["-c", f"{kwarg}={1 if value else 0}"])
             else:
                 command.extend(["-c", f"{kwarg}={value}"])
+        if tsv:
+            command.append("tsv")
         return command
 
-    def _run_tesseract_sync(self, command: list[str]) -> None:
-        """Run tesseract command synchronously."""
+    async def _run_tesseract(self, command: list[str], input_data: bytes | None = None) -> str:
+        """Run tesseract command.
+
+        Args:
+            command: The tesseract command.
+            input_data: The encoded image, if the command reads it from stdin.
+
+        Raises:
+            OCRError: If tesseract could not be run or exited with a non-0 return code.
+
+        Returns:
+            The standard output of tesseract.
+        """
+        env: dict[str, Any] | None = None
+        if sys.platform.startswith("linux"):
+            env = {"OMP_THREAD_LIMIT": "1"}
+
+        try:
+            result = await run_process(command, input=input_data, env=env)
+        except (RuntimeError, OSError) as e:
+            raise OCRError(f"Failed to OCR using tesseract: {e}") from e
+
+        if not result.returncode == 0:
+            raise OCRError(
+                "OCR failed with a non-0 return code.",
+                context={"error": result.stderr.decode() if isinstance(result.stderr, bytes) else result.stderr},
+            )
+
+        return result.stdout.decode("utf-8")
+
+    def _run_tesseract_sync(self, command: list[str], input_data: bytes | None = None, timeout: float = 30) -> str:
+        """Run tesseract command synchronously.
+
+        Args:
+            command: The tesseract command.
+            input_data: The encoded image, if the command reads it from stdin.
+            timeout: The maximum run time of tesseract in seconds.
+
+        Raises:
+            OCRError: If tesseract exited with a non-0 return code.
+
+        Returns:
+            The standard output of tesseract.
+        """
         env = os.environ.copy()
         if sys.platform.startswith("linux"):
             env["OMP_THREAD_LIMIT"] = "1"
@@ -589,16 +1216,18 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
             check=False,
             env=env,
             capture_output=True,
-            text=True,
-            timeout=30,
+            input=input_data,
+            timeout=timeout,
         )
 
         if result.returncode != 0:
             raise OCRError(
                 "OCR failed with a non-0 return code.",
-                context={"error": result.stderr},
+                context={"error": result.stderr.decode("utf-8", errors="replace")},
             )
 
+        return result.stdout.decode("utf-8")
+
     @classmethod
     def _validate_tesseract_version_sync(cls) -> None:
         """Synchronously validate that Tesseract is installed and is version 5 or above.
@@ -657,6 +1286,265 @@ class TesseractBackend(OCRBackend[TesseractConfig]):
         )
 
 
+def _encode_image(image: PILImage) -> bytes:
+    """Encode an image as uncompressed PNM, the cheapest format to pipe to tesseract.
+
+    Modes PNM cannot hold are converted to RGB, and transparent images are flattened onto white first, as
+    tesseract does when it reads a transparent PNG.
+
+    Returns:
+        The PBM, PGM or PPM encoded image.
+    """
+    if image.mode in {"RGBA", "LA", "PA"} or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, "white")
+        image.paste(rgba, mask=rgba.getchannel("A"))
+    elif image.mode not in {"1", "L", "RGB"}:
+        image = image.convert("RGB")
+
+    image_buffer = io.BytesIO()
+    image.save(image_buffer, format="PPM")
+    return image_buffer.getvalue()
+
+
+def _open_image(path: Path) -> PILImage:
+    """Open an image file and load its first frame."""
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+def _get_image_cache_key(image: PILImage, ocr_config: str, perceptual: bool) -> tuple[str, bytes | None, bytes | None]:
+    """Get the hash an image is cached under in the OCR cache.
+
+    The exact hash is taken over the uncompressed PNM encoding of the image, its raw pixels with its mode and size,
+    which is then piped to tesseract as well. The perceptual hash is the indexed perceptual hash nearest to the image's,
+    if there is one close enough, so that near-identical images share a cache entry.
+
+    Args:
+        image: The image.
+        ocr_config: The OCR configuration the image is cached under.
+        perceptual: Whether to use a perceptual hash.
+
+    Returns:
+        The hash; the image encoded by ``_encode_image`` for an exact hash; and the perceptual hash of the image if it
+        is to be indexed once its result is cached, because no indexed hash was close enough.
+    """
+    from kreuzberg._utils._cache import (  # noqa: PLC0415
+        get_image_hash,
+        get_perceptual_hash_index,
+        get_perceptual_image_hash,
+    )
+
+    if not perceptual:
+        image_content = _encode_image(image)
+        return get_image_hash(image_content), image_content, None
+
+    perceptual_hash = get_perceptual_image_hash(image)
+    nearest = get_perceptual_hash_index().find(_get_perceptual_namespace(ocr_config), perceptual_hash)
+    if nearest is not None:
+        return f"perceptual:{nearest.hex()}", None, None
+    return f"perceptual:{perceptual_hash.hex()}", None, perceptual_hash
+
+
+def _index_perceptual_hash(ocr_config: str, perceptual_hash: bytes) -> None:
+    """Add the perceptual hash of a newly cached image to the index, for near-identical images to find it."""
+    from kreuzberg._utils._cache import get_perceptual_hash_index  # noqa: PLC0415
+
+    get_perceptual_hash_index().add(_get_perceptual_namespace(ocr_config), perceptual_hash)
+
+
+def _get_perceptual_namespace(ocr_config: str) -> str:
+    """Get the namespace of the perceptual hashes of the images cached with an OCR configuration."""
+    return hashlib.sha256(ocr_config.encode()).hexdigest()[:16]
+
+
+def _preprocess_image(image: PILImage | Path, config: ImagePreprocessingConfig) -> tuple[PILImage, bytes, Metadata]:
+    """Preprocess an image, or an image file, for OCR.
+
+    Returns:
+        The preprocessed image, the image encoded by ``_encode_image`` and its metadata with the preprocessing timings.
+    """
+    if isinstance(image, Path):
+        with Image.open(image) as opened:
+            return _preprocess_image(opened, config)
+
+    preprocessed, timings = preprocess_image(image, config)
+    return preprocessed, _encode_image(preprocessed), {"preprocessing_timings": timings}
+
+
+def _preprocess_files(
+    paths: list[Path], config: ImagePreprocessingConfig, directory: Path
+) -> tuple[list[Path], list[Metadata]]:
+    """Preprocess image files for OCR into uncompressed image files in a directory.
+
+    Returns:
+        The preprocessed files, and the metadata of each with the preprocessing timings.
+    """
+    preprocessed_paths = []
+    metadata_list = []
+    for index, path in enumerate(paths):
+        _, image_content, metadata = _preprocess_image(path, config)
+        preprocessed_paths.append(directory / f"{index}.pnm")
+        preprocessed_paths[-1].write_bytes(image_content)
+        metadata_list.append(metadata)
+    return preprocessed_paths, metadata_list
+
+
+def _get_batch_size(image_count: int, workers: int) -> int:
+    """Get the number of images per tesseract run that spreads ``image_count`` images evenly over ``workers`` runs.
+
+    Returns:
+        The batch size, at most ``MAX_IMAGES_PER_TESSERACT_RUN``.
+    """
+    return max(1, min(MAX_IMAGES_PER_TESSERACT_RUN, math.ceil(image_count / max(workers, 1))))
+
+
+def _split_tesseract_pages(output: str, image_count: int, tsv: bool = False) -> list[str] | None:
+    """Split the output of a multi-image tesseract run into the output of each image.
+
+    Tesseract 5 writes the page separator between the images and older versions after each image, so a trailing
+    empty page is dropped. The TSV output has no page separator, its rows are split by their page number instead
+    and renumbered as page 1, so the layout of an image does not depend on its position in the run.
+
+    Args:
+        output: The text or TSV output of tesseract.
+        image_count: The number of images of the run.
+        tsv: Whether the output is TSV.
+
+    Returns:
+        The output of each image, or None if the output does not split into ``image_count`` pages.
+    """
+    if tsv:
+        rows = output.splitlines()
+        header = rows.pop(0) if rows and rows[0].startswith("level") else ""
+        page_rows: list[list[str]] = [[] for _ in range(image_count)]
+        for row in rows:
+            level, page_number, fields = row.split("\t", 2) if row.count("\t") >= 2 else ("", "", "")
+            if not page_number.isdigit() or not 0 < int(page_number) <= image_count:
+                return None
+            page_rows[int(page_number) - 1].append(f"{level}\t1\t{fields}")
+        return ["\n".join([header, *page]) for page in page_rows]
+
+    pages = output.split(TESSERACT_PAGE_SEPARATOR)
+    if len(pages) == image_count + 1 and not pages[-1].strip():
+        pages.pop()
+    return pages if len(pages) == image_count else None
+
+
+TSV_LAYOUT_COLUMNS: Final[dict[str, str]] = {
+    "page_num": "int32",
+    "block_num": "int32",
+    "par_num": "int32",
+    "line_num": "int32",
+    "word_num": "int32",
+    "left": "int32",
+    "top": "int32",
+    "width": "int32",
+    "height": "int32",
+    "conf": "float32",
+    "text": "object",
+}
+"""The columns of the word layout and their data types, in the order of the TSV output of tesseract."""
+
+_TSV_WORD_LEVEL: Final[str] = "5"
+
+
+def _parse_tsv(output: str) -> tuple[str, DataFrame]:
+    """Parse the TSV output of tesseract into the recognised text and the layout of its words.
+
+    The text is put together from the words as tesseract writes its plain text output: words are separated by
+    spaces, lines by a line break, and paragraphs and blocks by an empty line.
+
+    Args:
+        output: The TSV output of tesseract.
+
+    Raises:
+        MissingDependencyError: If pandas is not installed.
+
+    Returns:
+        The text, and a frame with one row per word in ``TSV_LAYOUT_COLUMNS``, with the boxes in pixels.
+    """
+    try:
+        import pandas as pd  # noqa: PLC0415
+    except ImportError as e:
+        raise MissingDependencyError.create_for_package(
+            dependency_group="auto-classify-document-type", functionality="OCR layout output", package_name="pandas"
+        ) from e
+
+    columns: dict[str, list[str]] = {column: [] for column in TSV_LAYOUT_COLUMNS}
+    text_parts: list[str] = []
+    previous_line: tuple[str, ...] | None = None
+    for row in output.splitlines():
+        fields = row.split("\t", len(TSV_LAYOUT_COLUMNS))
+        if len(fields) != len(TSV_LAYOUT_COLUMNS) + 1 or fields[0] != _TSV_WORD_LEVEL or not fields[-1].strip():
+            continue
+
+        line = tuple(fields[1:5])
+        if previous_line is not None:
+            text_parts.append(" " if line == previous_line else "\n" if line[:3] == previous_line[:3] else "\n\n")
+        text_parts.append(fields[-1])
+        previous_line = line
+
+        for column, value in zip(TSV_LAYOUT_COLUMNS, fields[1:], strict=True):
+            columns[column].append(value)
+
+    layout = pd.DataFrame(columns).astype(TSV_LAYOUT_COLUMNS)
+    return "".join(text_parts), layout
+
+
+def _build_result(output: str, tsv: bool, metadata: Metadata | None = None) -> ExtractionResult:
+    """Build the extraction result of the plain text or TSV output of tesseract for one image."""
+    if not tsv:
+        return ExtractionResult(
+            content=normalize_spaces(output), mime_type=PLAIN_TEXT_MIME_TYPE, metadata=metadata or {}, chunks=[]
+        )
+
+    text, layout = _parse_tsv(output)
+    return ExtractionResult(
+        content=normalize_spaces(text),
+        mime_type=PLAIN_TEXT_MIME_TYPE,
+        metadata=metadata or {},
+        chunks=[],
+        layout=layout,
+    )
+
+
+def _build_worker_command(input_path: str, output_base: str, config_dict: dict[str, Any]) -> list[str]:
+    """Build the tesseract command of a process pool worker from a configuration dictionary."""
+    command = [
+        "tesseract",
+        input_path,
+        output_base,
+        "-l",
+        config_dict.get("language", "eng"),
+        "--psm",
+        str(config_dict.get("psm", 3)),
+        "--oem",
+        "1",
+        "--loglevel",
+        "OFF",
+    ]
+
+    boolean_options = [
+        "classify_use_pre_adapted_templates",
+        "language_model_ngram_on",
+        "tessedit_dont_blkrej_good_wds",
+        "tessedit_dont_rowrej_good_wds",
+        "tessedit_enable_dict_correction",
+        "tessedit_use_primary_params_model",
+        "textord_space_size_is_variable",
+        "thresholding_method",
+    ]
+
+    for option in boolean_options:
+        if option in config_dict:
+            value = 1 if config_dict[option] else 0
+            command.extend(["-c", f"{option}={value}"])
+
+    return command
+
+
 def _process_image_with_tesseract(
     image_path: str,
     config_dict: dict[str, Any],
@@ -678,38 +1566,7 @@ def _process_image_with_tesseract(
             output_base = tmp_file.name.replace(".txt", "")
 
         try:
-            language = config_dict.get("language", "eng")
-            psm = config_dict.get("psm", 3)
-
-            command = [
-                "tesseract",
-                image_path,
-                output_base,
-                "-l",
-                language,
-                "--psm",
-                str(psm),
-                "--oem",
-                "1",
-                "--loglevel",
-                "OFF",
-            ]
-
-            boolean_options = [
-                "classify_use_pre_adapted_templates",
-                "language_model_ngram_on",
-                "tessedit_dont_blkrej_good_wds",
-                "tessedit_dont_rowrej_good_wds",
-                "tessedit_enable_dict_correction",
-                "tessedit_use_primary_params_model",
-                "textord_space_size_is_variable",
-                "thresholding_method",
-            ]
-
-            for option in boolean_options:
-                if option in config_dict:
-                    value = 1 if config_dict[option] else 0
-                    command.extend(["-c", f"{option}={value}"])
+            command = _build_worker_command(image_path, output_base, config_dict)
 
             env = os.environ.copy()
             env["OMP_THREAD_LIMIT"] = "1"
@@ -755,6 +1612,77 @@ def _process_image_with_tesseract(
         }
 
 
+def _process_images_with_tesseract(
+    image_paths: list[str],
+    config_dict: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Process several images with one Tesseract run in a separate process.
+
+    The images are passed to tesseract in a list file, so it starts and loads its traineddata once for all of them,
+    and its output is split back into the text of each image at the page separator. If the output does not split
+    into one page per image, the images are processed one by one instead.
+
+    Args:
+        image_paths: Paths to the image files.
+        config_dict: Tesseract configuration as dictionary.
+
+    Returns:
+        OCR result as dictionary for each image, in the same order as the paths.
+    """
+    if len(image_paths) == 1:
+        return [_process_image_with_tesseract(image_paths[0], config_dict)]
+
+    try:
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as list_file:
+            list_file.write("\n".join(image_paths) + "\n")
+
+        try:
+            command = _build_worker_command(list_file.name, "stdout", config_dict)
+            command.extend(["-c", f"page_separator={TESSERACT_PAGE_SEPARATOR}"])
+
+            env = os.environ.copy()
+            env["OMP_THREAD_LIMIT"] = "1"
+
+            result = subprocess.run(
+                command,
+                check=False,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=30 * len(image_paths),
+            )
+
+            if result.returncode != 0:
+                raise Exception(f"Tesseract failed with return code {result.returncode}: {result.stderr}")
+        finally:
+            Path(list_file.name).unlink(missing_ok=True)
+
+    except Exception as e:  # noqa: BLE001
+        return [
+            {
+                "success": False,
+                "text": "",
+                "confidence": None,
+                "error": str(e),
+            }
+            for _ in image_paths
+        ]
+
+    pages = _split_tesseract_pages(result.stdout, len(image_paths))
+    if pages is None:
+        return [_process_image_with_tesseract(image_path, config_dict) for image_path in image_paths]
+
+    return [
+        {
+            "success": True,
+            "text": normalize_spaces(text),
+            "confidence": None,
+            "error": None,
+        }
+        for text in pages
+    ]
+
+
 def _process_image_bytes_with_tesseract(
     image_bytes: bytes,
     config_dict: dict[str, Any],
@@ -790,6 +1718,61 @@ def _process_image_bytes_with_tesseract(
         }
 
 
+def _process_shared_image_with_tesseract(
+    shared_image: SharedImage,
+    config_dict: dict[str, Any],
+) -> dict[str, Any]:
+    """Process an image in shared memory with Tesseract in a separate process.
+
+    The pixels are read from the shared memory block without copying them into the process, encoded as PNM and
+    piped to tesseract.
+
+    Args:
+        shared_image: The reference to the image in shared memory.
+        config_dict: Tesseract configuration as dictionary.
+
+    Returns:
+        OCR result as dictionary.
+    """
+    from kreuzberg._utils._process_pool import open_shared_image  # noqa: PLC0415
+
+    try:
+        with open_shared_image(shared_image) as image:
+            image_content = _encode_image(image)
+
+        env = os.environ.copy()
+        env["OMP_THREAD_LIMIT"] = "1"
+
+        result = subprocess.run(
+            _build_worker_command("stdin", "stdout", config_dict),
+            check=False,
+            env=env,
+            input=image_content,
+            capture_output=True,
+            timeout=30,
+        )
+
+        if result.returncode != 0:
+            raise Exception(
+                f"Tesseract failed with return code {result.returncode}: {result.stderr.decode('utf-8', 'replace')}"
+            )
+
+        return {
+            "success": True,
+            "text": normalize_spaces(result.stdout.decode("utf-8")),
+            "confidence": None,
+            "error": None,
+        }
+
+    except Exception as e:  # noqa: BLE001
+        return {
+            "success": False,
+            "text": "",
+            "confidence": None,
+            "error": str(e),
+        }
+
+
 class TesseractProcessPool:
     """Process pool for parallel Tesseract OCR processing."""
 
@@ -901,13 +1884,19 @@ class TesseractProcessPool:
         image_paths: list[str | Path],
         config: TesseractConfig | None = None,
         max_concurrent: int | None = None,
+        batch_size: int | None = None,
     ) -> list[ExtractionResult]:
-        """Process a batch of images in parallel.
+        """Process a batch of images in parallel, several images per Tesseract run.
+
+        The images are split into chunks of consecutive images and each chunk is OCR'd by one tesseract run in a
+        worker process, so tesseract starts and loads its traineddata once per chunk rather than once per image.
 
         Args:
             image_paths: List of image file paths.
             config: Tesseract configuration (uses default if None).
             max_concurrent: Maximum concurrent processes.
+            batch_size: Maximum number of images per Tesseract run. By default, the images are spread evenly over
+                the processes, with at most ``MAX_IMAGES_PER_TESSERACT_RUN`` images per run.
 
         Returns:
             List of OCR results in the same order as input.
@@ -917,18 +1906,24 @@ class TesseractProcessPool:
 
         config_dict = self._config_to_dict(config)
 
-        arg_batches = [(str(path), config_dict) for path in image_paths]
+        batch_size = batch_size or _get_batch_size(
+            len(image_paths), max_concurrent or self.process_manager.max_processes
+        )
+        arg_batches = [
+            ([str(path) for path in image_paths[start : start + batch_size]], config_dict)
+            for start in range(0, len(image_paths), batch_size)
+        ]
 
         task_memory_mb = 80
 
-        result_dicts = await self.process_manager.submit_batch(
-            _process_image_with_tesseract,
+        chunk_results = await self.process_manager.submit_batch(
+            _process_images_with_tesseract,
             arg_batches,
             task_memory_mb=task_memory_mb,
             max_concurrent=max_concurrent,
         )
 
-        return [self._result_from_dict(result_dict) for result_dict in result_dicts]
+        return [self._result_from_dict(result_dict) for result_dicts in chunk_results for result_dict in result_dicts]
 
     async def process_batch_bytes(
         self,
@@ -965,6 +1960,65 @@ class TesseractProcessPool:
 
         return [self._result_from_dict(result_dict) for result_dict in result_dicts]
 
+    async def process_pil_image(
+        self,
+        image: PILImage,
+        config: TesseractConfig | None = None,
+    ) -> ExtractionResult:
+        """Process an image, such as a rendered page, with Tesseract.
+
+        The pixels are handed to the worker process through shared memory instead of being encoded and pickled.
+
+        Args:
+            image: The image.
+            config: Tesseract configuration (uses default if None).
+
+        Returns:
+            OCR result.
+        """
+        return (await self.process_batch_pil_images([image], config))[0]
+
+    async def process_batch_pil_images(
+        self,
+        images: list[PILImage],
+        config: TesseractConfig | None = None,
+        max_concurrent: int | None = None,
+    ) -> list[ExtractionResult]:
+        """Process a batch of images, such as rendered pages, in parallel.
+
+        The pixels of each image are copied once into shared memory, which the worker processes read directly, and
+        the memory is released once all images are processed.
+
+        Args:
+            images: The images.
+            config: Tesseract configuration (uses default if None).
+            max_concurrent: Maximum concurrent processes.
+
+        Returns:
+            List of OCR results in the same order as input.
+        """
+        from kreuzberg._utils._process_pool import share_image  # noqa: PLC0415
+
+        if not images:
+            return []
+
+        config_dict = self._config_to_dict(config)
+
+        with ExitStack() as stack:
+            arg_batches = [(stack.enter_context(share_image(image)), config_dict) for image in images]
+
+            avg_image_size_mb = sum(image.width * image.height * 3 for image in images) / len(images) / 1024 / 1024
+            task_memory_mb = max(80, avg_image_size_mb * 2 + 50)
+
+            result_dicts = await self.process_manager.submit_batch(
+                _process_shared_image_with_tesseract,
+                arg_batches,
+                task_memory_mb=task_memory_mb,
+                max_concurrent=max_concurrent,
+            )
+
+        return [self._result_from_dict(result_dict) for result_dict in result_dicts]
+
     def get_system_info(self) -> dict[str, Any]:
         """Get system information from the process manager."""
         return self.process_manager.get_system_info()
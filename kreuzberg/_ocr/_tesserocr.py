@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import os
+import re
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from multiprocessing import cpu_count
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from PIL import Image, ImageSequence
+
+from kreuzberg._ocr._tesseract import MINIMAL_SUPPORTED_TESSERACT_VERSION, PSMMode, TesseractBackend, TesseractConfig
+from kreuzberg._utils._sync import run_sync, run_taskgroup
+from kreuzberg.exceptions import MissingDependencyError, OCRError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from PIL.Image import Image as PILImage
+
+    from kreuzberg._types import ExtractionResult
+
+try:  # pragma: no cover
+    from typing import Unpack  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    from typing_extensions import Unpack
+
+
+EngineKey = tuple[str, int, tuple[tuple[str, str], ...]]
+
+
+class TesserocrEnginePool:
+    """Initialised Tesseract engines, kept idle between images and reused for the same configuration.
+
+    An engine is created the first time a configuration is used by a worker thread and returned to the pool after
+    every image. At most ``max_engines`` engines exist at a time: when the limit is reached, an idle engine of
+    another configuration is replaced, or the thread waits until an engine is returned.
+    """
+
+    def __init__(self, max_engines: int | None = None) -> None:
+        """Initialize the engine pool.
+
+        Args:
+            max_engines: The largest number of engines, idle or in use. Defaults to the CPU count.
+        """
+        self.max_engines = max_engines or cpu_count()
+        self._condition = threading.Condition()
+        self._idle: dict[EngineKey, list[Any]] = defaultdict(list)
+        self._engine_count = 0
+
+    @contextmanager
+    def acquire(self, language: str, psm: PSMMode, variables: dict[str, str]) -> Generator[Any, None, None]:
+        """Borrow an engine initialised with a language, page segmentation mode and variables.
+
+        Args:
+            language: The validated Tesseract language code.
+            psm: The page segmentation mode.
+            variables: The Tesseract configuration variables, as strings.
+
+        Yields:
+            The engine, a ``tesserocr.PyTessBaseAPI``.
+        """
+        key: EngineKey = (language, psm.value, tuple(sorted(variables.items())))
+        engine, evicted = self._take_engine(key)
+        if evicted is not None:
+            evicted.End()
+        if engine is None:
+            try:
+                engine = _create_engine(language, psm, variables)
+            except BaseException:
+                with self._condition:
+                    self._engine_count -= 1
+                    self._condition.notify()
+                raise
+        try:
+            yield engine
+        finally:
+            engine.Clear()
+            with self._condition:
+                self._idle[key].append(engine)
+                self._condition.notify()
+
+    def _take_engine(self, key: EngineKey) -> tuple[Any | None, Any | None]:
+        """Take an idle engine of a configuration, or reserve a new one once the number of engines allows it.
+
+        Returns:
+            The idle engine, or None if a new engine is to be created, and the idle engine of another configuration
+            that was removed to make room for it, if any.
+        """
+        with self._condition:
+            while True:
+                if self._idle[key]:
+                    return self._idle[key].pop(), None
+                if self._engine_count < self.max_engines:
+                    self._engine_count += 1
+                    return None, None
+                if other_key := next((other for other, engines in self._idle.items() if engines), None):
+                    return None, self._idle[other_key].pop()
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Release all idle engines."""
+        with self._condition:
+            engines = [engine for engines in self._idle.values() for engine in engines]
+            self._idle.clear()
+            self._engine_count -= len(engines)
+            self._condition.notify_all()
+        for engine in engines:
+            engine.End()
+
+    def __len__(self) -> int:
+        """The number of idle engines."""
+        with self._condition:
+            return sum(len(engines) for engines in self._idle.values())
+
+
+def _import_tesserocr() -> Any:
+    """Import the tesserocr binding, limiting the OpenMP threads of Tesseract to one as the CLI backend does.
+
+    Raises:
+        MissingDependencyError: If tesserocr is not installed.
+    """
+    if sys.platform.startswith("linux"):
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    try:
+        import tesserocr  # noqa: PLC0415
+    except ImportError as e:
+        raise MissingDependencyError.create_for_package(
+            dependency_group="tesserocr", functionality="Tesserocr as an OCR backend", package_name="tesserocr"
+        ) from e
+    return tesserocr
+
+
+def _create_engine(language: str, psm: PSMMode, variables: dict[str, str]) -> Any:
+    """Create and initialise a Tesseract engine, loading the traineddata of the language.
+
+    Raises:
+        OCRError: If the engine could not be initialised, e.g. because the traineddata is missing.
+    """
+    tesserocr = _import_tesserocr()
+    try:
+        return tesserocr.PyTessBaseAPI(lang=language, psm=psm.value, oem=tesserocr.OEM.LSTM_ONLY, variables=variables)
+    except RuntimeError as e:
+        raise OCRError(f"Failed to initialise tesserocr: {e}", context={"language": language}) from e
+
+
+def _to_variables(kwargs: dict[str, Any]) -> dict[str, str]:
+    """Convert Tesseract configuration values to the strings of Tesseract variables."""
+    return {key: str(int(value)) if isinstance(value, bool) else str(value) for key, value in kwargs.items()}
+
+
+def _join_frame_results(results: list[ExtractionResult]) -> ExtractionResult:
+    """Combine the OCR results of the frames of an image, as the image extractor does."""
+    from kreuzberg._extractors._image import ImageExtractor  # noqa: PLC0415
+
+    return ImageExtractor._join_frame_results(results)  # noqa: SLF001
+
+
+class TesserocrBackend(TesseractBackend):
+    """Tesseract OCR through the tesserocr C-API binding, reusing initialised engines across images.
+
+    The ``tesseract`` backend starts a process for every image, which loads the traineddata again each time. This
+    backend keeps the engines initialised in a pool shared by all worker threads, so the traineddata is loaded once
+    per engine. It takes the same ``TesseractConfig`` as the ``tesseract`` backend and shares its OCR cache.
+    """
+
+    _version_checked: ClassVar[bool] = False
+    engine_pool: ClassVar[TesserocrEnginePool] = TesserocrEnginePool()
+
+    async def process_file(
+        self,
+        path: Path,
+        **kwargs: Unpack[TesseractConfig],
+    ) -> ExtractionResult:
+        with Image.open(path) as image:
+            if getattr(image, "n_frames", 1) == 1:
+                return await self.process_image(image, **kwargs)
+            frames = [frame.copy() for frame in ImageSequence.Iterator(image)]
+        return _join_frame_results(await run_taskgroup(*(self.process_image(frame, **kwargs) for frame in frames)))
+
+    def process_file_sync(
+        self,
+        path: Path,
+        **kwargs: Unpack[TesseractConfig],
+    ) -> ExtractionResult:
+        """Synchronously process a file and extract its text and metadata.
+
+        Every frame of a multi-frame image, such as a multi-page TIFF, is recognised, as the ``tesseract`` backend
+        does.
+
+        Args:
+            path: A Path object representing the file to be processed.
+            **kwargs: Any kwargs related to the given backend
+
+        Returns:
+            The extraction result object
+        """
+        with Image.open(path) as image:
+            if getattr(image, "n_frames", 1) == 1:
+                return self.process_image_sync(image, **kwargs)
+            return _join_frame_results(
+                [self.process_image_sync(frame, **kwargs) for frame in ImageSequence.Iterator(image)]
+            )
+
+    async def process_batch(self, paths: list[Path], **kwargs: Unpack[TesseractConfig]) -> list[ExtractionResult]:
+        """Asynchronously process a batch of files, one image at a time per pooled engine.
+
+        The engines are already initialised, so unlike the ``tesseract`` backend there is no start-up cost to share by
+        recognising several images in one run.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Any kwargs related to the given backend
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+        """
+        return await run_taskgroup(*(self.process_file(path, **kwargs) for path in paths))
+
+    def process_batch_sync(self, paths: list[Path], **kwargs: Unpack[TesseractConfig]) -> list[ExtractionResult]:
+        """Synchronously process a batch of files, one image at a time.
+
+        Args:
+            paths: List of Path objects representing files to be processed.
+            **kwargs: Any kwargs related to the given backend
+
+        Returns:
+            List of extraction result objects in the same order as input paths
+        """
+        return [self.process_file_sync(path, **kwargs) for path in paths]
+
+    async def _recognize_image(
+        self, image: PILImage, image_content: bytes, language: str, psm: PSMMode, tsv: bool = False, **kwargs: Any
+    ) -> str:
+        """Recognise the text of an image with a pooled engine, in a worker thread."""
+        return await run_sync(self._recognize_image_sync, image, image_content, language, psm, tsv, **kwargs)
+
+    def _recognize_image_sync(
+        self,
+        image: PILImage,
+        image_content: bytes,  # noqa: ARG002
+        language: str,
+        psm: PSMMode,
+        tsv: bool = False,
+        **kwargs: Any,
+    ) -> str:
+        """Recognise the text of an image with a pooled engine.
+
+        Raises:
+            OCRError: If the engine failed to recognise the image.
+
+        Returns:
+            The recognised text, or the TSV output.
+        """
+        with self.engine_pool.acquire(language, psm, _to_variables(kwargs)) as engine:
+            try:
+                engine.SetImage(image)
+                if tsv:
+                    return str(engine.GetTSVText(0))
+                return str(engine.GetUTF8Text())
+            except RuntimeError as e:
+                raise OCRError(f"Failed to OCR using tesserocr: {e}") from e
+
+    async def _detect_orientation(self, image: PILImage, language: str) -> tuple[int, float, str | None, float]:
+        """Detect the orientation and script of an image with a pooled engine, in a worker thread."""
+        return await run_sync(self._detect_orientation_sync, image, language)
+
+    def _detect_orientation_sync(self, image: PILImage, language: str) -> tuple[int, float, str | None, float]:
+        """Detect the orientation and script of an image with a pooled engine.
+
+        Returns:
+            The clockwise rotation in degrees that makes the image upright, its confidence, the script and its
+            confidence. Images the detection fails on are reported as upright with no confidence.
+        """
+        with self.engine_pool.acquire(language, PSMMode.OSD_ONLY, {}) as engine:
+            try:
+                engine.SetImage(image)
+                result = engine.DetectOrientationScript()
+            except RuntimeError:
+                return 0, 0.0, None, 0.0
+        if not result:
+            return 0, 0.0, None, 0.0
+        return (
+            (360 - int(result["orient_deg"])) % 360,
+            float(result["orient_conf"]),
+            result["script_name"],
+            float(result["script_conf"]),
+        )
+
+    @classmethod
+    async def _validate_tesseract_version(cls) -> None:
+        """Validate that tesserocr is installed and linked against Tesseract version 5 or above.
+
+        Raises:
+            MissingDependencyError: If tesserocr is not installed or Tesseract is below version 5.
+        """
+        cls._validate_tesseract_version_sync()
+
+    @classmethod
+    def _validate_tesseract_version_sync(cls) -> None:
+        """Synchronously validate that tesserocr is installed and linked against Tesseract version 5 or above.
+
+        Raises:
+            MissingDependencyError: If tesserocr is not installed or Tesseract is below version 5.
+        """
+        if cls._version_checked:
+            return
+
+        version_match = re.search(r"tesseract\s+v?(\d+)\.\d+\.\d+", _import_tesserocr().tesseract_version())
+        if not version_match or int(version_match.group(1)) < MINIMAL_SUPPORTED_TESSERACT_VERSION:
+            raise MissingDependencyError(
+                "Tesseract version 5 is required by tesserocr. Please install tesserocr built against Tesseract 5."
+            )
+
+        cls._version_checked = True
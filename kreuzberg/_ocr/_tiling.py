@@ -0,0 +1,184 @@
+"""Splitting very large images into overlapping horizontal bands that are OCR'd in parallel, and joining the results."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import pairwise
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+    from PIL.Image import Image as PILImage
+
+_MIN_LINE_SIMILARITY: Final[float] = 0.8
+"""Smallest similarity of two lines of text from neighbouring bands for them to be the same line of the image."""
+_MAX_OVERLAP_LINES: Final[int] = 50
+"""Largest number of lines searched for duplicates at the join of two bands."""
+
+
+@dataclass(frozen=True, slots=True)
+class ImageBand:
+    """A horizontal band of an image, overlapping its neighbouring bands."""
+
+    top: int
+    """The row of the image the band starts at."""
+    image: PILImage
+    """The pixels of the band."""
+
+    @property
+    def bottom(self) -> int:
+        """The row of the image below the band."""
+        return self.top + self.image.height
+
+
+def _find_blank_row(image: PILImage, start: int, end: int, target: int) -> int:
+    """Find the lightest row of an image between two rows, which is blank between two lines of text if there is one.
+
+    Args:
+        image: The image.
+        start: The first row searched.
+        end: The row after the last row searched.
+        target: The row preferred among equally light rows.
+
+    Returns:
+        The lightest row, or ``target`` if there are no rows to search.
+    """
+    if end <= start:
+        return target
+    window = np.asarray(image.crop((0, start, image.width, end)).convert("L"), dtype=np.float32)
+    brightness = window.mean(axis=1)
+    candidates = np.flatnonzero(brightness >= brightness.max()) + start
+    return int(candidates[np.abs(candidates - target).argmin()])
+
+
+def split_into_bands(image: PILImage, band_count: int, overlap: int) -> list[ImageBand]:
+    """Split an image into horizontal bands overlapping each other by ``overlap`` to twice ``overlap`` rows.
+
+    The upper edge of every overlap is placed on the lightest row between ``overlap`` and half of ``overlap`` rows
+    above the boundary between two bands, and its lower edge likewise below the boundary, so that the bands are cut
+    between lines of text where possible. A line of text at most ``overlap`` rows high is complete in at least one
+    of the two bands even where it is not.
+
+    Args:
+        image: The image to split.
+        band_count: The number of bands.
+        overlap: The number of rows the overlap extends above and below each boundary.
+
+    Returns:
+        The bands from top to bottom, or a single band of the whole image if ``band_count`` is below 2.
+    """
+    if band_count < 2:
+        return [ImageBand(top=0, image=image)]
+
+    tops = [0]
+    bottoms = []
+    for index in range(1, band_count):
+        boundary = round(index * image.height / band_count)
+        half = overlap // 2
+        tops.append(_find_blank_row(image, max(tops[-1] + 1, boundary - overlap), boundary - half, boundary))
+        bottoms.append(_find_blank_row(image, boundary + half, min(image.height, boundary + overlap), boundary) + 1)
+    bottoms.append(image.height)
+
+    return [
+        ImageBand(top=top, image=image.crop((0, top, image.width, bottom)))
+        for top, bottom in zip(tops, bottoms, strict=True)
+    ]
+
+
+def _normalize_line(line: str) -> str:
+    return " ".join(line.split())
+
+
+def _is_same_line(first: str, second: str) -> bool:
+    if first == second:
+        return True
+    return bool(first and second) and SequenceMatcher(None, first, second).ratio() >= _MIN_LINE_SIMILARITY
+
+
+def _find_overlap(upper: list[str], lower: list[str]) -> tuple[int, int, int]:
+    """Find the lines recognised in both of two neighbouring bands.
+
+    The last line of the upper band and the first line of the lower band may be a line of text cut by the edge of
+    the band, which is recognised differently from the complete line in the other band, so they are skipped if that
+    finds a longer run of matching lines. Runs of blank lines alone are not matches.
+
+    Args:
+        upper: The normalised lines of the upper band.
+        lower: The normalised lines of the lower band.
+
+    Returns:
+        The number of lines at the end of the upper band and at the start of the lower band that are dropped, and
+        the number of matching lines.
+    """
+    best = (0, 0, 0)
+    for skip_upper in (0, 1):
+        for skip_lower in (0, 1):
+            upper_lines = upper[: len(upper) - skip_upper]
+            lower_lines = lower[skip_lower:]
+            for count in range(min(len(upper_lines), len(lower_lines), _MAX_OVERLAP_LINES), best[2], -1):
+                if any(upper_lines[-count:]) and all(
+                    _is_same_line(upper_line, lower_line)
+                    for upper_line, lower_line in zip(upper_lines[-count:], lower_lines[:count], strict=True)
+                ):
+                    best = (skip_upper, skip_lower, count)
+                    break
+    return best
+
+
+def merge_band_texts(texts: list[str]) -> str:
+    """Join the text of overlapping horizontal bands, removing the lines recognised twice in their overlaps.
+
+    Args:
+        texts: The recognised text of each band, from top to bottom.
+
+    Returns:
+        The text of the whole image.
+    """
+    lines: list[str] = []
+    for text in texts:
+        band_lines = text.strip("\n").splitlines()
+        skip_upper, skip_lower, count = _find_overlap(
+            [_normalize_line(line) for line in lines[-_MAX_OVERLAP_LINES - 1 :]],
+            [_normalize_line(line) for line in band_lines[: _MAX_OVERLAP_LINES + 1]],
+        )
+        if count:
+            del lines[len(lines) - skip_upper :]
+            band_lines = band_lines[skip_lower + count :]
+        lines.extend(band_lines)
+    return "\n".join(lines)
+
+
+def merge_band_layouts(bands: list[ImageBand], layouts: list[DataFrame]) -> DataFrame:
+    """Join the OCR layouts of overlapping horizontal bands into the layout of the whole image.
+
+    The positions of the words are moved from the band to the image, and every overlap is split at its middle: each
+    band keeps the rows whose vertical centre is on its side of the split, so words in the overlap are kept once.
+    The block numbers are renumbered to be unique across the bands.
+
+    Args:
+        bands: The bands, from top to bottom.
+        layouts: The OCR layout of each band.
+
+    Returns:
+        The layout of the whole image.
+    """
+    import pandas as pd  # noqa: PLC0415
+
+    splits = [0, *((upper.bottom + lower.top) // 2 for upper, lower in pairwise(bands))]
+    splits.append(bands[-1].bottom)
+
+    block_offset = 0
+    kept = []
+    for index, (band, band_layout) in enumerate(zip(bands, layouts, strict=True)):
+        layout = band_layout.assign(
+            top=band_layout["top"] + band.top, block_num=band_layout["block_num"] + block_offset
+        )
+        centers = layout["top"] + layout["height"] / 2
+        kept.append(layout[(centers >= splits[index]) & (centers < splits[index + 1])])
+        if not layout.empty:
+            block_offset = int(layout["block_num"].max())
+
+    return pd.concat(kept, ignore_index=True).astype(layouts[0].dtypes.to_dict())
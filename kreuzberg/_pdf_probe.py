@@ -0,0 +1,189 @@
+"""Cheap classification of PDF pages into text, scanned and mixed pages."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import pypdfium2
+import pypdfium2.raw as pdfium_c
+
+from kreuzberg._utils._errors import create_error_context
+from kreuzberg._utils._pdf_document import PDFDocumentContext
+from kreuzberg._utils._pdf_lock import pypdfium_file_lock
+from kreuzberg._utils._sync import run_sync
+from kreuzberg.exceptions import ParsingError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from os import PathLike
+
+PageType = Literal["text", "scanned", "mixed", "empty"]
+
+MIXED_IMAGE_COVERAGE = 0.1
+SCANNED_IMAGE_COVERAGE = 0.9
+_VISIBLE_OBJECT_TYPES = (
+    pdfium_c.FPDF_PAGEOBJ_TEXT,
+    pdfium_c.FPDF_PAGEOBJ_PATH,
+    pdfium_c.FPDF_PAGEOBJ_IMAGE,
+    pdfium_c.FPDF_PAGEOBJ_SHADING,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PDFPageClassification:
+    """The classification of a single PDF page, derived from its page objects."""
+
+    page_number: int
+    """The 1-based number of the page."""
+    page_type: PageType
+    """``text`` for pages with a text layer and little imagery, ``scanned`` for pages that are essentially
+    one image or have no text objects, ``mixed`` for text pages with large embedded images and ``empty``
+    for pages without visible objects."""
+    text_object_count: int
+    """The number of text objects on the page, including invisible text such as an OCR layer."""
+    image_object_count: int
+    """The number of image objects on the page."""
+    image_coverage: float
+    """The summed area of the image objects as a share of the page area, capped at 1.0."""
+
+
+@dataclass(frozen=True, slots=True)
+class PDFClassification:
+    """The classification of the pages of a PDF document."""
+
+    pages: tuple[PDFPageClassification, ...]
+    """The classification of every probed page, in page order."""
+
+    @property
+    def document_type(self) -> PageType:
+        """The type shared by all non-empty pages, ``mixed`` if they differ, or ``empty`` if all pages are empty."""
+        page_types = {page.page_type for page in self.pages if page.page_type != "empty"}
+        if not page_types:
+            return "empty"
+        return page_types.pop() if len(page_types) == 1 else "mixed"
+
+    @property
+    def scanned_pages(self) -> list[int]:
+        """The 1-based numbers of the scanned pages."""
+        return [page.page_number for page in self.pages if page.page_type == "scanned"]
+
+
+def classify_pdf_page(page: pypdfium2.PdfPage, page_number: int) -> PDFPageClassification:
+    """Classify a page by counting its page objects, without extracting any text or rendering.
+
+    Objects nested in form XObjects are included.
+
+    Args:
+        page: The PDF page.
+        page_number: The 1-based number of the page.
+
+    Returns:
+        The classification of the page.
+    """
+    object_counts: Counter[int] = Counter()
+    image_area = 0.0
+    page_left, page_bottom, page_right, page_top = page.get_bbox()
+
+    for page_object in page.get_objects(filter=_VISIBLE_OBJECT_TYPES):
+        object_counts[page_object.type] += 1
+        if page_object.type == pdfium_c.FPDF_PAGEOBJ_IMAGE:
+            left, bottom, right, top = page_object.get_pos()
+            width = min(right, page_right) - max(left, page_left)
+            height = min(top, page_top) - max(bottom, page_bottom)
+            image_area += max(width, 0) * max(height, 0)
+
+    page_area = (page_right - page_left) * (page_top - page_bottom)
+    image_coverage = min(image_area / page_area, 1.0) if page_area > 0 else 0.0
+    text_object_count = object_counts[pdfium_c.FPDF_PAGEOBJ_TEXT]
+
+    page_type: PageType
+    if not object_counts:
+        page_type = "empty"
+    elif not text_object_count or image_coverage >= SCANNED_IMAGE_COVERAGE:
+        page_type = "scanned"
+    elif image_coverage >= MIXED_IMAGE_COVERAGE:
+        page_type = "mixed"
+    else:
+        page_type = "text"
+
+    return PDFPageClassification(
+        page_number=page_number,
+        page_type=page_type,
+        text_object_count=text_object_count,
+        image_object_count=object_counts[pdfium_c.FPDF_PAGEOBJ_IMAGE],
+        image_coverage=image_coverage,
+    )
+
+
+def classify_pdf_document(
+    document: pypdfium2.PdfDocument, page_indices: Sequence[int] | None = None
+) -> PDFClassification:
+    """Classify the pages of an opened PDF document.
+
+    Args:
+        document: The opened PDF document.
+        page_indices: The 0-based indices of the pages to classify, or None for all pages.
+
+    Returns:
+        The classification of the pages.
+    """
+    pages = []
+    for page_index in range(len(document)) if page_indices is None else page_indices:
+        page = document[page_index]
+        try:
+            pages.append(classify_pdf_page(page, page_index + 1))
+        finally:
+            page.close()
+    return PDFClassification(pages=tuple(pages))
+
+
+def classify_pdf_sync(
+    source: PathLike[str] | str | bytes, page_indices: Sequence[int] | None = None
+) -> PDFClassification:
+    """Classify the pages of a PDF as text, scanned, mixed or empty.
+
+    The classification only inspects the page objects of each page, so it is much cheaper than extracting the
+    text layer. It can be used to route scanned documents to OCR before any extraction is done.
+
+    Args:
+        source: The path to the PDF file, or its content.
+        page_indices: The 0-based indices of the pages to classify, or None for all pages.
+
+    Raises:
+        ParsingError: If the PDF could not be opened.
+
+    Returns:
+        The classification of the pages.
+    """
+    path, content = (None, source) if isinstance(source, bytes) else (Path(source), None)
+    with PDFDocumentContext(path, content) as document:
+        try:
+            pdf = document.get_pdfium_document()
+        except pypdfium2.PdfiumError as e:
+            raise ParsingError(
+                "Could not open PDF file",
+                context=create_error_context(operation="classify_pdf", file_path=path, error=e),
+            ) from e
+        with pypdfium_file_lock(document.lock_key):
+            return classify_pdf_document(pdf, page_indices)
+
+
+async def classify_pdf(
+    source: PathLike[str] | str | bytes, page_indices: Sequence[int] | None = None
+) -> PDFClassification:
+    """Classify the pages of a PDF as text, scanned, mixed or empty.
+
+    The classification only inspects the page objects of each page, so it is much cheaper than extracting the
+    text layer. It can be used to route scanned documents to OCR before any extraction is done.
+
+    Args:
+        source: The path to the PDF file, or its content.
+        page_indices: The 0-based indices of the pages to classify, or None for all pages.
+
+    Returns:
+        The classification of the pages.
+    """
+    return await run_sync(classify_pdf_sync, source, page_indices)
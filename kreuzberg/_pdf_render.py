@@ -0,0 +1,191 @@
+"""Resolution selection and rendering of PDF pages for OCR."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import median
+from typing import TYPE_CHECKING, Literal, cast
+
+from PIL import Image as PILImage
+from PIL import ImageOps
+
+from kreuzberg.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    import pypdfium2
+    from PIL.Image import Image
+
+POINTS_PER_INCH = 72
+_MAX_SAMPLED_CHARS = 2000
+_INK_THRESHOLD = 128
+_MIN_INK_ROW_LEVEL = 2
+_MIN_LINE_ROWS = 2
+
+
+@dataclass(unsafe_hash=True, slots=True)
+class PDFRenderConfig:
+    """Configuration for rendering PDF pages before OCR.
+
+    In adaptive mode the resolution of every page is chosen so that its text is rendered at roughly
+    ``target_text_height`` pixels per line. The text height is read from the text layer when the page has one,
+    and otherwise estimated from a cheap low-resolution probe render. The result is clamped to the
+    ``min_dpi``/``max_dpi`` range and to the ``max_pixels`` budget.
+    """
+
+    adaptive: bool = True
+    """Whether to estimate the resolution per page. If False, every page is rendered at ``dpi``."""
+    dpi: int = 300
+    """Resolution used when ``adaptive`` is False, or when no text height could be estimated for a page."""
+    target_text_height: int = 40
+    """Target height of a line of text in pixels. Tesseract is most accurate with an x-height of 20-30 pixels."""
+    min_dpi: int = 150
+    """Lowest resolution chosen in adaptive mode."""
+    max_dpi: int = 600
+    """Highest resolution chosen in adaptive mode."""
+    max_pixels: int | None = 12_000_000
+    """Upper bound on the pixels of a rendered page. Large pages are rendered below ``min_dpi`` to stay within it."""
+    probe_dpi: int = 100
+    """Resolution of the probe render used to estimate the text height of pages without a text layer."""
+    color_mode: Literal["rgb", "grayscale", "bilevel"] = "rgb"
+    """Color mode of the rendered pages.
+
+    ``grayscale`` uses a third of the memory of ``rgb``, and ``bilevel`` renders a 1-bit black and white image.
+    Bilevel images are best suited to Tesseract, which binarizes its input anyway.
+    """
+
+    def __post_init__(self) -> None:
+        if min(self.dpi, self.min_dpi, self.probe_dpi, self.target_text_height) < 1:
+            raise ValidationError(
+                "'dpi', 'min_dpi', 'probe_dpi' and 'target_text_height' must be positive",
+                context={
+                    "dpi": self.dpi,
+                    "min_dpi": self.min_dpi,
+                    "probe_dpi": self.probe_dpi,
+                    "target_text_height": self.target_text_height,
+                },
+            )
+        if self.min_dpi > self.max_dpi:
+            raise ValidationError(
+                "'min_dpi' must not be greater than 'max_dpi'",
+                context={"min_dpi": self.min_dpi, "max_dpi": self.max_dpi},
+            )
+        if self.max_pixels is not None and self.max_pixels < 1:
+            raise ValidationError("'max_pixels' must be positive", context={"max_pixels": self.max_pixels})
+
+
+def get_text_layer_line_height(page: pypdfium2.PdfPage) -> float | None:
+    """Get the median line height of the text layer of a page.
+
+    Args:
+        page: The PDF page.
+
+    Returns:
+        The median line height in points, or None if the page has no visible text.
+    """
+    text_page = page.get_textpage()
+    try:
+        char_count = text_page.count_chars()
+        step = max(1, char_count // _MAX_SAMPLED_CHARS)
+        heights = []
+        for index in range(0, char_count, step):
+            _, tight_bottom, _, tight_top = text_page.get_charbox(index)
+            if tight_top <= tight_bottom:
+                # whitespace and generated characters have an empty glyph box
+                continue
+            _, bottom, _, top = text_page.get_charbox(index, loose=True)
+            heights.append(top - bottom)
+    finally:
+        text_page.close()
+
+    return median(heights) if heights else None
+
+
+def probe_line_height(page: pypdfium2.PdfPage, probe_dpi: int) -> float | None:
+    """Estimate the median line height of a page from a low-resolution render.
+
+    The probe is binarized and reduced to a horizontal projection profile. Consecutive rows containing ink
+    are treated as a line of text, and the median run length is the line height.
+
+    Args:
+        page: The PDF page.
+        probe_dpi: The resolution of the probe render.
+
+    Returns:
+        The median line height in points, or None if no lines of text were found.
+    """
+    bitmap = page.render(scale=probe_dpi / POINTS_PER_INCH, grayscale=True)
+    try:
+        probe = ImageOps.autocontrast(bitmap.to_pil())
+    finally:
+        bitmap.close()
+
+    ink = probe.point(lambda value: 255 if value < _INK_THRESHOLD else 0)
+    # one byte per row: the share of ink in the row, scaled to 0-255
+    profile = ink.resize((1, ink.height), PILImage.Resampling.BOX).tobytes()
+    probe.close()
+    ink.close()
+
+    line_heights = []
+    run = 0
+    for level in [*profile, 0]:
+        if level >= _MIN_INK_ROW_LEVEL:
+            run += 1
+            continue
+        if run >= _MIN_LINE_ROWS:
+            line_heights.append(run)
+        run = 0
+
+    if not line_heights:
+        return None
+    return median(line_heights) * POINTS_PER_INCH / probe_dpi
+
+
+def get_render_scale(page: pypdfium2.PdfPage, config: PDFRenderConfig) -> float:
+    """Choose the render scale of a page.
+
+    Args:
+        page: The PDF page.
+        config: The render configuration.
+
+    Returns:
+        The scale to render the page at, where 1.0 is 72 DPI.
+    """
+    dpi = float(config.dpi)
+    if config.adaptive:
+        line_height = get_text_layer_line_height(page) or probe_line_height(page, config.probe_dpi)
+        if line_height:
+            dpi = min(max(config.target_text_height * POINTS_PER_INCH / line_height, config.min_dpi), config.max_dpi)
+
+    scale = dpi / POINTS_PER_INCH
+    if config.max_pixels is not None:
+        width, height = page.get_size()
+        scale = min(scale, math.sqrt(config.max_pixels / (width * height)))
+    return scale
+
+
+def render_pdf_page(document: pypdfium2.PdfDocument, page_index: int, config: PDFRenderConfig) -> Image:
+    """Render a single page to a Pillow image at the resolution chosen by ``config``.
+
+    Args:
+        document: The opened PDF document.
+        page_index: The 0-based index of the page.
+        config: The render configuration.
+
+    Returns:
+        The rendered page, in RGB, L or 1 mode depending on ``config.color_mode``.
+    """
+    page = document[page_index]
+    try:
+        scale = get_render_scale(page, config)
+        bitmap = page.render(scale=scale, grayscale=config.color_mode != "rgb")
+        try:
+            image = cast("Image", bitmap.to_pil())
+            if config.color_mode == "bilevel":
+                return image.convert("1", dither=PILImage.Dither.NONE)
+            # grayscale images share the bitmap buffer, which is released below
+            return image.copy() if config.color_mode == "grayscale" else image
+        finally:
+            bitmap.close()
+    finally:
+        page.close()
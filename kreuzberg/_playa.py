@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import contextlib
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, cast, get_args
 
 from playa import asobj, parse
-from playa.utils import decode_text
+from playa.pdftypes import dict_value, int_value, list_value, rect_value, resolve1
+from playa.utils import decode_text, normalize_rect
 
+from kreuzberg._types import PDFMetadataField
 from kreuzberg.exceptions import ParsingError
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from playa.document import Document
+    from playa.pdftypes import Rect
 
     from kreuzberg._types import Metadata
 
@@ -22,13 +28,18 @@ UTF16BE_ENCODING = "utf-16be"
 MIN_DATE_LENGTH = 8
 FULL_DATE_LENGTH = 14
 BOM_CHAR = "\ufeff"
+MAX_PAGE_TREE_DEPTH = 64
+ALL_PDF_METADATA_FIELDS: frozenset[PDFMetadataField] = frozenset(get_args(PDFMetadataField))
 
 
-async def extract_pdf_metadata(pdf_content: bytes) -> Metadata:
+async def extract_pdf_metadata(
+    pdf_content: bytes, fields: Collection[PDFMetadataField] = ALL_PDF_METADATA_FIELDS
+) -> Metadata:
     """Extract metadata from a PDF document.
 
     Args:
         pdf_content: The bytes of the PDF document.
+        fields: The expensive metadata fields to compute, see ``extract_pdf_metadata_from_document``.
 
     Raises:
         ParsingError: If the PDF metadata could not be extracted.
@@ -38,6 +49,36 @@ async def extract_pdf_metadata(pdf_content: bytes) -> Metadata:
     """
     try:
         document = parse(pdf_content, max_workers=1)
+    except Exception as e:
+        raise ParsingError(f"Failed to extract PDF metadata: {e!s}") from e
+
+    return extract_pdf_metadata_from_document(document, fields)
+
+
+def extract_pdf_metadata_from_document(
+    document: Document, fields: Collection[PDFMetadataField] = ALL_PDF_METADATA_FIELDS
+) -> Metadata:
+    """Extract metadata from an already parsed PDF document.
+
+    The Info dictionary and the size of the first page are always extracted. They only need the trailer and the
+    path to the first page in the page tree, so their cost does not grow with the page count. The remaining fields
+    are only computed when requested:
+
+    - ``outline``: the table of contents as ``description``, which walks the document outline.
+    - ``languages``: the ``languages`` and ``subtitle`` from the structure tree, which walks every structure element.
+    - ``summary``: a one-line ``summary`` of the page count, PDF version, encryption and permissions.
+
+    Args:
+        document: The parsed playa document.
+        fields: The expensive metadata fields to compute.
+
+    Raises:
+        ParsingError: If the PDF metadata could not be extracted.
+
+    Returns:
+        A dictionary of metadata extracted from the PDF.
+    """
+    try:
         metadata: Metadata = {}
 
         for raw_info in document.info:
@@ -49,16 +90,16 @@ async def extract_pdf_metadata(pdf_content: bytes) -> Metadata:
             _extract_date_metadata(pdf_info, metadata)
             _extract_creator_metadata(pdf_info, metadata)
 
-        if document.pages:
-            _extract_document_dimensions(document, metadata)
+        _extract_document_dimensions(document, metadata)
 
-        if document.outline and "description" not in metadata:
+        if "outline" in fields and "description" not in metadata and document.outline:
             metadata["description"] = _generate_outline_description(document)
 
-        if "summary" not in metadata:
+        if "summary" in fields and "summary" not in metadata:
             metadata["summary"] = _generate_document_summary(document)
 
-        _extract_structure_information(document, metadata)
+        if "languages" in fields:
+            _extract_structure_information(document, metadata)
 
         return metadata
     except Exception as e:
@@ -174,11 +215,48 @@ def _extract_creator_metadata(pdf_info: dict[str, Any], result: Metadata) -> Non
             result["created_by"] = f"{result['created_by']} (Producer: {producer_str})"
 
 
+def _get_page_tree_root(document: Document) -> dict[str, Any]:
+    return dict_value(document.catalog["Pages"])
+
+
+def _get_page_count(document: Document) -> int:
+    """Get the page count from the root of the page tree, falling back to walking the whole tree."""
+    try:
+        return int_value(_get_page_tree_root(document)["Count"])
+    except Exception:  # noqa: BLE001
+        return len(document.pages)
+
+
+def _get_first_page_mediabox(document: Document) -> Rect | None:
+    """Get the media box of the first page by descending the page tree along its first kids.
+
+    Returns:
+        The media box, inherited from the nearest ancestor that defines one, or None if it could not be found.
+    """
+    node = _get_page_tree_root(document)
+    mediabox = None
+    for _ in range(MAX_PAGE_TREE_DEPTH):
+        if "MediaBox" in node:
+            mediabox = normalize_rect(rect_value(node["MediaBox"]))
+        if "Kids" not in node:
+            return mediabox
+        kids = list_value(node["Kids"])
+        if not kids:
+            return None
+        node = dict_value(resolve1(kids[0]))
+    return None
+
+
 def _extract_document_dimensions(document: Document, result: Metadata) -> None:
-    first_page = document.pages[0]
-    if hasattr(first_page, "width") and hasattr(first_page, "height"):
-        result["width"] = int(first_page.width)
-        result["height"] = int(first_page.height)
+    mediabox = None
+    with contextlib.suppress(Exception):
+        mediabox = _get_first_page_mediabox(document)
+    if mediabox is None and document.pages:
+        mediabox = document.pages[0].mediabox
+    if mediabox is not None:
+        x0, y0, x1, y1 = mediabox
+        result["width"] = int(x1 - x0)
+        result["height"] = int(y1 - y0)
 
 
 def _format_outline(entries: list[Any], level: int = 0) -> list[str]:
@@ -202,7 +280,7 @@ def _generate_outline_description(document: Document) -> str:
 def _generate_document_summary(document: Document) -> str:
     summary_parts = []
 
-    page_count = len(document.pages)
+    page_count = _get_page_count(document)
     summary_parts.append(f"PDF document with {page_count} page{'s' if page_count != 1 else ''}.")
 
     if hasattr(document, "pdf_version"):
@@ -275,13 +353,16 @@ def _extract_structure_information(document: Document, result: Metadata) -> None
             result["subtitle"] = subtitle
 
 
-def extract_pdf_metadata_sync(pdf_content: bytes) -> Metadata:
+def extract_pdf_metadata_sync(
+    pdf_content: bytes, fields: Collection[PDFMetadataField] = ALL_PDF_METADATA_FIELDS
+) -> Metadata:
     """Synchronous version of extract_pdf_metadata.
 
     Extract metadata from a PDF document without using async/await.
 
     Args:
         pdf_content: The bytes of the PDF document.
+        fields: The expensive metadata fields to compute, see ``extract_pdf_metadata_from_document``.
 
     Raises:
         ParsingError: If the PDF metadata could not be extracted.
@@ -291,28 +372,7 @@ def extract_pdf_metadata_sync(pdf_content: bytes) -> Metadata:
     """
     try:
         document = parse(pdf_content, max_workers=1)
-        metadata: Metadata = {}
-
-        for raw_info in document.info:
-            pdf_info = {k.lower(): v for k, v in asobj(raw_info).items()}
-            _extract_basic_metadata(pdf_info, metadata)
-            _extract_author_metadata(pdf_info, metadata)
-            _extract_keyword_metadata(pdf_info, metadata)
-            _extract_category_metadata(pdf_info, metadata)
-            _extract_date_metadata(pdf_info, metadata)
-            _extract_creator_metadata(pdf_info, metadata)
-
-        if document.pages:
-            _extract_document_dimensions(document, metadata)
-
-        if document.outline and "description" not in metadata:
-            metadata["description"] = _generate_outline_description(document)
-
-        if "summary" not in metadata:
-            metadata["summary"] = _generate_document_summary(document)
-
-        _extract_structure_information(document, metadata)
-
-        return metadata
     except Exception as e:
         raise ParsingError(f"Failed to extract PDF metadata: {e!s}") from e
+
+    return extract_pdf_metadata_from_document(document, fields)
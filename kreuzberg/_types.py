@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Awaitable, Callable
-from dataclasses import asdict, dataclass, field
-from typing import TYPE_CHECKING, Any, Literal, TypedDict
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, get_args
 
 import msgspec
 
@@ -30,8 +30,11 @@ if TYPE_CHECKING:
     from kreuzberg._ocr._easyocr import EasyOCRConfig
     from kreuzberg._ocr._paddleocr import PaddleOCRConfig
     from kreuzberg._ocr._tesseract import TesseractConfig
+    from kreuzberg._pdf_render import PDFRenderConfig
 
-OcrBackendType = Literal["tesseract", "easyocr", "paddleocr"]
+OcrBackendType = Literal["tesseract", "tesserocr", "easyocr", "paddleocr"]
+PDFMetadataField = Literal["outline", "languages", "summary"]
+OcrFallbackMode = Literal["document", "page"]
 
 
 class TableData(TypedDict):
@@ -137,6 +140,32 @@ class Metadata(TypedDict, total=False):
     quality_score: NotRequired[float]
     """Quality score for extracted content (0.0-1.0)."""
 
+    # Page-level extraction metadata
+    page_number: NotRequired[int]
+    """1-based page number, set on per-page results yielded by streaming extraction."""
+    text_source: NotRequired[Literal["text_layer", "ocr"]]
+    """Whether the page text was taken from the embedded text layer or produced by OCR."""
+    ocr_pages: NotRequired[list[int]]
+    """1-based numbers of the pages whose text was produced by OCR in per-page fallback mode."""
+    page_cache_hits: NotRequired[int]
+    """Number of pages whose OCR result was reused from the page cache."""
+    page_cache_misses: NotRequired[int]
+    """Number of pages that were OCR'd because the page cache had no result for their content."""
+    deadline_exceeded: NotRequired[bool]
+    """Whether the extraction ran out of its ``document_timeout`` and returned a partial result."""
+    completed_pages: NotRequired[list[int]]
+    """1-based numbers of the pages that were fully extracted before the deadline."""
+    skipped_pages: NotRequired[list[int]]
+    """1-based numbers of the pages that were left out, or only partially extracted, because of the deadline."""
+    skipped_stages: NotRequired[list[str]]
+    """The extraction stages that were skipped or cut short because of the deadline."""
+    preprocessing_timings: NotRequired[dict[str, float]]
+    """Seconds spent in each image preprocessing step before OCR, when preprocessing is configured."""
+    ocr_rotations: NotRequired[list[int]]
+    """Clockwise rotation in degrees applied to each OCR'd image or page by the OCR pre-pass, in page order."""
+    ocr_languages: NotRequired[list[str]]
+    """Tesseract languages each OCR'd image or page was recognised with, as chosen by the OCR pre-pass, in page order."""
+
 
 # Cache valid metadata keys at module level for performance
 _VALID_METADATA_KEYS = {
@@ -178,6 +207,18 @@ _VALID_METADATA_KEYS = {
     "table_count",
     "tables_summary",
     "quality_score",
+    "page_number",
+    "text_source",
+    "ocr_pages",
+    "page_cache_hits",
+    "page_cache_misses",
+    "deadline_exceeded",
+    "completed_pages",
+    "skipped_pages",
+    "skipped_stages",
+    "preprocessing_timings",
+    "ocr_rotations",
+    "ocr_languages",
 }
 
 
@@ -252,7 +293,7 @@ class ExtractionResult:
         # Use msgspec.to_builtins for efficient conversion
         # The builtin_types parameter allows DataFrames to pass through
         result = msgspec.to_builtins(
-            self,
+            self if self.layout is None else replace(self, layout=None),
             builtin_types=(type(None),),  # Allow None to pass through
             order="deterministic",  # Ensure consistent output
         )
@@ -313,6 +354,31 @@ class ExtractionConfig:
 
     force_ocr: bool = False
     """Whether to force OCR."""
+    ocr_fallback_mode: OcrFallbackMode = "document"
+    """How to decide between the embedded text layer and OCR for PDFs.
+
+    Notes:
+        - 'document' OCRs the whole document when its text layer fails validation.
+        - 'page' keeps the text layer of every page that passes validation and OCRs only the failing pages.
+    """
+    ocr_embedded_images: bool = False
+    """Whether to OCR the embedded images of PDF pages whose text layer is used.
+
+    Notes:
+        - Each image is decoded at its native resolution and its text is merged into the page text at the
+          vertical position of the image, recovering text from screenshots, scanned signatures and the like.
+        - Images smaller than 32 pixels on either side are skipped.
+    """
+    pdf_metadata_fields: frozenset[PDFMetadataField] = frozenset({"outline", "languages", "summary"})
+    """The expensive PDF metadata fields to compute.
+
+    Notes:
+        - The Info dictionary fields and the size of the first page are always extracted, at a cost that does
+          not grow with the page count.
+        - 'outline' adds the table of contents as ``description``, 'languages' adds ``languages`` and
+          ``subtitle`` from the structure tree and 'summary' adds the document ``summary``.
+        - Use an empty set for the fastest metadata extraction on large documents.
+    """
     chunk_content: bool = False
     """Whether to chunk the content into smaller chunks."""
     extract_tables: bool = False
@@ -329,6 +395,89 @@ class ExtractionConfig:
     """
     ocr_config: TesseractConfig | PaddleOCRConfig | EasyOCRConfig | None = None
     """Configuration to pass to the OCR backend."""
+    page_range: tuple[int, int] | None = None
+    """1-based inclusive range of pages, as (first, last), to extract from paged documents (PDFs and multi-page TIFFs).
+
+    Notes:
+        - Honoured by text layer extraction, rendering, OCR, table detection and playa text extraction.
+        - Document-level metadata is always extracted for the whole document.
+        - A range extending past the end of the document is clipped to its last page.
+    """
+    max_pages: int | None = None
+    """Maximum number of pages to extract from paged documents, counted from the start of 'page_range'."""
+    ocr_max_rendered_pages: int | None = None
+    """Maximum number of rendered PDF pages held in memory while waiting for or undergoing OCR.
+
+    Notes:
+        - Pages are rendered lazily and released as soon as they are recognised, so peak memory is roughly
+          this value times the size of one rendered page (about 25 MB for an A4 page).
+        - If set to 'None', the number of CPUs is used.
+    """
+    ocr_tile_min_pixels: int | None = 40_000_000
+    """Minimum number of pixels of an image for it to be OCR'd in overlapping horizontal bands in parallel.
+
+    Notes:
+        - Tesseract recognises an image on a single core, so a large drawing or panorama takes minutes. Splitting
+          it into one band per worker recognises the bands concurrently, and the lines of text recognised twice in
+          the overlaps of the bands are removed when joining their text.
+        - The default is above an A4 page scanned at 600 DPI.
+        - If set to 'None', images are always OCR'd as a whole.
+    """
+    ocr_tile_overlap: int = 200
+    """Number of pixel rows each band boundary is widened by above and below, which should exceed the height of a
+    line of text."""
+    ocr_tile_max_workers: int | None = None
+    """Maximum number of bands an image is OCR'd in at once.
+
+    Notes:
+        - If set to 'None', one band per CPU core is used.
+        - With fewer than two workers, images are always OCR'd as a whole.
+    """
+    parallel_pdf_text_min_pages: int | None = None
+    """Minimum number of selected pages for the text layer of a PDF to be extracted in parallel worker processes.
+
+    Notes:
+        - The pages are split into contiguous ranges that are extracted by separate processes, each with its own
+          pdfium instance, and reassembled in order.
+        - The worker processes are started with 'forkserver' or 'spawn', which import the '__main__' module of the
+          program again, so a script enabling this must guard its entry point with 'if __name__ == "__main__":'.
+        - If set to 'None', the default, the text layer is always extracted in the current process.
+    """
+    parallel_pdf_text_min_pages_per_process: int = 100
+    """Minimum number of pages handed to each worker process during parallel text layer extraction."""
+    document_timeout: float | None = None
+    """Time budget in seconds for extracting a single document, or 'None' for no budget.
+
+    Notes:
+        - Every stage checks the deadline cooperatively: once it has passed, no new pages are extracted or OCR'd,
+          no new tables are detected and optional post-processing is skipped.
+        - Running OCR calls are cancelled in async extraction; sync extraction finishes the running OCR batch.
+          Isolated table extraction is given the remaining time as its timeout.
+        - The partial result is returned, with ``deadline_exceeded``, ``completed_pages``, ``skipped_pages`` and
+          ``skipped_stages`` in its metadata. Partial results are not cached.
+    """
+    parallel_playa_min_pages: int | None = None
+    """Minimum number of selected pages for the structure-preserving playa text pass to run in worker processes.
+
+    Notes:
+        - Smaller documents are extracted in the current process, as starting the workers costs more than it saves.
+        - As with 'parallel_pdf_text_min_pages', the workers import the '__main__' module of the program again, so a
+          script enabling this must guard its entry point with 'if __name__ == "__main__":'.
+        - If set to 'None', the default, the playa pass always runs in the current process.
+    """
+    parallel_playa_max_workers: int | None = None
+    """Maximum number of worker processes for the parallel playa text pass.
+
+    Notes:
+        - If set to 'None', one worker per CPU core but one is used.
+        - With fewer than two workers, the playa pass runs in the current process.
+    """
+    pdf_render_config: PDFRenderConfig | None = None
+    """Configuration of how PDF pages are rendered for OCR, e.g. adaptive per-page resolution and grayscale.
+
+    Notes:
+        - If set to 'None', pages are rendered at a fixed resolution.
+    """
     gmft_config: GMFTConfig | None = None
     """GMFT configuration."""
     post_processing_hooks: list[PostProcessingHook] | None = None
@@ -365,6 +514,10 @@ class ExtractionConfig:
             object.__setattr__(self, "post_processing_hooks", tuple(self.post_processing_hooks))
         if self.validators is not None and isinstance(self.validators, list):
             object.__setattr__(self, "validators", tuple(self.validators))
+        if self.page_range is not None and isinstance(self.page_range, list):
+            object.__setattr__(self, "page_range", tuple(self.page_range))
+        if not isinstance(self.pdf_metadata_fields, frozenset):
+            object.__setattr__(self, "pdf_metadata_fields", frozenset(self.pdf_metadata_fields))
         from kreuzberg._ocr._easyocr import EasyOCRConfig  # noqa: PLC0415
         from kreuzberg._ocr._paddleocr import PaddleOCRConfig  # noqa: PLC0415
         from kreuzberg._ocr._tesseract import TesseractConfig  # noqa: PLC0415
@@ -372,8 +525,47 @@ class ExtractionConfig:
         if self.ocr_backend is None and self.ocr_config is not None:
             raise ValidationError("'ocr_backend' is None but 'ocr_config' is provided")
 
+        if self.page_range is not None and (
+            len(self.page_range) != 2 or self.page_range[0] < 1 or self.page_range[1] < self.page_range[0]
+        ):
+            raise ValidationError(
+                "'page_range' must be a (first, last) pair of 1-based page numbers with first <= last",
+                context={"page_range": self.page_range},
+            )
+
+        if unknown_fields := self.pdf_metadata_fields - set(get_args(PDFMetadataField)):
+            raise ValidationError(
+                "'pdf_metadata_fields' contains unknown fields",
+                context={"unknown_fields": sorted(unknown_fields), "valid_fields": list(get_args(PDFMetadataField))},
+            )
+
+        if self.ocr_fallback_mode not in get_args(OcrFallbackMode):
+            raise ValidationError(
+                "'ocr_fallback_mode' must be 'document' or 'page'",
+                context={"ocr_fallback_mode": self.ocr_fallback_mode},
+            )
+
+        if self.document_timeout is not None and self.document_timeout <= 0:
+            raise ValidationError(
+                "'document_timeout' must be positive", context={"document_timeout": self.document_timeout}
+            )
+
+        for name in (
+            "max_pages",
+            "parallel_pdf_text_min_pages",
+            "parallel_pdf_text_min_pages_per_process",
+            "parallel_playa_min_pages",
+            "parallel_playa_max_workers",
+            "ocr_max_rendered_pages",
+            "ocr_tile_min_pixels",
+            "ocr_tile_overlap",
+            "ocr_tile_max_workers",
+        ):
+            if (value := getattr(self, name)) is not None and value < 1:
+                raise ValidationError(f"'{name}' must be at least 1", context={name: value})
+
         if self.ocr_config is not None and (
-            (self.ocr_backend == "tesseract" and not isinstance(self.ocr_config, TesseractConfig))
+            (self.ocr_backend in {"tesseract", "tesserocr"} and not isinstance(self.ocr_config, TesseractConfig))
             or (self.ocr_backend == "easyocr" and not isinstance(self.ocr_config, EasyOCRConfig))
             or (self.ocr_backend == "paddleocr" and not isinstance(self.ocr_config, PaddleOCRConfig))
         ):
@@ -382,6 +574,21 @@ class ExtractionConfig:
                 context={"ocr_backend": self.ocr_backend, "ocr_config": type(self.ocr_config).__name__},
             )
 
+    def get_page_indices(self, page_count: int) -> list[int]:
+        """Returns the 0-based indices of the pages selected by 'page_range' and 'max_pages'.
+
+        Args:
+            page_count: The number of pages in the document.
+
+        Returns:
+            The selected page indices in ascending order.
+        """
+        first, last = self.page_range if self.page_range is not None else (1, page_count)
+        last = min(last, page_count)
+        if self.max_pages is not None:
+            last = min(last, first + self.max_pages - 1)
+        return list(range(first - 1, last))
+
     def get_config_dict(self) -> dict[str, Any]:
         """Returns the OCR configuration object based on the backend specified.
 
@@ -396,7 +603,7 @@ class ExtractionConfig:
             return asdict(self.ocr_config)
 
         # Lazy load and cache default configs instead of creating new instances
-        if self.ocr_backend == "tesseract":
+        if self.ocr_backend in {"tesseract", "tesserocr"}:
             from kreuzberg._ocr._tesseract import TesseractConfig  # noqa: PLC0415
 
             return asdict(TesseractConfig())
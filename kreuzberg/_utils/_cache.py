@@ -7,18 +7,43 @@ import os
 import threading
 import time
 from contextlib import suppress
+from dataclasses import replace
 from io import StringIO
 from pathlib import Path
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Final, Generic, TypeVar
 
+import numpy as np
 from anyio import Path as AsyncPath
+from PIL import Image
 
 from kreuzberg._types import ExtractionResult
 from kreuzberg._utils._serialization import deserialize, serialize
 from kreuzberg._utils._sync import run_sync
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from PIL.Image import Image as PILImage
+
+try:  # pragma: no cover
+    import xxhash
+
+    HAS_XXHASH = True
+except ImportError:  # pragma: no cover
+    HAS_XXHASH = False
+
 T = TypeVar("T")
 
+PERCEPTUAL_HASH_SIZE: Final[int] = 32
+"""The side of the grid of a perceptual image hash, which has ``PERCEPTUAL_HASH_SIZE ** 2`` bits."""
+
+PERCEPTUAL_HASH_MAX_DISTANCE: Final[int] = 64
+"""The most bits in which the perceptual hashes of two images may differ for them to share an OCR cache entry.
+
+Rescans, recompressions and slight rescales of a page stay within about 30 bits of each other, while different pages
+of a document differ in 150 bits and more."""
+
+_PERCEPTUAL_HASH_MIN_GRADIENT = 2
+
 
 class KreuzbergCache(Generic[T]):
     """File-based cache for Kreuzberg operations.
@@ -120,6 +145,16 @@ class KreuzbergCache(Generic[T]):
                     serialized_data.append(item)
             return {"type": "TableDataList", "data": serialized_data, "cached_at": time.time()}
 
+        # Store the OCR layout DataFrame column by column, with its data types
+        if isinstance(result, ExtractionResult) and result.layout is not None:
+            return {
+                "type": "ExtractionResult",
+                "data": replace(result, layout=None),
+                "layout": result.layout.to_dict(orient="list"),
+                "layout_dtypes": {column: str(dtype) for column, dtype in result.layout.dtypes.items()},
+                "cached_at": time.time(),
+            }
+
         return {"type": type(result).__name__, "data": result, "cached_at": time.time()}
 
     def _deserialize_result(self, cached_data: dict[str, Any]) -> T:
@@ -141,6 +176,10 @@ class KreuzbergCache(Generic[T]):
             return deserialized_data  # type: ignore[return-value]
 
         if cached_data.get("type") == "ExtractionResult" and isinstance(data, dict):
+            if "layout" in cached_data:
+                import pandas as pd  # noqa: PLC0415
+
+                data["layout"] = pd.DataFrame(cached_data["layout"]).astype(cached_data["layout_dtypes"])
             return ExtractionResult(**data)  # type: ignore[return-value]
 
         return data  # type: ignore[no-any-return]
@@ -331,10 +370,120 @@ class KreuzbergCache(Generic[T]):
             }
 
 
+def get_image_hash(content: bytes) -> str:
+    """Hash the content of an image for an exact cache key.
+
+    The hash is the non-cryptographic 64-bit xxHash (XXH3) if the ``xxhash`` package is installed, and a truncated
+    SHA-256 otherwise.
+
+    Args:
+        content: The raw pixels of the image, together with its mode and size, such as an uncompressed PNM encoding.
+
+    Returns:
+        The hash, as 16 hexadecimal digits.
+    """
+    if HAS_XXHASH:
+        return str(xxhash.xxh3_64_hexdigest(content))
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def get_perceptual_image_hash(image: PILImage) -> bytes:
+    """Get the perceptual hash of an image, which changes little with noise, compression, brightness or scale.
+
+    The image is reduced to a grayscale grid of ``PERCEPTUAL_HASH_SIZE`` rows of ``PERCEPTUAL_HASH_SIZE + 1`` cells,
+    and every bit tells whether a cell is brighter than the one to its left (a difference hash). Cells of equal
+    brightness, such as those of blank areas, give 0 bits even if noise makes them differ slightly.
+
+    Returns:
+        The hash, ``PERCEPTUAL_HASH_SIZE ** 2`` bits packed into bytes.
+    """
+    if image.mode not in {"L", "RGB"}:
+        image = image.convert("RGB" if image.mode in {"RGBA", "CMYK", "P"} else "L")
+    grid = image.resize((PERCEPTUAL_HASH_SIZE + 1, PERCEPTUAL_HASH_SIZE), Image.Resampling.BOX).convert("L")
+    cells = np.asarray(grid, dtype=np.int16)
+    return np.packbits(cells[:, 1:] - cells[:, :-1] > _PERCEPTUAL_HASH_MIN_GRADIENT).tobytes()
+
+
+class PerceptualHashIndex:
+    """Perceptual hashes of the images in the OCR cache, to find the cached result of a near-identical image.
+
+    The hashes are grouped by a namespace, such as the OCR configuration, searched by Hamming distance in memory, and
+    appended to a file so that they persist with the cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the index.
+
+        Args:
+            path: The file the hashes are stored in.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._hashes: dict[str, list[bytes]] | None = None
+        self._arrays: dict[str, NDArray[np.uint8]] = {}
+
+    def _load(self) -> dict[str, list[bytes]]:
+        if self._hashes is None:
+            self._hashes = {}
+            with suppress(OSError):
+                for line in self.path.read_text("utf-8").splitlines():
+                    namespace, _, image_hash = line.partition("\t")
+                    with suppress(ValueError):
+                        self._hashes.setdefault(namespace, []).append(bytes.fromhex(image_hash))
+        return self._hashes
+
+    def find(self, namespace: str, image_hash: bytes, max_distance: int = PERCEPTUAL_HASH_MAX_DISTANCE) -> bytes | None:
+        """Find the indexed hash nearest to a perceptual hash.
+
+        Args:
+            namespace: The namespace to search.
+            image_hash: The perceptual hash of the image.
+            max_distance: The most bits in which the indexed hash may differ.
+
+        Returns:
+            The nearest indexed hash, or None if none differs in at most ``max_distance`` bits.
+        """
+        with self._lock:
+            hashes = self._load().get(namespace)
+            if not hashes:
+                return None
+            if len(self._arrays.get(namespace, ())) != len(hashes):
+                self._arrays[namespace] = np.frombuffer(b"".join(hashes), dtype=np.uint8).reshape(len(hashes), -1)
+            array = self._arrays[namespace]
+
+        if array.shape[1] != len(image_hash):
+            return None
+        distances = np.unpackbits(array ^ np.frombuffer(image_hash, dtype=np.uint8), axis=1).sum(axis=1)
+        nearest = int(distances.argmin())
+        return array[nearest].tobytes() if distances[nearest] <= max_distance else None
+
+    def add(self, namespace: str, image_hash: bytes) -> None:
+        """Add a perceptual hash to the index.
+
+        Args:
+            namespace: The namespace of the hash. It must not contain tabs or line breaks.
+            image_hash: The perceptual hash of the image.
+        """
+        with self._lock:
+            self._load().setdefault(namespace, []).append(image_hash)
+            with suppress(OSError), self.path.open("a", encoding="utf-8") as index_file:
+                index_file.write(f"{namespace}\t{image_hash.hex()}\n")
+
+    def clear(self) -> None:
+        """Remove all hashes from the index."""
+        with self._lock:
+            self._hashes = None
+            self._arrays.clear()
+            with suppress(OSError):
+                self.path.unlink(missing_ok=True)
+
+
 _ocr_cache: KreuzbergCache[ExtractionResult] | None = None
 _document_cache: KreuzbergCache[ExtractionResult] | None = None
 _table_cache: KreuzbergCache[Any] | None = None
 _mime_cache: KreuzbergCache[str] | None = None
+_page_cache: KreuzbergCache[ExtractionResult] | None = None
+_perceptual_hash_index: PerceptualHashIndex | None = None
 
 
 def get_ocr_cache() -> KreuzbergCache[ExtractionResult]:
@@ -409,9 +558,37 @@ def get_mime_cache() -> KreuzbergCache[str]:
     return _mime_cache
 
 
+def get_page_cache() -> KreuzbergCache[ExtractionResult]:
+    """Get the global page cache instance, holding the OCR results of single PDF pages by content hash."""
+    global _page_cache
+    if _page_cache is None:
+        cache_dir_str = os.environ.get("KREUZBERG_CACHE_DIR")
+        cache_dir: Path | None = None
+        if cache_dir_str:
+            cache_dir = Path(cache_dir_str) / "pages"
+
+        _page_cache = KreuzbergCache[ExtractionResult](
+            cache_type="pages",
+            cache_dir=cache_dir,
+            max_cache_size_mb=float(os.environ.get("KREUZBERG_PAGE_CACHE_SIZE_MB", "500")),
+            max_age_days=int(os.environ.get("KREUZBERG_PAGE_CACHE_AGE_DAYS", "30")),
+        )
+    return _page_cache
+
+
+def get_perceptual_hash_index() -> PerceptualHashIndex:
+    """Get the global index of the perceptual hashes of the images in the OCR cache."""
+    global _perceptual_hash_index
+    if _perceptual_hash_index is None:
+        _perceptual_hash_index = PerceptualHashIndex(get_ocr_cache().cache_dir / "perceptual_hashes.tsv")
+    return _perceptual_hash_index
+
+
 def clear_all_caches() -> None:
     """Clear all caches."""
     get_ocr_cache().clear()
+    get_perceptual_hash_index().clear()
     get_document_cache().clear()
     get_table_cache().clear()
     get_mime_cache().clear()
+    get_page_cache().clear()
@@ -0,0 +1,170 @@
+"""Cooperative per-document time budget for extraction stages."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from kreuzberg._types import Metadata
+
+
+@dataclass(slots=True)
+class Deadline:
+    """The time budget of one document extraction, and the work skipped because it ran out.
+
+    Stages check ``expired`` before scheduling new work. Once it has passed, they stop, record what they
+    skipped and return what is done.
+    """
+
+    expires_at: float
+    """The ``time.monotonic`` time at which the budget runs out."""
+    page_indices: list[int] = field(default_factory=list)
+    """The 0-based indices of the selected pages of a paged document."""
+    skipped_pages: set[int] = field(default_factory=set)
+    """The 0-based indices of the pages left out of the result, or only partially extracted."""
+    skipped_stages: list[str] = field(default_factory=list)
+    """The stages that were skipped or cut short."""
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        """Create a deadline that expires ``seconds`` from now."""
+        return cls(expires_at=time.monotonic() + seconds)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget has run out."""
+        return time.monotonic() >= self.expires_at
+
+    @property
+    def exceeded(self) -> bool:
+        """Whether any work was skipped because the budget ran out."""
+        return bool(self.skipped_pages or self.skipped_stages)
+
+    def remaining(self) -> float:
+        """Get the number of seconds left, or 0 if the budget has run out."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def skip_pages(self, page_indices: Iterable[int]) -> None:
+        """Record pages that were not extracted."""
+        self.skipped_pages.update(page_indices)
+
+    def skip_stage(self, stage: str) -> None:
+        """Record a stage that was skipped or cut short."""
+        if stage not in self.skipped_stages:
+            self.skipped_stages.append(stage)
+
+    def get_metadata(self) -> Metadata:
+        """Get the metadata describing what was skipped, with 1-based page numbers.
+
+        Returns:
+            The metadata, or an empty dict if nothing was skipped.
+        """
+        if not self.exceeded:
+            return {}
+        metadata: Metadata = {"deadline_exceeded": True}
+        if self.page_indices:
+            metadata["completed_pages"] = [i + 1 for i in self.page_indices if i not in self.skipped_pages]
+            metadata["skipped_pages"] = [i + 1 for i in self.page_indices if i in self.skipped_pages]
+        if self.skipped_stages:
+            metadata["skipped_stages"] = list(self.skipped_stages)
+        return metadata
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar("kreuzberg_deadline", default=None)
+
+
+def get_deadline() -> Deadline | None:
+    """Get the deadline of the current document extraction, or None if it has no time budget."""
+    return _current_deadline.get()
+
+
+def deadline_expired() -> bool:
+    """Whether the current document extraction has a time budget that has run out."""
+    return (deadline := _current_deadline.get()) is not None and deadline.expired
+
+
+def get_remaining_time(default: float) -> float:
+    """Get the seconds left for the current document extraction, capped at ``default``."""
+    if (deadline := _current_deadline.get()) is None:
+        return default
+    return min(default, deadline.remaining())
+
+
+def skip_if_expired(page_indices: Iterable[int] = (), stage: str | None = None) -> bool:
+    """Record pages and a stage as skipped if the time budget of the current document extraction has run out.
+
+    Args:
+        page_indices: The 0-based indices of the pages that would be extracted next.
+        stage: The stage that would be cut short.
+
+    Returns:
+        True if the budget has run out and the caller should stop.
+    """
+    if (deadline := _current_deadline.get()) is None or not deadline.expired:
+        return False
+    deadline.skip_pages(page_indices)
+    if stage is not None:
+        deadline.skip_stage(stage)
+    return True
+
+
+def start_deadline(timeout: float | None) -> Deadline | None:
+    """Get the deadline of a document extraction, starting a new one unless one is already running.
+
+    Unlike ``deadline_scope``, this does not make the deadline current. A streamed extraction enters it with
+    ``use_deadline`` around each of its steps, so it does not apply to the code consuming the stream in between.
+
+    Args:
+        timeout: The time budget in seconds, or None for no budget.
+
+    Returns:
+        The running deadline, a new deadline, or None if the extraction has no time budget.
+    """
+    running = _current_deadline.get()
+    if timeout is None or running is not None:
+        return running
+    return Deadline.after(timeout)
+
+
+@contextmanager
+def use_deadline(deadline: Deadline | None) -> Generator[Deadline | None, None, None]:
+    """Make a started deadline the deadline of the current document extraction within the scope.
+
+    Args:
+        deadline: The deadline from ``start_deadline``, or None to keep the current one.
+
+    Yields:
+        The deadline of the current document extraction, or None if it has no time budget.
+    """
+    if deadline is None or _current_deadline.get() is deadline:
+        yield _current_deadline.get()
+        return
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+@contextmanager
+def deadline_scope(timeout: float | None) -> Generator[Deadline | None, None, None]:
+    """Start the time budget of a document extraction, unless one is already running.
+
+    The deadline is stored in a context variable, so it follows the extraction into tasks and worker threads
+    started from within the scope, but not into worker processes.
+
+    Args:
+        timeout: The time budget in seconds, or None for no budget.
+
+    Yields:
+        The running deadline, or None if the extraction has no time budget.
+    """
+    with use_deadline(start_deadline(timeout)) as deadline:
+        yield deadline
@@ -6,12 +6,19 @@ from __future__ import annotations
 import warnings
 from dataclasses import dataclass
 from itertools import chain
-from typing import Literal
+from typing import Final, Literal
+
+import psutil
 
 from kreuzberg.exceptions import ValidationError
 
 DeviceType = Literal["cpu", "cuda", "mps", "auto"]
 
+MAX_CPU_BATCH_SIZE: Final[int] = 8
+"""Largest recommended batch size on CPU, where batching only saves the per-call overhead of the model."""
+LINE_CROP_SIZE_MB: Final[float] = 0.5
+"""Estimated memory of a text line cropped from a page for an OCR recogniser, in MB."""
+
 
 @dataclass(frozen=True, slots=True)
 class DeviceInfo:
@@ -294,6 +301,8 @@ def is_backend_gpu_compatible(backend: str) -> bool:
 def get_recommended_batch_size(device: DeviceInfo, input_size_mb: float = 10.0) -> int:
     """Get recommended batch size for OCR processing.
 
+    On CPU the batch may use a quarter of the available system memory, and at most ``MAX_CPU_BATCH_SIZE`` items.
+
     Args:
         device: The device to optimize for.
         input_size_mb: Estimated input size per item in MB.
@@ -302,8 +311,8 @@ def get_recommended_batch_size(device: DeviceInfo, input_size_mb: float = 10.0)
         Recommended batch size.
     """
     if device.device_type == "cpu":
-        # Conservative batch size for CPU  # ~keep
-        return 1
+        usable_memory_mb = psutil.virtual_memory().available / 1024**2 * 0.25
+        return max(1, min(int(usable_memory_mb / (input_size_mb * 4)), MAX_CPU_BATCH_SIZE))
 
     _, available_memory = get_device_memory_info(device)
 
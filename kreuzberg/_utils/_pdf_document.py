@@ -0,0 +1,243 @@
+"""Shared parsed-document handle for a single PDF extraction."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pypdfium2
+from playa import open as playa_open
+from playa import parse
+from playa.pdftypes import ContentStream, ObjRef
+from typing_extensions import Self
+
+from kreuzberg._utils._pdf_lock import pypdfium_file_lock
+from kreuzberg._utils._process_pool import get_mp_context
+from kreuzberg._utils._sync import run_sync
+from kreuzberg.exceptions import ParsingError
+
+if TYPE_CHECKING:
+    import types
+
+    from playa.document import Document
+
+# back-references that do not affect the appearance of a page
+_FINGERPRINT_IGNORED_KEYS = frozenset({"Parent", "P", "StructParent", "StructParents", "LastModified"})
+
+
+class PDFDocumentContext:
+    """Parse a PDF file at most once per backend and share the handles across one extraction.
+
+    The raw bytes, the pypdfium2 document and the playa document are each created lazily on first use
+    and reused by text extraction, metadata extraction and rendering. The context must be closed once
+    the extraction is done, ideally by using it as a (async) context manager. pypdfium2 and playa read a file
+    directly, playa through a memory map, so its bytes are only read into memory if a consumer needs them.
+
+    A context created from bytes alone is parsed entirely in memory. A temporary file is only written if a
+    consumer needs a file path, see ``get_path``, and it is removed when the context is closed.
+
+    Args:
+        path: The path to the PDF file, or None if the PDF only exists in memory.
+        content: The bytes of the PDF file, if already read. Required if ``path`` is None.
+
+    Raises:
+        ValueError: If neither a path nor content is given.
+    """
+
+    __slots__ = ("_content", "_object_digests", "_pdfium_document", "_playa_document", "_temp_path", "path")
+
+    def __init__(self, path: Path | None, content: bytes | None = None) -> None:
+        if path is None and content is None:
+            raise ValueError("Either a path or the content of the PDF file is required")
+        self.path = path
+        self._content = content
+        self._pdfium_document: pypdfium2.PdfDocument | None = None
+        self._playa_document: Document | None = None
+        self._temp_path: Path | None = None
+        self._object_digests: dict[int, bytes] = {}
+
+    @property
+    def content(self) -> bytes:
+        """The bytes of the PDF file, read on first access."""
+        if self._content is None:
+            self._content = cast("Path", self.path).read_bytes()
+        return self._content
+
+    @property
+    def lock_key(self) -> Path | str:
+        """The key of the pypdfium2 file lock guarding this document."""
+        return self.path if self.path is not None else f"<memory-pdf-{id(self)}>"
+
+    def get_path(self) -> Path:
+        """Get a file path of the PDF, writing the content to a temporary file if it only exists in memory.
+
+        Returns:
+            The path to the PDF file.
+        """
+        if self.path is not None:
+            return self.path
+        if self._temp_path is None:
+            fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.content)
+            self._temp_path = Path(temp_path)
+        return self._temp_path
+
+    def get_pdfium_document(self) -> pypdfium2.PdfDocument:
+        """Get the pypdfium2 document, opening it on first access.
+
+        Raises:
+            pypdfium2.PdfiumError: If the PDF file could not be opened.
+
+        Returns:
+            The shared pypdfium2 document. It is owned by the context and must not be closed by the caller.
+        """
+        if self._pdfium_document is None:
+            with pypdfium_file_lock(self.lock_key):
+                source = str(self.path) if self.path is not None else self.content
+                self._pdfium_document = pypdfium2.PdfDocument(source)
+        return self._pdfium_document
+
+    def get_playa_document(self) -> Document:
+        """Get the playa document, opening it on first access.
+
+        Raises:
+            ParsingError: If the PDF file could not be parsed.
+
+        Returns:
+            The shared playa document. It is owned by the context and must not be closed by the caller.
+        """
+        if self._playa_document is None:
+            self._playa_document = self.open_playa_document()
+        return self._playa_document
+
+    def open_playa_document(self, max_workers: int = 1) -> Document:
+        """Open a new playa document, memory-mapping the file instead of reading it if it has not been read yet.
+
+        Args:
+            max_workers: The number of worker processes that ``Document.pages.map`` parses pages in. With a file,
+                each worker memory-maps it as well; with bytes alone, each worker receives a copy of them. The
+                workers are started like the other worker processes, without forking the current process.
+
+        Raises:
+            ParsingError: If the PDF file could not be parsed.
+
+        Returns:
+            The playa document. It is owned by the caller, who must close it to release the file and the workers.
+        """
+        mp_context = get_mp_context() if max_workers > 1 else None
+        try:
+            if self.path is not None and self._content is None:
+                return playa_open(self.path, max_workers=max_workers, mp_context=mp_context)
+            return parse(self.content, max_workers=max_workers, mp_context=mp_context)
+        except Exception as e:
+            raise ParsingError(
+                f"Failed to parse PDF document: {e!s}", context={"file_path": str(self.path or "<bytes>")}
+            ) from e
+
+    def get_page_fingerprint(self, page_index: int) -> str | None:
+        """Get a content hash of a single page.
+
+        The hash covers the content streams, resources, annotations, boxes and rotation of the page, with indirect
+        objects resolved. It is independent of the other pages of the document, so it survives pages being added,
+        removed or edited elsewhere, and of where the page's objects are stored in the file.
+
+        Args:
+            page_index: The 0-based index of the page.
+
+        Returns:
+            The hex digest of the page, or None if the page could not be read.
+        """
+        try:
+            page = self.get_playa_document().pages[page_index]
+            digest = hashlib.sha256()
+            for value in (
+                page.attrs.get("Contents"),
+                page.resources,
+                page.attrs.get("Annots"),
+                page.mediabox,
+                page.cropbox,
+                page.rotate,
+            ):
+                digest.update(self._get_object_digest(value))
+        except Exception:  # noqa: BLE001
+            return None
+        return digest.hexdigest()
+
+    def _get_object_digest(self, value: object) -> bytes:
+        """Hash a PDF object recursively, memoizing the digests of indirect objects."""
+        if isinstance(value, ObjRef):
+            if (cached := self._object_digests.get(value.objid)) is not None:
+                return cached
+            # a placeholder breaks reference cycles
+            self._object_digests[value.objid] = b"cycle"
+            self._object_digests[value.objid] = self._get_object_digest(value.resolve())
+            return self._object_digests[value.objid]
+
+        digest = hashlib.sha256(type(value).__name__.encode())
+        if isinstance(value, ContentStream):
+            digest.update(self._get_object_digest(value.attrs))
+            # streams are hashed as stored, unless playa has already decoded them
+            digest.update(value.rawdata if value.rawdata is not None else value.buffer)
+        elif isinstance(value, dict):
+            for key in sorted(value):
+                if key not in _FINGERPRINT_IGNORED_KEYS:
+                    digest.update(key.encode())
+                    digest.update(self._get_object_digest(value[key]))
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                digest.update(self._get_object_digest(item))
+        else:
+            digest.update(repr(value).encode())
+        return digest.digest()
+
+    def close(self) -> None:
+        """Release all parsed handles."""
+        if self._pdfium_document is not None:
+            with pypdfium_file_lock(self.lock_key), contextlib.suppress(Exception):
+                self._pdfium_document.close()
+            self._pdfium_document = None
+        if self._temp_path is not None:
+            with contextlib.suppress(OSError):
+                self._temp_path.unlink()
+            self._temp_path = None
+        if self._playa_document is not None:
+            with contextlib.suppress(Exception):
+                self._playa_document.close()
+            self._playa_document = None
+        self._content = None
+        self._object_digests.clear()
+
+    async def aclose(self) -> None:
+        """Release all parsed handles without blocking the event loop."""
+        await run_sync(self.close)
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Context manager exit."""
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Async context manager exit."""
+        await self.aclose()
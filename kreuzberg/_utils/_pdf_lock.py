@@ -6,11 +6,16 @@ import hashlib
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 from weakref import WeakValueDictionary
 
+from kreuzberg._utils._sync import run_sync
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+T = TypeVar("T")
+P = ParamSpec("P")
 
 
 _PYPDFIUM_LOCK = threading.RLock()
@@ -62,6 +67,31 @@ def pypdfium_file_lock(file_path: Path | str) -> Generator[None, None, None]:
         yield
 
 
+async def run_sync_with_pypdfium_file_lock(
+    file_path: Path | str, sync_fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """Run a pypdfium2 operation on a file in a worker thread, holding the lock of the file in that thread.
+
+    The file lock is reentrant. Taken on the event loop thread, which all tasks share, it would not keep apart the
+    operations of concurrent tasks on the same document.
+
+    Args:
+        file_path: The path of the file, or another key of its lock.
+        sync_fn: The synchronous function to run.
+        *args: The positional arguments to pass to the function.
+        **kwargs: The keyword arguments to pass to the function.
+
+    Returns:
+        The result of the synchronous function.
+    """
+
+    def run_locked() -> T:
+        with pypdfium_file_lock(file_path):
+            return sync_fn(*args, **kwargs)
+
+    return await run_sync(run_locked)
+
+
 def with_pypdfium_lock(func: Any) -> Any:
     """Decorator to wrap functions with pypdfium2 lock."""
 
@@ -2,33 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import io
+import math
 import multiprocessing as mp
+import sys
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, TypeVar
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Final, TypeVar, cast
 
 import anyio
 import psutil
 import pypdfium2
+from PIL import Image
 from typing_extensions import Self
 
+from kreuzberg.exceptions import ParsingError
+
 if TYPE_CHECKING:
     import types
     from collections.abc import Callable, Generator
+    from concurrent.futures import Future
+    from multiprocessing.context import BaseContext
+
+    from PIL.Image import Image as PILImage
 
 T = TypeVar("T")
 
+DEFAULT_MAX_TASKS_PER_CHILD: Final[int] = 100
+"""The number of tasks after which a worker process of a ``ProcessPoolManager`` is replaced by a fresh one."""
+
 
 _PROCESS_POOL: ProcessPoolExecutor | None = None
 _POOL_SIZE = max(1, mp.cpu_count() - 1)
 
 
+def get_mp_context() -> BaseContext:
+    """Get the context worker processes are started with: a fork server where available, spawn otherwise.
+
+    Forking the extracting process directly can copy locks held by its other threads, e.g. inside pdfium, into the
+    worker, where they are never released.
+    """
+    return mp.get_context("forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn")
+
+
 def _init_process_pool() -> ProcessPoolExecutor:
     """Initialize the global process pool."""
     global _PROCESS_POOL
     if _PROCESS_POOL is None:
-        _PROCESS_POOL = ProcessPoolExecutor(max_workers=_POOL_SIZE)
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=_POOL_SIZE, mp_context=get_mp_context())
     return _PROCESS_POOL
 
 
@@ -59,19 +85,28 @@ def shutdown_process_pool() -> None:
         _PROCESS_POOL = None
 
 
-def _extract_pdf_text_worker(pdf_path: str) -> tuple[str, str]:
-    """Worker function for extracting PDF text in a separate process."""
+def _extract_pdf_text_worker(pdf_path: str, page_indices: list[int] | None = None) -> tuple[str, str]:
+    """Worker function for extracting PDF text in a separate process.
+
+    Args:
+        pdf_path: The path to the PDF file.
+        page_indices: The 0-based indices of the pages to extract. Defaults to all pages.
+
+    Returns:
+        The path and the text of the pages joined by newlines, or an ``ERROR:`` message if extraction failed.
+    """
     pdf = None
     try:
         pdf = pypdfium2.PdfDocument(pdf_path)
+        pages = pdf if page_indices is None else (pdf[i] for i in page_indices)
         text_parts = []
-        for page in pdf:
+        for page in pages:
             text_page = page.get_textpage()
             text = text_page.get_text_bounded()
             text_parts.append(text)
             text_page.close()
             page.close()
-        return (pdf_path, "".join(text_parts))
+        return (pdf_path, "\n".join(text_parts))
     except Exception as e:  # noqa: BLE001
         return (pdf_path, f"ERROR: {e}")
     finally:
@@ -79,6 +114,48 @@ def _extract_pdf_text_worker(pdf_path: str) -> tuple[str, str]:
             pdf.close()
 
 
+def extract_pdf_text_in_processes(pdf_path: str, page_indices: list[int], min_pages_per_process: int) -> str | None:
+    """Extract the text layer of PDF pages in parallel worker processes.
+
+    The pages are split into contiguous ranges, one per worker process of the global pool. Each worker opens
+    the file with its own pdfium instance, and the ranges are reassembled in page order.
+
+    Args:
+        pdf_path: The path to the PDF file.
+        page_indices: The 0-based indices of the pages to extract.
+        min_pages_per_process: The minimum number of pages handed to each worker process.
+
+    Raises:
+        ParsingError: If a worker process failed to extract its pages.
+        BrokenProcessPool: If a worker process died. The global pool is replaced on the next call.
+
+    Returns:
+        The text of the pages joined by newlines, or None if the pages are too few to split across processes.
+    """
+    process_count = min(_POOL_SIZE, len(page_indices) // max(1, min_pages_per_process))
+    if process_count < 2:
+        return None
+
+    chunk_size = math.ceil(len(page_indices) / process_count)
+    chunks = [page_indices[i : i + chunk_size] for i in range(0, len(page_indices), chunk_size)]
+
+    pool = _init_process_pool()
+    try:
+        futures = [pool.submit(_extract_pdf_text_worker, pdf_path, chunk) for chunk in chunks]
+        texts = [future.result()[1] for future in futures]
+    except BrokenProcessPool:
+        shutdown_process_pool()
+        raise
+
+    if errors := [text for text in texts if text.startswith("ERROR:")]:
+        raise ParsingError(
+            "Failed to extract PDF text in worker processes",
+            context={"file_path": pdf_path, "errors": errors},
+        )
+
+    return "\n".join(texts)
+
+
 def _extract_pdf_images_worker(pdf_path: str, scale: float = 4.25) -> tuple[str, list[bytes]]:
     """Worker function for converting PDF to images in a separate process."""
     pdf = None
@@ -101,21 +178,138 @@ def _extract_pdf_images_worker(pdf_path: str, scale: float = 4.25) -> tuple[str,
             pdf.close()
 
 
+@dataclass(frozen=True, slots=True)
+class SharedImage:
+    """The raw pixels of an image in a shared memory block, passed to worker processes instead of encoded bytes."""
+
+    name: str
+    """The name of the shared memory block."""
+    mode: str
+    """The PIL mode of the image."""
+    size: tuple[int, int]
+    """The width and height of the image."""
+
+
+@contextmanager
+def share_image(image: PILImage) -> Generator[SharedImage, None, None]:
+    """Copy the pixels of an image into a shared memory block, which is released when the context exits.
+
+    The pixels are copied once, without encoding them, and worker processes map the block rather than receiving a
+    pickled copy. Modes other than 1, L and RGB are converted to RGB, with transparent images flattened onto white.
+
+    Args:
+        image: The image.
+
+    Yields:
+        The reference to pass to worker processes, which open it with ``open_shared_image``.
+    """
+    if image.mode in {"RGBA", "LA", "PA"} or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, "white")
+        image.paste(rgba, mask=rgba.getchannel("A"))
+    elif image.mode not in {"1", "L", "RGB"}:
+        image = image.convert("RGB")
+
+    pixels = image.tobytes()
+    shared_memory = SharedMemory(create=True, size=max(1, len(pixels)))
+    try:
+        cast("memoryview", shared_memory.buf)[: len(pixels)] = pixels
+        yield SharedImage(name=shared_memory.name, mode=image.mode, size=image.size)
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+@contextmanager
+def open_shared_image(shared_image: SharedImage) -> Generator[PILImage, None, None]:
+    """Open an image shared by ``share_image``, in a worker process, without copying its pixels.
+
+    Args:
+        shared_image: The reference to the shared image.
+
+    Yields:
+        The image, which is only valid inside the context.
+    """
+    shared_memory = SharedMemory(name=shared_image.name)
+    try:
+        image = Image.frombuffer(
+            shared_image.mode,
+            shared_image.size,
+            shared_memory.buf,  # type: ignore[arg-type]
+            "raw",
+            shared_image.mode,
+            0,
+            1,
+        )
+        try:
+            yield image
+        finally:
+            image.close()
+    finally:
+        shared_memory.close()
+
+
+def _call_soon_threadsafe(callback: Callable[[], object]) -> Callable[[], None]:
+    """Make a function of the running event loop callable from any thread, as the done callback of a future is.
+
+    The returned function schedules ``callback`` on the event loop and does nothing once the loop has finished.
+    """
+    try:
+        schedule: Callable[[Callable[[], object]], object] = asyncio.get_running_loop().call_soon_threadsafe
+    except RuntimeError:
+        import trio  # noqa: PLC0415
+
+        schedule = trio.lowlevel.current_trio_token().run_sync_soon
+
+    def call() -> None:
+        with contextlib.suppress(RuntimeError):
+            schedule(callback)
+
+    return call
+
+
+async def _wait_for_future(future: Future[T]) -> T:
+    """Wait for the result of a worker process without blocking the event loop or a worker thread.
+
+    If the waiting task is cancelled, e.g. because the document deadline passed, the future is cancelled as well, so
+    a task that has not been started by a worker process yet never is.
+    """
+    done = anyio.Event()
+    notify = _call_soon_threadsafe(done.set)
+    future.add_done_callback(lambda _: notify())
+    try:
+        await done.wait()
+    except anyio.get_cancelled_exc_class():
+        future.cancel()
+        raise
+    return future.result()
+
+
 class ProcessPoolManager:
-    """Resource-aware process pool manager for CPU-intensive tasks."""
+    """Resource-aware process pool manager for CPU-intensive tasks.
+
+    Tasks run in worker processes, so they must be picklable, module-level functions with picklable arguments. The
+    workers are started from a fork server where available, and each worker is replaced after
+    ``max_tasks_per_child`` tasks to bound the memory it accumulates. Replacing workers requires Python 3.11; on
+    older versions they run until the pool is shut down.
+    """
 
     def __init__(
         self,
         max_processes: int | None = None,
         memory_limit_gb: float | None = None,
+        max_tasks_per_child: int | None = DEFAULT_MAX_TASKS_PER_CHILD,
     ) -> None:
         """Initialize the process pool manager.
 
         Args:
             max_processes: Maximum number of processes. Defaults to CPU count.
             memory_limit_gb: Memory limit in GB. Defaults to 75% of available memory.
+            max_tasks_per_child: The number of tasks after which a worker process is replaced. None keeps the
+                workers for the lifetime of the pool.
         """
         self.max_processes = max_processes or mp.cpu_count()
+        self.max_tasks_per_child = max_tasks_per_child
 
         if memory_limit_gb is None:
             available_memory = psutil.virtual_memory().available
@@ -124,6 +318,7 @@ class ProcessPoolManager:
             self.memory_limit_bytes = int(memory_limit_gb * 1024**3)
 
         self._executor: ProcessPoolExecutor | None = None
+        self._limiter: anyio.CapacityLimiter | None = None
         self._active_tasks = 0
 
     def get_optimal_workers(self, task_memory_mb: float = 100) -> int:
@@ -140,24 +335,43 @@ class ProcessPoolManager:
 
         return min(self.max_processes, memory_based_limit)
 
-    def _ensure_executor(self, max_workers: int | None = None) -> ProcessPoolExecutor:
-        """Ensure process pool executor is initialized."""
-        if self._executor is None or getattr(self._executor, "_max_workers", None) != max_workers:
-            if self._executor is not None:
-                self._executor.shutdown(wait=False)
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        """Ensure the process pool executor is initialized, with ``max_processes`` workers.
 
-            workers = max_workers or self.max_processes
-            self._executor = ProcessPoolExecutor(max_workers=workers)
+        The pool is sized once. How many of its workers run tasks at a time is limited by the memory of the tasks.
+        """
+        if self._executor is None:
+            options: dict[str, Any] = {"mp_context": get_mp_context()}
+            if self.max_tasks_per_child is not None and sys.version_info >= (3, 11):
+                options["max_tasks_per_child"] = self.max_tasks_per_child
+            self._executor = ProcessPoolExecutor(max_workers=self.max_processes, **options)
 
         return self._executor
 
+    def _get_limiter(self, workers: int) -> anyio.CapacityLimiter:
+        """Get the limiter of the number of tasks running in worker processes at a time, allowing ``workers``."""
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(workers)
+        else:
+            self._limiter.total_tokens = workers
+        return self._limiter
+
+    async def _run_task(self, func: Callable[..., T], args: tuple[Any, ...], workers: int) -> T:
+        """Run a task in a worker process once fewer than ``workers`` tasks are running."""
+        async with self._get_limiter(workers):
+            self._active_tasks += 1
+            try:
+                return await _wait_for_future(self._ensure_executor().submit(func, *args))
+            finally:
+                self._active_tasks -= 1
+
     async def submit_task(
         self,
         func: Callable[..., T],
         *args: Any,
         task_memory_mb: float = 100,
     ) -> T:
-        """Submit a task to the process pool.
+        """Submit a task to a worker process.
 
         Args:
             func: Function to execute.
@@ -167,15 +381,7 @@ class ProcessPoolManager:
         Returns:
             Result of the function execution.
         """
-        workers = self.get_optimal_workers(task_memory_mb)
-        self._ensure_executor(workers)
-
-        self._active_tasks += 1
-
-        try:
-            return await anyio.to_thread.run_sync(func, *args)
-        finally:
-            self._active_tasks -= 1
+        return await self._run_task(func, args, self.get_optimal_workers(task_memory_mb))
 
     async def submit_batch(
         self,
@@ -184,7 +390,7 @@ class ProcessPoolManager:
         task_memory_mb: float = 100,
         max_concurrent: int | None = None,
     ) -> list[T]:
-        """Submit a batch of tasks to the process pool.
+        """Submit a batch of tasks to worker processes.
 
         Args:
             func: Function to execute.
@@ -199,25 +405,14 @@ class ProcessPoolManager:
             return []
 
         workers = self.get_optimal_workers(task_memory_mb)
-        max_concurrent = max_concurrent or workers
-
-        self._ensure_executor(workers)
-
-        semaphore = anyio.CapacityLimiter(max_concurrent)
-
-        async def submit_single(args: tuple[Any, ...]) -> T:
-            async with semaphore:
-                self._active_tasks += 1
-                try:
-                    return await anyio.to_thread.run_sync(func, *args)
-                finally:
-                    self._active_tasks -= 1
+        semaphore = anyio.CapacityLimiter(max_concurrent or workers)
 
         async with anyio.create_task_group() as tg:
             results: list[T] = [None] * len(arg_batches)  # type: ignore[list-item]
 
             async def run_task(idx: int, args: tuple[Any, ...]) -> None:
-                results[idx] = await submit_single(args)
+                async with semaphore:
+                    results[idx] = await self._run_task(func, args, workers)
 
             for idx, args in enumerate(arg_batches):
                 tg.start_soon(run_task, idx, args)
@@ -245,6 +440,7 @@ class ProcessPoolManager:
         if self._executor is not None:
             self._executor.shutdown(wait=wait)
             self._executor = None
+        self._limiter = None
 
     def __enter__(self) -> Self:
         """Context manager entry."""
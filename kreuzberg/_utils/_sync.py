@@ -8,6 +8,8 @@ import anyio
 from anyio import create_task_group
 from anyio.to_thread import run_sync as any_io_run_sync
 
+from kreuzberg._utils._deadline import get_deadline
+
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Awaitable, Callable
 
@@ -75,6 +77,37 @@ async def run_taskgroup_batched(*async_tasks: Awaitable[Any], batch_size: int) -
     return results
 
 
+async def run_taskgroup_until_deadline(
+    *task_factories: Callable[[], Awaitable[T]], max_concurrency: int
+) -> list[T | None]:
+    """Run coroutines concurrently until the time budget of the current document extraction runs out.
+
+    Coroutines are only started while the budget lasts, and the running ones are cancelled when it runs out.
+
+    Args:
+        *task_factories: Functions creating the coroutines to run.
+        max_concurrency: The maximum number of coroutines running at the same time.
+
+    Returns:
+        The results of the coroutines, with None for those that were not started or did not finish.
+    """
+    deadline = get_deadline()
+    limiter = anyio.CapacityLimiter(max_concurrency)
+    results: list[T | None] = [None] * len(task_factories)
+
+    async def run_task(index: int, task_factory: Callable[[], Awaitable[T]]) -> None:
+        async with limiter:
+            if deadline is None or not deadline.expired:
+                results[index] = await task_factory()
+
+    with anyio.move_on_after(None if deadline is None else deadline.remaining()):
+        async with create_task_group() as tg:
+            for i, task_factory in enumerate(task_factories):
+                tg.start_soon(run_task, i, task_factory)
+
+    return results
+
+
 async def run_maybe_sync(fn: Callable[P, T | Awaitable[T]], *args: P.args, **kwargs: P.kwargs) -> T:
     """Executes a callable function and handles both synchronous and asynchronous
     results.
@@ -0,0 +1,102 @@
+"""Loading the OCR backend and models an extraction configuration uses ahead of the first document."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Final
+
+from kreuzberg._entity_extraction import load_entity_model, load_keyword_model
+from kreuzberg._gmft import load_table_models
+from kreuzberg._language_detection import detect_languages
+from kreuzberg._ocr import get_ocr_backend
+from kreuzberg._ocr._prepass import get_prepass_config
+from kreuzberg._ocr._tesseract import TesseractConfig
+from kreuzberg._utils._sync import run_sync
+from kreuzberg.extraction import DEFAULT_CONFIG
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kreuzberg._types import ExtractionConfig
+
+_WARMUP_TEXT: Final[str] = "Kreuzberg extracts text from documents."
+"""The text language detection is run on to load its model."""
+
+
+def _load_language_model(config: ExtractionConfig) -> None:
+    """Load the language detection model by detecting the language of a short text.
+
+    Raises:
+        MissingDependencyError: If fast-langdetect is not installed.
+    """
+    detect_languages(_WARMUP_TEXT, config=config.language_detection_config)
+
+
+def _get_model_loaders(config: ExtractionConfig) -> dict[str, Callable[[], None]]:
+    """Get the loaders of the models an extraction configuration uses, by component name."""
+    loaders: dict[str, Callable[[], None]] = {}
+    prepass = get_prepass_config(config.ocr_config.prepass) if isinstance(config.ocr_config, TesseractConfig) else None
+    if config.auto_detect_language or (prepass is not None and prepass.detect_language):
+        loaders["language_detection"] = lambda: _load_language_model(config)
+    if config.extract_entities:
+        loaders["entity_extraction"] = load_entity_model
+    if config.extract_keywords:
+        loaders["keyword_extraction"] = load_keyword_model
+    if config.extract_tables:
+        loaders["table_extraction"] = load_table_models
+    return loaders
+
+
+async def warmup(config: ExtractionConfig = DEFAULT_CONFIG) -> dict[str, float]:
+    """Load and validate the OCR backend and the models an extraction configuration uses.
+
+    Servers call this on start-up, so that the first documents they extract do not pay for starting the OCR backend,
+    loading models or importing their libraries. Components the configuration does not use are not loaded.
+
+    Args:
+        config: The extraction configuration the documents will be extracted with.
+
+    Raises:
+        MissingDependencyError: If a dependency of a used component is not installed.
+        OCRError: If the OCR backend failed to load, e.g. because its language data is missing.
+
+    Returns:
+        The seconds each component took to load, by component name. The OCR backend is named ``ocr:<backend>``.
+    """
+    timings: dict[str, float] = {}
+    if config.ocr_backend is not None:
+        start = time.perf_counter()
+        await get_ocr_backend(config.ocr_backend).warmup(**config.get_config_dict())
+        timings[f"ocr:{config.ocr_backend}"] = time.perf_counter() - start
+
+    for name, loader in _get_model_loaders(config).items():
+        start = time.perf_counter()
+        await run_sync(loader)
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def warmup_sync(config: ExtractionConfig = DEFAULT_CONFIG) -> dict[str, float]:
+    """Synchronous version of warmup.
+
+    Args:
+        config: The extraction configuration the documents will be extracted with.
+
+    Raises:
+        MissingDependencyError: If a dependency of a used component is not installed.
+        OCRError: If the OCR backend failed to load, e.g. because its language data is missing.
+
+    Returns:
+        The seconds each component took to load, by component name. The OCR backend is named ``ocr:<backend>``.
+    """
+    timings: dict[str, float] = {}
+    if config.ocr_backend is not None:
+        start = time.perf_counter()
+        get_ocr_backend(config.ocr_backend).warmup_sync(**config.get_config_dict())
+        timings[f"ocr:{config.ocr_backend}"] = time.perf_counter() - start
+
+    for name, loader in _get_model_loaders(config).items():
+        start = time.perf_counter()
+        loader()
+        timings[name] = time.perf_counter() - start
+    return timings
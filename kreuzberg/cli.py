@@ -41,7 +41,7 @@ class OcrBackendParamType(click.ParamType):
             return None
         if value.lower() == "none":
             return "none"
-        valid_backends = ["tesseract", "easyocr", "paddleocr", "none"]
+        valid_backends = ["tesseract", "tesserocr", "easyocr", "paddleocr", "none"]
         if value.lower() not in valid_backends:
             self.fail(f"Invalid OCR backend '{value}'. Choose from: {', '.join(valid_backends)}", param, ctx)
         return value.lower()  # type: ignore[no-any-return]
@@ -117,15 +117,15 @@ def _build_cli_args(
 ) -> dict[str, Any]:
     """Build CLI arguments dictionary."""
     cli_args: dict[str, Any] = {
-        "force_ocr": force_ocr if force_ocr else None,
-        "chunk_content": chunk_content if chunk_content else None,
-        "extract_tables": extract_tables if extract_tables else None,
+        "force_ocr": force_ocr or None,
+        "chunk_content": chunk_content or None,
+        "extract_tables": extract_tables or None,
         "max_chars": max_chars if max_chars != DEFAULT_MAX_CHARACTERS else None,
         "max_overlap": max_overlap if max_overlap != DEFAULT_MAX_OVERLAP else None,
         "ocr_backend": ocr_backend,
     }
 
-    if ocr_backend == "tesseract" and (tesseract_lang or tesseract_psm is not None):
+    if ocr_backend in {"tesseract", "tesserocr"} and (tesseract_lang or tesseract_psm is not None):
         tesseract_config = {}
         if tesseract_lang:
             tesseract_config["language"] = tesseract_lang
@@ -248,7 +248,9 @@ def cli(ctx: click.Context) -> None:
     help=f"Maximum overlap between chunks (default: {DEFAULT_MAX_OVERLAP})",
 )
 @click.option(
-    "--ocr-backend", type=OcrBackendParamType(), help="OCR backend to use (tesseract, easyocr, paddleocr, none)"
+    "--ocr-backend",
+    type=OcrBackendParamType(),
+    help="OCR backend to use (tesseract, tesserocr, easyocr, paddleocr, none)",
 )
 @click.option("--config", type=click.Path(exists=True, path_type=Path), help="Configuration file path")
 @click.option("--show-metadata", is_flag=True, help="Include metadata in output")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import multiprocessing as mp
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import aclosing
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, cast
 
@@ -16,6 +17,7 @@ from kreuzberg._mime_types import (
 )
 from kreuzberg._registry import ExtractorRegistry
 from kreuzberg._types import ExtractionConfig, ExtractionResult
+from kreuzberg._utils._deadline import deadline_scope, get_deadline, start_deadline, use_deadline
 from kreuzberg._utils._document_cache import get_document_cache
 from kreuzberg._utils._errors import create_error_context
 from kreuzberg._utils._string import safe_decode
@@ -23,7 +25,7 @@ from kreuzberg._utils._sync import run_maybe_sync, run_sync_only
 from kreuzberg.exceptions import ValidationError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, Sequence
     from os import PathLike
 
 
@@ -33,6 +35,10 @@ DEFAULT_CONFIG: Final[ExtractionConfig] = ExtractionConfig()
 def _validate_and_post_process_helper(
     result: ExtractionResult, config: ExtractionConfig, file_path: Path | None = None
 ) -> ExtractionResult:
+    if (deadline := get_deadline()) is not None and deadline.expired:
+        deadline.skip_stage("post_processing")
+        return result
+
     if config.chunk_content:
         result.chunks = _handle_chunk_content(
             mime_type=result.mime_type,
@@ -81,6 +87,9 @@ async def _validate_and_post_process_async(
     for post_processor in config.post_processing_hooks or []:
         result = await run_maybe_sync(post_processor, result)
 
+    if (deadline := get_deadline()) is not None:
+        result.metadata.update(deadline.get_metadata())
+
     return result
 
 
@@ -95,6 +104,9 @@ def _validate_and_post_process_sync(
     for post_processor in config.post_processing_hooks or []:
         result = run_sync_only(post_processor, result)
 
+    if (deadline := get_deadline()) is not None:
+        result.metadata.update(deadline.get_metadata())
+
     return result
 
 
@@ -120,17 +132,18 @@ async def extract_bytes(content: bytes, mime_type: str, config: ExtractionConfig
         The extracted content and the mime type of the content.
     """
     mime_type = validate_mime_type(mime_type=mime_type)
-    if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
-        result = await extractor.extract_bytes_async(content)
-    else:
-        result = ExtractionResult(
-            content=safe_decode(content),
-            chunks=[],
-            mime_type=mime_type,
-            metadata={},
-        )
+    with deadline_scope(config.document_timeout):
+        if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
+            result = await extractor.extract_bytes_async(content)
+        else:
+            result = ExtractionResult(
+                content=safe_decode(content),
+                chunks=[],
+                mime_type=mime_type,
+                metadata={},
+            )
 
-    return await _validate_and_post_process_async(result=result, config=config)
+        return await _validate_and_post_process_async(result=result, config=config)
 
 
 async def extract_file(
@@ -171,25 +184,78 @@ async def extract_file(
             raise ValidationError("The file does not exist", context={"file_path": str(path)})
 
         mime_type = validate_mime_type(file_path=file_path, mime_type=mime_type)
-        if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
-            result = await extractor.extract_path_async(Path(file_path))
-        else:
-            result = ExtractionResult(
-                content=safe_decode(await anyio.Path(file_path).read_bytes()),
-                chunks=[],
-                mime_type=mime_type,
-                metadata={},
-            )
+        with deadline_scope(config.document_timeout):
+            if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
+                result = await extractor.extract_path_async(Path(file_path))
+            else:
+                result = ExtractionResult(
+                    content=safe_decode(await anyio.Path(file_path).read_bytes()),
+                    chunks=[],
+                    mime_type=mime_type,
+                    metadata={},
+                )
 
-        result = await _validate_and_post_process_async(result=result, config=config, file_path=path)
+            result = await _validate_and_post_process_async(result=result, config=config, file_path=path)
 
-        cache.set(path, config, result)
+        if not result.metadata.get("deadline_exceeded"):
+            cache.set(path, config, result)
 
         return result
     finally:
         cache.mark_complete(path, config)
 
 
+async def extract_file_stream(
+    file_path: PathLike[str] | str, mime_type: str | None = None, config: ExtractionConfig = DEFAULT_CONFIG
+) -> AsyncGenerator[ExtractionResult, None]:
+    """Extract the textual content from a given file, yielding results as soon as they are ready.
+
+    PDFs yield one result per page, in page order, with ``page_number`` and ``text_source`` set in the
+    metadata. Only the page currently being processed is held in memory. Other formats yield a single
+    result for the whole file. Validators and post-processing hooks run on each yielded result, and
+    streamed results are not cached. With a ``document_timeout``, the stream ends after the last page
+    completed before the time budget ran out; the time spent consuming the results does not count.
+
+    Args:
+        file_path: The path to the file.
+        mime_type: The mime type of the content.
+        config: Extraction options object, defaults to the default object.
+
+    Yields:
+        The extracted content of each page (or of the whole file) and the mime type of the content.
+
+    Raises:
+        ValidationError: If the file path or configuration is invalid.
+    """
+    path = Path(file_path)
+    if not await anyio.Path(path).exists():
+        raise ValidationError("The file does not exist", context={"file_path": str(path)})
+
+    mime_type = validate_mime_type(file_path=file_path, mime_type=mime_type)
+    deadline = start_deadline(config.document_timeout)
+    if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
+        async with aclosing(extractor.extract_path_stream_async(path)) as stream:
+            while True:
+                # the deadline is only current while a result is extracted, not while the caller consumes it
+                with use_deadline(deadline):
+                    try:
+                        result = await anext(stream)
+                    except StopAsyncIteration:
+                        return
+                    result = await _validate_and_post_process_async(result=result, config=config, file_path=path)
+                yield result
+
+    with use_deadline(deadline):
+        result = ExtractionResult(
+            content=safe_decode(await anyio.Path(file_path).read_bytes()),
+            chunks=[],
+            mime_type=mime_type,
+            metadata={},
+        )
+        result = await _validate_and_post_process_async(result=result, config=config, file_path=path)
+    yield result
+
+
 async def batch_extract_file(
     file_paths: Sequence[PathLike[str] | str], config: ExtractionConfig = DEFAULT_CONFIG
 ) -> list[ExtractionResult]:
@@ -305,17 +371,18 @@ def extract_bytes_sync(content: bytes, mime_type: str, config: ExtractionConfig
         The extracted content and the mime type of the content.
     """
     mime_type = validate_mime_type(mime_type=mime_type)
-    if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
-        result = extractor.extract_bytes_sync(content)
-    else:
-        result = ExtractionResult(
-            content=safe_decode(content),
-            chunks=[],
-            mime_type=mime_type,
-            metadata={},
-        )
+    with deadline_scope(config.document_timeout):
+        if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
+            result = extractor.extract_bytes_sync(content)
+        else:
+            result = ExtractionResult(
+                content=safe_decode(content),
+                chunks=[],
+                mime_type=mime_type,
+                metadata={},
+            )
 
-    return _validate_and_post_process_sync(result=result, config=config)
+        return _validate_and_post_process_sync(result=result, config=config)
 
 
 def extract_file_sync(
@@ -356,19 +423,21 @@ def extract_file_sync(
             raise ValidationError("The file does not exist", context={"file_path": str(path)})
 
         mime_type = validate_mime_type(file_path=file_path, mime_type=mime_type)
-        if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
-            result = extractor.extract_path_sync(Path(file_path))
-        else:
-            result = ExtractionResult(
-                content=Path(file_path).read_text(),
-                chunks=[],
-                mime_type=mime_type,
-                metadata={},
-            )
+        with deadline_scope(config.document_timeout):
+            if extractor := ExtractorRegistry.get_extractor(mime_type=mime_type, config=config):
+                result = extractor.extract_path_sync(Path(file_path))
+            else:
+                result = ExtractionResult(
+                    content=Path(file_path).read_text(),
+                    chunks=[],
+                    mime_type=mime_type,
+                    metadata={},
+                )
 
-        result = _validate_and_post_process_sync(result=result, config=config, file_path=path)
+            result = _validate_and_post_process_sync(result=result, config=config, file_path=path)
 
-        cache.set(path, config, result)
+        if not result.metadata.get("deadline_exceeded"):
+            cache.set(path, config, result)
 
         return result
     finally:
@@ -407,3 +407,33 @@ def test_import_error_handling() -> None:
     except MissingDependencyError as e:
         assert "litestar" in str(e).lower()
         assert e.__cause__ is import_error
+
+
+@pytest.mark.anyio
+async def test_warmup_on_startup(monkeypatch: pytest.MonkeyPatch) -> None:
+    from kreuzberg._api.main import warmup_on_startup
+
+    mock_app = Mock()
+    monkeypatch.setenv("KREUZBERG_WARMUP", "true")
+
+    with (
+        patch("kreuzberg._api.main.try_discover_config", return_value=None),
+        patch("kreuzberg._api.main.warmup", AsyncMock(return_value={"ocr:tesseract": 0.5})) as mock_warmup,
+    ):
+        await warmup_on_startup(mock_app)
+
+    mock_warmup.assert_awaited_once()
+    assert mock_app.state.warmup_timings == {"ocr:tesseract": 0.5}
+    mock_app.logger.info.assert_called_once_with("Warm-up complete", timings={"ocr:tesseract": 0.5})
+
+
+@pytest.mark.anyio
+async def test_warmup_on_startup_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from kreuzberg._api.main import warmup_on_startup
+
+    monkeypatch.delenv("KREUZBERG_WARMUP", raising=False)
+
+    with patch("kreuzberg._api.main.warmup", AsyncMock()) as mock_warmup:
+        await warmup_on_startup(Mock())
+
+    mock_warmup.assert_not_awaited()
@@ -18,7 +18,10 @@ from kreuzberg._config import (
     parse_ocr_backend_config,
     try_discover_config,
 )
+from kreuzberg._ocr._prepass import OCRPrepassConfig
+from kreuzberg._ocr._preprocessing import ImagePreprocessingConfig
 from kreuzberg._ocr._tesseract import TesseractConfig
+from kreuzberg._pdf_render import PDFRenderConfig
 from kreuzberg._types import ExtractionConfig
 from kreuzberg.exceptions import ValidationError
 
@@ -184,6 +187,24 @@ class TestConfigParsing:
         assert result.language == "eng"
         assert result.psm.value == 6
 
+    def test_parse_tesseract_config_preprocessing(self) -> None:
+        """Test parsing the nested image preprocessing table of the Tesseract configuration."""
+        config_dict = {"tesseract": {"preprocessing": {"deskew": False, "target_x_height": 20}}}
+
+        result = parse_ocr_backend_config(config_dict, "tesseract")
+        assert isinstance(result, TesseractConfig)
+        assert result.preprocessing == ImagePreprocessingConfig(deskew=False, target_x_height=20)
+        assert hash(result)
+
+    def test_parse_tesseract_config_prepass(self) -> None:
+        """Test parsing the nested OCR pre-pass table of the Tesseract configuration."""
+        config_dict = {"tesseract": {"language": "eng+deu", "prepass": {"detect_orientation": False}}}
+
+        result = parse_ocr_backend_config(config_dict, "tesseract")
+        assert isinstance(result, TesseractConfig)
+        assert result.prepass == OCRPrepassConfig(detect_orientation=False)
+        assert hash(result)
+
     def test_parse_ocr_config_missing_backend(self) -> None:
         """Test parsing when OCR backend config is missing."""
         config_dict = {"other_setting": "value"}
@@ -238,6 +259,13 @@ class TestExtractionConfigBuilder:
         result = build_extraction_config_from_dict(config_dict)
         assert result.ocr_backend is None
 
+    def test_build_from_dict_with_pdf_render_config(self) -> None:
+        """Test building ExtractionConfig with PDF render configuration."""
+        config_dict = {"pdf_render": {"target_text_height": 32, "color_mode": "grayscale"}}
+
+        result = build_extraction_config_from_dict(config_dict)
+        assert result.pdf_render_config == PDFRenderConfig(target_text_height=32, color_mode="grayscale")
+
     def test_build_extraction_config_legacy(self) -> None:
         """Test legacy build_extraction_config function."""
         file_config = {
@@ -120,3 +120,11 @@ def clean_cache_session() -> Generator[None, None, None]:
     clear_all_caches()
     yield
     clear_all_caches()
+
+
+@pytest.fixture(autouse=True)
+def isolated_page_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own page cache, so OCR results of mocked backends do not leak between tests."""
+    from kreuzberg._utils import _cache
+
+    monkeypatch.setattr(_cache, "_page_cache", _cache.KreuzbergCache(cache_type="pages", cache_dir=tmp_path / "pages"))
@@ -84,3 +84,29 @@ async def test_extract_file_without_document_classification(tmp_path: Path) -> N
     result = await extract_file(test_file, config=config)
     assert result.document_type is None
     assert result.document_type_confidence is None
+
+
+def test_vision_classification_reuses_ocr_layout(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that vision-based classification uses the layout of the extraction instead of OCRing again."""
+    import pandas as pd
+
+    from kreuzberg import _document_classification
+    from kreuzberg._document_classification import auto_detect_document_type
+
+    def fail(*_: object) -> None:
+        raise AssertionError("the image should not be OCR'd again")
+
+    monkeypatch.setattr(_document_classification, "get_ocr_backend", fail)
+    monkeypatch.setattr(_document_classification, "_get_translated_text", lambda result: result.content.lower())
+
+    result = ExtractionResult(
+        content="invoice",
+        mime_type="text/plain",
+        metadata={},
+        layout=pd.DataFrame({"text": ["invoice"], "top": [10], "height": [10]}),
+    )
+    config = ExtractionConfig(auto_detect_document_type=True, document_classification_mode="vision")
+
+    auto_detect_document_type(result, config, file_path=tmp_path / "scan.png")
+
+    assert result.document_type == "invoice"
@@ -100,3 +100,32 @@ def test_extract_keywords_missing_keybert(monkeypatch: pytest.MonkeyPatch) -> No
     monkeypatch.setitem(sys.modules, "keybert", None)
     with pytest.raises(MissingDependencyError):
         ee.extract_keywords(SAMPLE_TEXT, keyword_count=5)
+
+
+def test_load_entity_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "spacy", MagicMock())
+    loaded: list[str] = []
+
+    def load_spacy_model(model_name: str, _config: object) -> object:
+        loaded.append(model_name)
+        return object()
+
+    monkeypatch.setattr(ee, "_load_spacy_model", load_spacy_model)
+
+    ee.load_entity_model()
+
+    assert loaded == ["en_core_web_sm"]
+
+
+def test_load_entity_model_missing_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "spacy", MagicMock())
+    monkeypatch.setattr(ee, "_load_spacy_model", lambda _model_name, _config: None)
+
+    with pytest.raises(MissingDependencyError, match="python -m spacy download en_core_web_sm"):
+        ee.load_entity_model()
+
+
+def test_load_keyword_model_missing_keybert(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "keybert", None)
+    with pytest.raises(MissingDependencyError):
+        ee.load_keyword_model()
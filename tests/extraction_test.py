@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import pytest
 
 from kreuzberg import TesseractConfig
+from kreuzberg._extractors._pdf import PDFExtractor
 from kreuzberg._mime_types import (
     DOCX_MIME_TYPE,
     EXCEL_MIME_TYPE,
@@ -17,6 +19,7 @@ from kreuzberg._mime_types import (
     POWER_POINT_MIME_TYPE,
 )
 from kreuzberg._types import ExtractionConfig
+from kreuzberg._utils._deadline import get_deadline
 from kreuzberg.exceptions import ValidationError
 from kreuzberg.extraction import (
     batch_extract_bytes,
@@ -26,6 +29,7 @@ from kreuzberg.extraction import (
     extract_bytes,
     extract_bytes_sync,
     extract_file,
+    extract_file_stream,
     extract_file_sync,
 )
 from tests.conftest import pdfs_with_tables
@@ -249,6 +253,58 @@ def test_extract_file_sync_not_exists() -> None:
         extract_file_sync("/invalid/path.txt", PLAIN_TEXT_MIME_TYPE)
 
 
+@pytest.mark.anyio
+async def test_extract_file_stream_pdf(test_contract: Path) -> None:
+    results = [result async for result in extract_file_stream(test_contract)]
+
+    assert len(results) == 10
+    assert [result.metadata["page_number"] for result in results] == list(range(1, 11))
+    for result in results:
+        assert_extraction_result(result, mime_type=PLAIN_TEXT_MIME_TYPE)
+
+
+@pytest.mark.anyio
+async def test_extract_file_stream_applies_post_processing(searchable_pdf: Path) -> None:
+    config = ExtractionConfig(chunk_content=True, max_chars=500, max_overlap=50)
+    results = [result async for result in extract_file_stream(searchable_pdf, config=config)]
+
+    assert len(results) == 1
+    assert results[0].chunks
+
+
+@pytest.mark.anyio
+async def test_extract_file_stream_non_paged_format(excel_document: Path) -> None:
+    results = [result async for result in extract_file_stream(excel_document)]
+
+    assert len(results) == 1
+    assert_extraction_result(results[0], mime_type=MARKDOWN_MIME_TYPE)
+
+
+@pytest.mark.anyio
+async def test_extract_file_stream_document_timeout(test_article: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow_page_text(*_: object) -> str:
+        time.sleep(0.1)
+        return "Page text that passes validation."
+
+    monkeypatch.setattr(PDFExtractor, "_get_page_text", slow_page_text)
+    config = ExtractionConfig(document_timeout=0.35)
+
+    page_numbers = []
+    async for result in extract_file_stream(test_article, config=config):
+        assert get_deadline() is None
+        page_numbers.append(result.metadata["page_number"])
+
+    assert 1 <= len(page_numbers) < 28
+    assert page_numbers == list(range(1, len(page_numbers) + 1))
+
+
+@pytest.mark.anyio
+async def test_extract_file_stream_missing_file() -> None:
+    with pytest.raises(ValidationError):
+        async for _ in extract_file_stream("/invalid/path.pdf"):
+            pass
+
+
 def assert_extraction_result(result: ExtractionResult, *, mime_type: str) -> None:
     assert isinstance(result.content, str)
     assert result.content.strip()
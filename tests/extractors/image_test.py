@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
+from PIL import Image as PILImage
 
 from kreuzberg._extractors._image import ImageExtractor
 from kreuzberg._types import ExtractionConfig, ExtractionResult
@@ -20,6 +23,13 @@ def extractor() -> ImageExtractor:
     return ImageExtractor(mime_type="image/png", config=config)
 
 
+@pytest.fixture
+def png_bytes() -> bytes:
+    buffer = BytesIO()
+    PILImage.new("RGB", (20, 10), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def mock_ocr_backend() -> Generator[MagicMock, None, None]:
     backend = MagicMock()
@@ -79,7 +89,22 @@ def test_extract_path_sync(mock_ocr_backend: MagicMock, tmp_path: Path) -> None:
     assert result == expected_result
 
 
-def test_extract_bytes_sync(mock_ocr_backend: MagicMock) -> None:
+def test_extract_bytes_sync(mock_ocr_backend: MagicMock, png_bytes: bytes) -> None:
+    config = ExtractionConfig(ocr_backend="tesseract")
+    extractor = ImageExtractor(mime_type="image/png", config=config)
+
+    expected_result = ExtractionResult(content="extracted text", chunks=[], mime_type="text/plain", metadata={})
+    mock_ocr_backend.process_image_sync = MagicMock(return_value=expected_result)
+
+    with patch("tempfile.mkstemp", side_effect=AssertionError("no temporary file must be written")):
+        result = extractor.extract_bytes_sync(png_bytes)
+
+    mock_ocr_backend.process_image_sync.assert_called_once()
+    mock_ocr_backend.process_file_sync.assert_not_called()
+    assert result.content == "extracted text"
+
+
+def test_extract_bytes_sync_unreadable_image(mock_ocr_backend: MagicMock) -> None:
     config = ExtractionConfig(ocr_backend="tesseract")
     extractor = ImageExtractor(mime_type="image/png", config=config)
 
@@ -134,7 +159,26 @@ def test_get_extension_from_unsupported_mime_type() -> None:
 
 
 @pytest.mark.anyio
-async def test_extract_bytes_async(mock_ocr_backend: MagicMock) -> None:
+async def test_extract_bytes_async(mock_ocr_backend: MagicMock, png_bytes: bytes) -> None:
+    config = ExtractionConfig(ocr_backend="tesseract")
+    extractor = ImageExtractor(mime_type="image/png", config=config)
+
+    expected_result = ExtractionResult(content="extracted text", chunks=[], mime_type="text/plain", metadata={})
+    mock_ocr_backend.process_image = AsyncMock(return_value=expected_result)
+
+    with patch("kreuzberg._extractors._image.create_temp_file") as mock_create_temp:
+        result = await extractor.extract_bytes_async(png_bytes)
+
+        mock_create_temp.assert_not_called()
+
+    image = mock_ocr_backend.process_image.call_args.args[0]
+    assert image.size == (20, 10)
+    mock_ocr_backend.process_file.assert_not_called()
+    assert result.content == "extracted text"
+
+
+@pytest.mark.anyio
+async def test_extract_bytes_async_unreadable_image(mock_ocr_backend: MagicMock) -> None:
     config = ExtractionConfig(ocr_backend="tesseract")
     extractor = ImageExtractor(mime_type="image/png", config=config)
 
@@ -149,22 +193,13 @@ async def test_extract_bytes_async(mock_ocr_backend: MagicMock) -> None:
     with patch("kreuzberg._extractors._image.create_temp_file") as mock_create_temp:
         mock_create_temp.return_value = (mock_path, mock_unlink)
 
-        with patch("kreuzberg._extractors._image.AsyncPath") as mock_async_path:
-            mock_async_path_instance = MagicMock()
-            mock_async_path_instance.write_bytes = AsyncMock()
-            mock_async_path.return_value = mock_async_path_instance
-
-            result = await extractor.extract_bytes_async(b"dummy image content")
-
-            mock_create_temp.assert_called_once_with(".png")
-
-            mock_async_path_instance.write_bytes.assert_called_once_with(b"dummy image content")
-
-            mock_ocr_backend.process_file.assert_called_once_with(mock_path, **config.get_config_dict())
+        result = await extractor.extract_bytes_async(b"dummy image content")
 
-            mock_unlink.assert_called_once()
+        mock_create_temp.assert_called_once_with(".png", b"dummy image content")
+        mock_ocr_backend.process_file.assert_called_once_with(mock_path, **config.get_config_dict())
+        mock_unlink.assert_called_once()
 
-            assert result == expected_result
+        assert result == expected_result
 
 
 def test_extract_path_sync_no_ocr_backend() -> None:
@@ -273,3 +308,212 @@ def test_extract_real_image_sync_integration() -> None:
     assert isinstance(result, ExtractionResult)
     assert result.mime_type == "text/plain"
     assert len(result.content) > 0  # Should extract some text
+
+
+@pytest.fixture
+def multipage_tiff(tmp_path: Path) -> Path:
+    from PIL import Image
+
+    frames = [Image.new("RGB", (10 * (i + 1), 10)) for i in range(5)]
+    tiff_path = tmp_path / "multipage.tiff"
+    frames[0].save(tiff_path, save_all=True, append_images=frames[1:])
+    return tiff_path
+
+
+@pytest.mark.anyio
+async def test_extract_path_async_tiff_page_range(mock_ocr_backend: MagicMock, multipage_tiff: Path) -> None:
+    async def process_image(image: object, **kwargs: object) -> ExtractionResult:
+        return ExtractionResult(content=f"width {image.width}", chunks=[], mime_type="text/plain", metadata={})  # type: ignore[attr-defined]
+
+    mock_ocr_backend.process_image = process_image
+    extractor = ImageExtractor(mime_type="image/tiff", config=ExtractionConfig(page_range=(2, 5), max_pages=2))
+
+    result = await extractor.extract_path_async(multipage_tiff)
+
+    mock_ocr_backend.process_file.assert_not_called()
+    assert result.content == "width 20\nwidth 30"
+
+
+def test_extract_path_sync_tiff_page_range(mock_ocr_backend: MagicMock, multipage_tiff: Path) -> None:
+    mock_ocr_backend.process_image_sync = MagicMock(
+        side_effect=lambda image, **_: ExtractionResult(
+            content=f"width {image.width}", chunks=[], mime_type="text/plain", metadata={}
+        )
+    )
+    extractor = ImageExtractor(mime_type="image/tiff", config=ExtractionConfig(max_pages=1))
+
+    result = extractor.extract_path_sync(multipage_tiff)
+
+    mock_ocr_backend.process_file_sync.assert_not_called()
+    assert result.content == "width 10"
+
+
+@pytest.mark.anyio
+async def test_extract_bytes_async_tiff_all_frames(mock_ocr_backend: MagicMock, multipage_tiff: Path) -> None:
+    async def process_image(image: object, **kwargs: object) -> ExtractionResult:
+        return ExtractionResult(content=f"width {image.width}", chunks=[], mime_type="text/plain", metadata={})  # type: ignore[attr-defined]
+
+    mock_ocr_backend.process_image = process_image
+    extractor = ImageExtractor(mime_type="image/tiff", config=ExtractionConfig())
+
+    result = await extractor.extract_bytes_async(await anyio.Path(multipage_tiff).read_bytes())
+
+    assert result.content == "width 10\nwidth 20\nwidth 30\nwidth 40\nwidth 50"
+
+
+def test_extract_path_sync_vision_classification_requests_layout(mock_ocr_backend: MagicMock) -> None:
+    config = ExtractionConfig(
+        ocr_backend="tesseract", auto_detect_document_type=True, document_classification_mode="vision"
+    )
+    mock_ocr_backend.process_file_sync.return_value = ExtractionResult(
+        content="text", chunks=[], mime_type="text/plain", metadata={}
+    )
+
+    ImageExtractor(mime_type="image/png", config=config).extract_path_sync(Path("test.png"))
+
+    assert mock_ocr_backend.process_file_sync.call_args.kwargs["include_layout"] is True
+    assert (
+        ImageExtractor(mime_type="image/png", config=ExtractionConfig())._get_config_kwargs()["include_layout"] is False
+    )
+
+
+def test_join_frame_results_layout() -> None:
+    import pandas as pd
+
+    results = [
+        ExtractionResult(
+            content=f"frame {i}",
+            chunks=[],
+            mime_type="text/plain",
+            metadata={},
+            layout=pd.DataFrame({"page_num": [1], "text": [f"frame{i}"]}).astype({"page_num": "int32"}),
+        )
+        for i in range(2)
+    ]
+
+    joined = ImageExtractor._join_frame_results(results)
+
+    assert joined.layout is not None
+    assert joined.layout["page_num"].tolist() == [1, 2]
+    assert joined.layout["text"].tolist() == ["frame0", "frame1"]
+    assert ImageExtractor._join_frame_results([ExtractionResult("a", "text/plain", {})]).layout is None
+
+
+def test_join_frame_results_metadata() -> None:
+    results = [
+        ExtractionResult(
+            content=f"frame {rotation}",
+            mime_type="text/plain",
+            metadata={
+                "ocr_rotations": [rotation],
+                "ocr_languages": [language],
+                "preprocessing_timings": {"binarize": 0.5},
+            },
+        )
+        for rotation, language in [(0, "eng"), (180, "deu")]
+    ]
+
+    joined = ImageExtractor._join_frame_results(results)
+
+    assert joined.metadata == {
+        "ocr_rotations": [0, 180],
+        "ocr_languages": ["eng", "deu"],
+        "preprocessing_timings": {"binarize": 1.0},
+    }
+    assert ImageExtractor._join_frame_results([ExtractionResult("a", "text/plain", {})]).metadata == {}
+
+
+def _band_results(count: int) -> list[ExtractionResult]:
+    words = ["alpha", "bravo", "charlie"]
+    return [
+        ExtractionResult(content=f"{words[i]} text\nsecond line {words[i]}", mime_type="text/plain", metadata={})
+        for i in range(count)
+    ]
+
+
+@pytest.mark.anyio
+async def test_extract_path_async_tiled(mock_ocr_backend: MagicMock, tmp_path: Path) -> None:
+    image_path = tmp_path / "drawing.png"
+    PILImage.new("L", (50, 1000), 255).save(image_path)
+    config = ExtractionConfig(ocr_tile_min_pixels=40_000, ocr_tile_overlap=20, ocr_tile_max_workers=3)
+    mock_ocr_backend.process_image = AsyncMock(side_effect=_band_results(3))
+
+    result = await ImageExtractor(mime_type="image/png", config=config).extract_path_async(image_path)
+
+    assert mock_ocr_backend.process_image.call_count == 3
+    mock_ocr_backend.process_file.assert_not_called()
+    heights = [call.args[0].height for call in mock_ocr_backend.process_image.call_args_list]
+    assert sum(heights) > 1000
+    assert result.content.count("text") == 3
+
+
+def test_extract_bytes_sync_tiled(mock_ocr_backend: MagicMock) -> None:
+    buffer = BytesIO()
+    PILImage.new("L", (50, 1000), 255).save(buffer, format="PNG")
+    config = ExtractionConfig(ocr_tile_min_pixels=40_000, ocr_tile_overlap=20, ocr_tile_max_workers=2)
+    mock_ocr_backend.process_image_sync = MagicMock(side_effect=_band_results(2))
+
+    result = ImageExtractor(mime_type="image/png", config=config).extract_bytes_sync(buffer.getvalue())
+
+    assert mock_ocr_backend.process_image_sync.call_count == 2
+    assert result.content.count("text") == 2
+
+
+@pytest.mark.parametrize(
+    ("size", "config", "expected"),
+    [
+        ((50, 1000), ExtractionConfig(ocr_tile_min_pixels=None, ocr_tile_max_workers=4), 1),
+        ((50, 1000), ExtractionConfig(ocr_tile_min_pixels=100_000, ocr_tile_max_workers=4), 1),
+        ((50, 1000), ExtractionConfig(ocr_tile_min_pixels=1, ocr_tile_overlap=20, ocr_tile_max_workers=4), 4),
+        ((50, 1000), ExtractionConfig(ocr_tile_min_pixels=1, ocr_tile_overlap=100, ocr_tile_max_workers=4), 2),
+        ((50, 1000), ExtractionConfig(ocr_tile_min_pixels=1, ocr_tile_overlap=20, ocr_tile_max_workers=1), 1),
+    ],
+)
+def test_get_band_count(size: tuple[int, int], config: ExtractionConfig, expected: int) -> None:
+    extractor = ImageExtractor(mime_type="image/png", config=config)
+
+    assert extractor._get_band_count(PILImage.new("L", size)) == expected
+
+
+@pytest.fixture
+def decompression_bomb(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    image_path = tmp_path / "bomb.png"
+    PILImage.new("L", (50, 1000), 255).save(image_path)
+    # Pillow refuses to open images of more than twice MAX_IMAGE_PIXELS
+    monkeypatch.setattr(PILImage, "MAX_IMAGE_PIXELS", 50 * 1000 // 2 - 1)
+    return image_path
+
+
+@pytest.mark.anyio
+async def test_extract_path_async_decompression_bomb(mock_ocr_backend: MagicMock, decompression_bomb: Path) -> None:
+    config = ExtractionConfig(ocr_tile_min_pixels=40_000, ocr_tile_overlap=20, page_range=(1, 1))
+    mock_ocr_backend.process_file.return_value = ExtractionResult(content="text", mime_type="text/plain", metadata={})
+
+    result = await ImageExtractor(mime_type="image/png", config=config).extract_path_async(decompression_bomb)
+
+    mock_ocr_backend.process_file.assert_called_once()
+    assert result.content == "text"
+
+
+def test_extract_path_sync_decompression_bomb(mock_ocr_backend: MagicMock, decompression_bomb: Path) -> None:
+    config = ExtractionConfig(ocr_tile_min_pixels=40_000, ocr_tile_overlap=20, page_range=(1, 1))
+    mock_ocr_backend.process_file_sync.return_value = ExtractionResult(
+        content="text", mime_type="text/plain", metadata={}
+    )
+
+    result = ImageExtractor(mime_type="image/png", config=config).extract_path_sync(decompression_bomb)
+
+    mock_ocr_backend.process_file_sync.assert_called_once()
+    assert result.content == "text"
+
+
+def test_extract_bytes_sync_decompression_bomb(mock_ocr_backend: MagicMock, decompression_bomb: Path) -> None:
+    config = ExtractionConfig(ocr_tile_min_pixels=40_000, ocr_tile_overlap=20)
+    mock_ocr_backend.process_file_sync.return_value = ExtractionResult(
+        content="text", mime_type="text/plain", metadata={}
+    )
+
+    result = ImageExtractor(mime_type="image/png", config=config).extract_bytes_sync(decompression_bomb.read_bytes())
+
+    mock_ocr_backend.process_file_sync.assert_called_once()
+    assert result.content == "text"
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from pathlib import Path
 from typing import NoReturn
 
+import anyio
 import pandas as pd
+import pypdfium2
 import pytest
+from PIL import Image as PILImage
 from PIL.Image import Image
+from playa import PageList
 from pytest import MonkeyPatch
 
 from kreuzberg import ExtractionResult
 from kreuzberg._extractors._pdf import PDFExtractor
+from kreuzberg._ocr._tesseract import TesseractConfig
+from kreuzberg._pdf_render import PDFRenderConfig
 from kreuzberg._types import ExtractionConfig
+from kreuzberg._utils._document_cache import get_document_cache
+from kreuzberg._utils._pdf_document import PDFDocumentContext
 from kreuzberg.exceptions import ParsingError
-from kreuzberg.extraction import DEFAULT_CONFIG
+from kreuzberg.extraction import DEFAULT_CONFIG, extract_file, extract_file_sync
 from tests.conftest import pdfs_with_tables
 
 IS_CI = os.environ.get("CI", "false").lower() == "true"
@@ -26,7 +36,7 @@ def extractor() -> PDFExtractor:
 
 @pytest.mark.anyio
 async def test_extract_pdf_searchable_text(extractor: PDFExtractor, searchable_pdf: Path) -> None:
-    result = await extractor._extract_pdf_searchable_text(searchable_pdf)
+    result = await extractor._extract_pdf_searchable_text(PDFDocumentContext(searchable_pdf))
     assert isinstance(result, str)
     assert result.strip()
 
@@ -43,7 +53,7 @@ async def test_extract_pdf_searchable_not_fallback_to_ocr(test_contract: Path) -
 @pytest.mark.anyio
 @pytest.mark.xfail(IS_CI, reason="OCR tests may fail in CI due to Tesseract issues")
 async def test_extract_pdf_text_with_ocr(extractor: PDFExtractor, scanned_pdf: Path) -> None:
-    result = await extractor._extract_pdf_text_with_ocr(scanned_pdf, ocr_backend="tesseract")
+    result = await extractor._extract_pdf_text_with_ocr(PDFDocumentContext(scanned_pdf), ocr_backend="tesseract")
     assert isinstance(result, ExtractionResult)
     assert result.content.strip()
 
@@ -79,12 +89,12 @@ async def test_extract_pdf_file_invalid(extractor: PDFExtractor) -> None:
 
 
 @pytest.mark.anyio
-async def test_convert_pdf_to_images_raises_parsing_error(extractor: PDFExtractor, tmp_path: Path) -> None:
+async def test_open_pdf_for_rendering_raises_parsing_error(extractor: PDFExtractor, tmp_path: Path) -> None:
     pdf_path = tmp_path / "invalid.pdf"
     pdf_path.write_text("invalid pdf content")
 
     with pytest.raises(ParsingError) as exc_info:
-        await extractor._convert_pdf_to_images(pdf_path)
+        await extractor._open_pdf_for_rendering(PDFDocumentContext(pdf_path))
 
     assert "Could not convert PDF to images" in str(exc_info.value)
     assert str(pdf_path) in str(exc_info.value.context["file"]["path"])
@@ -96,7 +106,7 @@ async def test_extract_pdf_searchable_text_raises_parsing_error(extractor: PDFEx
     pdf_path.write_text("invalid pdf content")
 
     with pytest.raises(ParsingError) as exc_info:
-        await extractor._extract_pdf_searchable_text(pdf_path)
+        await extractor._extract_pdf_searchable_text(PDFDocumentContext(pdf_path))
 
     assert "Could not extract text from PDF file" in str(exc_info.value)
     assert str(pdf_path) in str(exc_info.value.context["file"]["path"])
@@ -177,7 +187,7 @@ async def test_extract_pdf_with_rich_metadata(extractor: PDFExtractor, test_arti
 
 @pytest.mark.anyio
 async def test_extract_pdf_bytes_with_metadata(extractor: PDFExtractor, test_article: Path) -> None:
-    pdf_bytes = test_article.read_bytes()
+    pdf_bytes = await anyio.Path(test_article).read_bytes()
 
     result = await extractor.extract_bytes_async(pdf_bytes)
 
@@ -227,6 +237,25 @@ def test_extract_pdf_bytes_sync(extractor: PDFExtractor, test_article: Path) ->
     assert "title" in result.metadata
 
 
+@pytest.mark.anyio
+async def test_extract_pdf_bytes_without_temp_file(
+    extractor: PDFExtractor, test_article: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that PDF bytes are extracted in memory, without writing a temporary file."""
+
+    def fail_mkstemp(*_: object, **__: object) -> NoReturn:
+        raise AssertionError("no temporary file expected")
+
+    monkeypatch.setattr("tempfile.mkstemp", fail_mkstemp)
+    pdf_bytes = await anyio.Path(test_article).read_bytes()
+
+    async_result = await extractor.extract_bytes_async(pdf_bytes)
+    sync_result = extractor.extract_bytes_sync(pdf_bytes)
+
+    assert async_result.content.strip()
+    assert sync_result.content.strip()
+
+
 def test_extract_pdf_path_sync(extractor: PDFExtractor, searchable_pdf: Path) -> None:
     """Test sync PDF extraction from path."""
     result = extractor.extract_path_sync(searchable_pdf)
@@ -268,7 +297,7 @@ def test_extract_pdf_searchable_text_sync_error(extractor: PDFExtractor, tmp_pat
     pdf_path.write_text("invalid pdf content")
 
     with pytest.raises(ParsingError, match="Failed to extract PDF text"):
-        extractor._extract_pdf_searchable_text_sync(pdf_path)
+        extractor._extract_pdf_searchable_text_sync(PDFDocumentContext(pdf_path))
 
 
 def test_extract_pdf_with_ocr_sync_error(extractor: PDFExtractor, tmp_path: Path) -> None:
@@ -277,7 +306,7 @@ def test_extract_pdf_with_ocr_sync_error(extractor: PDFExtractor, tmp_path: Path
     pdf_path.write_text("invalid pdf content")
 
     with pytest.raises(ParsingError, match="Failed to OCR PDF"):
-        extractor._extract_pdf_with_ocr_sync(pdf_path)
+        extractor._extract_pdf_with_ocr_sync(PDFDocumentContext(pdf_path))
 
 
 @pytest.mark.anyio
@@ -388,3 +417,636 @@ async def test_extract_pdf_searchable_text_page_errors(
         return MockDocument()
 
     monkeypatch.setattr(pypdfium2, "PdfDocument", mock_pdf_document)
+
+
+@pytest.mark.anyio
+async def test_extract_path_stream_async_yields_pages_in_order(extractor: PDFExtractor, test_contract: Path) -> None:
+    results = [result async for result in extractor.extract_path_stream_async(test_contract)]
+
+    assert len(results) == 10
+    assert [result.metadata["page_number"] for result in results] == list(range(1, 11))
+    assert all(result.metadata["text_source"] == "text_layer" for result in results)
+    assert all(result.content.strip() for result in results)
+    assert results[0].content.startswith("Page 1\nSample Contract")
+
+
+@pytest.mark.anyio
+async def test_extract_path_stream_async_ocr_fallback(non_searchable_pdf: Path, monkeypatch: MonkeyPatch) -> None:
+    class MockOCRBackend:
+        async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+            return ExtractionResult(content="ocr text", mime_type="text/plain", metadata={}, chunks=[])
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: MockOCRBackend())
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(ocr_backend="tesseract"))
+
+    results = [result async for result in extractor.extract_path_stream_async(non_searchable_pdf)]
+
+    assert len(results) == 1
+    assert results[0].content == "ocr text"
+    assert results[0].metadata["page_number"] == 1
+    assert results[0].metadata["text_source"] == "ocr"
+
+
+@pytest.mark.anyio
+async def test_extract_path_stream_async_no_ocr_backend(non_searchable_pdf: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(ocr_backend=None))
+
+    results = [result async for result in extractor.extract_path_stream_async(non_searchable_pdf)]
+
+    assert len(results) == 1
+    assert results[0].content == ""
+    assert results[0].metadata == {"page_number": 1, "text_source": "text_layer"}
+
+
+@pytest.mark.anyio
+async def test_extract_path_stream_async_invalid_pdf(extractor: PDFExtractor, tmp_path: Path) -> None:
+    pdf_path = tmp_path / "invalid.pdf"
+    pdf_path.write_text("invalid pdf content")
+
+    with pytest.raises(ParsingError, match="Could not open PDF file"):
+        async for _ in extractor.extract_path_stream_async(pdf_path):
+            pass
+
+
+@pytest.fixture
+def mixed_pdf(tmp_path: Path, test_contract: Path, non_searchable_pdf: Path) -> Path:
+    import pypdfium2
+
+    output = tmp_path / "mixed.pdf"
+    contract = pypdfium2.PdfDocument(str(test_contract))
+    scan = pypdfium2.PdfDocument(str(non_searchable_pdf))
+    document = pypdfium2.PdfDocument.new()
+    document.import_pages(contract, [0])
+    document.import_pages(scan, [0])
+    document.import_pages(contract, [1])
+    document.save(str(output))
+    for pdf in (document, scan, contract):
+        pdf.close()
+    return output
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_per_page_ocr_fallback(mixed_pdf: Path, monkeypatch: MonkeyPatch) -> None:
+    class MockOCRBackend:
+        async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+            return ExtractionResult(content="ocr text", mime_type="text/plain", metadata={}, chunks=[])
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: MockOCRBackend())
+    extractor = PDFExtractor(
+        mime_type="application/pdf", config=ExtractionConfig(ocr_backend="tesseract", ocr_fallback_mode="page")
+    )
+
+    result = await extractor.extract_path_async(mixed_pdf)
+
+    assert result.content.startswith("Page 1\nSample Contract")
+    assert result.content.index("ocr text") < result.content.index("Page 2")
+    assert result.metadata["ocr_pages"] == [2]
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_per_page_no_ocr_needed(test_contract: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(ocr_fallback_mode="page"))
+
+    result = await extractor.extract_path_async(test_contract)
+
+    assert result.content.startswith("Page 1\nSample Contract")
+    assert "ocr_pages" not in result.metadata
+
+
+def test_extract_pdf_per_page_ocr_fallback_sync(mixed_pdf: Path, monkeypatch: MonkeyPatch) -> None:
+    class MockOCRBackend:
+        def process_batch_sync(self, paths: list[Path], **kwargs: object) -> list[ExtractionResult]:
+            return [ExtractionResult(content="ocr text", mime_type="text/plain", metadata={}, chunks=[]) for _ in paths]
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: MockOCRBackend())
+    extractor = PDFExtractor(
+        mime_type="application/pdf", config=ExtractionConfig(ocr_backend="tesseract", ocr_fallback_mode="page")
+    )
+
+    result = extractor.extract_path_sync(mixed_pdf)
+
+    assert result.content.startswith("Page 1\nSample Contract")
+    assert result.content.index("ocr text") < result.content.index("Page 2")
+    assert result.metadata["ocr_pages"] == [2]
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_text_with_ocr_bounds_rendered_pages(test_contract: Path, monkeypatch: MonkeyPatch) -> None:
+    import anyio
+
+    in_flight = 0
+    max_in_flight = 0
+    calls = 0
+
+    class MockOCRBackend:
+        async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+            nonlocal in_flight, max_in_flight, calls
+            page = calls
+            calls += 1
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await anyio.sleep(0.01 * (3 - page % 3))
+            in_flight -= 1
+            return ExtractionResult(content=f"page {page}", mime_type="text/plain", metadata={}, chunks=[])
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: MockOCRBackend())
+    monkeypatch.setattr(PDFExtractor, "_render_page", staticmethod(lambda *_: PILImage.new("RGB", (10, 10))))
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(ocr_max_rendered_pages=2))
+
+    result = await extractor._extract_pdf_text_with_ocr(PDFDocumentContext(test_contract), ocr_backend="tesseract")
+
+    assert result.content == "\n".join(f"page {i}" for i in range(10))
+    assert max_in_flight == 2
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_page_range(test_contract: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(page_range=(2, 3)))
+
+    result = await extractor.extract_path_async(test_contract)
+
+    assert result.content.startswith("Page 2")
+    assert "Page 3" in result.content
+    assert "Page 1\n" not in result.content
+    assert "Page 4" not in result.content
+
+
+def test_extract_pdf_max_pages_sync(test_contract: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(max_pages=2))
+
+    result = extractor.extract_path_sync(test_contract)
+
+    assert result.content.startswith("Page 1")
+    assert "Page 2" in result.content
+    assert "Page 3" not in result.content
+
+
+@pytest.mark.anyio
+async def test_extract_path_stream_async_page_range(extractor: PDFExtractor, test_contract: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(page_range=(9, 20)))
+
+    results = [result async for result in extractor.extract_path_stream_async(test_contract)]
+
+    assert [result.metadata["page_number"] for result in results] == [9, 10]
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_text_with_ocr_page_range(test_contract: Path, monkeypatch: MonkeyPatch) -> None:
+    rendered: list[int] = []
+
+    def render_page(document: object, page_index: int, scale: float = 4.25) -> Image:
+        rendered.append(page_index)
+        return PILImage.new("RGB", (10, 10))
+
+    class MockOCRBackend:
+        async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+            return ExtractionResult(content="ocr text", mime_type="text/plain", metadata={}, chunks=[])
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: MockOCRBackend())
+    monkeypatch.setattr(PDFExtractor, "_render_page", staticmethod(render_page))
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(max_pages=3))
+
+    result = await extractor._extract_pdf_text_with_ocr(PDFDocumentContext(test_contract), ocr_backend="tesseract")
+
+    assert rendered == [0, 1, 2]
+    assert result.content == "ocr text\nocr text\nocr text"
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_text_with_ocr_pdf_render_config(searchable_pdf: Path, monkeypatch: MonkeyPatch) -> None:
+    images: list[Image] = []
+
+    class MockOCRBackend:
+        async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+            images.append(image.copy())
+            return ExtractionResult(content="ocr text", mime_type="text/plain", metadata={}, chunks=[])
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: MockOCRBackend())
+    config = ExtractionConfig(pdf_render_config=PDFRenderConfig(target_text_height=24, color_mode="grayscale"))
+    extractor = PDFExtractor(mime_type="application/pdf", config=config)
+
+    result = await extractor._extract_pdf_text_with_ocr(PDFDocumentContext(searchable_pdf), ocr_backend="tesseract")
+
+    assert result.content == "ocr text"
+    assert images[0].mode == "L"
+    # 12pt lines rendered at 24px per line is 144 DPI, clamped to the 150 DPI minimum
+    assert images[0].width == 612 * 150 // 72
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_searchable_text_in_processes(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    from kreuzberg._utils._process_pool import shutdown_process_pool
+
+    monkeypatch.setattr("kreuzberg._utils._process_pool._POOL_SIZE", 2)
+    serial_extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig())
+    parallel_extractor = PDFExtractor(
+        mime_type="application/pdf",
+        config=ExtractionConfig(parallel_pdf_text_min_pages=10, parallel_pdf_text_min_pages_per_process=5),
+    )
+
+    try:
+        with PDFDocumentContext(test_article) as document:
+            page_indices = list(range(28))
+            assert parallel_extractor._extract_pdf_text_in_processes(document, page_indices) is not None
+            assert serial_extractor._extract_pdf_text_in_processes(document, page_indices) is None
+
+            parallel_text = await parallel_extractor._extract_pdf_searchable_text(document)
+            serial_text = await serial_extractor._extract_pdf_searchable_text(document)
+            parallel_sync_text = parallel_extractor._extract_pdf_searchable_text_sync(document)
+            serial_sync_text = serial_extractor._extract_pdf_searchable_text_sync(document)
+    finally:
+        shutdown_process_pool()
+
+    assert parallel_text == serial_text
+    assert parallel_sync_text == serial_sync_text
+
+
+def test_extract_pdf_text_in_processes_off_by_default(test_article: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig())
+
+    with PDFDocumentContext(test_article) as document:
+        assert extractor._extract_pdf_text_in_processes(document, list(range(28)) * 50) is None
+
+
+def test_extract_pdf_text_in_processes_falls_back_on_worker_error(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    def failing_extract(*args: object, **kwargs: object) -> NoReturn:
+        raise ParsingError("Failed to extract PDF text in worker processes")
+
+    monkeypatch.setattr("kreuzberg._extractors._pdf.extract_pdf_text_in_processes", failing_extract)
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(parallel_pdf_text_min_pages=1))
+
+    with PDFDocumentContext(test_article) as document:
+        assert extractor._extract_pdf_text_in_processes(document, [0, 1]) is None
+        assert "INVERTED HONOR" in extractor._extract_pdf_searchable_text_sync(document)
+
+
+class _EmbeddedImageOCRBackend:
+    def __init__(self) -> None:
+        self.image_sizes: list[tuple[int, int]] = []
+
+    async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+        return self.process_image_sync(image)
+
+    def process_image_sync(self, image: Image, **kwargs: object) -> ExtractionResult:
+        self.image_sizes.append(image.size)
+        return ExtractionResult(content="EMBEDDED IMAGE TEXT", mime_type="text/plain", metadata={}, chunks=[])
+
+
+@pytest.fixture
+def pdf_with_embedded_image(searchable_pdf: Path, tmp_path: Path) -> Path:
+    """The searchable PDF with a 200x50 pixel image in the middle of its page, and a tiny image at the top."""
+    document = pypdfium2.PdfDocument(str(searchable_pdf))
+    page = document[0]
+    _, height = page.get_size()
+    for size, position in (((200, 50), (100, height / 2)), ((8, 8), (10, height - 20))):
+        image = pypdfium2.PdfImage.new(document)
+        image.set_bitmap(pypdfium2.PdfBitmap.from_pil(PILImage.new("RGB", size, "white")))
+        image.set_matrix(pypdfium2.PdfMatrix().scale(*size).translate(*position))
+        page.insert_obj(image)
+    page.gen_content()
+    page.close()
+
+    output = tmp_path / "embedded-image.pdf"
+    document.save(str(output))
+    document.close()
+    return output
+
+
+def _assert_embedded_image_text_merged(content: str) -> None:
+    assert content.count("EMBEDDED IMAGE TEXT") == 1
+    before, after = content.split("EMBEDDED IMAGE TEXT")
+    assert before.rstrip().endswith("justo quam")
+    assert after.lstrip().startswith("lobortis tortor")
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_ocr_embedded_images(pdf_with_embedded_image: Path, monkeypatch: MonkeyPatch) -> None:
+    backend = _EmbeddedImageOCRBackend()
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: backend)
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(ocr_embedded_images=True))
+
+    result = await extractor.extract_path_async(pdf_with_embedded_image)
+
+    _assert_embedded_image_text_merged(result.content)
+    assert backend.image_sizes == [(200, 50)]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("ocr_fallback_mode", ["document", "page"])
+async def test_extract_pdf_ocr_embedded_images_modes(
+    pdf_with_embedded_image: Path, monkeypatch: MonkeyPatch, ocr_fallback_mode: str
+) -> None:
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: _EmbeddedImageOCRBackend())
+    extractor = PDFExtractor(
+        mime_type="application/pdf",
+        config=ExtractionConfig(ocr_embedded_images=True, ocr_fallback_mode=ocr_fallback_mode),  # type: ignore[arg-type]
+    )
+
+    _assert_embedded_image_text_merged((await extractor.extract_path_async(pdf_with_embedded_image)).content)
+    _assert_embedded_image_text_merged(extractor.extract_path_sync(pdf_with_embedded_image).content)
+
+
+@pytest.mark.anyio
+async def test_extract_path_stream_async_ocr_embedded_images(
+    pdf_with_embedded_image: Path, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: _EmbeddedImageOCRBackend())
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(ocr_embedded_images=True))
+
+    results = [result async for result in extractor.extract_path_stream_async(pdf_with_embedded_image)]
+
+    _assert_embedded_image_text_merged(results[0].content)
+    assert results[0].metadata["text_source"] == "text_layer"
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_without_ocr_embedded_images(pdf_with_embedded_image: Path, monkeypatch: MonkeyPatch) -> None:
+    backend = _EmbeddedImageOCRBackend()
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: backend)
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig())
+
+    result = await extractor.extract_path_async(pdf_with_embedded_image)
+
+    assert "EMBEDDED IMAGE TEXT" not in result.content
+    assert backend.image_sizes == []
+
+
+class _CountingOCRBackend:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+        return self.process_image_sync(image)
+
+    def process_image_sync(self, image: Image, **kwargs: object) -> ExtractionResult:
+        self.calls += 1
+        return ExtractionResult(content=f"page text {self.calls}", mime_type="text/plain", metadata={}, chunks=[])
+
+    def process_batch_sync(self, paths: list[Path], **kwargs: object) -> list[ExtractionResult]:
+        results = []
+        for path in paths:
+            with PILImage.open(path) as image:
+                results.append(self.process_image_sync(image))
+        return results
+
+
+class _SlowOCRBackend(_CountingOCRBackend):
+    delay = 0.25
+
+    async def process_image(self, image: Image, **kwargs: object) -> ExtractionResult:
+        await anyio.sleep(self.delay)
+        return self.process_image_sync(image)
+
+    def process_batch_sync(self, paths: list[Path], **kwargs: object) -> list[ExtractionResult]:
+        time.sleep(self.delay * len(paths))
+        return super().process_batch_sync(paths)
+
+
+class _RenderTracker:
+    """Counts the pdfium calls on a document that run at the same time."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    def track(self) -> None:
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+
+    def render(self, *_: object, **__: object) -> Image:
+        self.track()
+        return PILImage.new("RGB", (10, 10))
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_per_page_ocr_renders_serially(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    tracker = _RenderTracker()
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: _SlowOCRBackend())
+    monkeypatch.setattr(PDFExtractor, "_render_ocr_page", tracker.render)
+    monkeypatch.setattr(PDFExtractor, "_validate_extracted_text", lambda *_, **__: False)
+    config = ExtractionConfig(ocr_backend="tesseract", ocr_fallback_mode="page", ocr_max_rendered_pages=4, max_pages=6)
+
+    result = await PDFExtractor(mime_type="application/pdf", config=config).extract_path_async(test_article)
+
+    assert tracker.calls == 6
+    assert tracker.max_running == 1
+    assert result.metadata["ocr_pages"] == [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_ocr_embedded_images_splits_pages_serially(
+    test_article: Path, monkeypatch: MonkeyPatch
+) -> None:
+    tracker = _RenderTracker()
+    monkeypatch.setattr(PDFExtractor, "_split_page_at_images", lambda *_: tracker.track())
+    config = ExtractionConfig(ocr_embedded_images=True, ocr_max_rendered_pages=4, max_pages=6)
+
+    result = await PDFExtractor(mime_type="application/pdf", config=config).extract_path_async(test_article)
+
+    assert tracker.calls == 6
+    assert tracker.max_running == 1
+    assert "INVERTED HONOR" in result.content
+
+
+@pytest.fixture
+def extended_article(test_article: Path, tmp_path: Path) -> Path:
+    """The test article with a blank page appended."""
+    document = pypdfium2.PdfDocument(str(test_article))
+    width, height = document[0].get_size()
+    document.new_page(width, height).close()
+    output = tmp_path / "extended-article.pdf"
+    document.save(str(output))
+    document.close()
+    return output
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("ocr_fallback_mode", ["document", "page"])
+async def test_extract_pdf_page_cache_reuses_unchanged_pages(
+    test_article: Path, extended_article: Path, monkeypatch: MonkeyPatch, ocr_fallback_mode: str
+) -> None:
+    backend = _CountingOCRBackend()
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: backend)
+    extractor = PDFExtractor(
+        mime_type="application/pdf",
+        config=ExtractionConfig(force_ocr=True, ocr_fallback_mode=ocr_fallback_mode),  # type: ignore[arg-type]
+    )
+    page_count = len(pypdfium2.PdfDocument(str(test_article)))
+
+    result = await extractor.extract_path_async(test_article)
+    assert result.metadata.get("page_cache_misses") == page_count
+    assert result.metadata.get("page_cache_hits") == 0
+
+    extended_result = await extractor.extract_path_async(extended_article)
+    assert backend.calls == page_count + 1
+    assert extended_result.metadata.get("page_cache_hits") == page_count
+    assert extended_result.metadata.get("page_cache_misses") == 1
+    assert extended_result.content.startswith(result.content)
+
+    sync_result = extractor.extract_path_sync(extended_article)
+    assert backend.calls == page_count + 1
+    assert sync_result.metadata.get("page_cache_hits") == page_count + 1
+    assert sync_result.metadata.get("page_cache_misses") == 0
+
+
+def test_extract_pdf_page_cache_keyed_by_ocr_config(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    backend = _CountingOCRBackend()
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: backend)
+    page_count = len(pypdfium2.PdfDocument(str(test_article)))
+
+    for language in ("eng", "deu", "eng"):
+        config = ExtractionConfig(force_ocr=True, ocr_config=TesseractConfig(language=language))
+        PDFExtractor(mime_type="application/pdf", config=config).extract_path_sync(test_article)
+
+    assert backend.calls == 2 * page_count
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_metadata_fields(test_article: Path) -> None:
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(pdf_metadata_fields=frozenset()))
+
+    result = await extractor.extract_path_async(test_article)
+
+    assert result.metadata.get("title") == "Inverted Honor"
+    assert "summary" not in result.metadata
+    assert "description" not in result.metadata
+
+
+def test_extract_pdf_playa_in_worker_processes(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    serial_config = ExtractionConfig(parallel_playa_min_pages=None, max_pages=4)
+    serial_result = PDFExtractor(mime_type="application/pdf", config=serial_config).extract_path_sync(test_article)
+    parallel_extractor = PDFExtractor(
+        mime_type="application/pdf",
+        config=ExtractionConfig(parallel_playa_min_pages=1, parallel_playa_max_workers=2, max_pages=4),
+    )
+
+    assert parallel_extractor._get_playa_worker_count(4) == 2
+    assert parallel_extractor.extract_path_sync(test_article).content == serial_result.content
+
+    monkeypatch.setattr(PageList, "map", _raise_os_error)
+    assert parallel_extractor.extract_path_sync(test_article).content == serial_result.content
+
+
+def _raise_os_error(*_: object, **__: object) -> NoReturn:
+    raise OSError("no worker processes")
+
+
+@pytest.mark.parametrize(
+    ("min_pages", "max_workers", "page_count", "expected"),
+    [(None, 4, 1000, 1), (200, 4, 199, 1), (200, 4, 200, 4), (1, 4, 3, 3), (1, 1, 100, 1)],
+)
+def test_get_playa_worker_count(min_pages: int | None, max_workers: int, page_count: int, expected: int) -> None:
+    config = ExtractionConfig(parallel_playa_min_pages=min_pages, parallel_playa_max_workers=max_workers)
+
+    assert PDFExtractor(mime_type="application/pdf", config=config)._get_playa_worker_count(page_count) == expected
+
+
+@pytest.fixture
+def slow_ocr_backend(monkeypatch: MonkeyPatch) -> _SlowOCRBackend:
+    backend = _SlowOCRBackend()
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: backend)
+    monkeypatch.setattr(PDFExtractor, "_render_ocr_page", lambda *_, **__: PILImage.new("RGB", (10, 10)))
+    return backend
+
+
+def _assert_partial_result(result: ExtractionResult, backend: _CountingOCRBackend, page_count: int) -> None:
+    completed_pages = result.metadata.get("completed_pages", [])
+    skipped_pages = result.metadata.get("skipped_pages", [])
+
+    assert result.metadata.get("deadline_exceeded") is True
+    assert completed_pages
+    assert skipped_pages
+    assert sorted(completed_pages + skipped_pages) == list(range(1, page_count + 1))
+    assert "ocr" in result.metadata.get("skipped_stages", [])
+    assert "post_processing" in result.metadata.get("skipped_stages", [])
+    assert backend.calls == len(completed_pages)
+    assert result.chunks == []
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_document_timeout_returns_partial_result(
+    test_article: Path, slow_ocr_backend: _SlowOCRBackend
+) -> None:
+    config = ExtractionConfig(force_ocr=True, ocr_max_rendered_pages=1, document_timeout=0.4)
+    page_count = len(pypdfium2.PdfDocument(str(test_article)))
+
+    result = await extract_file(test_article, config=config)
+
+    _assert_partial_result(result, slow_ocr_backend, page_count)
+    assert get_document_cache().get(test_article, config) is None
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class _ClockedOCRBackend(_CountingOCRBackend):
+    """An OCR backend that advances a fake clock by ``delay`` per page instead of sleeping."""
+
+    delay = 0.25
+
+    def __init__(self, clock: _FakeClock) -> None:
+        super().__init__()
+        self.clock = clock
+
+    def process_batch_sync(self, paths: list[Path], **kwargs: object) -> list[ExtractionResult]:
+        self.clock.now += self.delay * len(paths)
+        return super().process_batch_sync(paths)
+
+
+@pytest.fixture
+def clocked_ocr_backend(monkeypatch: MonkeyPatch) -> _ClockedOCRBackend:
+    clock = _FakeClock()
+    monkeypatch.setattr("kreuzberg._utils._deadline.time", clock)
+    backend = _ClockedOCRBackend(clock)
+    monkeypatch.setattr("kreuzberg._extractors._pdf.get_ocr_backend", lambda _: backend)
+    monkeypatch.setattr(PDFExtractor, "_render_ocr_page", lambda *_, **__: PILImage.new("RGB", (10, 10)))
+    return backend
+
+
+def test_extract_pdf_document_timeout_returns_partial_result_sync(
+    test_article: Path, clocked_ocr_backend: _ClockedOCRBackend
+) -> None:
+    config = ExtractionConfig(force_ocr=True, ocr_max_rendered_pages=1, document_timeout=0.4)
+    page_count = len(pypdfium2.PdfDocument(str(test_article)))
+
+    result = extract_file_sync(test_article, config=config)
+
+    _assert_partial_result(result, clocked_ocr_backend, page_count)
+    assert result.metadata["completed_pages"] == [1, 2]
+    assert get_document_cache().get(test_article, config) is None
+
+
+def test_extract_pdf_force_ocr_skips_text_layer_sync(
+    test_article: Path, clocked_ocr_backend: _ClockedOCRBackend, monkeypatch: MonkeyPatch
+) -> None:
+    monkeypatch.setattr(PDFExtractor, "_extract_pdf_searchable_text_sync", _raise_os_error)
+    monkeypatch.setattr(PDFExtractor, "_lacks_text_layer", _raise_os_error)
+
+    result = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig(force_ocr=True)).extract_path_sync(
+        test_article
+    )
+
+    assert result.content.startswith("page text 1")
+    assert clocked_ocr_backend.calls == len(pypdfium2.PdfDocument(str(test_article)))
+
+
+def test_extract_pdf_document_timeout_not_exceeded(test_article: Path) -> None:
+    config = ExtractionConfig(document_timeout=60)
+
+    result = extract_file_sync(test_article, config=config)
+
+    assert result.content == extract_file_sync(test_article).content
+    assert "deadline_exceeded" not in result.metadata
+    assert get_document_cache().get(test_article, config) is not None
@@ -5,6 +5,7 @@ from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path as SyncPath
 from typing import TYPE_CHECKING, Any
 
+import anyio
 import pytest
 from python_calamine import CalamineWorkbook
 
@@ -267,28 +268,25 @@ def test_extract_path_sync_parsing_error_wrapping(
 
 
 @pytest.mark.anyio
-async def test_extract_bytes_async_exception_cleanup(extractor: SpreadSheetExtractor, mocker: MockerFixture) -> None:
-    """Test extract_bytes_async properly cleans up temp file on exception."""
-
-    mock_path = "/tmp/test_excel.xlsx"
-    mock_unlink = mocker.AsyncMock()
-
-    mocker.patch("kreuzberg._extractors._spread_sheet.create_temp_file", return_value=(mock_path, mock_unlink))
-
-    mock_write_bytes = mocker.AsyncMock()
-    mocker.patch("kreuzberg._extractors._spread_sheet.AsyncPath.write_bytes", mock_write_bytes)
+async def test_extract_bytes_async_in_memory(
+    excel_document: Path, extractor: SpreadSheetExtractor, mocker: MockerFixture
+) -> None:
+    """Test that extract_bytes_async reads the workbook from memory without touching the disk."""
+    expected = await extractor.extract_path_async(excel_document)
+    mocker.patch.object(CalamineWorkbook, "from_path", side_effect=AssertionError("from_path must not be used"))
+    mocker.patch("tempfile.NamedTemporaryFile", side_effect=AssertionError("no temporary file must be written"))
 
-    mock_error = ValueError("Test extraction error")
-    mocker.patch.object(extractor, "extract_path_async", side_effect=mock_error)
+    result = await extractor.extract_bytes_async(await anyio.Path(excel_document).read_bytes())
 
-    test_content = b"fake excel content"
+    assert result.content == expected.content
 
-    with pytest.raises(ValueError, match="Test extraction error"):
-        await extractor.extract_bytes_async(test_content)
 
-    mock_write_bytes.assert_called_once_with(test_content)
+@pytest.mark.anyio
+async def test_extract_bytes_async_invalid_content(extractor: SpreadSheetExtractor) -> None:
+    with pytest.raises(ParsingError) as exc_info:
+        await extractor.extract_bytes_async(b"fake excel content")
 
-    mock_unlink.assert_called_once()
+    assert exc_info.value.context["content_size"] == len(b"fake excel content")
 
 
 def test_convert_sheet_to_text_sync_empty_rows(extractor: SpreadSheetExtractor, mocker: MockerFixture) -> None:
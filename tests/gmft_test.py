@@ -11,7 +11,7 @@ import pytest
 from PIL import Image
 
 from kreuzberg import ExtractionConfig, GMFTConfig
-from kreuzberg._gmft import extract_tables
+from kreuzberg._gmft import _extract_tables_from_document, extract_tables
 from kreuzberg.exceptions import MissingDependencyError
 from kreuzberg.extraction import extract_file
 
@@ -395,3 +395,13 @@ async def test_extract_tables_cache_hit(tiny_pdf_with_tables: Path) -> None:
     assert result[0]["df"].equals(cached_tables[0]["df"])
     assert len(result) == 1
     assert result[0]["text"] == "cached table"
+
+
+def test_extract_tables_from_document_selected_pages() -> None:
+    pages = [MagicMock(name=f"page_{index}") for index in range(5)]
+    detector = MagicMock()
+    detector.extract.return_value = []
+
+    assert _extract_tables_from_document(pages, detector, MagicMock(), [3, 1]) == []
+
+    assert [call.args[0] for call in detector.extract.call_args_list] == [pages[1], pages[3]]
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import multiprocessing as mp
+import os
+import sys
+from concurrent.futures import Future
 from typing import Any
 from unittest.mock import patch
 
+import anyio
 import pytest
 
-from kreuzberg._utils._process_pool import ProcessPoolManager
+from kreuzberg._utils._process_pool import ProcessPoolManager, _wait_for_future
 
 
 def simple_function(x: int) -> int:
@@ -21,6 +25,11 @@ def add_function(x: int, y: int) -> int:
     return x + y
 
 
+def pid_function() -> int:
+    """Function that returns the id of the process it runs in."""
+    return os.getpid()
+
+
 def error_function() -> None:
     """Function that raises an error."""
     raise ValueError("Test error")
@@ -34,6 +43,7 @@ class TestProcessPoolManager:
         manager = ProcessPoolManager()
         expected_processes = mp.cpu_count()
         assert manager.max_processes == expected_processes
+        assert manager.max_tasks_per_child == 100
         assert manager._executor is None
         assert manager._active_tasks == 0
 
@@ -85,32 +95,27 @@ class TestProcessPoolManager:
         assert executor is manager._executor
 
     def test_ensure_executor_reuse(self) -> None:
-        """Test that _ensure_executor reuses existing executor with same workers."""
+        """Test that _ensure_executor reuses the existing executor."""
         manager = ProcessPoolManager(max_processes=2)
-        executor1 = manager._ensure_executor(max_workers=2)
-        executor2 = manager._ensure_executor(max_workers=2)
+        executor1 = manager._ensure_executor()
+        executor2 = manager._ensure_executor()
 
         assert executor1 is executor2
 
-    def test_ensure_executor_recreation(self) -> None:
-        """Test that _ensure_executor recreates executor with different workers."""
-        manager = ProcessPoolManager(max_processes=4)
-
-        class _MockExecutor:
-            def __init__(self) -> None:
-                self._max_workers = 2
-                self.shutdown_called = False
-
-            def shutdown(self, wait: bool = True) -> None:
-                self.shutdown_called = True
-
-        mock_executor = _MockExecutor()
-        manager._executor = mock_executor  # type: ignore[assignment]
+    @pytest.mark.anyio
+    async def test_submit_task_keeps_executor_for_memory_constraint(self) -> None:
+        """Test that tasks of different memory usage share the executor sized to max_processes."""
+        async with ProcessPoolManager(max_processes=4, memory_limit_gb=1.0) as manager:
+            await manager.submit_task(simple_function, 1, task_memory_mb=100)
+            executor = manager._executor
+            assert manager._limiter is not None
+            assert manager._limiter.total_tokens == 4
 
-        new_executor = manager._ensure_executor(max_workers=4)
+            await manager.submit_task(simple_function, 2, task_memory_mb=500)
 
-        assert mock_executor.shutdown_called
-        assert new_executor is not mock_executor  # type: ignore[comparison-overlap]
+            assert executor is not None
+            assert manager._executor is executor
+            assert manager._limiter.total_tokens == 2
 
     @pytest.mark.anyio
     async def test_submit_task_success(self) -> None:
@@ -280,3 +285,53 @@ class TestProcessPoolManager:
         async with ProcessPoolManager(max_processes=2) as manager:
             result = await manager.submit_task(simple_function, 7)
             assert result == 14
+
+    @pytest.mark.anyio
+    async def test_submit_task_runs_in_worker_process(self) -> None:
+        """Test that tasks run in a worker process rather than a thread of this process."""
+        async with ProcessPoolManager(max_processes=1) as manager:
+            worker_pid = await manager.submit_task(pid_function)
+
+        assert worker_pid != os.getpid()
+
+    @pytest.mark.anyio
+    async def test_submit_task_error(self) -> None:
+        """Test that an error raised in a worker process is raised to the caller."""
+        async with ProcessPoolManager(max_processes=1) as manager:
+            with pytest.raises(ValueError, match="Test error"):
+                await manager.submit_task(error_function)
+
+            assert manager._active_tasks == 0
+
+    @pytest.mark.anyio
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="Workers are recycled from Python 3.11")
+    async def test_submit_batch_recycles_workers(self) -> None:
+        """Test that a worker process is replaced after max_tasks_per_child tasks."""
+        async with ProcessPoolManager(max_processes=1, max_tasks_per_child=2) as manager:
+            worker_pids = await manager.submit_batch(pid_function, [(), (), (), ()], max_concurrent=1)
+
+        assert worker_pids[0] == worker_pids[1]
+        assert worker_pids[2] == worker_pids[3]
+        assert worker_pids[1] != worker_pids[2]
+
+
+@pytest.mark.anyio
+async def test_wait_for_future_result() -> None:
+    """Test that the result of a future completed from another thread is returned."""
+    future: Future[int] = Future()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(anyio.to_thread.run_sync, future.set_result, 42)
+        assert await _wait_for_future(future) == 42
+
+
+@pytest.mark.anyio
+async def test_wait_for_future_cancellation() -> None:
+    """Test that cancelling the wait cancels the future, without waiting for its result."""
+    future: Future[int] = Future()
+
+    with anyio.move_on_after(0.1) as scope:
+        await _wait_for_future(future)
+
+    assert scope.cancelled_caught
+    assert future.cancelled()
@@ -14,7 +14,10 @@ from kreuzberg._ocr._tesseract import (
     TesseractProcessPool,
     _process_image_bytes_with_tesseract,
     _process_image_with_tesseract,
+    _process_images_with_tesseract,
+    _process_shared_image_with_tesseract,
 )
+from kreuzberg._utils._process_pool import share_image
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -44,7 +47,7 @@ def test_image_path(tmp_path: Path) -> Path:
 class _MockSubprocessResult:
     """Simple mock for subprocess result."""
 
-    def __init__(self, returncode: int, stdout: str = "", stderr: str = ""):
+    def __init__(self, returncode: int, stdout: str | bytes = "", stderr: str | bytes = ""):
         self.returncode = returncode
         self.stdout = stdout
         self.stderr = stderr
@@ -119,6 +122,50 @@ def test_process_image_with_tesseract_custom_params(test_image_path: Path) -> No
             assert "1" in args
 
 
+def test_process_images_with_tesseract_one_run(tmp_path: Path, tesseract_config: dict[str, Any]) -> None:
+    """Test that several images are processed with one tesseract run over a list file."""
+    image_paths = [str(tmp_path / f"page_{i}.png") for i in range(3)]
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = _MockSubprocessResult(returncode=0, stdout="first\f  second  \fthird\f")
+
+        results = _process_images_with_tesseract(image_paths, tesseract_config)
+
+    assert [result["text"] for result in results] == ["first", "second", "third"]
+    assert all(result["success"] for result in results)
+    mock_run.assert_called_once()
+    command = mock_run.call_args[0][0]
+    assert command[1].endswith(".txt")
+    assert command[2] == "stdout"
+    assert command[-2:] == ["-c", "page_separator=\f"]
+
+
+def test_process_images_with_tesseract_page_mismatch(tmp_path: Path, tesseract_config: dict[str, Any]) -> None:
+    """Test that the images are processed one by one if the output does not split into one page per image."""
+    image_paths = [str(tmp_path / f"page_{i}.png") for i in range(2)]
+    single_result = {"success": True, "text": "single", "confidence": None, "error": None}
+
+    with (
+        patch("subprocess.run", return_value=_MockSubprocessResult(returncode=0, stdout="merged")),
+        patch("kreuzberg._ocr._tesseract._process_image_with_tesseract", return_value=single_result) as mock_single,
+    ):
+        results = _process_images_with_tesseract(image_paths, tesseract_config)
+
+    assert results == [single_result, single_result]
+    assert [call.args[0] for call in mock_single.call_args_list] == image_paths
+
+
+def test_process_images_with_tesseract_error(tmp_path: Path, tesseract_config: dict[str, Any]) -> None:
+    """Test that a failed tesseract run fails every image of the run."""
+    image_paths = [str(tmp_path / f"page_{i}.png") for i in range(2)]
+
+    with patch("subprocess.run", return_value=_MockSubprocessResult(returncode=1, stderr="Tesseract error")):
+        results = _process_images_with_tesseract(image_paths, tesseract_config)
+
+    assert [result["success"] for result in results] == [False, False]
+    assert all("Tesseract failed" in result["error"] for result in results)
+
+
 def test_process_image_bytes_with_tesseract(tesseract_config: dict[str, Any]) -> None:
     """Test image bytes processing."""
 
@@ -142,6 +189,33 @@ def test_process_image_bytes_with_tesseract(tesseract_config: dict[str, Any]) ->
         mock_process.assert_called_once()
 
 
+def test_process_shared_image_with_tesseract(tesseract_config: dict[str, Any]) -> None:
+    """Test that an image in shared memory is piped to tesseract as PNM."""
+    image = Image.new("L", (40, 20), color=255)
+
+    with (
+        patch("subprocess.run", return_value=_MockSubprocessResult(returncode=0, stdout=b"Shared  text\n")) as mock_run,
+        share_image(image) as shared_image,
+    ):
+        result = _process_shared_image_with_tesseract(shared_image, tesseract_config)
+
+    assert result == {"success": True, "text": "Shared text", "confidence": None, "error": None}
+    assert mock_run.call_args.args[0][1:3] == ["stdin", "stdout"]
+    assert mock_run.call_args.kwargs["input"] == b"P5\n40 20\n255\n" + bytes([255] * 800)
+
+
+def test_process_shared_image_with_tesseract_error(tesseract_config: dict[str, Any]) -> None:
+    """Test shared image processing with tesseract error."""
+    with (
+        patch("subprocess.run", return_value=_MockSubprocessResult(returncode=1, stderr=b"Tesseract error")),
+        share_image(Image.new("RGB", (10, 10), color="white")) as shared_image,
+    ):
+        result = _process_shared_image_with_tesseract(shared_image, tesseract_config)
+
+    assert result["success"] is False
+    assert "Tesseract error" in result["error"]
+
+
 class TestTesseractProcessPool:
     """Tests for TesseractProcessPool class."""
 
@@ -272,22 +346,41 @@ class TestTesseractProcessPool:
         pool = TesseractProcessPool(max_processes=2)
 
         mock_results = [
-            {
-                "success": True,
-                "text": f"Image {i} text",
-                "confidence": None,
-                "error": None,
-            }
-            for i in range(3)
+            [
+                {
+                    "success": True,
+                    "text": f"Image {i} text",
+                    "confidence": None,
+                    "error": None,
+                }
+                for i in chunk
+            ]
+            for chunk in ([0, 1], [2])
         ]
 
-        with patch.object(pool.process_manager, "submit_batch", return_value=mock_results):
+        with patch.object(pool.process_manager, "submit_batch", return_value=mock_results) as mock_submit:
             results = await pool.process_batch_images(images)  # type: ignore[arg-type]
 
             assert len(results) == 3
             for i, result in enumerate(results):
                 assert result.content == f"Image {i} text"
 
+            function, arg_batches = mock_submit.call_args.args
+            assert function is _process_images_with_tesseract
+            assert [paths for paths, _ in arg_batches] == [[str(images[0]), str(images[1])], [str(images[2])]]
+
+    @pytest.mark.anyio
+    async def test_process_batch_images_batch_size(self, tmp_path: Path) -> None:
+        """Test batch image processing with an explicit number of images per tesseract run."""
+        pool = TesseractProcessPool(max_processes=2)
+        images = [str(tmp_path / f"test_{i}.png") for i in range(5)]
+
+        with patch.object(pool.process_manager, "submit_batch", return_value=[]) as mock_submit:
+            await pool.process_batch_images(images, batch_size=4)  # type: ignore[arg-type]
+
+            _, arg_batches = mock_submit.call_args.args
+            assert [paths for paths, _ in arg_batches] == [images[:4], images[4:]]
+
     @pytest.mark.anyio
     async def test_process_batch_bytes(self) -> None:
         """Test batch byte processing."""
@@ -318,6 +411,28 @@ class TestTesseractProcessPool:
             for i, result in enumerate(results):
                 assert result.content == f"Bytes {i} text"
 
+    @pytest.mark.anyio
+    async def test_process_batch_pil_images(self) -> None:
+        """Test that images are handed to the workers in shared memory."""
+        images = [Image.new("RGB", (50, 50), color="white"), Image.new("L", (30, 20), color=255)]
+        pool = TesseractProcessPool(max_processes=2)
+
+        async def submit_batch(function: Any, arg_batches: list[tuple[Any, ...]], **_: Any) -> list[dict[str, Any]]:
+            assert function is _process_shared_image_with_tesseract
+            return [function(*args) for args in arg_batches]
+
+        with (
+            patch.object(pool.process_manager, "submit_batch", side_effect=submit_batch),
+            patch("subprocess.run", return_value=_MockSubprocessResult(returncode=0, stdout=b"Page text")) as mock_run,
+        ):
+            results = await pool.process_batch_pil_images(images)
+            single = await pool.process_pil_image(images[1])
+
+        assert [result.content for result in results] == ["Page text", "Page text"]
+        assert single.content == "Page text"
+        assert [call.kwargs["input"][:2] for call in mock_run.call_args_list] == [b"P6", b"P5", b"P5"]
+        assert await pool.process_batch_pil_images([]) == []
+
     def test_shutdown(self) -> None:
         """Test pool shutdown."""
         pool = TesseractProcessPool(max_processes=2)
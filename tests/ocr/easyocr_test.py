@@ -12,6 +12,7 @@ from kreuzberg._ocr._easyocr import (
     EasyOCRBackend,
 )
 from kreuzberg._types import ExtractionResult
+from kreuzberg._utils._device import DeviceInfo
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
 
 if TYPE_CHECKING:
@@ -496,3 +497,99 @@ def test_process_file_sync(backend: EasyOCRBackend, tmp_path: Path) -> None:
 
         assert isinstance(result, ExtractionResult)
         assert result.content.strip() == "Sample file text"
+
+
+@pytest.mark.anyio
+async def test_warmup(backend: EasyOCRBackend, mocker: MockerFixture, config_dict: dict[str, Any]) -> None:
+    mock_init = mocker.patch.object(EasyOCRBackend, "_init_easyocr")
+    mock_init_sync = mocker.patch.object(EasyOCRBackend, "_init_easyocr_sync")
+
+    await backend.warmup(**config_dict)
+    backend.warmup_sync(**config_dict)
+
+    mock_init.assert_awaited_once_with(**config_dict)
+    mock_init_sync.assert_called_once_with(**config_dict)
+
+
+def _save_images(tmp_path: Path, sizes: list[tuple[int, int]]) -> list[Path]:
+    paths = []
+    for index, size in enumerate(sizes):
+        path = tmp_path / f"page_{index}.png"
+        Image.new("RGB", size).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_process_batch_sync_groups_pages_by_size(
+    backend: EasyOCRBackend, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    paths = _save_images(tmp_path, [(100, 100), (50, 80), (100, 100)])
+    mock_reader = Mock()
+    mock_reader.readtext_batched.side_effect = lambda images, **_: [
+        [(f"page {image.shape[1]}x{image.shape[0]}", 0.9)] for image in images
+    ]
+    mocker.patch.object(EasyOCRBackend, "_init_easyocr_sync")
+    mocker.patch.object(EasyOCRBackend, "_get_batch_size", return_value=8)
+
+    with patch.object(backend, "_reader", mock_reader):
+        results = backend.process_batch_sync(paths, beam_width=5, language="en")
+
+    assert [result.content.strip() for result in results] == ["page 100x100", "page 50x80", "page 100x100"]
+    assert [len(call.args[0]) for call in mock_reader.readtext_batched.call_args_list] == [2, 1]
+    assert mock_reader.readtext_batched.call_args.kwargs["batch_size"] == 8
+    assert mock_reader.readtext_batched.call_args.kwargs["beamWidth"] == 5
+
+
+def test_process_batch_sync_limits_batch_size(backend: EasyOCRBackend, mocker: MockerFixture, tmp_path: Path) -> None:
+    paths = _save_images(tmp_path, [(100, 100)] * 5)
+    mock_reader = Mock()
+    mock_reader.readtext_batched.side_effect = lambda images, **_: [[("text", 0.9)] for _ in images]
+    mocker.patch.object(EasyOCRBackend, "_init_easyocr_sync")
+    mocker.patch.object(EasyOCRBackend, "_get_batch_size", return_value=2)
+
+    with patch.object(backend, "_reader", mock_reader):
+        results = backend.process_batch_sync(paths, beam_width=5, language="en")
+
+    assert len(results) == 5
+    assert [len(call.args[0]) for call in mock_reader.readtext_batched.call_args_list] == [2, 2, 1]
+
+
+def test_process_batch_sync_empty(backend: EasyOCRBackend, mocker: MockerFixture) -> None:
+    mock_init = mocker.patch.object(EasyOCRBackend, "_init_easyocr_sync")
+
+    assert backend.process_batch_sync([], beam_width=5, language="en") == []
+    mock_init.assert_not_called()
+
+
+def test_process_batch_sync_error(backend: EasyOCRBackend, mocker: MockerFixture, tmp_path: Path) -> None:
+    paths = _save_images(tmp_path, [(100, 100)])
+    mock_reader = Mock()
+    mock_reader.readtext_batched.side_effect = RuntimeError("out of memory")
+    mocker.patch.object(EasyOCRBackend, "_init_easyocr_sync")
+
+    with patch.object(backend, "_reader", mock_reader), pytest.raises(OCRError, match="out of memory"):
+        backend.process_batch_sync(paths, beam_width=5, language="en")
+
+
+@pytest.mark.anyio
+async def test_process_batch(backend: EasyOCRBackend, mocker: MockerFixture, tmp_path: Path) -> None:
+    paths = _save_images(tmp_path, [(100, 100), (100, 100)])
+    mock_reader = Mock()
+    mock_reader.readtext_batched.side_effect = lambda images, **_: [[("text", 0.9)] for _ in images]
+    mocker.patch.object(EasyOCRBackend, "_init_easyocr")
+    mocker.patch.object(EasyOCRBackend, "_init_easyocr_sync")
+
+    with patch.object(backend, "_reader", mock_reader):
+        results = await backend.process_batch(paths, beam_width=5, language="en")
+
+    assert [result.content.strip() for result in results] == ["text", "text"]
+    mock_reader.readtext_batched.assert_called_once()
+
+
+def test_get_batch_size_uses_reader_device(mocker: MockerFixture) -> None:
+    mock_recommended = mocker.patch("kreuzberg._ocr._easyocr.get_recommended_batch_size", return_value=3)
+    device = DeviceInfo(device_type="cuda", device_id=0, name="GPU")
+    mocker.patch.object(EasyOCRBackend, "_device_info", device)
+
+    assert EasyOCRBackend._get_batch_size(12.0) == 3
+    mock_recommended.assert_called_once_with(device, 12.0)
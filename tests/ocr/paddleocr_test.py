@@ -900,3 +900,49 @@ def test_process_file_sync(backend: PaddleBackend, tmp_path: Path) -> None:
 
         assert isinstance(result, ExtractionResult)
         assert result.content.strip() == "Sample file text"
+
+
+@pytest.mark.anyio
+async def test_warmup(backend: PaddleBackend, mocker: MockerFixture) -> None:
+    mock_init = mocker.patch.object(PaddleBackend, "_init_paddle_ocr")
+    mock_init_sync = mocker.patch.object(PaddleBackend, "_init_paddle_ocr_sync")
+
+    await backend.warmup(language="german")
+    backend.warmup_sync(language="german")
+
+    mock_init.assert_awaited_once_with(language="german")
+    mock_init_sync.assert_called_once_with(language="german")
+
+
+@pytest.mark.anyio
+async def test_init_paddle_ocr_batch_sizes(
+    backend: PaddleBackend, mock_paddleocr: Mock, mock_run_sync: Mock, mock_find_spec: Mock, mocker: MockerFixture
+) -> None:
+    PaddleBackend._paddle_ocr = None
+    mocker.patch("kreuzberg._ocr._paddleocr.get_recommended_batch_size", return_value=5)
+
+    await backend._init_paddle_ocr()
+
+    _, call_kwargs = mock_paddleocr.call_args
+    assert call_kwargs.get("rec_batch_num") == 5
+    assert call_kwargs.get("cls_batch_num") == 5
+    PaddleBackend._paddle_ocr = None
+
+
+@pytest.mark.anyio
+async def test_process_batch(backend: PaddleBackend, mocker: MockerFixture, tmp_path: Path) -> None:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"page_{index}.png"
+        Image.new("RGB", (100, 100)).save(path)
+        paths.append(path)
+    mocker.patch.object(PaddleBackend, "_init_paddle_ocr")
+    mocker.patch.object(PaddleBackend, "_init_paddle_ocr_sync")
+    mock_ocr = Mock()
+    mock_ocr.ocr.return_value = [[[[[10, 10], [100, 10], [100, 30], [10, 30]], ("Page text", 0.95)]]]
+
+    with patch.object(PaddleBackend, "_paddle_ocr", mock_ocr):
+        results = await backend.process_batch(paths, language="en")
+
+    assert [result.content.strip() for result in results] == ["Page text"] * 3
+    assert mock_ocr.ocr.call_count == 3
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from PIL import Image
+
+from kreuzberg._ocr._prepass import (
+    OCRPrepassConfig,
+    get_prepass_config,
+    get_script_languages,
+    make_draft,
+    parse_osd,
+    rotate_image,
+    select_languages,
+)
+from kreuzberg.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+_OSD_OUTPUT = """Page number: 0
+Orientation in degrees: 270
+Rotate: 90
+Orientation confidence: 11.52
+Script: Cyrillic
+Script confidence: 3.21
+"""
+
+
+def test_parse_osd() -> None:
+    assert parse_osd(_OSD_OUTPUT) == (90, 11.52, "Cyrillic", 3.21)
+    assert parse_osd("") == (0, 0.0, None, 0.0)
+    assert parse_osd("Rotate: 45\nOrientation confidence: 1.0\n") == (0, 1.0, None, 0.0)
+    assert parse_osd("Rotate: n/a\n") == (0, 0.0, None, 0.0)
+
+
+@pytest.mark.parametrize(("rotation", "expected"), [(0, (0, 0)), (90, (4, 0)), (180, (9, 4)), (270, (0, 9))])
+def test_rotate_image_clockwise(rotation: int, expected: tuple[int, int]) -> None:
+    image = Image.new("L", (10, 5), 255)
+    image.putpixel((0, 0), 0)
+
+    rotated = rotate_image(image, rotation)
+
+    assert rotated.size == ((10, 5) if rotation in {0, 180} else (5, 10))
+    assert rotated.getpixel(expected) == 0
+
+
+def test_make_draft() -> None:
+    draft = make_draft(Image.new("RGB", (101, 40), "white"), 0.5)
+
+    assert draft.mode == "L"
+    assert draft.size == (50, 20)
+    assert make_draft(Image.new("L", (10, 10)), 1).size == (10, 10)
+
+
+@pytest.mark.parametrize(
+    ("script", "expected"),
+    [
+        (None, ["eng", "rus", "ukr", "jpn"]),
+        ("Latin", ["eng"]),
+        ("Cyrillic", ["rus", "ukr"]),
+        ("Han", ["jpn"]),
+        ("Arabic", ["eng", "rus", "ukr", "jpn"]),
+        ("Unknown", ["eng", "rus", "ukr", "jpn"]),
+    ],
+)
+def test_get_script_languages(script: str | None, expected: list[str]) -> None:
+    assert get_script_languages(["eng", "rus", "ukr", "jpn"], script) == expected
+
+
+def test_select_languages(mocker: MockerFixture) -> None:
+    detect = mocker.patch("kreuzberg._ocr._prepass.detect_languages", return_value=["fr", "en", "es"])
+    languages = ["eng", "deu", "fra", "spa"]
+    text = "Bonjour, ceci est une page en français.\n"
+
+    assert select_languages(text, languages, max_languages=2) == ["eng", "fra"]
+    assert detect.call_args.args[1].multilingual is True
+    assert detect.call_args.args[1].top_k == 2
+
+    detect.return_value = ["it"]
+    assert select_languages(text, languages, max_languages=2) == languages
+    detect.return_value = None
+    assert select_languages(text, languages, max_languages=2) == languages
+
+
+def test_select_languages_short_draft(mocker: MockerFixture) -> None:
+    detect = mocker.patch("kreuzberg._ocr._prepass.detect_languages")
+
+    assert select_languages("  Seite 1 \n", ["eng", "deu"], max_languages=1) == ["eng", "deu"]
+    detect.assert_not_called()
+
+
+def test_get_prepass_config() -> None:
+    config = OCRPrepassConfig(detect_orientation=False)
+
+    assert get_prepass_config(None) is None
+    assert get_prepass_config(config) is config
+    assert get_prepass_config({"detect_orientation": False}) == config
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_languages": 0}, {"draft_scale": 0}, {"draft_scale": 1.5}, {"min_orientation_confidence": -1}]
+)
+def test_prepass_config_validation(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValidationError):
+        OCRPrepassConfig(**kwargs)
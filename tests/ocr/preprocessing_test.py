@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from kreuzberg._ocr._preprocessing import (
+    ImagePreprocessingConfig,
+    _binarize,
+    _crop_borders,
+    _estimate_x_height,
+    _find_skew_angle,
+    get_preprocessing_config,
+    preprocess_image,
+)
+from kreuzberg.exceptions import ValidationError
+
+_NO_STEPS = {"crop_borders": False, "deskew": False, "downscale": False, "binarize": False, "despeckle": False}
+
+
+def _text_page(x_height: int = 16, lines: int = 8, background: int = 230) -> Image.Image:
+    """Draw lines of text-like blocks: a dense band of ``x_height`` rows with sparse ascenders above it."""
+    line_pitch = x_height * 3
+    image = Image.new("L", (40 * x_height, (lines + 2) * line_pitch), background)
+    draw = ImageDraw.Draw(image)
+    for line in range(lines):
+        top = (line + 1) * line_pitch
+        for left in range(2 * x_height, 36 * x_height, x_height):
+            draw.rectangle((left, top, left + x_height * 2 // 3, top + x_height - 1), fill=20)
+        for left in range(2 * x_height, 36 * x_height, 6 * x_height):
+            draw.rectangle((left, top - x_height // 2, left + 2, top), fill=20)
+    return image
+
+
+def test_estimate_x_height() -> None:
+    assert _estimate_x_height(_text_page(x_height=16)) == 16
+    assert _estimate_x_height(Image.new("L", (100, 100), 255)) is None
+
+
+def test_crop_borders_removes_dark_border_and_margins() -> None:
+    page = _text_page()
+    scan = Image.new("L", (page.width + 100, page.height + 100), 0)
+    scan.paste(page, (40, 60))
+
+    cropped = _crop_borders(scan, padding=5)
+
+    assert cropped.width < page.width
+    assert cropped.height < page.height
+    assert np.asarray(cropped)[0].min() > 128
+    assert np.asarray(cropped)[:, 0].min() > 128
+
+
+def test_crop_borders_blank_image() -> None:
+    blank = Image.new("L", (50, 40), 255)
+
+    assert _crop_borders(blank, padding=5).size == (50, 40)
+
+
+@pytest.mark.parametrize("angle", [-3.0, 0.0, 2.5])
+def test_find_skew_angle(angle: float) -> None:
+    skewed = _text_page().rotate(angle, expand=True, fillcolor=230)
+
+    assert _find_skew_angle(skewed, max_angle=5) == pytest.approx(-angle, abs=0.15)
+
+
+def test_binarize_follows_uneven_lighting() -> None:
+    gradient = np.tile(np.linspace(120, 250, 300), (100, 1))
+    gradient[40:60, 20:280] -= 100
+    image = Image.fromarray(gradient.astype(np.uint8))
+
+    binarized = np.asarray(_binarize(image, window=31, k=0.2))
+
+    assert set(np.unique(binarized)) == {0, 255}
+    assert (binarized[45:55, 30:270] == 0).mean() > 0.95
+    assert (binarized[:30] == 255).mean() > 0.95
+
+
+def test_preprocess_image() -> None:
+    page = _text_page(x_height=48).rotate(2, expand=True, fillcolor=230)
+    noisy = np.asarray(page).copy()
+    noisy[np.random.default_rng(0).random(noisy.shape) < 0.002] = 0
+
+    result, timings = preprocess_image(Image.fromarray(noisy).convert("RGB"), ImagePreprocessingConfig())
+
+    assert result.mode == "1"
+    assert list(timings) == ["grayscale", "crop_borders", "deskew", "downscale", "binarize", "despeckle"]
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert _estimate_x_height(result.convert("L")) == pytest.approx(24, abs=2)
+
+
+def test_preprocess_image_steps_disabled() -> None:
+    image = Image.new("RGBA", (30, 20), (0, 0, 0, 0))
+
+    result, timings = preprocess_image(image, ImagePreprocessingConfig(**_NO_STEPS))
+
+    assert result.mode == "L"
+    assert result.size == (30, 20)
+    assert np.asarray(result).min() == 255
+    assert list(timings) == ["grayscale"]
+    assert image.mode == "RGBA"
+
+
+def test_get_preprocessing_config() -> None:
+    config = ImagePreprocessingConfig(deskew=False)
+
+    assert get_preprocessing_config(None) is None
+    assert get_preprocessing_config(config) is config
+    assert get_preprocessing_config({"deskew": False}) == config
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"border_padding": -1},
+        {"target_x_height": 0},
+        {"max_skew_angle": 50},
+        {"binarize_window": 30},
+        {"despeckle_size": 1},
+    ],
+)
+def test_preprocessing_config_validation(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValidationError):
+        ImagePreprocessingConfig(**kwargs)
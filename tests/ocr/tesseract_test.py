@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from PIL import Image
 
-from kreuzberg import PSMMode
+from kreuzberg import ImagePreprocessingConfig, OCRPrepassConfig, PSMMode
 from kreuzberg._ocr._tesseract import (
     TesseractBackend,
+    TesseractConfig,
 )
 from kreuzberg._types import ExtractionResult
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
@@ -34,6 +36,11 @@ def mock_run_process(mocker: MockerFixture) -> Mock:
         if "--version" in command and command[0].endswith("tesseract"):
             return result
 
+        if len(command) >= 3 and command[0].endswith("tesseract") and command[2] == "stdout":
+            assert command[1] != "stdin" or kwargs.get("input")
+            result.stdout = b"Sample OCR text"
+            return result
+
         if len(command) >= 3 and command[0].endswith("tesseract"):
             output_file = command[2]
             if "test_process_image_with_tesseract_invalid_input" in str(kwargs.get("cwd")):
@@ -194,6 +201,8 @@ async def test_process_image(backend: TesseractBackend, mock_run_process: Mock)
     result = await backend.process_image(image, language="eng", psm=PSMMode.AUTO)
     assert isinstance(result, ExtractionResult)
     assert result.content.strip() == "Sample OCR text"
+    command = mock_run_process.call_args.args[0]
+    assert command[1:3] == ["stdin", "stdout"]
 
 
 @pytest.mark.anyio
@@ -313,27 +322,26 @@ async def test_process_image_cache_processing_coordination(
     image_bytes = b"fake image bytes"
     image_hash = hashlib.sha256(image_bytes).hexdigest()[:16]
 
+    mock_hash_obj = Mock()
+    mock_hash_obj.hexdigest.return_value = image_hash + "0" * 48
+    mocker.patch("kreuzberg._ocr._tesseract.hashlib.sha256", return_value=mock_hash_obj)
+
     cache.mark_processing(image_hash=image_hash, config="test_config")
 
     async def complete_processing(event: anyio.Event) -> None:
         await anyio.sleep(0.1)
-        cache.mark_complete(image_hash=image_hash, config="test_config")
-
         cache.set(
             ExtractionResult(content="cached text", mime_type="text/plain", metadata={}, chunks=[], tables=[]),
             image_hash=image_hash,
             config="test_config",
         )
+        cache.mark_complete(image_hash=image_hash, config="test_config")
         event.set()
 
     async with anyio.create_task_group() as nursery:
         completion_event = anyio.Event()
         nursery.start_soon(complete_processing, completion_event)
 
-        mock_hash_obj = Mock()
-        mock_hash_obj.hexdigest.return_value = image_hash + "0" * 48
-        mocker.patch("kreuzberg._ocr._tesseract.hashlib.sha256", return_value=mock_hash_obj)
-
         result = await backend.process_image(test_image, language="eng")
 
         assert result.content == "cached text"
@@ -434,44 +442,370 @@ async def test_process_file_validation_error(backend: TesseractBackend, tmp_path
 
 
 def test_process_image_sync(backend: TesseractBackend) -> None:
-    """Test sync image processing."""
-    from unittest.mock import Mock, mock_open, patch
+    """Test sync image processing pipes the image to tesseract."""
+    from unittest.mock import patch
 
     image = Image.new("RGB", (100, 100))
 
     with (
-        patch.object(backend, "_run_tesseract_sync") as mock_run,
-        patch("tempfile.NamedTemporaryFile") as mock_temp,
-        patch("pathlib.Path.open", mock_open(read_data="Sample OCR text")),
+        patch.object(backend, "_run_tesseract_sync", return_value="Sample OCR text") as mock_run,
+        patch("tempfile.NamedTemporaryFile", side_effect=AssertionError("no temporary file expected")),
         patch.object(backend, "_validate_tesseract_version_sync"),
     ):
-        mock_run.return_value = None
-        mock_temp_file = Mock()
-        mock_temp_file.name = "test_image"  # Use relative path for cross-platform compatibility
-        mock_temp.return_value.__enter__.return_value = mock_temp_file
-
         result = backend.process_image_sync(image, language="eng")
 
-        assert isinstance(result, ExtractionResult)
-        assert result.content.strip() == "Sample OCR text"
+    assert isinstance(result, ExtractionResult)
+    assert result.content.strip() == "Sample OCR text"
+    command = mock_run.call_args.args[0]
+    assert command[1:3] == ["stdin", "stdout"]
+    assert mock_run.call_args.kwargs["input_data"].startswith(b"P6\n100 100\n255\n")
 
 
 def test_process_file_sync(backend: TesseractBackend, ocr_image: Path) -> None:
-    """Test sync file processing."""
-    from unittest.mock import Mock, mock_open, patch
+    """Test sync file processing reads the text from the standard output of tesseract."""
+    from unittest.mock import patch
 
     with (
-        patch.object(backend, "_run_tesseract_sync") as mock_run,
-        patch("tempfile.NamedTemporaryFile") as mock_temp,
-        patch("pathlib.Path.open", mock_open(read_data="Sample file text")),
+        patch.object(backend, "_run_tesseract_sync", return_value="Sample file text") as mock_run,
+        patch("tempfile.NamedTemporaryFile", side_effect=AssertionError("no temporary file expected")),
         patch.object(backend, "_validate_tesseract_version_sync"),
     ):
-        mock_run.return_value = None
-        mock_temp_file = Mock()
-        mock_temp_file.name = "test_output"  # Use relative path for cross-platform compatibility
-        mock_temp.return_value.__enter__.return_value = mock_temp_file
-
         result = backend.process_file_sync(ocr_image, language="eng")
 
-        assert isinstance(result, ExtractionResult)
-        assert result.content.strip() == "Sample file text"
+    assert isinstance(result, ExtractionResult)
+    assert result.content.strip() == "Sample file text"
+    assert mock_run.call_args.args[0][1:3] == [str(ocr_image), "stdout"]
+
+
+@pytest.fixture
+def batch_images(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"page_{i}.png"
+        Image.new("RGB", (20, 20), "white").save(path)
+        paths.append(path)
+    return paths
+
+
+def _tesseract_list_output(command: list[str], **_: Any) -> str:
+    names = [Path(line).stem for line in Path(command[1]).read_text().splitlines()]
+    return "".join(f"text of {name}\n\f" for name in names)
+
+
+def test_process_batch_sync_runs_one_tesseract_per_chunk(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", side_effect=_tesseract_list_output)
+
+    results = backend.process_batch_sync(batch_images, language="eng", psm=PSMMode.AUTO)
+
+    assert [result.content for result in results] == ["text of page_0", "text of page_1", "text of page_2"]
+    mock_run.assert_called_once()
+    command = mock_run.call_args.args[0]
+    assert command[2] == "stdout"
+    assert "page_separator=\f" in command
+    assert mock_run.call_args.kwargs["timeout"] == 90
+    assert not Path(command[1]).exists()
+
+    mock_run.reset_mock()
+    assert backend.process_batch_sync(batch_images, language="eng", psm=PSMMode.AUTO) == results
+    assert backend.process_file_sync(batch_images[1], language="eng", psm=PSMMode.AUTO) == results[1]
+    mock_run.assert_not_called()
+
+
+def test_process_batch_sync_falls_back_to_single_images(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    def run_tesseract(command: list[str], **_: Any) -> str:
+        return "merged text" if command[1].endswith(".txt") else f"single {Path(command[1]).stem}"
+
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", side_effect=run_tesseract)
+
+    results = backend.process_batch_sync(batch_images, language="eng")
+
+    assert [result.content for result in results] == ["single page_0", "single page_1", "single page_2"]
+    assert mock_run.call_count == 4
+
+
+@pytest.mark.anyio
+async def test_process_batch_spreads_chunks_over_cpus(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    async def run_tesseract(command: list[str], **_: Any) -> str:
+        if command[1].endswith(".txt"):
+            return _tesseract_list_output(command)
+        return f"text of {Path(command[1]).stem}"
+
+    mocker.patch("kreuzberg._ocr._tesseract.cpu_count", return_value=2)
+    mocker.patch.object(backend, "_validate_tesseract_version")
+    mock_run = mocker.patch.object(backend, "_run_tesseract", side_effect=run_tesseract)
+
+    results = await backend.process_batch(batch_images, language="eng", psm=PSMMode.AUTO)
+
+    assert [result.content for result in results] == ["text of page_0", "text of page_1", "text of page_2"]
+    assert sorted(call.args[0][1].endswith(".txt") for call in mock_run.call_args_list) == [False, True]
+    assert await backend.process_file(batch_images[2], language="eng", psm=PSMMode.AUTO) == results[2]
+    assert mock_run.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "output,expected",
+    [
+        ("first\fsecond", ["first", "second"]),
+        ("first\fsecond\f", ["first", "second"]),
+        ("first\n\f\fthird\n\f", ["first\n", "", "third\n"]),
+        ("first", None),
+    ],
+)
+def test_split_tesseract_pages(output: str, expected: list[str] | None) -> None:
+    from kreuzberg._ocr._tesseract import _split_tesseract_pages
+
+    assert _split_tesseract_pages(output, 2 if expected is None else len(expected)) == expected
+
+
+def test_split_tesseract_pages_tsv() -> None:
+    from kreuzberg._ocr._tesseract import _split_tesseract_pages
+
+    output = "level\tpage_num\ttext\n5\t1\tfirst\n5\t2\tsecond\n5\t2\tthird"
+
+    assert _split_tesseract_pages(output, 2, tsv=True) == [
+        "level\tpage_num\ttext\n5\t1\tfirst",
+        "level\tpage_num\ttext\n5\t1\tsecond\n5\t1\tthird",
+    ]
+    assert _split_tesseract_pages(output, 1, tsv=True) is None
+
+
+@pytest.mark.parametrize(
+    "image,header,pixel",
+    [
+        (Image.new("RGB", (2, 1), (10, 20, 30)), b"P6\n2 1\n255\n", b"\x0a\x14\x1e"),
+        (Image.new("L", (2, 1), 128), b"P5\n2 1\n255\n", b"\x80"),
+        (Image.new("RGBA", (2, 1), (0, 0, 0, 0)), b"P6\n2 1\n255\n", b"\xff\xff\xff"),
+        (Image.new("CMYK", (2, 1), (0, 0, 0, 0)), b"P6\n2 1\n255\n", b"\xff\xff\xff"),
+    ],
+)
+def test_encode_image(image: Image.Image, header: bytes, pixel: bytes) -> None:
+    from kreuzberg._ocr._tesseract import _encode_image
+
+    encoded = _encode_image(image)
+
+    assert encoded.startswith(header)
+    assert encoded[len(header) :] == pixel * 2
+
+
+_TSV_OUTPUT = """level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext
+1\t1\t0\t0\t0\t0\t0\t0\t100\t60\t-1\t
+4\t1\t1\t1\t1\t0\t5\t5\t50\t10\t-1\t
+5\t1\t1\t1\t1\t1\t5\t5\t20\t10\t96.5\tInvoice
+5\t1\t1\t1\t1\t2\t30\t5\t25\t10\t91\tnumber
+5\t1\t1\t1\t2\t1\t5\t20\t20\t10\t90\t42
+5\t1\t2\t1\t1\t1\t5\t40\t20\t10\t88\tTotal
+5\t1\t2\t1\t1\t2\t30\t40\t20\t10\t95\t \n"""
+
+
+def test_parse_tsv() -> None:
+    from kreuzberg._ocr._tesseract import TSV_LAYOUT_COLUMNS, _parse_tsv
+
+    text, layout = _parse_tsv(_TSV_OUTPUT)
+
+    assert text == "Invoice number\n42\n\nTotal"
+    assert list(layout.columns) == list(TSV_LAYOUT_COLUMNS)
+    assert {column: str(dtype) for column, dtype in layout.dtypes.items()} == TSV_LAYOUT_COLUMNS
+    assert layout["text"].tolist() == ["Invoice", "number", "42", "Total"]
+    assert layout["top"].tolist() == [5, 5, 20, 40]
+    assert layout["conf"].tolist() == [96.5, 91.0, 90.0, 88.0]
+
+
+def test_process_image_sync_include_layout(backend: TesseractBackend, fresh_cache: None, mocker: MockerFixture) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", return_value=_TSV_OUTPUT)
+    image = Image.new("RGB", (100, 60), "white")
+
+    result = backend.process_image_sync(image, language="eng", include_layout=True)
+    cached = backend.process_image_sync(image, language="eng", include_layout=True)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0][-1] == "tsv"
+    assert "include_layout=1" not in " ".join(mock_run.call_args.args[0])
+    assert result.content == "Invoice number\n42\n\nTotal"
+    assert result.layout is not None
+    assert cached.layout is not None
+    assert cached.layout.equals(result.layout)
+
+
+def test_process_batch_sync_include_layout(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    from kreuzberg._ocr._tesseract import _parse_tsv
+
+    header, *rows = _TSV_OUTPUT.splitlines()
+    pages = ["\n".join(row.replace("\t1\t", f"\t{page}\t", 1) for row in rows) for page in (1, 2, 3)]
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", return_value="\n".join([header, *pages]))
+
+    results = backend.process_batch_sync(batch_images, language="eng", include_layout=True)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0][-1] == "tsv"
+    _, single_layout = _parse_tsv(_TSV_OUTPUT)
+    assert [result.content for result in results] == ["Invoice number\n42\n\nTotal"] * 3
+    assert all(result.layout is not None and result.layout.equals(single_layout) for result in results)
+
+
+def test_process_image_sync_preprocessing(backend: TesseractBackend, fresh_cache: None, mocker: MockerFixture) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", return_value="Preprocessed text")
+    image = Image.new("RGB", (100, 60), "white")
+    config = asdict(TesseractConfig(preprocessing=ImagePreprocessingConfig(deskew=False)))
+
+    result = backend.process_image_sync(image, **config)
+    cached = backend.process_image_sync(image, **config)
+
+    mock_run.assert_called_once()
+    assert mock_run.call_args.kwargs["input_data"].startswith(b"P4\n")
+    assert "preprocessing" not in " ".join(mock_run.call_args.args[0])
+    assert result.content == "Preprocessed text"
+    assert list(result.metadata["preprocessing_timings"]) == [
+        "grayscale",
+        "crop_borders",
+        "downscale",
+        "binarize",
+        "despeckle",
+    ]
+    assert cached == result
+
+
+def test_process_file_sync_preprocessing_pipes_image(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", return_value="Preprocessed file")
+
+    result = backend.process_file_sync(batch_images[0], language="eng", preprocessing=ImagePreprocessingConfig())
+
+    assert result.content == "Preprocessed file"
+    assert "preprocessing_timings" in result.metadata
+    assert mock_run.call_args.args[0][1:3] == ["stdin", "stdout"]
+    assert mock_run.call_args.kwargs["input_data"].startswith(b"P4\n")
+
+
+def test_process_batch_sync_preprocessing(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    listed: list[str] = []
+
+    def run_tesseract(command: list[str], **kwargs: Any) -> str:
+        listed.extend(Path(command[1]).read_text().splitlines())
+        assert all(Path(line).read_bytes().startswith(b"P4\n") for line in listed)
+        return _tesseract_list_output(command, **kwargs)
+
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mocker.patch.object(backend, "_run_tesseract_sync", side_effect=run_tesseract)
+
+    results = backend.process_batch_sync(batch_images, language="eng", preprocessing=ImagePreprocessingConfig())
+
+    assert [result.content for result in results] == ["text of 0", "text of 1", "text of 2"]
+    assert all("preprocessing_timings" in result.metadata for result in results)
+    assert [Path(line).suffix for line in listed] == [".pnm"] * 3
+    assert not any(Path(line).exists() for line in listed)
+
+
+def test_process_image_sync_perceptual_cache_key(
+    backend: TesseractBackend, fresh_cache: None, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", return_value="Scanned text")
+    page = Image.new("L", (300, 200), 240)
+    for top in range(20, 180, 30):
+        page.paste(30, (20, top, 280 - top, top + 12))
+    rescan = page.point(lambda value: value - 8 if value > 128 else value + 8).resize((280, 186))
+    other_page = page.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+
+    result = backend.process_image_sync(page, language="eng", perceptual_cache_key=True)
+    cached = backend.process_image_sync(rescan, language="eng", perceptual_cache_key=True)
+    assert mock_run.call_count == 1
+    assert "perceptual_cache_key" not in " ".join(mock_run.call_args.args[0])
+    assert cached == result
+
+    backend.process_image_sync(other_page, language="eng", perceptual_cache_key=True)
+    backend.process_image_sync(rescan, language="eng")
+    assert mock_run.call_count == 3
+
+
+_OSD_OUTPUT = "Rotate: 90\nOrientation confidence: 9.5\nScript: Latin\nScript confidence: 4.0\n"
+
+
+def test_process_image_sync_prepass(backend: TesseractBackend, fresh_cache: None, mocker: MockerFixture) -> None:
+    def run_tesseract(command: list[str], **kwargs: Any) -> str:
+        if "osd" in command:
+            return _OSD_OUTPUT
+        if command[command.index("-l") + 1] == "eng":
+            return "Sehr geehrte Damen und Herren, anbei die Rechnung.\n"
+        return "Full page text\n"
+
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(backend, "_run_tesseract_sync", side_effect=run_tesseract)
+    mocker.patch("kreuzberg._ocr._prepass.detect_languages", return_value=["de"])
+
+    result = backend.process_image_sync(
+        Image.new("RGB", (200, 100), "white"), language="eng+deu+rus", prepass=OCRPrepassConfig()
+    )
+
+    osd, draft, full = mock_run.call_args_list
+    assert osd.args[0][-4:] == ["--psm", "0", "-l", "osd"]
+    assert osd.kwargs["input_data"].startswith(b"P5\n100 50\n")
+    assert draft.kwargs["input_data"].startswith(b"P5\n50 100\n")
+    assert full.args[0][full.args[0].index("-l") + 1] == "deu"
+    assert full.kwargs["input_data"].startswith(b"P6\n100 200\n")
+    assert result.content == "Full page text"
+    assert result.metadata["ocr_rotations"] == [90]
+    assert result.metadata["ocr_languages"] == ["deu"]
+
+
+def test_process_batch_sync_prepass(
+    backend: TesseractBackend, batch_images: list[Path], fresh_cache: None, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mock_run = mocker.patch.object(
+        backend,
+        "_run_tesseract_sync",
+        side_effect=[
+            _OSD_OUTPUT.replace("9.5", "0.5"),
+            "Upright page",
+            OCRError("Too few characters"),
+            "Blank page",
+        ],
+    )
+    config = OCRPrepassConfig(min_orientation_confidence=1.0)
+
+    results = backend.process_batch_sync(batch_images[:2], language="eng", prepass=config)
+
+    assert [result.content for result in results] == ["Upright page", "Blank page"]
+    assert [result.metadata["ocr_rotations"] for result in results] == [[0], [0]]
+    assert [result.metadata["ocr_languages"] for result in results] == [["eng"], ["eng"]]
+    assert [call.args[0][1] for call in mock_run.call_args_list] == ["stdin"] * 4
+    assert "prepass" not in " ".join(mock_run.call_args.args[0])
+
+
+@pytest.mark.anyio
+async def test_warmup(backend: TesseractBackend, mocker: MockerFixture) -> None:
+    mock_validate = mocker.patch.object(backend, "_validate_tesseract_version", AsyncMock())
+    mock_recognize = mocker.patch.object(backend, "_recognize_image", AsyncMock(return_value=""))
+
+    await backend.warmup(**asdict(TesseractConfig(language="eng+deu", psm=PSMMode.SINGLE_BLOCK)))
+
+    mock_validate.assert_awaited_once()
+    _, image_content, language, psm = mock_recognize.call_args.args
+    assert image_content.startswith(b"P5\n")
+    assert (language, psm) == ("eng+deu", PSMMode.SINGLE_BLOCK)
+    assert not set(mock_recognize.call_args.kwargs) & {"language", "psm", "prepass", "preprocessing"}
+
+
+def test_warmup_sync_missing_language(backend: TesseractBackend, mocker: MockerFixture) -> None:
+    mocker.patch.object(backend, "_validate_tesseract_version_sync")
+    mocker.patch.object(backend, "_run_tesseract_sync", side_effect=OCRError("Failed loading language 'deu'"))
+
+    with pytest.raises(OCRError, match="Failed loading language"):
+        backend.warmup_sync(language="deu")
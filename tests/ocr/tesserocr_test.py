@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import sys
+import threading
+from dataclasses import asdict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, NoReturn
+
+import pytest
+from PIL import Image
+
+from kreuzberg import ExtractionConfig, OCRPrepassConfig, PSMMode
+from kreuzberg._config import parse_ocr_backend_config
+from kreuzberg._ocr import get_ocr_backend
+from kreuzberg._ocr._tesseract import TesseractBackend, TesseractConfig
+from kreuzberg._ocr._tesserocr import TesserocrBackend, TesserocrEnginePool
+from kreuzberg.exceptions import MissingDependencyError, OCRError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+class _FakeTessBaseAPI:
+    instances: list[_FakeTessBaseAPI] = []
+
+    def __init__(self, lang: str, psm: int, oem: int, variables: dict[str, str]) -> None:
+        if lang == "fra":
+            raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+        self.lang = lang
+        self.psm = psm
+        self.variables = variables
+        self.images: list[Image.Image] = []
+        self.ended = False
+        self.instances.append(self)
+
+    def SetImage(self, image: Image.Image) -> None:  # noqa: N802
+        self.images.append(image)
+
+    def GetUTF8Text(self) -> str:  # noqa: N802
+        return f"text   {self.lang} {len(self.images)}\n"
+
+    def DetectOrientationScript(self) -> dict[str, Any]:  # noqa: N802
+        return {"orient_deg": 270, "orient_conf": 7.5, "script_name": "Latin", "script_conf": 3.0}
+
+    def Clear(self) -> None:  # noqa: N802
+        pass
+
+    def End(self) -> None:  # noqa: N802
+        self.ended = True
+
+
+@pytest.fixture
+def tesserocr(monkeypatch: MonkeyPatch, fresh_cache: None) -> type[_FakeTessBaseAPI]:
+    _FakeTessBaseAPI.instances = []
+    module = SimpleNamespace(
+        PyTessBaseAPI=_FakeTessBaseAPI,
+        OEM=SimpleNamespace(LSTM_ONLY=1),
+        tesseract_version=lambda: "tesseract 5.3.0\n leptonica-1.82.0",
+    )
+    monkeypatch.setitem(sys.modules, "tesserocr", module)
+    monkeypatch.setattr(TesserocrBackend, "engine_pool", TesserocrEnginePool(max_engines=4))
+    monkeypatch.setattr(TesserocrBackend, "_version_checked", False)
+    return _FakeTessBaseAPI
+
+
+def _image(color: str) -> Image.Image:
+    return Image.new("RGB", (20, 20), color)
+
+
+def test_tesserocr_reuses_engine_per_configuration(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    backend = TesserocrBackend()
+
+    first = backend.process_image_sync(_image("white"), language="eng")
+    second = backend.process_image_sync(_image("black"), language="eng")
+    backend.process_image_sync(_image("white"), language="deu", psm=PSMMode.SINGLE_BLOCK)
+
+    assert first.content == "text eng 1"
+    assert second.content == "text eng 2"
+    assert [(engine.lang, engine.psm) for engine in tesserocr.instances] == [("eng", 3), ("deu", 6)]
+    assert len(backend.engine_pool) == 2
+
+
+def test_tesserocr_engine_variables(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    TesserocrBackend().process_image_sync(
+        _image("white"), **asdict(TesseractConfig(tessedit_char_whitelist="0123456789"))
+    )
+
+    variables = tesserocr.instances[0].variables
+    assert variables["tessedit_char_whitelist"] == "0123456789"
+    assert variables["tessedit_enable_dict_correction"] == "1"
+    assert variables["language_model_ngram_on"] == "0"
+    assert "language" not in variables
+    assert "psm" not in variables
+
+
+@pytest.mark.anyio
+async def test_tesserocr_process_image_and_file(
+    tesserocr: type[_FakeTessBaseAPI], ocr_image: Path, tmp_path: Path
+) -> None:
+    backend = TesserocrBackend()
+    image_path = tmp_path / "image.png"
+    _image("gray").save(image_path)
+
+    assert (await backend.process_image(_image("white"), language="eng")).content == "text eng 1"
+    assert (await backend.process_file(image_path, language="eng")).content == "text eng 2"
+    assert backend.process_file_sync(ocr_image, language="eng").content == "text eng 3"
+    assert len(tesserocr.instances) == 1
+
+
+def test_tesserocr_shares_cache_with_tesseract(tesserocr: type[_FakeTessBaseAPI], monkeypatch: MonkeyPatch) -> None:
+    config = asdict(TesseractConfig())
+    result = TesserocrBackend().process_image_sync(_image("white"), **config)
+
+    def fail(*_: Any, **__: Any) -> NoReturn:
+        raise AssertionError("the cached result should be used")
+
+    monkeypatch.setattr(TesseractBackend, "_recognize_image_sync", fail)
+    assert TesseractBackend().process_image_sync(_image("white"), **config).content == result.content
+
+
+def test_tesserocr_initialisation_error(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    with pytest.raises(OCRError, match="Failed to initialise tesserocr"):
+        TesserocrBackend().process_image_sync(_image("white"), language="fra")
+
+
+def test_tesserocr_missing_dependency(monkeypatch: MonkeyPatch, fresh_cache: None) -> None:
+    monkeypatch.setitem(sys.modules, "tesserocr", None)
+    monkeypatch.setattr(TesserocrBackend, "_version_checked", False)
+
+    with pytest.raises(MissingDependencyError, match="tesserocr"):
+        TesserocrBackend().process_image_sync(_image("white"))
+
+
+def test_tesserocr_engine_pool_close(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    pool = TesserocrEnginePool(max_engines=2)
+    with pool.acquire("eng", PSMMode.AUTO, {}) as engine, pool.acquire("eng", PSMMode.AUTO, {}) as other:
+        assert engine is not other
+    assert len(pool) == 2
+
+    pool.close()
+
+    assert len(pool) == 0
+    assert all(engine.ended for engine in tesserocr.instances)
+
+
+def test_tesserocr_engine_pool_replaces_idle_engine_at_limit(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    pool = TesserocrEnginePool(max_engines=1)
+    with pool.acquire("eng", PSMMode.AUTO, {}):
+        pass
+    with pool.acquire("deu", PSMMode.AUTO, {}) as engine:
+        assert engine.lang == "deu"
+
+    assert [engine.ended for engine in tesserocr.instances] == [True, False]
+    assert len(pool) == 1
+
+
+def test_tesserocr_engine_pool_waits_for_engine_at_limit(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    pool = TesserocrEnginePool(max_engines=1)
+    acquired = threading.Event()
+
+    def acquire_other() -> None:
+        with pool.acquire("deu", PSMMode.AUTO, {}):
+            acquired.set()
+
+    with pool.acquire("eng", PSMMode.AUTO, {}):
+        thread = threading.Thread(target=acquire_other)
+        thread.start()
+        assert not acquired.wait(0.1)
+    thread.join(timeout=5)
+
+    assert acquired.is_set()
+    assert len(tesserocr.instances) == 2
+    assert len(pool) == 1
+
+
+def test_tesserocr_engine_pool_releases_slot_on_initialisation_error(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    pool = TesserocrEnginePool(max_engines=1)
+    with pytest.raises(OCRError), pool.acquire("fra", PSMMode.AUTO, {}):
+        pass
+
+    with pool.acquire("eng", PSMMode.AUTO, {}) as engine:
+        assert engine.lang == "eng"
+
+
+@pytest.mark.anyio
+async def test_tesserocr_process_multi_frame_file(tesserocr: type[_FakeTessBaseAPI], tmp_path: Path) -> None:
+    backend = TesserocrBackend()
+    image_path = tmp_path / "pages.tiff"
+    _image("white").save(image_path, save_all=True, append_images=[_image("black"), _image("gray")])
+
+    sync_result = backend.process_file_sync(image_path, language="eng")
+    async_result = await backend.process_file(image_path, language="eng")
+
+    assert sync_result.content.splitlines() == ["text eng 1", "text eng 2", "text eng 3"]
+    assert async_result.content == sync_result.content
+
+
+def test_tesserocr_backend_configuration() -> None:
+    assert isinstance(get_ocr_backend("tesserocr"), TesserocrBackend)
+    assert ExtractionConfig(ocr_backend="tesserocr").get_config_dict() == ExtractionConfig().get_config_dict()
+    assert parse_ocr_backend_config({"tesseract": {"language": "deu", "psm": 6}}, "tesserocr") == TesseractConfig(
+        language="deu", psm=PSMMode.SINGLE_BLOCK
+    )
+
+
+def test_tesserocr_process_batch_one_image_at_a_time(tesserocr: type[_FakeTessBaseAPI], tmp_path: Path) -> None:
+    paths = []
+    for i, color in enumerate(["white", "black"]):
+        paths.append(tmp_path / f"page_{i}.png")
+        _image(color).save(paths[-1])
+
+    results = TesserocrBackend().process_batch_sync(paths, language="eng")
+
+    assert [result.content for result in results] == ["text eng 1", "text eng 2"]
+    assert len(tesserocr.instances) == 1
+
+
+def test_tesserocr_prepass(tesserocr: type[_FakeTessBaseAPI], monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr("kreuzberg._ocr._prepass.detect_languages", lambda *_: ["de"])
+    monkeypatch.setattr(_FakeTessBaseAPI, "GetUTF8Text", lambda _: "Sehr geehrte Damen und Herren, anbei " * 2)
+    backend = TesserocrBackend()
+
+    result = backend.process_image_sync(
+        Image.new("RGB", (40, 20), "white"), language="eng+deu", prepass=OCRPrepassConfig(draft_scale=1)
+    )
+
+    osd, draft, full = tesserocr.instances
+    assert (osd.lang, osd.psm, draft.lang, full.lang) == ("eng", 0, "eng", "deu")
+    assert osd.images[0].size == (40, 20)
+    assert full.images[0].size == (20, 40)
+    assert result.metadata["ocr_rotations"] == [90]
+    assert result.metadata["ocr_languages"] == ["deu"]
+
+
+def test_tesserocr_warmup_leaves_idle_engine(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    backend = TesserocrBackend()
+    config = asdict(TesseractConfig(language="deu"))
+
+    backend.warmup_sync(**config)
+    result = backend.process_image_sync(_image("white"), **config)
+
+    assert len(tesserocr.instances) == 1
+    assert result.content == "text deu 2"
+
+
+@pytest.mark.anyio
+async def test_tesserocr_warmup_missing_language(tesserocr: type[_FakeTessBaseAPI]) -> None:
+    with pytest.raises(OCRError, match="Failed to initialise tesserocr"):
+        await TesserocrBackend().warmup(language="fra")
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from itertools import pairwise
+
+import pandas as pd
+import pytest
+from PIL import Image, ImageDraw
+
+from kreuzberg._ocr._tiling import ImageBand, merge_band_layouts, merge_band_texts, split_into_bands
+
+
+def _lined_page(line_count: int = 20, line_height: int = 30, gap: int = 20) -> Image.Image:
+    image = Image.new("L", (200, line_count * (line_height + gap)), 255)
+    draw = ImageDraw.Draw(image)
+    for line in range(line_count):
+        top = line * (line_height + gap)
+        draw.rectangle((10, top, 190, top + line_height - 1), fill=0)
+    return image
+
+
+def test_split_into_bands_cuts_between_lines() -> None:
+    page = _lined_page()
+
+    bands = split_into_bands(page, 3, overlap=60)
+
+    assert len(bands) == 3
+    assert bands[0].top == 0
+    assert bands[-1].bottom == page.height
+    for upper, lower in pairwise(bands):
+        assert 60 <= upper.bottom - lower.top <= 120
+    for upper, lower in pairwise(bands):
+        assert page.getpixel((100, upper.bottom - 1)) == 255
+        assert page.getpixel((100, lower.top)) == 255
+
+
+def test_split_into_bands_single_band() -> None:
+    page = _lined_page()
+
+    [band] = split_into_bands(page, 1, overlap=60)
+
+    assert band.top == 0
+    assert band.image is page
+
+
+@pytest.mark.parametrize(
+    ("texts", "expected"),
+    [
+        (
+            ["a line\nshared one\nshared two", "shared one\nshared two\nnext line"],
+            "a line\nshared one\nshared two\nnext line",
+        ),
+        (["first\nshared\ncvt l1", "shared\ncut line\nlast"], "first\nshared\ncut line\nlast"),
+        (
+            ["first\nshared one\nshared two", "ed two?\nshared one\nshared  two\nlast"],
+            "first\nshared one\nshared two\nlast",
+        ),
+        (["upper text\n\n", "\nlower text"], "upper text\nlower text"),
+        (["same\n\nx", "\ny\nsame"], "same\n\nx\ny\nsame"),
+        (["only band"], "only band"),
+    ],
+)
+def test_merge_band_texts(texts: list[str], expected: str) -> None:
+    assert merge_band_texts(texts) == expected
+
+
+def test_merge_band_layouts() -> None:
+    image = Image.new("L", (10, 300))
+    bands = [
+        ImageBand(top=0, image=image.crop((0, 0, 10, 180))),
+        ImageBand(top=120, image=image.crop((0, 120, 10, 300))),
+    ]
+    dtypes = {"block_num": "int32", "top": "int32", "height": "int32", "text": "object"}
+    layouts = [
+        pd.DataFrame({"block_num": [1, 1, 2], "top": [10, 130, 165], "height": [10, 10, 10], "text": ["a", "b", "c"]}),
+        pd.DataFrame({"block_num": [1, 1, 2], "top": [10, 45, 100], "height": [10, 10, 10], "text": ["b", "c", "d"]}),
+    ]
+
+    merged = merge_band_layouts(bands, [layout.astype(dtypes) for layout in layouts])
+
+    assert merged["text"].tolist() == ["a", "b", "c", "d"]
+    assert merged["top"].tolist() == [10, 130, 165, 220]
+    assert merged["block_num"].tolist() == [1, 1, 3, 4]
+    assert merged.dtypes.to_dict() == {column: pd.Series(dtype=dtype).dtype for column, dtype in dtypes.items()}
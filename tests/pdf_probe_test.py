@@ -0,0 +1,147 @@
+"""Tests for the page-type probe of PDF documents."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING, NoReturn
+
+import pypdfium2
+import pytest
+from PIL import Image
+
+from kreuzberg import ExtractionConfig, ExtractionResult, classify_pdf, classify_pdf_sync
+from kreuzberg._extractors._pdf import PDFExtractor
+from kreuzberg._pdf_probe import PageType, PDFClassification, PDFPageClassification
+from kreuzberg.exceptions import ParsingError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+@pytest.fixture
+def mixed_pdf_bytes(searchable_pdf: Path) -> bytes:
+    """A text page with an image covering a quarter of it, followed by a blank page."""
+    document = pypdfium2.PdfDocument(str(searchable_pdf))
+    page = document[0]
+    width, height = page.get_size()
+    image = pypdfium2.PdfImage.new(document)
+    image.set_bitmap(pypdfium2.PdfBitmap.from_pil(Image.new("RGB", (10, 10))))
+    image.set_matrix(pypdfium2.PdfMatrix().scale(width / 2, height / 2))
+    page.insert_obj(image)
+    page.gen_content()
+    page.close()
+    document.new_page(width, height).close()
+
+    buffer = BytesIO()
+    document.save(buffer)
+    document.close()
+    return buffer.getvalue()
+
+
+def _page(page_type: PageType) -> PDFPageClassification:
+    return PDFPageClassification(
+        page_number=1, page_type=page_type, text_object_count=0, image_object_count=0, image_coverage=0.0
+    )
+
+
+def test_classify_pdf_text(searchable_pdf: Path) -> None:
+    classification = classify_pdf_sync(searchable_pdf)
+
+    assert classification.document_type == "text"
+    assert classification.pages[0].text_object_count > 0
+    assert classification.pages[0].image_object_count == 0
+    assert classification.scanned_pages == []
+
+
+def test_classify_pdf_scanned_without_text_layer(non_searchable_pdf: Path) -> None:
+    classification = classify_pdf_sync(str(non_searchable_pdf))
+
+    assert classification.document_type == "scanned"
+    assert classification.pages[0].text_object_count == 0
+    assert classification.scanned_pages == [1]
+
+
+def test_classify_pdf_scanned_with_ocr_layer(scanned_pdf: Path) -> None:
+    page = classify_pdf_sync(scanned_pdf).pages[0]
+
+    assert page.page_type == "scanned"
+    assert page.text_object_count > 0
+    assert page.image_coverage == pytest.approx(1.0)
+
+
+def test_classify_pdf_mixed_and_empty(mixed_pdf_bytes: bytes) -> None:
+    classification = classify_pdf_sync(mixed_pdf_bytes)
+
+    assert [page.page_type for page in classification.pages] == ["mixed", "empty"]
+    assert classification.pages[0].image_coverage == pytest.approx(0.25)
+    assert classification.document_type == "mixed"
+
+
+def test_classify_pdf_page_indices(test_article: Path) -> None:
+    classification = classify_pdf_sync(test_article, page_indices=[2, 0])
+
+    assert [page.page_number for page in classification.pages] == [3, 1]
+
+
+def test_classify_pdf_invalid() -> None:
+    with pytest.raises(ParsingError, match="Could not open PDF file"):
+        classify_pdf_sync(b"not a pdf")
+
+
+@pytest.mark.parametrize(
+    ("page_types", "expected"),
+    [
+        ([], "empty"),
+        (["empty"], "empty"),
+        (["text", "empty"], "text"),
+        (["scanned", "scanned"], "scanned"),
+        (["text", "scanned"], "mixed"),
+    ],
+)
+def test_pdf_classification_document_type(page_types: list[PageType], expected: PageType) -> None:
+    classification = PDFClassification(pages=tuple(_page(page_type) for page_type in page_types))
+    assert classification.document_type == expected
+
+
+@pytest.mark.anyio
+async def test_classify_pdf_async(test_article: Path) -> None:
+    classification = await classify_pdf(test_article)
+
+    assert len(classification.pages) > 1
+    assert classification.document_type == "text"
+
+
+@pytest.mark.anyio
+async def test_pdf_without_text_objects_skips_text_layer(non_searchable_pdf: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that documents without any text objects go straight to OCR."""
+
+    def fail(*_: object, **__: object) -> NoReturn:
+        raise AssertionError("the text layer should not be extracted")
+
+    async def ocr(*_: object, **__: object) -> ExtractionResult:
+        return ExtractionResult(content="ocr text", mime_type="text/plain", metadata={}, chunks=[])
+
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig())
+    monkeypatch.setattr(extractor, "_extract_pdf_searchable_text", fail)
+    monkeypatch.setattr(extractor, "_extract_pdf_text_with_ocr", ocr)
+
+    result = await extractor.extract_path_async(non_searchable_pdf)
+
+    assert result.content == "ocr text"
+
+
+def test_pdf_without_text_objects_skips_text_layer_sync(non_searchable_pdf: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that documents without any text objects go straight to OCR (sync version)."""
+
+    def fail(*_: object, **__: object) -> NoReturn:
+        raise AssertionError("the text layer should not be extracted")
+
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig())
+    monkeypatch.setattr(extractor, "_extract_pdf_searchable_text_sync", fail)
+    monkeypatch.setattr(extractor, "_extract_pdf_with_ocr_sync", lambda *_: ("ocr text", {}))
+
+    result = extractor.extract_path_sync(non_searchable_pdf)
+
+    assert result.content == "ocr text"
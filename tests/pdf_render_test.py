@@ -0,0 +1,108 @@
+"""Tests for adaptive rendering of PDF pages for OCR."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pypdfium2
+import pytest
+
+from kreuzberg._pdf_render import (
+    PDFRenderConfig,
+    get_render_scale,
+    get_text_layer_line_height,
+    probe_line_height,
+    render_pdf_page,
+)
+from kreuzberg.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def searchable_document(searchable_pdf: Path) -> Generator[pypdfium2.PdfDocument, None, None]:
+    document = pypdfium2.PdfDocument(str(searchable_pdf))
+    yield document
+    document.close()
+
+
+@pytest.fixture
+def non_searchable_document(non_searchable_pdf: Path) -> Generator[pypdfium2.PdfDocument, None, None]:
+    document = pypdfium2.PdfDocument(str(non_searchable_pdf))
+    yield document
+    document.close()
+
+
+def test_get_text_layer_line_height(searchable_document: pypdfium2.PdfDocument) -> None:
+    assert get_text_layer_line_height(searchable_document[0]) == pytest.approx(12.0)
+
+
+def test_get_text_layer_line_height_without_text(non_searchable_document: pypdfium2.PdfDocument) -> None:
+    assert get_text_layer_line_height(non_searchable_document[0]) is None
+
+
+def test_probe_line_height(non_searchable_document: pypdfium2.PdfDocument) -> None:
+    line_height = probe_line_height(non_searchable_document[0], probe_dpi=100)
+
+    assert line_height is not None
+    assert 6 < line_height < 16
+
+
+def test_probe_line_height_blank_page() -> None:
+    document = pypdfium2.PdfDocument.new()
+    document.new_page(612, 792)
+
+    assert probe_line_height(document[0], probe_dpi=100) is None
+
+
+def test_get_render_scale_from_text_layer(searchable_document: pypdfium2.PdfDocument) -> None:
+    config = PDFRenderConfig(target_text_height=48, max_pixels=None)
+
+    assert get_render_scale(searchable_document[0], config) == pytest.approx(4.0)
+
+
+def test_get_render_scale_clamps_to_dpi_range(searchable_document: pypdfium2.PdfDocument) -> None:
+    page = searchable_document[0]
+
+    assert get_render_scale(page, PDFRenderConfig(target_text_height=1, max_pixels=None)) == pytest.approx(150 / 72)
+    assert get_render_scale(page, PDFRenderConfig(target_text_height=1000, max_pixels=None)) == pytest.approx(600 / 72)
+
+
+def test_get_render_scale_respects_pixel_budget(searchable_document: pypdfium2.PdfDocument) -> None:
+    page = searchable_document[0]
+    width, height = page.get_size()
+    config = PDFRenderConfig(target_text_height=1000, max_pixels=1_000_000)
+
+    scale = get_render_scale(page, config)
+
+    assert width * height * scale**2 == pytest.approx(1_000_000)
+
+
+def test_get_render_scale_fixed(searchable_document: pypdfium2.PdfDocument) -> None:
+    config = PDFRenderConfig(adaptive=False, dpi=144, max_pixels=None)
+
+    assert get_render_scale(searchable_document[0], config) == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize(("color_mode", "image_mode"), [("rgb", "RGB"), ("grayscale", "L"), ("bilevel", "1")])
+def test_render_pdf_page_color_mode(
+    searchable_document: pypdfium2.PdfDocument, color_mode: str, image_mode: str
+) -> None:
+    config = PDFRenderConfig(adaptive=False, dpi=72, color_mode=color_mode)  # type: ignore[arg-type]
+
+    image = render_pdf_page(searchable_document, 0, config)
+
+    assert image.mode == image_mode
+    assert image.size == (612, 792)
+    assert image.getextrema() != (255, 255)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"dpi": 0}, {"target_text_height": 0}, {"min_dpi": 300, "max_dpi": 200}, {"max_pixels": 0}],
+)
+def test_pdf_render_config_validation(kwargs: dict[str, int]) -> None:
+    with pytest.raises(ValidationError):
+        PDFRenderConfig(**kwargs)  # type: ignore[arg-type]
@@ -1,13 +1,18 @@
 from pathlib import Path
 
+import anyio
 import pytest
+from playa import parse
 
-from kreuzberg._playa import extract_pdf_metadata
+from kreuzberg._playa import extract_pdf_metadata, extract_pdf_metadata_from_document
+from kreuzberg._types import PDFMetadataField
+
+SUMMARY_ONLY: tuple[PDFMetadataField, ...] = ("summary",)
 
 
 @pytest.mark.anyio
 async def test_extract_pdf_metadata_test_article(test_article: Path) -> None:
-    content = test_article.read_bytes()
+    content = await anyio.Path(test_article).read_bytes()
     metadata = await extract_pdf_metadata(content)
 
     assert isinstance(metadata, dict)
@@ -25,7 +30,7 @@ async def test_extract_pdf_metadata_test_article(test_article: Path) -> None:
 
 @pytest.mark.anyio
 async def test_extract_pdf_metadata_searchable(searchable_pdf: Path) -> None:
-    content = searchable_pdf.read_bytes()
+    content = await anyio.Path(searchable_pdf).read_bytes()
     metadata = await extract_pdf_metadata(content)
 
     assert isinstance(metadata, dict)
@@ -42,7 +47,7 @@ async def test_extract_pdf_metadata_searchable(searchable_pdf: Path) -> None:
 
 @pytest.mark.anyio
 async def test_extract_pdf_metadata_non_searchable(non_searchable_pdf: Path) -> None:
-    content = non_searchable_pdf.read_bytes()
+    content = await anyio.Path(non_searchable_pdf).read_bytes()
     metadata = await extract_pdf_metadata(content)
 
     assert isinstance(metadata, dict)
@@ -55,7 +60,7 @@ async def test_extract_pdf_metadata_non_searchable(non_searchable_pdf: Path) ->
 
 @pytest.mark.anyio
 async def test_extract_pdf_metadata_non_ascii(non_ascii_pdf: Path) -> None:
-    content = non_ascii_pdf.read_bytes()
+    content = await anyio.Path(non_ascii_pdf).read_bytes()
     metadata = await extract_pdf_metadata(content)
 
     assert isinstance(metadata, dict)
@@ -68,7 +73,7 @@ async def test_extract_pdf_metadata_non_ascii(non_ascii_pdf: Path) -> None:
 
 @pytest.mark.anyio
 async def test_extract_pdf_metadata_scanned(scanned_pdf: Path) -> None:
-    content = scanned_pdf.read_bytes()
+    content = await anyio.Path(scanned_pdf).read_bytes()
     metadata = await extract_pdf_metadata(content)
 
     assert isinstance(metadata, dict)
@@ -83,7 +88,7 @@ async def test_extract_pdf_metadata_scanned(scanned_pdf: Path) -> None:
 
 @pytest.mark.anyio
 async def test_extract_pdf_metadata_contract(test_contract: Path) -> None:
-    content = test_contract.read_bytes()
+    content = await anyio.Path(test_contract).read_bytes()
     metadata = await extract_pdf_metadata(content)
 
     assert isinstance(metadata, dict)
@@ -109,3 +114,37 @@ async def test_extract_pdf_metadata_error_handling() -> None:
     assert isinstance(result, dict)
 
     assert "summary" in result
+
+
+@pytest.mark.anyio
+async def test_extract_pdf_metadata_without_expensive_fields(test_article: Path) -> None:
+    metadata = await extract_pdf_metadata(await anyio.Path(test_article).read_bytes(), fields=())
+
+    assert metadata.get("title") == "Inverted Honor"
+    assert metadata.get("width") == 595
+    assert metadata.get("height") == 842
+    assert "description" not in metadata
+    assert "summary" not in metadata
+    assert "languages" not in metadata
+
+
+def test_extract_pdf_metadata_reads_page_tree_lazily(test_article: Path) -> None:
+    document = parse(test_article.read_bytes(), max_workers=1)
+
+    metadata = extract_pdf_metadata_from_document(document, fields=SUMMARY_ONLY)
+
+    assert document._pages is None
+    assert "PDF document with 28 pages" in metadata["summary"]
+    assert metadata.get("width") == 595
+
+
+def test_extract_pdf_metadata_dimensions_without_page_tree_root(searchable_pdf: Path) -> None:
+    document = parse(searchable_pdf.read_bytes(), max_workers=1)
+    page = document.pages[0]
+    document.catalog = {key: value for key, value in document.catalog.items() if key != "Pages"}
+
+    metadata = extract_pdf_metadata_from_document(document, fields=SUMMARY_ONLY)
+
+    assert metadata.get("width") == int(page.width)
+    assert metadata.get("height") == int(page.height)
+    assert "PDF document with 1 page." in metadata["summary"]
@@ -189,3 +189,67 @@ def test_extraction_result_to_dict_minimal() -> None:
     assert "entities" not in result_dict
     assert "keywords" not in result_dict
     assert "detected_languages" not in result_dict
+
+
+@pytest.mark.parametrize(
+    ("page_range", "max_pages", "expected"),
+    [
+        (None, None, [0, 1, 2, 3, 4]),
+        (None, 3, [0, 1, 2]),
+        ((2, 4), None, [1, 2, 3]),
+        ((2, 4), 2, [1, 2]),
+        ((4, 10), None, [3, 4]),
+        ((7, 10), None, []),
+    ],
+)
+def test_get_page_indices(page_range: tuple[int, int] | None, max_pages: int | None, expected: list[int]) -> None:
+    config = ExtractionConfig(page_range=page_range, max_pages=max_pages)
+
+    assert config.get_page_indices(5) == expected
+
+
+@pytest.mark.parametrize("page_range", [(0, 3), (3, 2), (1, 2, 3)])
+def test_extraction_config_validation_invalid_page_range(page_range: tuple[int, ...]) -> None:
+    with pytest.raises(ValidationError, match="'page_range' must be"):
+        ExtractionConfig(page_range=page_range)  # type: ignore[arg-type]
+
+
+def test_extraction_config_validation_invalid_max_pages() -> None:
+    with pytest.raises(ValidationError, match="'max_pages' must be at least 1"):
+        ExtractionConfig(max_pages=0)
+
+
+@pytest.mark.parametrize("field", ["ocr_tile_min_pixels", "ocr_tile_overlap", "ocr_tile_max_workers"])
+def test_extraction_config_validation_invalid_ocr_tiling(field: str) -> None:
+    with pytest.raises(ValidationError, match=f"'{field}' must be at least 1"):
+        ExtractionConfig(**{field: 0})  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("document_timeout", [0, -1.5])
+def test_extraction_config_validation_document_timeout(document_timeout: float) -> None:
+    with pytest.raises(ValidationError, match="'document_timeout' must be positive"):
+        ExtractionConfig(document_timeout=document_timeout)
+
+
+def test_extraction_config_pdf_metadata_fields_list_converted_to_frozenset() -> None:
+    config = ExtractionConfig(pdf_metadata_fields=["outline"])  # type: ignore[arg-type]
+
+    assert config.pdf_metadata_fields == frozenset({"outline"})
+    assert hash(config)
+
+
+def test_extraction_config_validation_invalid_pdf_metadata_fields() -> None:
+    with pytest.raises(ValidationError, match="'pdf_metadata_fields' contains unknown fields"):
+        ExtractionConfig(pdf_metadata_fields=frozenset({"outline", "fonts"}))  # type: ignore[arg-type]
+
+
+def test_extraction_config_validation_invalid_ocr_fallback_mode() -> None:
+    with pytest.raises(ValidationError, match="'ocr_fallback_mode' must be 'document' or 'page'"):
+        ExtractionConfig(ocr_fallback_mode="pages")  # type: ignore[arg-type]
+
+
+def test_extraction_config_page_range_list_converted_to_tuple() -> None:
+    config = ExtractionConfig(page_range=[2, 3])  # type: ignore[arg-type]
+
+    assert config.page_range == (2, 3)
+    assert hash(config)
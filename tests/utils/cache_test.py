@@ -9,15 +9,23 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import numpy as np
 import pytest
+from PIL import Image
 
 from kreuzberg._types import ExtractionResult
 from kreuzberg._utils._cache import (
+    PERCEPTUAL_HASH_MAX_DISTANCE,
+    PERCEPTUAL_HASH_SIZE,
     KreuzbergCache,
+    PerceptualHashIndex,
     clear_all_caches,
     get_document_cache,
+    get_image_hash,
     get_mime_cache,
     get_ocr_cache,
+    get_page_cache,
+    get_perceptual_image_hash,
     get_table_cache,
 )
 
@@ -131,6 +139,24 @@ def test_serialize_result(cache: KreuzbergCache[ExtractionResult]) -> None:
     assert isinstance(serialized["cached_at"], float)
 
 
+def test_cache_roundtrip_layout(cache: KreuzbergCache[ExtractionResult]) -> None:
+    """Test that the OCR layout of a result is cached with its column data types."""
+    import pandas as pd
+
+    layout = pd.DataFrame({"top": [10, 20], "conf": [95.5, 80.0], "text": ["Hello", "world"]}).astype(
+        {"top": "int32", "conf": "float32"}
+    )
+    result = ExtractionResult(content="Hello world", mime_type="text/plain", metadata={}, layout=layout)
+
+    cache.set(result, key="layout")
+    cached = cache.get(key="layout")
+
+    assert cached is not None
+    assert cached.content == "Hello world"
+    assert cached.layout is not None
+    pd.testing.assert_frame_equal(cached.layout, layout)
+
+
 def test_deserialize_result_extraction_result(cache: KreuzbergCache[ExtractionResult]) -> None:
     """Test ExtractionResult deserialization."""
     result_data = {
@@ -401,6 +427,13 @@ def test_get_mime_cache() -> None:
     assert cache.cache_type == "mime"
 
 
+def test_get_page_cache() -> None:
+    """Test page cache factory function."""
+    cache = get_page_cache()
+    assert isinstance(cache, KreuzbergCache)
+    assert cache.cache_type == "pages"
+
+
 def test_clear_all_caches() -> None:
     """Test clearing all global caches."""
 
@@ -408,11 +441,15 @@ def test_clear_all_caches() -> None:
         ExtractionResult(content="test", mime_type="text/plain", metadata={}, chunks=[], tables=[]), key="test"
     )
     get_mime_cache().set("application/pdf", key="test")
+    get_page_cache().set(
+        ExtractionResult(content="test", mime_type="text/plain", metadata={}, chunks=[], tables=[]), key="test"
+    )
 
     clear_all_caches()
 
     assert get_ocr_cache().get(key="test") is None
     assert get_mime_cache().get(key="test") is None
+    assert get_page_cache().get(key="test") is None
 
 
 def test_cleanup_cache_periodic_trigger(cache: KreuzbergCache[str]) -> None:
@@ -468,3 +505,59 @@ async def test_aset_serialization_error(cache: KreuzbergCache[str]) -> None:
 
     with patch("kreuzberg._utils._cache.serialize", side_effect=TypeError("Serialize error")):
         await cache.aset(unserializable, key="test")  # type: ignore
+
+
+def test_get_image_hash() -> None:
+    content = b"P5\n2 2\n255\n\x00\x01\x02\x03"
+
+    assert get_image_hash(content) == get_image_hash(bytes(content))
+    assert len(get_image_hash(content)) == 16
+    assert get_image_hash(content) != get_image_hash(b"P5\n4 1\n255\n\x00\x01\x02\x03")
+
+
+def _scan(seed: int, noise: int) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    page = np.full((400, 300), 240, dtype=np.int16)
+    for top in range(40, 360, 24):
+        for left in rng.integers(20, 260, size=12):
+            page[top : top + 12, left : left + int(rng.integers(8, 30))] = 30
+    page += np.random.default_rng(seed + 100).integers(-noise, noise + 1, size=page.shape)
+    return Image.fromarray(np.clip(page, 0, 255).astype(np.uint8)).convert("RGB")
+
+
+def test_get_perceptual_image_hash() -> None:
+    original = get_perceptual_image_hash(_scan(1, noise=0))
+    rescan = get_perceptual_image_hash(_scan(1, noise=12).resize((270, 360)))
+    other_page = get_perceptual_image_hash(_scan(2, noise=0))
+
+    def distance(first: bytes, second: bytes) -> int:
+        return int(np.unpackbits(np.frombuffer(first, np.uint8) ^ np.frombuffer(second, np.uint8)).sum())
+
+    assert len(original) == PERCEPTUAL_HASH_SIZE**2 // 8
+    assert distance(original, rescan) <= PERCEPTUAL_HASH_MAX_DISTANCE
+    assert distance(original, other_page) > PERCEPTUAL_HASH_MAX_DISTANCE
+    assert len(get_perceptual_image_hash(_scan(1, noise=0).convert("RGBA"))) == len(original)
+
+
+def test_perceptual_hash_index(temp_cache_dir: Path) -> None:
+    path = temp_cache_dir / "perceptual_hashes.tsv"
+    index = PerceptualHashIndex(path)
+    first = bytes(128)
+    second = bytes([0xFF] * 128)
+
+    assert index.find("config", first) is None
+    index.add("config", first)
+    index.add("config", second)
+
+    near = bytes([0x0F, *bytes(127)])
+    assert index.find("config", near) == first
+    assert index.find("config", near, max_distance=3) is None
+    assert index.find("other", near) is None
+    assert index.find("config", bytes(16)) is None
+
+    reloaded = PerceptualHashIndex(path)
+    assert reloaded.find("config", bytes([0xFE, *[0xFF] * 127])) == second
+
+    reloaded.clear()
+    assert not path.exists()
+    assert reloaded.find("config", first) is None
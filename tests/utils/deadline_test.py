@@ -0,0 +1,95 @@
+"""Tests for the per-document time budget."""
+
+from __future__ import annotations
+
+import anyio
+import pytest
+
+from kreuzberg._utils._deadline import (
+    Deadline,
+    deadline_expired,
+    deadline_scope,
+    get_deadline,
+    get_remaining_time,
+    skip_if_expired,
+    start_deadline,
+    use_deadline,
+)
+from kreuzberg._utils._sync import run_sync
+
+
+def test_deadline_metadata() -> None:
+    deadline = Deadline.after(-1)
+    deadline.page_indices = [0, 1, 2, 3]
+
+    assert deadline.expired
+    assert deadline.remaining() == 0
+    assert deadline.get_metadata() == {}
+
+    deadline.skip_pages([2, 3])
+    deadline.skip_stage("ocr")
+    deadline.skip_stage("ocr")
+
+    assert deadline.get_metadata() == {
+        "deadline_exceeded": True,
+        "completed_pages": [1, 2],
+        "skipped_pages": [3, 4],
+        "skipped_stages": ["ocr"],
+    }
+
+
+def test_deadline_metadata_without_pages() -> None:
+    deadline = Deadline.after(-1)
+    deadline.skip_stage("post_processing")
+
+    assert deadline.get_metadata() == {"deadline_exceeded": True, "skipped_stages": ["post_processing"]}
+
+
+def test_deadline_scope_without_timeout() -> None:
+    with deadline_scope(None) as deadline:
+        assert deadline is None
+        assert get_deadline() is None
+        assert not deadline_expired()
+        assert not skip_if_expired([0], stage="ocr")
+        assert get_remaining_time(300.0) == 300.0
+
+
+def test_deadline_scope_reuses_outer_deadline() -> None:
+    with deadline_scope(60) as outer:
+        with deadline_scope(0.001) as inner:
+            assert inner is outer
+        assert get_deadline() is outer
+        assert get_remaining_time(300.0) <= 60
+        assert get_remaining_time(1.0) == 1.0
+    assert get_deadline() is None
+
+
+def test_use_deadline() -> None:
+    deadline = start_deadline(60)
+
+    assert deadline is not None
+    assert get_deadline() is None
+    with use_deadline(deadline):
+        assert get_deadline() is deadline
+        assert start_deadline(0.001) is deadline
+    assert get_deadline() is None
+    assert start_deadline(None) is None
+
+
+def test_skip_if_expired() -> None:
+    with deadline_scope(0) as deadline:
+        assert deadline is not None
+        assert deadline_expired()
+        assert skip_if_expired([1, 2], stage="text_layer")
+        assert deadline.skipped_pages == {1, 2}
+        assert deadline.skipped_stages == ["text_layer"]
+
+
+@pytest.mark.anyio
+async def test_deadline_follows_worker_threads() -> None:
+    with deadline_scope(60) as deadline:
+        assert await run_sync(get_deadline) is deadline
+
+    with deadline_scope(0.05):
+        await anyio.sleep(0.1)
+        assert await run_sync(deadline_expired)
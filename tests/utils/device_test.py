@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 from kreuzberg._utils._device import (
+    MAX_CPU_BATCH_SIZE,
     DeviceInfo,
     cleanup_device_memory,
     detect_available_devices,
@@ -299,10 +300,14 @@ def test_is_backend_gpu_compatible() -> None:
     assert is_backend_gpu_compatible("unknown") is False
 
 
-def test_get_recommended_batch_size_cpu() -> None:
+@patch("kreuzberg._utils._device.psutil.virtual_memory")
+def test_get_recommended_batch_size_cpu(mock_virtual_memory: Mock) -> None:
+    mock_virtual_memory.return_value = Mock(available=1024**3)
     device = DeviceInfo(device_type="cpu", name="CPU")
-    batch_size = get_recommended_batch_size(device)
-    assert batch_size == 1
+
+    assert get_recommended_batch_size(device, input_size_mb=16.0) == 4
+    assert get_recommended_batch_size(device, input_size_mb=0.5) == MAX_CPU_BATCH_SIZE
+    assert get_recommended_batch_size(device, input_size_mb=100.0) == 1
 
 
 @patch("kreuzberg._utils._device.get_device_memory_info")
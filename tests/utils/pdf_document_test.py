@@ -0,0 +1,219 @@
+"""Tests for the shared PDF document context."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import playa
+import pypdfium2
+import pytest
+
+from kreuzberg._extractors._pdf import PDFExtractor, _extract_playa_page_text
+from kreuzberg._types import ExtractionConfig
+from kreuzberg._utils._pdf_document import PDFDocumentContext
+from kreuzberg.exceptions import ParsingError
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
+
+def test_pdf_document_context_reuses_handles(searchable_pdf: Path) -> None:
+    """Test that each backend parses the file only once."""
+    with PDFDocumentContext(searchable_pdf) as document:
+        assert document.get_pdfium_document() is document.get_pdfium_document()
+        assert document.get_playa_document() is document.get_playa_document()
+        assert document.content == searchable_pdf.read_bytes()
+
+
+def test_pdf_document_context_close_releases_handles(searchable_pdf: Path) -> None:
+    """Test that closing the context drops all parsed handles."""
+    document = PDFDocumentContext(searchable_pdf, searchable_pdf.read_bytes())
+    pdf = document.get_pdfium_document()
+    document.get_playa_document()
+
+    document.close()
+
+    assert document._pdfium_document is None
+    assert document._playa_document is None
+    assert document._content is None
+    assert pdf.raw is None
+
+
+def test_pdf_document_context_invalid_pdf(tmp_path: Path) -> None:
+    """Test that opening an invalid PDF raises and leaves no handle behind."""
+    pdf_path = tmp_path / "invalid.pdf"
+    pdf_path.write_text("invalid pdf content")
+
+    with PDFDocumentContext(pdf_path) as document, pytest.raises(pypdfium2.PdfiumError):
+        document.get_pdfium_document()
+
+    assert document._pdfium_document is None
+
+
+@pytest.mark.parametrize("from_bytes", [False, True])
+def test_pdf_document_context_playa_parse_error(
+    searchable_pdf: Path, monkeypatch: MonkeyPatch, from_bytes: bool
+) -> None:
+    """Test that playa parse failures are raised as ParsingError."""
+
+    def failing_parse(*args: object, **kwargs: object) -> None:
+        raise ValueError("Test error")
+
+    monkeypatch.setattr("kreuzberg._utils._pdf_document.parse", failing_parse)
+    monkeypatch.setattr("kreuzberg._utils._pdf_document.playa_open", failing_parse)
+
+    path, content = (None, searchable_pdf.read_bytes()) if from_bytes else (searchable_pdf, None)
+    with PDFDocumentContext(path, content) as document, pytest.raises(ParsingError, match="Failed to parse PDF"):
+        document.get_playa_document()
+
+
+def test_pdf_document_context_playa_memory_maps_file(searchable_pdf: Path) -> None:
+    """Test that the playa document of a file is memory-mapped instead of parsed from a copy of its bytes."""
+    with PDFDocumentContext(searchable_pdf) as document:
+        playa_document = document.get_playa_document()
+
+        assert document._content is None
+        assert playa_document._fp is not None
+
+    assert playa_document._fp is None
+
+
+def test_pdf_document_context_open_playa_document_with_workers(test_article: Path) -> None:
+    """Test that a separately opened playa document parses pages in worker processes."""
+    with PDFDocumentContext(test_article) as document, document.open_playa_document(max_workers=2) as playa_document:
+        assert playa_document._pool is not None
+        texts = list(playa_document.pages[[0, 2]].map(_extract_playa_page_text))
+
+        assert texts == [document.get_playa_document().pages[i].extract_text() for i in (0, 2)]
+
+
+def test_pdf_document_context_playa_workers_do_not_fork(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that the playa worker processes are not forked from the extracting process."""
+    mp_contexts: list[BaseContext | None] = []
+    original_open = playa.open
+
+    def recording_open(*args: Any, mp_context: BaseContext | None = None, **kwargs: Any) -> playa.Document:
+        mp_contexts.append(mp_context)
+        return original_open(*args, mp_context=mp_context, **kwargs)
+
+    monkeypatch.setattr("kreuzberg._utils._pdf_document.playa_open", recording_open)
+    with PDFDocumentContext(test_article) as document, document.open_playa_document(max_workers=2):
+        pass
+
+    assert len(mp_contexts) == 1
+    assert mp_contexts[0] is not None
+    assert mp_contexts[0].get_start_method() in {"forkserver", "spawn"}
+
+
+def test_pdf_document_context_requires_path_or_content() -> None:
+    """Test that a context needs either a path or the PDF bytes."""
+    with pytest.raises(ValueError, match="Either a path or the content"):
+        PDFDocumentContext(None)
+
+
+def test_pdf_document_context_from_bytes(searchable_pdf: Path) -> None:
+    """Test that a context created from bytes parses the PDF in memory."""
+    with PDFDocumentContext(None, searchable_pdf.read_bytes()) as document:
+        assert len(document.get_pdfium_document()) > 0
+        assert document.get_playa_document() is not None
+        assert document.lock_key != PDFDocumentContext(None, b"").lock_key
+        assert document._temp_path is None
+
+
+def test_pdf_document_context_get_path_from_bytes(searchable_pdf: Path) -> None:
+    """Test that a temporary file is only written on demand, and removed on close."""
+    document = PDFDocumentContext(None, searchable_pdf.read_bytes())
+
+    path = document.get_path()
+
+    assert document.get_path() == path
+    assert path.read_bytes() == searchable_pdf.read_bytes()
+    document.close()
+    assert not path.exists()
+
+
+def test_pdf_document_context_get_path_from_file(searchable_pdf: Path) -> None:
+    """Test that a context created from a file returns that file."""
+    with PDFDocumentContext(searchable_pdf) as document:
+        assert document.get_path() == searchable_pdf
+        assert document.lock_key == searchable_pdf
+
+
+@pytest.mark.anyio
+async def test_pdf_extraction_opens_document_once(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that one extraction opens the PDF once per backend."""
+    pdfium_opens = 0
+    playa_parses = 0
+    original_pdf_document = pypdfium2.PdfDocument
+    original_parse = playa.parse
+    original_open = playa.open
+
+    def counting_pdf_document(*args: object, **kwargs: object) -> pypdfium2.PdfDocument:
+        nonlocal pdfium_opens
+        pdfium_opens += 1
+        return original_pdf_document(*args, **kwargs)
+
+    def counting_parse(*args: Any, **kwargs: Any) -> playa.Document:
+        nonlocal playa_parses
+        playa_parses += 1
+        return original_parse(*args, **kwargs)
+
+    def counting_open(*args: Any, **kwargs: Any) -> playa.Document:
+        nonlocal playa_parses
+        playa_parses += 1
+        return original_open(*args, **kwargs)
+
+    monkeypatch.setattr(pypdfium2, "PdfDocument", counting_pdf_document)
+    monkeypatch.setattr("kreuzberg._utils._pdf_document.parse", counting_parse)
+    monkeypatch.setattr("kreuzberg._utils._pdf_document.playa_open", counting_open)
+
+    extractor = PDFExtractor(mime_type="application/pdf", config=ExtractionConfig())
+    result = await extractor.extract_path_async(test_article)
+
+    assert result.content
+    assert result.metadata.get("title")
+    assert pdfium_opens == 1
+    assert playa_parses == 1
+
+
+def _append_blank_page(source: Path, output: Path) -> None:
+    document = pypdfium2.PdfDocument(str(source))
+    width, height = document[0].get_size()
+    document.new_page(width, height).close()
+    document.save(str(output))
+    document.close()
+
+
+def test_pdf_document_context_page_fingerprint(test_article: Path, tmp_path: Path) -> None:
+    """Test that page fingerprints differ between pages and survive another page being added."""
+    edited = tmp_path / "edited.pdf"
+    _append_blank_page(test_article, edited)
+
+    with PDFDocumentContext(test_article) as document, PDFDocumentContext(edited) as edited_document:
+        page_count = len(document.get_pdfium_document())
+        fingerprints = [document.get_page_fingerprint(i) for i in range(page_count)]
+        edited_fingerprints = [edited_document.get_page_fingerprint(i) for i in range(page_count + 1)]
+
+    assert all(fingerprints)
+    assert len(set(fingerprints)) == page_count
+    assert edited_fingerprints[:page_count] == fingerprints
+    assert edited_fingerprints[page_count] not in fingerprints
+
+
+def test_pdf_document_context_page_fingerprint_from_bytes(searchable_pdf: Path) -> None:
+    """Test that a page has the same fingerprint whether the document is read from a file or from bytes."""
+    with PDFDocumentContext(searchable_pdf) as document:
+        fingerprint = document.get_page_fingerprint(0)
+    with PDFDocumentContext(None, searchable_pdf.read_bytes()) as document:
+        assert document.get_page_fingerprint(0) == fingerprint
+
+
+def test_pdf_document_context_page_fingerprint_invalid(tmp_path: Path) -> None:
+    """Test that pages of a document playa cannot parse have no fingerprint."""
+    pdf_path = tmp_path / "invalid.pdf"
+    pdf_path.write_bytes(b"not a pdf")
+    with PDFDocumentContext(pdf_path) as document:
+        assert document.get_page_fingerprint(0) is None
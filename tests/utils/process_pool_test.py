@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import multiprocessing as mp
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
+import pypdfium2
+import pytest
 from PIL import Image
 
 from kreuzberg._utils._process_pool import (
@@ -14,14 +17,20 @@ from kreuzberg._utils._process_pool import (
     _extract_pdf_images_worker,
     _extract_pdf_text_worker,
     _init_process_pool,
+    extract_pdf_text_in_processes,
+    open_shared_image,
     process_pool,
+    share_image,
     shutdown_process_pool,
     submit_to_process_pool,
 )
+from kreuzberg.exceptions import ParsingError
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest import MonkeyPatch
+
 
 def _simple_add(x: int, y: int) -> int:
     """Simple addition function for testing."""
@@ -173,6 +182,78 @@ def test_extract_pdf_text_worker_with_mock() -> None:
         mock_pdf.close.assert_called_once()
 
 
+def test_extract_pdf_text_worker_page_indices(test_article: Path) -> None:
+    """Test PDF text extraction worker with a subset of pages."""
+    pdf = pypdfium2.PdfDocument(str(test_article))
+    expected = []
+    for i in [2, 3]:
+        text_page = pdf[i].get_textpage()
+        expected.append(text_page.get_text_bounded())
+        text_page.close()
+    pdf.close()
+
+    _, text = _extract_pdf_text_worker(str(test_article), [2, 3])
+
+    assert text == "\n".join(expected)
+
+
+def test_extract_pdf_text_in_processes(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that page ranges extracted in worker processes are reassembled in order."""
+    monkeypatch.setattr("kreuzberg._utils._process_pool._POOL_SIZE", 3)
+    page_indices = list(range(1, 28))
+
+    try:
+        text = extract_pdf_text_in_processes(str(test_article), page_indices, min_pages_per_process=5)
+    finally:
+        shutdown_process_pool()
+
+    assert text == _extract_pdf_text_worker(str(test_article), page_indices)[1]
+
+
+def test_extract_pdf_text_in_processes_too_few_pages(test_article: Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that no processes are used when the pages cannot be split across at least two of them."""
+    monkeypatch.setattr("kreuzberg._utils._process_pool._POOL_SIZE", 4)
+
+    assert extract_pdf_text_in_processes(str(test_article), list(range(9)), min_pages_per_process=5) is None
+
+
+def test_extract_pdf_text_in_processes_worker_error(monkeypatch: MonkeyPatch) -> None:
+    """Test that a failing worker process raises ParsingError."""
+    monkeypatch.setattr("kreuzberg._utils._process_pool._POOL_SIZE", 2)
+
+    try:
+        with pytest.raises(ParsingError, match="worker processes"):
+            extract_pdf_text_in_processes("/nonexistent/file.pdf", list(range(10)), min_pages_per_process=5)
+    finally:
+        shutdown_process_pool()
+
+
+def test_init_process_pool_does_not_fork() -> None:
+    shutdown_process_pool()
+    try:
+        mp_context = _init_process_pool()._mp_context
+        assert mp_context is not None
+        assert mp_context.get_start_method() in {"forkserver", "spawn"}
+    finally:
+        shutdown_process_pool()
+
+
+def test_extract_pdf_text_in_processes_resets_broken_pool(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr("kreuzberg._utils._process_pool._POOL_SIZE", 2)
+    broken_future = Mock()
+    broken_future.result.side_effect = BrokenProcessPool("worker died")
+    broken_pool = Mock(spec=ProcessPoolExecutor)
+    broken_pool.submit.return_value = broken_future
+    monkeypatch.setattr("kreuzberg._utils._process_pool._PROCESS_POOL", broken_pool)
+
+    with pytest.raises(BrokenProcessPool):
+        extract_pdf_text_in_processes("/nonexistent/file.pdf", list(range(10)), min_pages_per_process=5)
+
+    broken_pool.shutdown.assert_called_once_with(wait=True)
+    assert _init_process_pool() is not broken_pool
+    shutdown_process_pool()
+
+
 def test_extract_pdf_images_worker(searchable_pdf: Path) -> None:
     """Test PDF image extraction worker."""
     path_str = str(searchable_pdf)
@@ -241,3 +322,30 @@ def test_process_pool_concurrent_usage() -> None:
     assert results == [0, 1, 4, 9, 16]
 
     shutdown_process_pool()
+
+
+@pytest.mark.parametrize("mode", ["1", "L", "RGB"])
+def test_share_image(mode: str) -> None:
+    image = Image.new("RGB", (37, 11), "white")
+    image.paste((10, 120, 200), (5, 2, 20, 8))
+    image = image.convert(mode)
+
+    with share_image(image) as shared_image:
+        assert shared_image.mode == mode
+        assert shared_image.size == (37, 11)
+
+        with open_shared_image(shared_image) as shared:
+            assert shared.tobytes() == image.tobytes()
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared_image.name)
+
+
+def test_share_image_flattens_transparency() -> None:
+    image = Image.new("RGBA", (4, 4), (0, 0, 0, 0))
+
+    with share_image(image) as shared_image, open_shared_image(shared_image) as shared:
+        assert shared_image.mode == "RGB"
+        assert shared.getpixel((0, 0)) == (255, 255, 255)
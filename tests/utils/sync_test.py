@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 import anyio
 import pytest
 
+from kreuzberg._utils._deadline import deadline_scope
 from kreuzberg._utils._sync import (
     run_maybe_async,
     run_maybe_sync,
@@ -12,6 +15,7 @@ from kreuzberg._utils._sync import (
     run_sync_only,
     run_taskgroup,
     run_taskgroup_batched,
+    run_taskgroup_until_deadline,
 )
 
 
@@ -300,3 +304,41 @@ async def test_run_taskgroup_batched_empty() -> None:
     """Test run_taskgroup_batched with no tasks."""
     results = await run_taskgroup_batched(batch_size=2)
     assert results == []
+
+
+@pytest.mark.anyio
+async def test_run_taskgroup_until_deadline_without_deadline() -> None:
+    """Test run_taskgroup_until_deadline runs all tasks when there is no deadline."""
+    tasks = [partial(async_function, i, y=1) for i in range(5)]
+    results = await run_taskgroup_until_deadline(*tasks, max_concurrency=2)
+    assert results == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.anyio
+async def test_run_taskgroup_until_deadline_cancels_running_tasks() -> None:
+    """Test run_taskgroup_until_deadline cancels the running tasks when the deadline passes."""
+
+    async def make_task(value: int) -> int:
+        await anyio.sleep(0.2 if value % 2 else 0)
+        return value
+
+    with deadline_scope(0.1):
+        results = await run_taskgroup_until_deadline(*[partial(make_task, i) for i in range(4)], max_concurrency=4)
+
+    assert results == [0, None, 2, None]
+
+
+@pytest.mark.anyio
+async def test_run_taskgroup_until_deadline_skips_pending_tasks() -> None:
+    """Test run_taskgroup_until_deadline does not start tasks once the deadline has passed."""
+    started = []
+
+    async def make_task(value: int) -> int:
+        started.append(value)
+        return value
+
+    with deadline_scope(0):
+        results = await run_taskgroup_until_deadline(*[partial(make_task, i) for i in range(3)], max_concurrency=1)
+
+    assert results == [None, None, None]
+    assert started == []
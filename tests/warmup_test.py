@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from kreuzberg import ExtractionConfig, OCRPrepassConfig, TesseractConfig, warmup, warmup_sync
+from kreuzberg.exceptions import MissingDependencyError
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def mock_backend(mocker: MockerFixture) -> MagicMock:
+    backend = MagicMock()
+    backend.warmup = AsyncMock()
+    mocker.patch("kreuzberg._warmup.get_ocr_backend", return_value=backend)
+    return backend
+
+
+@pytest.fixture
+def mock_loaders(mocker: MockerFixture) -> dict[str, MagicMock]:
+    return {
+        "language_detection": mocker.patch("kreuzberg._warmup.detect_languages", return_value=["en"]),
+        "entity_extraction": mocker.patch("kreuzberg._warmup.load_entity_model"),
+        "keyword_extraction": mocker.patch("kreuzberg._warmup.load_keyword_model"),
+        "table_extraction": mocker.patch("kreuzberg._warmup.load_table_models"),
+    }
+
+
+@pytest.mark.anyio
+async def test_warmup_default_config(mock_backend: MagicMock, mock_loaders: dict[str, MagicMock]) -> None:
+    timings = await warmup()
+
+    assert list(timings) == ["ocr:tesseract"]
+    assert timings["ocr:tesseract"] >= 0
+    mock_backend.warmup.assert_awaited_once_with(**ExtractionConfig().get_config_dict())
+    assert not any(loader.called for loader in mock_loaders.values())
+
+
+@pytest.mark.anyio
+async def test_warmup_all_components(mock_backend: MagicMock, mock_loaders: dict[str, MagicMock]) -> None:
+    config = ExtractionConfig(
+        ocr_backend="tesserocr",
+        auto_detect_language=True,
+        extract_entities=True,
+        extract_keywords=True,
+        extract_tables=True,
+    )
+
+    timings = await warmup(config)
+
+    assert list(timings) == [
+        "ocr:tesserocr",
+        "language_detection",
+        "entity_extraction",
+        "keyword_extraction",
+        "table_extraction",
+    ]
+    assert all(loader.call_count == 1 for loader in mock_loaders.values())
+
+
+def test_warmup_sync(mock_backend: MagicMock, mock_loaders: dict[str, MagicMock]) -> None:
+    config = ExtractionConfig(ocr_config=TesseractConfig(prepass=OCRPrepassConfig()))
+
+    timings = warmup_sync(config)
+
+    assert list(timings) == ["ocr:tesseract", "language_detection"]
+    mock_backend.warmup_sync.assert_called_once_with(**config.get_config_dict())
+    mock_loaders["language_detection"].assert_called_once()
+
+
+def test_warmup_sync_no_ocr(mock_backend: MagicMock, mock_loaders: dict[str, MagicMock]) -> None:
+    assert warmup_sync(ExtractionConfig(ocr_backend=None)) == {}
+    mock_backend.warmup_sync.assert_not_called()
+
+
+def test_warmup_sync_missing_dependency(mock_backend: MagicMock, mock_loaders: dict[str, MagicMock]) -> None:
+    mock_loaders["table_extraction"].side_effect = MissingDependencyError("gmft is missing")
+
+    with pytest.raises(MissingDependencyError, match="gmft is missing"):
+        warmup_sync(ExtractionConfig(extract_tables=True))